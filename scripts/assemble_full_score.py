@@ -2,9 +2,16 @@
 """
 FULL SCORE ASSEMBLY — MASTER PROMPT
 Assembles all 5 orchestrated movements into a single multi-movement full score.
+
+Usage: python scripts/assemble_full_score.py [--jobs N]   (N worker processes, 0 = one per CPU)
 """
 
 import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from job_pool import parse_jobs
+from score_writer import MeasureTemplates, ScoreWriter, configure_output
 
 # ============ UTILITIES ============
 def note(step, octave, duration, ntype, alter=None, voice=1, staff=1, 
@@ -93,6 +100,11 @@ def measure_attrs(divisions=256, fifths=0, beats=4, beat_type=4, clef_sign="G",
         x += '        <print new-system="yes"/>\n'
     return x
 
+# Whole-bar rest of a tacet bar, rendered once
+TACET = rest(1024, "whole")
+# Measure bodies rendered once per run and shared by every part that needs them
+MEASURES = MeasureTemplates()
+
 # ============ FULL SCORE HEADER ============
 def full_score_header():
     return '''<?xml version="1.0" encoding="UTF-8"?>
@@ -189,505 +201,860 @@ def part_footer():
     return '  </part>\n'
 
 # ============ GENERATE MOVEMENT I ============
-def gen_movement1(part_id, clef_sign, clef_line, start_bar=1):
+# Bars whose opening or closing marks differ from a plain bar
+_MOVEMENT1_MARKED_BARS = (1, 11, 12)
+
+def _movement1_notes(part_id, bar):
+    """Notes of one bar of a part (TACET for a whole-bar rest)."""
     content = ""
-    for bar in range(1, 13):
-        content += f'    <measure number="{bar}">\n'
-        
-        if bar == 1:
-            new_page = (start_bar == 1)
-            content += measure_attrs(256, -3, 4, 4, clef_sign, clef_line, new_page=new_page)
-            if part_id == "P1":
-                content += '        <direction placement="above"><direction-type><words font-size="14" font-weight="bold">I. Mingus Blues Cathedral</words></direction-type></direction>\n'
-                content += direction("Slow gospel blues, with fire", tempo=54)
-            content += direction(dynamic="mf")
-            content += harmony("C", "minor", [(9, 0, "add"), (11, 0, "add"), (13, 0, "add")])
-        
-        # Simplified part content based on role
-        if part_id == "P1":  # Flute
-            if bar in [1, 5, 9]:
-                content += note("G", 5, 256, "quarter", slur_s=True, acc=True)
-                content += note("B", 5, 256, "quarter", alter=-1)
-                content += note("D", 6, 256, "quarter")
-                content += note("E", 5, 256, "quarter", alter=-1, slur_e=True)
-            else:
-                content += rest(1024, "whole")
-        elif part_id == "P2":  # Clarinet
-            if bar in [2, 6, 10]:
-                content += note("D", 5, 256, "quarter", slur_s=True)
-                content += note("F", 5, 256, "quarter")
-                content += note("A", 5, 256, "quarter", alter=-1)
-                content += note("C", 6, 256, "quarter", slur_e=True)
-            else:
-                content += rest(1024, "whole")
-        elif part_id == "P3":  # Flugelhorn
-            if bar in [1, 2, 5, 6, 9, 10]:
-                content += note("C", 4, 256, "quarter", slur_s=True, acc=True)
-                content += note("E", 4, 256, "quarter", alter=-1, acc=True)
-                content += note("F", 4, 256, "quarter", acc=True)
-                content += note("B", 4, 256, "quarter", alter=-1, slur_e=True)
-            else:
-                content += rest(1024, "whole")
-        elif part_id == "P4":  # Violin I
-            if bar in [3, 4, 7, 8, 11, 12]:
-                content += note("C", 5, 256, "quarter", slur_s=True, acc=True)
-                content += note("E", 5, 256, "quarter", alter=-1, acc=True)
-                content += note("G", 5, 256, "quarter", acc=True)
-                content += note("B", 5, 256, "quarter", alter=-1, slur_e=True)
-            else:
-                content += rest(1024, "whole")
-        elif part_id == "P5":  # Violin II
-            if bar % 2 == 0:
-                content += note("E", 4, 512, "half", alter=-1, slur_s=True)
-                content += note("G", 4, 512, "half", slur_e=True)
-            else:
-                content += rest(1024, "whole")
-        elif part_id == "P6":  # Viola
-            content += note("G", 3, 512, "half", slur_s=True)
-            content += note("B", 3, 512, "half", alter=-1, slur_e=True)
-        elif part_id == "P7":  # Cello
-            content += note("C", 3, 256, "quarter", slur_s=True)
-            content += note("G", 3, 256, "quarter", chord=True)
-            content += note("E", 3, 256, "quarter", alter=-1)
-            content += note("B", 3, 256, "quarter", alter=-1, chord=True)
-            content += note("G", 3, 512, "half", slur_e=True)
-        elif part_id == "P8":  # Bass
-            content += note("C", 2, 512, "half")
-            content += note("G", 2, 256, "quarter")
-            content += note("C", 2, 256, "quarter")
-        elif part_id == "P9":  # Guitar
-            content += note("C", 3, 256, "quarter")
-            content += note("F", 3, 256, "quarter", chord=True)
-            content += note("B", 3, 256, "quarter", alter=-1, chord=True)
+    # Simplified part content based on role
+    if part_id == "P1":  # Flute
+        if bar in [1, 5, 9]:
+            content += note("G", 5, 256, "quarter", slur_s=True, acc=True)
+            content += note("B", 5, 256, "quarter", alter=-1)
+            content += note("D", 6, 256, "quarter")
+            content += note("E", 5, 256, "quarter", alter=-1, slur_e=True)
+        else:
+            return TACET
+    elif part_id == "P2":  # Clarinet
+        if bar in [2, 6, 10]:
+            content += note("D", 5, 256, "quarter", slur_s=True)
+            content += note("F", 5, 256, "quarter")
+            content += note("A", 5, 256, "quarter", alter=-1)
+            content += note("C", 6, 256, "quarter", slur_e=True)
+        else:
+            return TACET
+    elif part_id == "P3":  # Flugelhorn
+        if bar in [1, 2, 5, 6, 9, 10]:
+            content += note("C", 4, 256, "quarter", slur_s=True, acc=True)
+            content += note("E", 4, 256, "quarter", alter=-1, acc=True)
+            content += note("F", 4, 256, "quarter", acc=True)
+            content += note("B", 4, 256, "quarter", alter=-1, slur_e=True)
+        else:
+            return TACET
+    elif part_id == "P4":  # Violin I
+        if bar in [3, 4, 7, 8, 11, 12]:
+            content += note("C", 5, 256, "quarter", slur_s=True, acc=True)
+            content += note("E", 5, 256, "quarter", alter=-1, acc=True)
+            content += note("G", 5, 256, "quarter", acc=True)
+            content += note("B", 5, 256, "quarter", alter=-1, slur_e=True)
+        else:
+            return TACET
+    elif part_id == "P5":  # Violin II
+        if bar % 2 == 0:
+            content += note("E", 4, 512, "half", alter=-1, slur_s=True)
+            content += note("G", 4, 512, "half", slur_e=True)
+        else:
+            return TACET
+    elif part_id == "P6":  # Viola
+        content += note("G", 3, 512, "half", slur_s=True)
+        content += note("B", 3, 512, "half", alter=-1, slur_e=True)
+    elif part_id == "P7":  # Cello
+        content += note("C", 3, 256, "quarter", slur_s=True)
+        content += note("G", 3, 256, "quarter", chord=True)
+        content += note("E", 3, 256, "quarter", alter=-1)
+        content += note("B", 3, 256, "quarter", alter=-1, chord=True)
+        content += note("G", 3, 512, "half", slur_e=True)
+    elif part_id == "P8":  # Bass
+        content += note("C", 2, 512, "half")
+        content += note("G", 2, 256, "quarter")
+        content += note("C", 2, 256, "quarter")
+    elif part_id == "P9":  # Guitar
+        content += note("C", 3, 256, "quarter")
+        content += note("F", 3, 256, "quarter", chord=True)
+        content += note("B", 3, 256, "quarter", alter=-1, chord=True)
+        content += rest(768, "half", dot=True)
+    elif part_id == "P10":  # Glockenspiel
+        if bar in [1, 5, 9]:
+            content += note("C", 6, 256, "quarter", acc=True)
             content += rest(768, "half", dot=True)
-        elif part_id == "P10":  # Glockenspiel
-            if bar in [1, 5, 9]:
-                content += note("C", 6, 256, "quarter", acc=True)
-                content += rest(768, "half", dot=True)
-            elif bar == 12:
-                content += rest(768, "half", dot=True)
-                content += note("C", 6, 256, "quarter", ferm=True)
-            else:
-                content += rest(1024, "whole")
-        
-        if bar == 11 and part_id == "P1":
-            content += direction("rit.")
-        if bar == 12:
-            content += barline()
-        
-        content += '    </measure>\n'
+        elif bar == 12:
+            content += rest(768, "half", dot=True)
+            content += note("C", 6, 256, "quarter", ferm=True)
+        else:
+            return TACET
     return content
 
-# ============ GENERATE MOVEMENT II ============
-def gen_movement2(part_id, clef_sign, clef_line, start_bar=13):
+def _movement1_role(part_id, bar):
+    """Branch of _movement1_notes() a bar of a part takes (None for TACET); keep in step with it."""
+    # Simplified part content based on role
+    if part_id == "P1":  # Flute
+        if bar in [1, 5, 9]:
+            return 1
+        else:
+            return None
+    elif part_id == "P2":  # Clarinet
+        if bar in [2, 6, 10]:
+            return 2
+        else:
+            return None
+    elif part_id == "P3":  # Flugelhorn
+        if bar in [1, 2, 5, 6, 9, 10]:
+            return 3
+        else:
+            return None
+    elif part_id == "P4":  # Violin I
+        if bar in [3, 4, 7, 8, 11, 12]:
+            return 4
+        else:
+            return None
+    elif part_id == "P5":  # Violin II
+        if bar % 2 == 0:
+            return 5
+        else:
+            return None
+    elif part_id == "P6":  # Viola
+        return 6
+    elif part_id == "P7":  # Cello
+        return 7
+    elif part_id == "P8":  # Bass
+        return 8
+    elif part_id == "P9":  # Guitar
+        return 9
+    elif part_id == "P10":  # Glockenspiel
+        if bar in [1, 5, 9]:
+            return 10
+        elif bar == 12:
+            return 11
+        else:
+            return None
+    return 0
+
+def _movement1_measure(part_id, bar, first_part, clef_sign, clef_line, start_bar):
+    """Body of one bar: opening marks, the notes, closing marks."""
     content = ""
+    if bar == 1:
+        new_page = (start_bar == 1)
+        content += measure_attrs(256, -3, 4, 4, clef_sign, clef_line, new_page=new_page)
+        if first_part:
+            content += '        <direction placement="above"><direction-type><words font-size="14" font-weight="bold">I. Mingus Blues Cathedral</words></direction-type></direction>\n'
+            content += direction("Slow gospel blues, with fire", tempo=54)
+        content += direction(dynamic="mf")
+        content += harmony("C", "minor", [(9, 0, "add"), (11, 0, "add"), (13, 0, "add")])
+    content += _movement1_notes(part_id, bar)
+    if bar == 11 and first_part:
+        content += direction("rit.")
+    if bar == 12:
+        content += barline()
+    return content
+
+def gen_movement1(part_id, clef_sign, clef_line, start_bar=1, out=None):
+    content = ScoreWriter(out)
+    first_part = part_id == "P1"
     for bar in range(1, 13):
-        content += f'    <measure number="{bar}">\n'
-        
-        if bar == 1:
-            content += measure_attrs(256, 0, 4, 4, clef_sign, clef_line, new_page=True)
-            if part_id == "P1":
-                content += '        <direction placement="above"><direction-type><words font-size="14" font-weight="bold">II. Gil\'s Canvas</words></direction-type></direction>\n'
-                content += direction("Floating, pastel clouds", tempo=58)
-            content += direction(dynamic="pp")
-            content += harmony("E", "major-seventh", [(9, 0, "add"), (11, 1, "add")])
-        
-        if part_id == "P1":  # Flute - high harmonics
-            if bar in [1, 3, 5, 7, 9, 11]:
-                content += note("B", 6, 512, "half", slur_s=True, harmonic=True)
-                content += note("F", 6, 512, "half", alter=1, slur_e=True)
-            else:
-                content += rest(1024, "whole")
-        elif part_id == "P2":  # Clarinet
-            if bar % 2 == 0:
-                content += note("G", 4, 256, "quarter", slur_s=True)
-                content += note("A", 4, 256, "quarter")
-                content += note("B", 4, 256, "quarter")
-                content += note("F", 5, 256, "quarter", alter=1, slur_e=True)
-            else:
-                content += rest(1024, "whole")
-        elif part_id == "P3":  # Flugelhorn
-            if bar in [2, 4, 6, 8, 10]:
-                content += note("E", 4, 512, "half", slur_s=True)
-                content += note("G", 4, 512, "half", alter=1, slur_e=True)
-            else:
-                content += rest(1024, "whole")
-        elif part_id == "P4":  # Violin I - Lydian melody
-            if bar in [1, 3, 5, 7, 9, 11]:
-                content += note("G", 4, 256, "quarter", slur_s=True)
-                content += note("A", 4, 256, "quarter")
-                content += note("B", 4, 256, "quarter")
-                content += note("F", 5, 256, "quarter", alter=1, slur_e=True)
-            else:
-                content += note("E", 5, 512, "half", slur_s=True)
-                content += note("D", 5, 512, "half", slur_e=True)
-        elif part_id == "P5":  # Violin II
-            content += note("B", 4, 1024, "whole", slur_s=True, slur_e=True)
-        elif part_id == "P6":  # Viola
-            content += note("G", 3, 1024, "whole", alter=1, slur_s=True, slur_e=True)
-        elif part_id == "P7":  # Cello
-            content += note("E", 3, 1024, "whole", slur_s=True, slur_e=True)
-        elif part_id == "P8":  # Bass
-            content += note("E", 2, 1024, "whole")
-        elif part_id == "P9":  # Guitar - shimmer
-            content += note("E", 3, 256, "quarter")
-            content += note("G", 3, 256, "quarter", alter=1, chord=True)
-            content += note("B", 3, 256, "quarter", chord=True)
+        marks = bar if bar in _MOVEMENT1_MARKED_BARS else 0
+        key = (1, _movement1_role(part_id, bar), marks, first_part, clef_sign, clef_line, start_bar)
+        content += MEASURES.measure(bar, key, _movement1_measure,
+                                    part_id, bar, first_part, clef_sign, clef_line, start_bar)
+    return content.finish()
+
+# ============ GENERATE MOVEMENT II ============
+# Bars whose opening or closing marks differ from a plain bar
+_MOVEMENT2_MARKED_BARS = (1, 11, 12)
+
+def _movement2_notes(part_id, bar):
+    """Notes of one bar of a part (TACET for a whole-bar rest)."""
+    content = ""
+    if part_id == "P1":  # Flute - high harmonics
+        if bar in [1, 3, 5, 7, 9, 11]:
+            content += note("B", 6, 512, "half", slur_s=True, harmonic=True)
+            content += note("F", 6, 512, "half", alter=1, slur_e=True)
+        else:
+            return TACET
+    elif part_id == "P2":  # Clarinet
+        if bar % 2 == 0:
+            content += note("G", 4, 256, "quarter", slur_s=True)
+            content += note("A", 4, 256, "quarter")
+            content += note("B", 4, 256, "quarter")
+            content += note("F", 5, 256, "quarter", alter=1, slur_e=True)
+        else:
+            return TACET
+    elif part_id == "P3":  # Flugelhorn
+        if bar in [2, 4, 6, 8, 10]:
+            content += note("E", 4, 512, "half", slur_s=True)
+            content += note("G", 4, 512, "half", alter=1, slur_e=True)
+        else:
+            return TACET
+    elif part_id == "P4":  # Violin I - Lydian melody
+        if bar in [1, 3, 5, 7, 9, 11]:
+            content += note("G", 4, 256, "quarter", slur_s=True)
+            content += note("A", 4, 256, "quarter")
+            content += note("B", 4, 256, "quarter")
+            content += note("F", 5, 256, "quarter", alter=1, slur_e=True)
+        else:
+            content += note("E", 5, 512, "half", slur_s=True)
+            content += note("D", 5, 512, "half", slur_e=True)
+    elif part_id == "P5":  # Violin II
+        content += note("B", 4, 1024, "whole", slur_s=True, slur_e=True)
+    elif part_id == "P6":  # Viola
+        content += note("G", 3, 1024, "whole", alter=1, slur_s=True, slur_e=True)
+    elif part_id == "P7":  # Cello
+        content += note("E", 3, 1024, "whole", slur_s=True, slur_e=True)
+    elif part_id == "P8":  # Bass
+        content += note("E", 2, 1024, "whole")
+    elif part_id == "P9":  # Guitar - shimmer
+        content += note("E", 3, 256, "quarter")
+        content += note("G", 3, 256, "quarter", alter=1, chord=True)
+        content += note("B", 3, 256, "quarter", chord=True)
+        content += rest(768, "half", dot=True)
+    elif part_id == "P10":  # Glockenspiel
+        if bar in [4, 8]:
+            content += note("F", 6, 256, "quarter", alter=1)
             content += rest(768, "half", dot=True)
-        elif part_id == "P10":  # Glockenspiel
-            if bar in [4, 8]:
-                content += note("F", 6, 256, "quarter", alter=1)
-                content += rest(768, "half", dot=True)
-            elif bar == 12:
-                content += note("E", 6, 1024, "whole", ferm=True)
-            else:
-                content += rest(1024, "whole")
-        
-        if bar == 11 and part_id == "P1":
-            content += direction("rit.")
-        if bar == 12:
-            content += barline()
-        
-        content += '    </measure>\n'
+        elif bar == 12:
+            content += note("E", 6, 1024, "whole", ferm=True)
+        else:
+            return TACET
     return content
 
-# ============ GENERATE MOVEMENT III ============
-def gen_movement3(part_id, clef_sign, clef_line, start_bar=25):
+def _movement2_role(part_id, bar):
+    """Branch of _movement2_notes() a bar of a part takes (None for TACET); keep in step with it."""
+    if part_id == "P1":  # Flute - high harmonics
+        if bar in [1, 3, 5, 7, 9, 11]:
+            return 1
+        else:
+            return None
+    elif part_id == "P2":  # Clarinet
+        if bar % 2 == 0:
+            return 2
+        else:
+            return None
+    elif part_id == "P3":  # Flugelhorn
+        if bar in [2, 4, 6, 8, 10]:
+            return 3
+        else:
+            return None
+    elif part_id == "P4":  # Violin I - Lydian melody
+        if bar in [1, 3, 5, 7, 9, 11]:
+            return 4
+        else:
+            return 5
+    elif part_id == "P5":  # Violin II
+        return 6
+    elif part_id == "P6":  # Viola
+        return 7
+    elif part_id == "P7":  # Cello
+        return 8
+    elif part_id == "P8":  # Bass
+        return 9
+    elif part_id == "P9":  # Guitar - shimmer
+        return 10
+    elif part_id == "P10":  # Glockenspiel
+        if bar in [4, 8]:
+            return 11
+        elif bar == 12:
+            return 12
+        else:
+            return None
+    return 0
+
+def _movement2_measure(part_id, bar, first_part, clef_sign, clef_line, start_bar):
+    """Body of one bar: opening marks, the notes, closing marks."""
     content = ""
+    if bar == 1:
+        content += measure_attrs(256, 0, 4, 4, clef_sign, clef_line, new_page=True)
+        if first_part:
+            content += '        <direction placement="above"><direction-type><words font-size="14" font-weight="bold">II. Gil\'s Canvas</words></direction-type></direction>\n'
+            content += direction("Floating, pastel clouds", tempo=58)
+        content += direction(dynamic="pp")
+        content += harmony("E", "major-seventh", [(9, 0, "add"), (11, 1, "add")])
+    content += _movement2_notes(part_id, bar)
+    if bar == 11 and first_part:
+        content += direction("rit.")
+    if bar == 12:
+        content += barline()
+    return content
+
+def gen_movement2(part_id, clef_sign, clef_line, start_bar=13, out=None):
+    content = ScoreWriter(out)
+    first_part = part_id == "P1"
     for bar in range(1, 13):
-        content += f'    <measure number="{bar}">\n'
-        
-        if bar == 1:
-            content += measure_attrs(256, 0, 4, 4, clef_sign, clef_line, new_page=True)
-            if part_id == "P1":
-                content += '        <direction placement="above"><direction-type><words font-size="14" font-weight="bold">III. Bartok Night</words></direction-type></direction>\n'
-                content += direction("Molto misterioso, nocturnal", tempo=40)
-            content += direction(dynamic="ppp")
-            content += harmony("A", "minor", [(9, -1, "add"), (11, 0, "add")])
-        elif bar == 5:
-            content += harmony("Eb", "augmented", [(9, 0, "add"), (11, 1, "add")])
-            if part_id == "P1":
-                content += direction("expanding")
-        elif bar == 9:
-            if part_id == "P1":
-                content += direction("dissolving")
-            content += harmony("A", "minor", [(9, 0, "add"), (11, 0, "add")])
-        
-        if part_id == "P1":  # Flute - high flicks
-            if bar in [2, 4, 6, 8, 10]:
-                content += rest(512, "half")
-                content += note("E", 7, 128, "eighth", stac=True, acc=True, harmonic=True)
-                content += note("F", 7, 128, "eighth", stac=True, harmonic=True)
-                content += rest(256, "quarter")
-            else:
-                content += rest(1024, "whole")
-        elif part_id == "P2":  # Clarinet - m2 clusters
-            if bar in [1, 3, 5, 7, 9, 11]:
-                content += note("B", 4, 128, "eighth", alter=-1, slur_s=True, stac=True, acc=True)
-                content += note("A", 4, 128, "eighth", chord=True)
-                content += rest(256, "quarter")
-                content += note("E", 5, 256, "quarter", acc=True)
-                content += note("F", 5, 256, "quarter", slur_e=True)
-            else:
-                content += rest(1024, "whole")
-        elif part_id == "P3":  # Flugelhorn
-            if bar in [4, 8]:
-                content += rest(256, "quarter")
-                content += note("F", 4, 256, "quarter", slur_s=True, stac=True, acc=True)
-                content += note("B", 4, 256, "quarter")
-                content += note("E", 4, 256, "quarter", slur_e=True)
-            else:
-                content += rest(1024, "whole")
-        elif part_id == "P4":  # Violin I - motif
-            if bar in [1, 3, 5, 7, 9, 11]:
-                content += note("A", 4, 256, "quarter", slur_s=True, acc=True)
-                content += note("B", 4, 128, "eighth", alter=-1, acc=True)
-                content += note("E", 5, 128, "eighth", acc=True)
-                content += note("B", 5, 256, "quarter")
-                content += note("F", 5, 256, "quarter", slur_e=True)
-            else:
-                content += rest(1024, "whole")
-        elif part_id == "P5":  # Violin II - registral jumps
-            if bar in [1, 3, 5, 7, 9, 11]:
-                content += note("A", 6, 256, "quarter", slur_s=True, stac=True, acc=True)
-                content += rest(256, "quarter")
-                content += note("B", 3, 256, "quarter", alter=-1, stac=True)
-                content += note("E", 4, 256, "quarter", slur_e=True)
-            else:
-                content += rest(1024, "whole")
-        elif part_id == "P6":  # Viola - clusters
-            content += note("D", 4, 256, "quarter", slur_s=True, acc=True)
-            content += note("E", 4, 256, "quarter", alter=-1, chord=True)
-            content += note("G", 4, 256, "quarter", alter=1)
-            content += note("A", 4, 256, "quarter", slur_e=True)
-        elif part_id == "P7":  # Cello - pedal
-            content += note("A", 2, 256, "quarter", slur_s=True, acc=True)
-            content += note("E", 3, 256, "quarter", chord=True)
-            content += note("B", 2, 256, "quarter", alter=-1)
-            content += note("A", 2, 512, "half", slur_e=True)
-        elif part_id == "P8":  # Bass
-            if bar in [1, 5, 9]:
-                content += note("A", 1, 256, "quarter", acc=True, pizz=True)
-                content += rest(768, "half", dot=True)
-            else:
-                content += note("A", 1, 1024, "whole")
-        elif part_id == "P9":  # Guitar - harmonics
-            if bar in [1, 3, 5, 7, 9, 11]:
-                content += note("A", 4, 256, "quarter", slur_s=True, harmonic=True, acc=True)
-                content += note("B", 4, 256, "quarter", alter=-1, harmonic=True)
-                content += note("E", 4, 256, "quarter", harmonic=True)
-                content += note("F", 4, 256, "quarter", harmonic=True, slur_e=True)
-            else:
-                content += rest(1024, "whole")
-        elif part_id == "P10":  # Glockenspiel
-            if bar in [2, 6]:
-                content += rest(768, "half", dot=True)
-                content += note("E", 7, 256, "quarter", stac=True, acc=True)
-            elif bar == 12:
-                content += note("A", 6, 1024, "whole", ferm=True)
-            else:
-                content += rest(1024, "whole")
-        
-        if bar == 11 and part_id == "P1":
-            content += direction("rit., morendo")
-        if bar == 12:
-            content += barline()
-        
-        content += '    </measure>\n'
+        marks = bar if bar in _MOVEMENT2_MARKED_BARS else 0
+        key = (2, _movement2_role(part_id, bar), marks, first_part, clef_sign, clef_line, start_bar)
+        content += MEASURES.measure(bar, key, _movement2_measure,
+                                    part_id, bar, first_part, clef_sign, clef_line, start_bar)
+    return content.finish()
+
+# ============ GENERATE MOVEMENT III ============
+# Bars whose opening or closing marks differ from a plain bar
+_MOVEMENT3_MARKED_BARS = (1, 5, 9, 11, 12)
+
+def _movement3_notes(part_id, bar):
+    """Notes of one bar of a part (TACET for a whole-bar rest)."""
+    content = ""
+    if part_id == "P1":  # Flute - high flicks
+        if bar in [2, 4, 6, 8, 10]:
+            content += rest(512, "half")
+            content += note("E", 7, 128, "eighth", stac=True, acc=True, harmonic=True)
+            content += note("F", 7, 128, "eighth", stac=True, harmonic=True)
+            content += rest(256, "quarter")
+        else:
+            return TACET
+    elif part_id == "P2":  # Clarinet - m2 clusters
+        if bar in [1, 3, 5, 7, 9, 11]:
+            content += note("B", 4, 128, "eighth", alter=-1, slur_s=True, stac=True, acc=True)
+            content += note("A", 4, 128, "eighth", chord=True)
+            content += rest(256, "quarter")
+            content += note("E", 5, 256, "quarter", acc=True)
+            content += note("F", 5, 256, "quarter", slur_e=True)
+        else:
+            return TACET
+    elif part_id == "P3":  # Flugelhorn
+        if bar in [4, 8]:
+            content += rest(256, "quarter")
+            content += note("F", 4, 256, "quarter", slur_s=True, stac=True, acc=True)
+            content += note("B", 4, 256, "quarter")
+            content += note("E", 4, 256, "quarter", slur_e=True)
+        else:
+            return TACET
+    elif part_id == "P4":  # Violin I - motif
+        if bar in [1, 3, 5, 7, 9, 11]:
+            content += note("A", 4, 256, "quarter", slur_s=True, acc=True)
+            content += note("B", 4, 128, "eighth", alter=-1, acc=True)
+            content += note("E", 5, 128, "eighth", acc=True)
+            content += note("B", 5, 256, "quarter")
+            content += note("F", 5, 256, "quarter", slur_e=True)
+        else:
+            return TACET
+    elif part_id == "P5":  # Violin II - registral jumps
+        if bar in [1, 3, 5, 7, 9, 11]:
+            content += note("A", 6, 256, "quarter", slur_s=True, stac=True, acc=True)
+            content += rest(256, "quarter")
+            content += note("B", 3, 256, "quarter", alter=-1, stac=True)
+            content += note("E", 4, 256, "quarter", slur_e=True)
+        else:
+            return TACET
+    elif part_id == "P6":  # Viola - clusters
+        content += note("D", 4, 256, "quarter", slur_s=True, acc=True)
+        content += note("E", 4, 256, "quarter", alter=-1, chord=True)
+        content += note("G", 4, 256, "quarter", alter=1)
+        content += note("A", 4, 256, "quarter", slur_e=True)
+    elif part_id == "P7":  # Cello - pedal
+        content += note("A", 2, 256, "quarter", slur_s=True, acc=True)
+        content += note("E", 3, 256, "quarter", chord=True)
+        content += note("B", 2, 256, "quarter", alter=-1)
+        content += note("A", 2, 512, "half", slur_e=True)
+    elif part_id == "P8":  # Bass
+        if bar in [1, 5, 9]:
+            content += note("A", 1, 256, "quarter", acc=True, pizz=True)
+            content += rest(768, "half", dot=True)
+        else:
+            content += note("A", 1, 1024, "whole")
+    elif part_id == "P9":  # Guitar - harmonics
+        if bar in [1, 3, 5, 7, 9, 11]:
+            content += note("A", 4, 256, "quarter", slur_s=True, harmonic=True, acc=True)
+            content += note("B", 4, 256, "quarter", alter=-1, harmonic=True)
+            content += note("E", 4, 256, "quarter", harmonic=True)
+            content += note("F", 4, 256, "quarter", harmonic=True, slur_e=True)
+        else:
+            return TACET
+    elif part_id == "P10":  # Glockenspiel
+        if bar in [2, 6]:
+            content += rest(768, "half", dot=True)
+            content += note("E", 7, 256, "quarter", stac=True, acc=True)
+        elif bar == 12:
+            content += note("A", 6, 1024, "whole", ferm=True)
+        else:
+            return TACET
+    return content
+
+def _movement3_role(part_id, bar):
+    """Branch of _movement3_notes() a bar of a part takes (None for TACET); keep in step with it."""
+    if part_id == "P1":  # Flute - high flicks
+        if bar in [2, 4, 6, 8, 10]:
+            return 1
+        else:
+            return None
+    elif part_id == "P2":  # Clarinet - m2 clusters
+        if bar in [1, 3, 5, 7, 9, 11]:
+            return 2
+        else:
+            return None
+    elif part_id == "P3":  # Flugelhorn
+        if bar in [4, 8]:
+            return 3
+        else:
+            return None
+    elif part_id == "P4":  # Violin I - motif
+        if bar in [1, 3, 5, 7, 9, 11]:
+            return 4
+        else:
+            return None
+    elif part_id == "P5":  # Violin II - registral jumps
+        if bar in [1, 3, 5, 7, 9, 11]:
+            return 5
+        else:
+            return None
+    elif part_id == "P6":  # Viola - clusters
+        return 6
+    elif part_id == "P7":  # Cello - pedal
+        return 7
+    elif part_id == "P8":  # Bass
+        if bar in [1, 5, 9]:
+            return 8
+        else:
+            return 9
+    elif part_id == "P9":  # Guitar - harmonics
+        if bar in [1, 3, 5, 7, 9, 11]:
+            return 10
+        else:
+            return None
+    elif part_id == "P10":  # Glockenspiel
+        if bar in [2, 6]:
+            return 11
+        elif bar == 12:
+            return 12
+        else:
+            return None
+    return 0
+
+def _movement3_measure(part_id, bar, first_part, clef_sign, clef_line, start_bar):
+    """Body of one bar: opening marks, the notes, closing marks."""
+    content = ""
+    if bar == 1:
+        content += measure_attrs(256, 0, 4, 4, clef_sign, clef_line, new_page=True)
+        if first_part:
+            content += '        <direction placement="above"><direction-type><words font-size="14" font-weight="bold">III. Bartok Night</words></direction-type></direction>\n'
+            content += direction("Molto misterioso, nocturnal", tempo=40)
+        content += direction(dynamic="ppp")
+        content += harmony("A", "minor", [(9, -1, "add"), (11, 0, "add")])
+    elif bar == 5:
+        content += harmony("Eb", "augmented", [(9, 0, "add"), (11, 1, "add")])
+        if first_part:
+            content += direction("expanding")
+    elif bar == 9:
+        if first_part:
+            content += direction("dissolving")
+        content += harmony("A", "minor", [(9, 0, "add"), (11, 0, "add")])
+    content += _movement3_notes(part_id, bar)
+    if bar == 11 and first_part:
+        content += direction("rit., morendo")
+    if bar == 12:
+        content += barline()
     return content
 
+def gen_movement3(part_id, clef_sign, clef_line, start_bar=25, out=None):
+    content = ScoreWriter(out)
+    first_part = part_id == "P1"
+    for bar in range(1, 13):
+        marks = bar if bar in _MOVEMENT3_MARKED_BARS else 0
+        key = (3, _movement3_role(part_id, bar), marks, first_part, clef_sign, clef_line, start_bar)
+        content += MEASURES.measure(bar, key, _movement3_measure,
+                                    part_id, bar, first_part, clef_sign, clef_line, start_bar)
+    return content.finish()
+
 # ============ GENERATE MOVEMENT IV ============
-def gen_movement4(part_id, clef_sign, clef_line, start_bar=37):
+# Bars whose opening or closing marks differ from a plain bar
+_MOVEMENT4_MARKED_BARS = (1, 5, 7, 9, 11, 12)
+
+def _movement4_notes(part_id, bar):
+    """Notes of one bar of a part (TACET for a whole-bar rest)."""
     content = ""
+    if part_id == "P1":  # Flute - Klangfarben bars 3-4
+        if bar == 3:
+            content += note("C", 5, 256, "quarter", slur_s=True, acc=True)
+            content += note("B", 4, 256, "quarter", alter=-1, acc=True)
+            content += note("A", 4, 256, "quarter", alter=-1, acc=True)
+            content += note("E", 5, 256, "quarter", slur_e=True)
+        elif bar == 4:
+            content += note("D", 5, 256, "quarter", slur_s=True)
+            content += note("B", 4, 256, "quarter", slur_e=True)
+            content += rest(512, "half")
+        else:
+            return TACET
+    elif part_id == "P2":  # Clarinet - bars 5-6 (augmentation)
+        if bar == 5:
+            content += note("C", 5, 512, "half", slur_s=True, acc=True)
+            content += note("D", 5, 512, "half")
+        elif bar == 6:
+            content += note("E", 5, 512, "half")
+            content += note("G", 4, 512, "half", alter=1, slur_e=True)
+        else:
+            return TACET
+    elif part_id == "P3":  # Flugelhorn - bars 7-8 (diminution)
+        if bar == 7:
+            content += note("C", 5, 128, "eighth", slur_s=True, acc=True)
+            content += note("D", 5, 128, "eighth", acc=True)
+            content += note("E", 5, 128, "eighth", acc=True)
+            content += note("G", 4, 128, "eighth", alter=1)
+            content += note("B", 4, 256, "quarter", acc=True)
+            content += note("D", 5, 256, "quarter", slur_e=True)
+        elif bar == 8:
+            content += note("E", 5, 256, "quarter", slur_s=True)
+            content += note("G", 3, 256, "quarter", alter=1, acc=True)
+            content += note("D", 6, 256, "quarter", acc=True)
+            content += note("B", 4, 256, "quarter", slur_e=True)
+        else:
+            return TACET
+    elif part_id == "P4":  # Violin I - seed + synthesis
+        if bar in [1, 2, 9, 10]:
+            content += note("C", 5, 256, "quarter", slur_s=True, acc=True)
+            content += note("D", 5, 256, "quarter", acc=True)
+            content += note("E", 5, 256, "quarter", acc=True)
+            content += note("G", 4, 256, "quarter", alter=1, slur_e=True)
+        elif bar == 12:
+            content += note("C", 5, 1024, "whole", ferm=True)
+        else:
+            return TACET
+    elif part_id == "P5":  # Violin II - chromatic planing
+        if bar % 2 == 0:
+            content += note("G", 4, 256, "quarter", slur_s=True, acc=True)
+            content += note("A", 4, 256, "quarter", alter=-1)
+            content += note("A", 4, 256, "quarter")
+            content += note("B", 4, 256, "quarter", alter=-1, slur_e=True)
+        else:
+            content += note("E", 4, 256, "quarter", slur_s=True)
+            content += note("F", 4, 256, "quarter")
+            content += note("F", 4, 256, "quarter", alter=1)
+            content += note("G", 4, 256, "quarter", slur_e=True)
+    elif part_id == "P6":  # Viola - chromatic
+        content += note("C", 4, 256, "quarter", slur_s=True, acc=True)
+        content += note("D", 4, 256, "quarter", alter=-1)
+        content += note("D", 4, 256, "quarter")
+        content += note("E", 4, 256, "quarter", alter=-1, slur_e=True)
+    elif part_id == "P7":  # Cello - interval cycles
+        content += note("C", 3, 256, "quarter", slur_s=True, acc=True)
+        content += note("E", 3, 256, "quarter")
+        content += note("G", 3, 256, "quarter", alter=1)
+        content += note("C", 4, 256, "quarter", slur_e=True)
+    elif part_id == "P8":  # Bass
+        content += note("C", 2, 512, "half", acc=True)
+        content += note("G", 2, 256, "quarter")
+        content += note("C", 2, 256, "quarter")
+    elif part_id == "P9":  # Guitar - polychords
+        content += note("C", 3, 256, "quarter", slur_s=True, acc=True)
+        content += note("F", 3, 256, "quarter", chord=True)
+        content += note("B", 3, 256, "quarter", chord=True)
+        content += note("G", 4, 256, "quarter", alter=1, slur_e=True)
+    elif part_id == "P10":  # Glockenspiel
+        if bar == 7:
+            content += note("C", 7, 256, "quarter", acc=True)
+            content += rest(768, "half", dot=True)
+        elif bar == 12:
+            content += rest(768, "half", dot=True)
+            content += note("C", 6, 256, "quarter", ferm=True)
+        else:
+            return TACET
+    return content
+
+def _movement4_role(part_id, bar):
+    """Branch of _movement4_notes() a bar of a part takes (None for TACET); keep in step with it."""
+    if part_id == "P1":  # Flute - Klangfarben bars 3-4
+        if bar == 3:
+            return 1
+        elif bar == 4:
+            return 2
+        else:
+            return None
+    elif part_id == "P2":  # Clarinet - bars 5-6 (augmentation)
+        if bar == 5:
+            return 3
+        elif bar == 6:
+            return 4
+        else:
+            return None
+    elif part_id == "P3":  # Flugelhorn - bars 7-8 (diminution)
+        if bar == 7:
+            return 5
+        elif bar == 8:
+            return 6
+        else:
+            return None
+    elif part_id == "P4":  # Violin I - seed + synthesis
+        if bar in [1, 2, 9, 10]:
+            return 7
+        elif bar == 12:
+            return 8
+        else:
+            return None
+    elif part_id == "P5":  # Violin II - chromatic planing
+        if bar % 2 == 0:
+            return 9
+        else:
+            return 10
+    elif part_id == "P6":  # Viola - chromatic
+        return 11
+    elif part_id == "P7":  # Cello - interval cycles
+        return 12
+    elif part_id == "P8":  # Bass
+        return 13
+    elif part_id == "P9":  # Guitar - polychords
+        return 14
+    elif part_id == "P10":  # Glockenspiel
+        if bar == 7:
+            return 15
+        elif bar == 12:
+            return 16
+        else:
+            return None
+    return 0
+
+def _movement4_measure(part_id, bar, first_part, clef_sign, clef_line, start_bar):
+    """Body of one bar: opening marks, the notes, closing marks."""
+    content = ""
+    if bar == 1:
+        content += measure_attrs(256, 0, 4, 4, clef_sign, clef_line, new_page=True)
+        if first_part:
+            content += '        <direction placement="above"><direction-type><words font-size="14" font-weight="bold">IV. German Development</words></direction-type></direction>\n'
+            content += direction("Streng, mit innerer Kraft", tempo=66)
+        content += direction(dynamic="f")
+        content += harmony("C", "major-seventh", [(9, 0, "add"), (11, 1, "add")])
+    elif bar == 5:
+        if first_part:
+            content += direction("Breiter - augmentation")
+        content += direction(dynamic="mf")
+    elif bar == 7:
+        if first_part:
+            content += direction("diminution, intensifying")
+        content += direction(dynamic="ff")
+    elif bar == 9:
+        if first_part:
+            content += direction("Ankunft - synthesis")
+    content += _movement4_notes(part_id, bar)
+    if bar == 11 and first_part:
+        content += direction("rit., resolution")
+        content += direction(dynamic="p")
+    if bar == 12:
+        content += barline()
+    return content
+
+def gen_movement4(part_id, clef_sign, clef_line, start_bar=37, out=None):
+    content = ScoreWriter(out)
+    first_part = part_id == "P1"
     for bar in range(1, 13):
-        content += f'    <measure number="{bar}">\n'
-        
+        marks = bar if bar in _MOVEMENT4_MARKED_BARS else 0
+        key = (4, _movement4_role(part_id, bar), marks, first_part, clef_sign, clef_line, start_bar)
+        content += MEASURES.measure(bar, key, _movement4_measure,
+                                    part_id, bar, first_part, clef_sign, clef_line, start_bar)
+    return content.finish()
+
+# ============ GENERATE MOVEMENT V ============
+# Bars whose opening or closing marks differ from a plain bar
+_MOVEMENT5_MARKED_BARS = (1, 5, 9, 11, 12)
+
+def _movement5_notes(part_id, bar):
+    """Notes of one bar of a part (TACET for a whole-bar rest)."""
+    content = ""
+    if part_id == "P1":  # Flute - M-voice echo
+        if bar in [3, 7]:
+            content += note("A", 5, 1024, "whole", slur_s=True, slur_e=True)
+        elif bar in [1, 5, 9]:
+            content += note("D", 6, 512, "half", slur_s=True, harmonic=True)
+            content += note("A", 5, 512, "half", slur_e=True, harmonic=True)
+        else:
+            return TACET
+    elif part_id == "P2":  # Clarinet - T-voice
+        if bar in [1, 3, 5, 7, 9, 11]:
+            content += note("A", 4, 512, "half", slur_s=True)
+            content += note("F", 4, 512, "half", slur_e=True)
+        else:
+            content += note("D", 4, 1024, "whole")
+    elif part_id == "P3":  # Flugelhorn - tacet mostly
+        if bar in [5, 9]:
+            content += note("D", 4, 1024, "whole", slur_s=True, slur_e=True)
+        else:
+            return TACET
+    elif part_id == "P4":  # Violin I - M-voice solo
         if bar == 1:
-            content += measure_attrs(256, 0, 4, 4, clef_sign, clef_line, new_page=True)
-            if part_id == "P1":
-                content += '        <direction placement="above"><direction-type><words font-size="14" font-weight="bold">IV. German Development</words></direction-type></direction>\n'
-                content += direction("Streng, mit innerer Kraft", tempo=66)
-            content += direction(dynamic="f")
-            content += harmony("C", "major-seventh", [(9, 0, "add"), (11, 1, "add")])
+            content += note("D", 5, 512, "half", slur_s=True, acc=True)
+            content += note("E", 5, 512, "half")
+        elif bar == 2:
+            content += note("F", 5, 512, "half", acc=True)
+            content += note("G", 5, 512, "half", slur_e=True)
+        elif bar == 3:
+            content += note("A", 5, 1024, "whole", slur_s=True, acc=True)
+        elif bar == 4:
+            content += note("G", 5, 512, "half")
+            content += note("F", 5, 512, "half", slur_e=True)
         elif bar == 5:
-            if part_id == "P1":
-                content += direction("Breiter - augmentation")
-            content += direction(dynamic="mf")
+            content += note("E", 5, 512, "half", slur_s=True, acc=True)
+            content += note("D", 5, 512, "half")
+        elif bar == 6:
+            content += note("C", 5, 512, "half")
+            content += note("D", 5, 512, "half", slur_e=True)
         elif bar == 7:
-            if part_id == "P1":
-                content += direction("diminution, intensifying")
-            content += direction(dynamic="ff")
+            content += note("E", 5, 1024, "whole", slur_s=True, acc=True)
+        elif bar == 8:
+            content += note("F", 5, 512, "half")
+            content += note("G", 5, 512, "half", slur_e=True)
         elif bar == 9:
-            if part_id == "P1":
-                content += direction("Ankunft - synthesis")
-        
-        if part_id == "P1":  # Flute - Klangfarben bars 3-4
-            if bar == 3:
-                content += note("C", 5, 256, "quarter", slur_s=True, acc=True)
-                content += note("B", 4, 256, "quarter", alter=-1, acc=True)
-                content += note("A", 4, 256, "quarter", alter=-1, acc=True)
-                content += note("E", 5, 256, "quarter", slur_e=True)
-            elif bar == 4:
-                content += note("D", 5, 256, "quarter", slur_s=True)
-                content += note("B", 4, 256, "quarter", slur_e=True)
-                content += rest(512, "half")
-            else:
-                content += rest(1024, "whole")
-        elif part_id == "P2":  # Clarinet - bars 5-6 (augmentation)
-            if bar == 5:
-                content += note("C", 5, 512, "half", slur_s=True, acc=True)
-                content += note("D", 5, 512, "half")
-            elif bar == 6:
-                content += note("E", 5, 512, "half")
-                content += note("G", 4, 512, "half", alter=1, slur_e=True)
-            else:
-                content += rest(1024, "whole")
-        elif part_id == "P3":  # Flugelhorn - bars 7-8 (diminution)
-            if bar == 7:
-                content += note("C", 5, 128, "eighth", slur_s=True, acc=True)
-                content += note("D", 5, 128, "eighth", acc=True)
-                content += note("E", 5, 128, "eighth", acc=True)
-                content += note("G", 4, 128, "eighth", alter=1)
-                content += note("B", 4, 256, "quarter", acc=True)
-                content += note("D", 5, 256, "quarter", slur_e=True)
-            elif bar == 8:
-                content += note("E", 5, 256, "quarter", slur_s=True)
-                content += note("G", 3, 256, "quarter", alter=1, acc=True)
-                content += note("D", 6, 256, "quarter", acc=True)
-                content += note("B", 4, 256, "quarter", slur_e=True)
-            else:
-                content += rest(1024, "whole")
-        elif part_id == "P4":  # Violin I - seed + synthesis
-            if bar in [1, 2, 9, 10]:
-                content += note("C", 5, 256, "quarter", slur_s=True, acc=True)
-                content += note("D", 5, 256, "quarter", acc=True)
-                content += note("E", 5, 256, "quarter", acc=True)
-                content += note("G", 4, 256, "quarter", alter=1, slur_e=True)
-            elif bar == 12:
-                content += note("C", 5, 1024, "whole", ferm=True)
-            else:
-                content += rest(1024, "whole")
-        elif part_id == "P5":  # Violin II - chromatic planing
-            if bar % 2 == 0:
-                content += note("G", 4, 256, "quarter", slur_s=True, acc=True)
-                content += note("A", 4, 256, "quarter", alter=-1)
-                content += note("A", 4, 256, "quarter")
-                content += note("B", 4, 256, "quarter", alter=-1, slur_e=True)
-            else:
-                content += note("E", 4, 256, "quarter", slur_s=True)
-                content += note("F", 4, 256, "quarter")
-                content += note("F", 4, 256, "quarter", alter=1)
-                content += note("G", 4, 256, "quarter", slur_e=True)
-        elif part_id == "P6":  # Viola - chromatic
-            content += note("C", 4, 256, "quarter", slur_s=True, acc=True)
-            content += note("D", 4, 256, "quarter", alter=-1)
-            content += note("D", 4, 256, "quarter")
-            content += note("E", 4, 256, "quarter", alter=-1, slur_e=True)
-        elif part_id == "P7":  # Cello - interval cycles
-            content += note("C", 3, 256, "quarter", slur_s=True, acc=True)
-            content += note("E", 3, 256, "quarter")
-            content += note("G", 3, 256, "quarter", alter=1)
-            content += note("C", 4, 256, "quarter", slur_e=True)
-        elif part_id == "P8":  # Bass
-            content += note("C", 2, 512, "half", acc=True)
-            content += note("G", 2, 256, "quarter")
-            content += note("C", 2, 256, "quarter")
-        elif part_id == "P9":  # Guitar - polychords
-            content += note("C", 3, 256, "quarter", slur_s=True, acc=True)
-            content += note("F", 3, 256, "quarter", chord=True)
-            content += note("B", 3, 256, "quarter", chord=True)
-            content += note("G", 4, 256, "quarter", alter=1, slur_e=True)
-        elif part_id == "P10":  # Glockenspiel
-            if bar == 7:
-                content += note("C", 7, 256, "quarter", acc=True)
-                content += rest(768, "half", dot=True)
-            elif bar == 12:
-                content += rest(768, "half", dot=True)
-                content += note("C", 6, 256, "quarter", ferm=True)
-            else:
-                content += rest(1024, "whole")
-        
-        if bar == 11 and part_id == "P1":
-            content += direction("rit., resolution")
-            content += direction(dynamic="p")
-        if bar == 12:
-            content += barline()
-        
-        content += '    </measure>\n'
+            content += note("A", 5, 512, "half", slur_s=True, acc=True)
+            content += note("B", 5, 512, "half", alter=-1)
+        elif bar == 10:
+            content += note("A", 5, 512, "half")
+            content += note("G", 5, 512, "half", slur_e=True)
+        elif bar == 11:
+            content += note("F", 5, 512, "half", slur_s=True, acc=True)
+            content += note("E", 5, 512, "half")
+        elif bar == 12:
+            content += note("D", 5, 1024, "whole", slur_e=True, ferm=True)
+    elif part_id == "P5":  # Violin II - sustained A
+        content += note("A", 4, 1024, "whole", slur_s=True, slur_e=True)
+    elif part_id == "P6":  # Viola - sustained F
+        content += note("F", 4, 512, "half", slur_s=True)
+        content += note("A", 4, 512, "half", slur_e=True)
+    elif part_id == "P7":  # Cello - D pedal
+        content += note("D", 3, 512, "half", slur_s=True)
+        content += note("A", 3, 512, "half", slur_e=True)
+    elif part_id == "P8":  # Bass
+        content += note("D", 2, 1024, "whole")
+    elif part_id == "P9":  # Guitar - T-voice harmonics
+        if bar in [1, 3, 5, 7, 9, 11]:
+            content += note("D", 4, 256, "quarter", slur_s=True, harmonic=True, acc=True)
+            content += note("A", 3, 256, "quarter", harmonic=True)
+            content += note("F", 4, 256, "quarter", harmonic=True)
+            content += note("D", 4, 256, "quarter", slur_e=True, harmonic=True)
+        else:
+            return TACET
+    elif part_id == "P10":  # Glockenspiel
+        if bar == 9:
+            content += note("A", 6, 256, "quarter", acc=True)
+            content += rest(768, "half", dot=True)
+        elif bar == 12:
+            content += rest(768, "half", dot=True)
+            content += note("D", 6, 256, "quarter", ferm=True)
+        else:
+            return TACET
     return content
 
-# ============ GENERATE MOVEMENT V ============
-def gen_movement5(part_id, clef_sign, clef_line, start_bar=49):
-    content = ""
-    for bar in range(1, 13):
-        content += f'    <measure number="{bar}">\n'
-        
+def _movement5_role(part_id, bar):
+    """Branch of _movement5_notes() a bar of a part takes (None for TACET); keep in step with it."""
+    if part_id == "P1":  # Flute - M-voice echo
+        if bar in [3, 7]:
+            return 1
+        elif bar in [1, 5, 9]:
+            return 2
+        else:
+            return None
+    elif part_id == "P2":  # Clarinet - T-voice
+        if bar in [1, 3, 5, 7, 9, 11]:
+            return 3
+        else:
+            return 4
+    elif part_id == "P3":  # Flugelhorn - tacet mostly
+        if bar in [5, 9]:
+            return 5
+        else:
+            return None
+    elif part_id == "P4":  # Violin I - M-voice solo
         if bar == 1:
-            content += measure_attrs(256, -1, 4, 4, clef_sign, clef_line, new_page=True)
-            if part_id == "P1":
-                content += '        <direction placement="above"><direction-type><words font-size="14" font-weight="bold">V. Tintinnabuli Epilogue</words></direction-type></direction>\n'
-                content += direction("Serene, like a prayer", tempo=52)
-            content += direction(dynamic="ppp")
-            content += harmony("D", "minor", [(9, 0, "add")])
+            return 6
+        elif bar == 2:
+            return 7
+        elif bar == 3:
+            return 8
+        elif bar == 4:
+            return 9
         elif bar == 5:
-            if part_id == "P1":
-                content += direction("breathing")
+            return 10
+        elif bar == 6:
+            return 11
+        elif bar == 7:
+            return 12
+        elif bar == 8:
+            return 13
         elif bar == 9:
-            if part_id == "P1":
-                content += direction("transcendent")
-        
-        if part_id == "P1":  # Flute - M-voice echo
-            if bar in [3, 7]:
-                content += note("A", 5, 1024, "whole", slur_s=True, slur_e=True)
-            elif bar in [1, 5, 9]:
-                content += note("D", 6, 512, "half", slur_s=True, harmonic=True)
-                content += note("A", 5, 512, "half", slur_e=True, harmonic=True)
-            else:
-                content += rest(1024, "whole")
-        elif part_id == "P2":  # Clarinet - T-voice
-            if bar in [1, 3, 5, 7, 9, 11]:
-                content += note("A", 4, 512, "half", slur_s=True)
-                content += note("F", 4, 512, "half", slur_e=True)
-            else:
-                content += note("D", 4, 1024, "whole")
-        elif part_id == "P3":  # Flugelhorn - tacet mostly
-            if bar in [5, 9]:
-                content += note("D", 4, 1024, "whole", slur_s=True, slur_e=True)
-            else:
-                content += rest(1024, "whole")
-        elif part_id == "P4":  # Violin I - M-voice solo
-            if bar == 1:
-                content += note("D", 5, 512, "half", slur_s=True, acc=True)
-                content += note("E", 5, 512, "half")
-            elif bar == 2:
-                content += note("F", 5, 512, "half", acc=True)
-                content += note("G", 5, 512, "half", slur_e=True)
-            elif bar == 3:
-                content += note("A", 5, 1024, "whole", slur_s=True, acc=True)
-            elif bar == 4:
-                content += note("G", 5, 512, "half")
-                content += note("F", 5, 512, "half", slur_e=True)
-            elif bar == 5:
-                content += note("E", 5, 512, "half", slur_s=True, acc=True)
-                content += note("D", 5, 512, "half")
-            elif bar == 6:
-                content += note("C", 5, 512, "half")
-                content += note("D", 5, 512, "half", slur_e=True)
-            elif bar == 7:
-                content += note("E", 5, 1024, "whole", slur_s=True, acc=True)
-            elif bar == 8:
-                content += note("F", 5, 512, "half")
-                content += note("G", 5, 512, "half", slur_e=True)
-            elif bar == 9:
-                content += note("A", 5, 512, "half", slur_s=True, acc=True)
-                content += note("B", 5, 512, "half", alter=-1)
-            elif bar == 10:
-                content += note("A", 5, 512, "half")
-                content += note("G", 5, 512, "half", slur_e=True)
-            elif bar == 11:
-                content += note("F", 5, 512, "half", slur_s=True, acc=True)
-                content += note("E", 5, 512, "half")
-            elif bar == 12:
-                content += note("D", 5, 1024, "whole", slur_e=True, ferm=True)
-        elif part_id == "P5":  # Violin II - sustained A
-            content += note("A", 4, 1024, "whole", slur_s=True, slur_e=True)
-        elif part_id == "P6":  # Viola - sustained F
-            content += note("F", 4, 512, "half", slur_s=True)
-            content += note("A", 4, 512, "half", slur_e=True)
-        elif part_id == "P7":  # Cello - D pedal
-            content += note("D", 3, 512, "half", slur_s=True)
-            content += note("A", 3, 512, "half", slur_e=True)
-        elif part_id == "P8":  # Bass
-            content += note("D", 2, 1024, "whole")
-        elif part_id == "P9":  # Guitar - T-voice harmonics
-            if bar in [1, 3, 5, 7, 9, 11]:
-                content += note("D", 4, 256, "quarter", slur_s=True, harmonic=True, acc=True)
-                content += note("A", 3, 256, "quarter", harmonic=True)
-                content += note("F", 4, 256, "quarter", harmonic=True)
-                content += note("D", 4, 256, "quarter", slur_e=True, harmonic=True)
-            else:
-                content += rest(1024, "whole")
-        elif part_id == "P10":  # Glockenspiel
-            if bar == 9:
-                content += note("A", 6, 256, "quarter", acc=True)
-                content += rest(768, "half", dot=True)
-            elif bar == 12:
-                content += rest(768, "half", dot=True)
-                content += note("D", 6, 256, "quarter", ferm=True)
-            else:
-                content += rest(1024, "whole")
-        
-        if bar == 11 and part_id == "P1":
-            content += direction("rit., dissolving")
-        if bar == 12:
-            content += barline("light-heavy")
-        
-        content += '    </measure>\n'
+            return 14
+        elif bar == 10:
+            return 15
+        elif bar == 11:
+            return 16
+        elif bar == 12:
+            return 17
+    elif part_id == "P5":  # Violin II - sustained A
+        return 18
+    elif part_id == "P6":  # Viola - sustained F
+        return 19
+    elif part_id == "P7":  # Cello - D pedal
+        return 20
+    elif part_id == "P8":  # Bass
+        return 21
+    elif part_id == "P9":  # Guitar - T-voice harmonics
+        if bar in [1, 3, 5, 7, 9, 11]:
+            return 22
+        else:
+            return None
+    elif part_id == "P10":  # Glockenspiel
+        if bar == 9:
+            return 23
+        elif bar == 12:
+            return 24
+        else:
+            return None
+    return 0
+
+def _movement5_measure(part_id, bar, first_part, clef_sign, clef_line, start_bar):
+    """Body of one bar: opening marks, the notes, closing marks."""
+    content = ""
+    if bar == 1:
+        content += measure_attrs(256, -1, 4, 4, clef_sign, clef_line, new_page=True)
+        if first_part:
+            content += '        <direction placement="above"><direction-type><words font-size="14" font-weight="bold">V. Tintinnabuli Epilogue</words></direction-type></direction>\n'
+            content += direction("Serene, like a prayer", tempo=52)
+        content += direction(dynamic="ppp")
+        content += harmony("D", "minor", [(9, 0, "add")])
+    elif bar == 5:
+        if first_part:
+            content += direction("breathing")
+    elif bar == 9:
+        if first_part:
+            content += direction("transcendent")
+    content += _movement5_notes(part_id, bar)
+    if bar == 11 and first_part:
+        content += direction("rit., dissolving")
+    if bar == 12:
+        content += barline("light-heavy")
     return content
 
+def gen_movement5(part_id, clef_sign, clef_line, start_bar=49, out=None):
+    content = ScoreWriter(out)
+    first_part = part_id == "P1"
+    for bar in range(1, 13):
+        marks = bar if bar in _MOVEMENT5_MARKED_BARS else 0
+        key = (5, _movement5_role(part_id, bar), marks, first_part, clef_sign, clef_line, start_bar)
+        content += MEASURES.measure(bar, key, _movement5_measure,
+                                    part_id, bar, first_part, clef_sign, clef_line, start_bar)
+    return content.finish()
+
+# ============ PARALLEL ASSEMBLY ============
+# (generator, start bar) in score order
+MOVEMENTS = [
+    (gen_movement1, 1),
+    (gen_movement2, 13),
+    (gen_movement3, 25),
+    (gen_movement4, 37),
+    (gen_movement5, 49),
+]
+
+def render_fragment(task):
+    """One part x movement fragment (module level so pool workers can run it)."""
+    movement, part_id, clef_sign, clef_line = task
+    generator, start_bar = MOVEMENTS[movement]
+    return generator(part_id, clef_sign, clef_line, start_bar=start_bar)
+
+def write_parts_parallel(full_score, parts, jobs):
+    """
+    Render every part x movement fragment in a process pool and stitch them
+    into full_score in part order. pool.map() returns results in submission
+    order, so the output is byte-identical to the serial loop.
+    """
+    tasks = [(movement, part_id, clef_sign, clef_line)
+             for part_id, _, clef_sign, clef_line in parts
+             for movement in range(len(MOVEMENTS))]
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        fragments = pool.map(render_fragment, tasks, chunksize=len(MOVEMENTS))
+        for part_id, part_name, _, _ in parts:
+            print(f"  Generating {part_name}...")
+            full_score += f'  <part id="{part_id}">\n'
+            for _ in MOVEMENTS:
+                full_score += next(fragments)
+            full_score += part_footer()
+
 # ============ MAIN ============
 def main():
     scores_dir = os.path.join(os.path.dirname(__file__), "..", "scores")
+    jobs = parse_jobs(sys.argv[1:])
+    configure_output(sys.argv[1:])
     
     print("=" * 70)
     print("FULL SCORE ASSEMBLY — MASTER PROMPT")
@@ -709,37 +1076,38 @@ def main():
         ("P10", "Glockenspiel", "G", 2),
     ]
     
-    # Generate full score
-    full_score = full_score_header()
-    
-    for part_id, part_name, clef_sign, clef_line in parts:
-        print(f"  Generating {part_name}...")
-        
-        full_score += f'  <part id="{part_id}">\n'
-        
-        # Movement I
-        full_score += gen_movement1(part_id, clef_sign, clef_line, start_bar=1)
-        
-        # Movement II
-        full_score += gen_movement2(part_id, clef_sign, clef_line, start_bar=13)
-        
-        # Movement III
-        full_score += gen_movement3(part_id, clef_sign, clef_line, start_bar=25)
-        
-        # Movement IV
-        full_score += gen_movement4(part_id, clef_sign, clef_line, start_bar=37)
-        
-        # Movement V
-        full_score += gen_movement5(part_id, clef_sign, clef_line, start_bar=49)
-        
-        full_score += part_footer()
-    
-    full_score += footer()
-    
-    # Write full score
+    # Generate full score, streaming each part straight to the file
     filepath = os.path.join(scores_dir, "Final-Suite-FullScore.musicxml")
-    with open(filepath, "w", encoding="utf-8") as f:
-        f.write(full_score)
+    with ScoreWriter(filepath) as full_score:
+        full_score += full_score_header()
+        
+        if jobs > 1:
+            print(f"  Parallel assembly: {jobs} worker processes")
+            write_parts_parallel(full_score, parts, jobs)
+        else:
+            for part_id, part_name, clef_sign, clef_line in parts:
+                print(f"  Generating {part_name}...")
+                
+                full_score += f'  <part id="{part_id}">\n'
+                
+                # Movement I
+                gen_movement1(part_id, clef_sign, clef_line, start_bar=1, out=full_score)
+                
+                # Movement II
+                gen_movement2(part_id, clef_sign, clef_line, start_bar=13, out=full_score)
+                
+                # Movement III
+                gen_movement3(part_id, clef_sign, clef_line, start_bar=25, out=full_score)
+                
+                # Movement IV
+                gen_movement4(part_id, clef_sign, clef_line, start_bar=37, out=full_score)
+                
+                # Movement V
+                gen_movement5(part_id, clef_sign, clef_line, start_bar=49, out=full_score)
+                
+                full_score += part_footer()
+            
+        full_score += footer()
     
     print()
     print("=" * 70)
@@ -19,13 +19,54 @@ ABSOLUTE PROTECTION RULES:
 6. Cello
 7. Double Bass
 8. Classical Guitar
+
+EVERY PART OF EVERY MOVEMENT:
+Parts are matched across movements by name (then id for unnamed parts) into
+one union part-list: the first movement's, with parts that only appear later
+inserted after their neighbour in the movement that introduces them. Where a
+movement lacks an instrument, the part gets tacet bars (whole-bar rests
+following that movement's time and key signatures), restating the part's
+clef at each movement start. Key changes are taken at concert pitch (the
+source part's <transpose> undone) and written in the tacet part's own
+transposition. The movement title goes on the top part of the score,
+the new-page break on every part.
+
+STREAMING ASSEMBLY (--stream):
+assemble_suite() builds the whole suite as one tree before writing it.
+assemble_suite_streaming() parses the movements in a process pool (--jobs N,
+0 = one per CPU), each worker returning its movement's measures,
+part by part, as serialized XML. The measures are renumbered in movement
+order as they arrive and appended to one spool file per part, which are
+concatenated into the output at the end, with at most N movements in
+flight, so peak memory is a few movements however many there are. The
+output is byte-identical to assemble_suite().
+
+COMMON TIME BASE:
+Movements written with different <divisions> (256 vs 480) are rescaled to
+the LCM of every movement's divisions before their measures are spliced in
+(see divisions_normalizer.py), so every bar of the suite adds up on one
+time base. Movements already on it are copied unchanged.
+
+Usage:
+    python scripts/assemble_prisms_suite.py [--stream] [--jobs N] [--compact] [--mxl]
 """
 
 import os
+import sys
+import tempfile
 import xml.etree.ElementTree as ET
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from copy import deepcopy
 from xml.dom import minidom
 from datetime import datetime
 
+from divisions_normalizer import normalize_divisions, suite_time_base
+from job_pool import parse_jobs
+from score_writer import (MUSICXML_DOCTYPE, ScoreWriter, configure_output, open_score,
+                          output_path, parse_score, write_tree)
+from transposition import choose_spelling, interval_fifths
+
 # Source files
 SOURCE_DIR = r"C:\Users\mike\Documents\Cursor AI Projects\large-ensemble-assistant\scores\Bora Lesson on 14 Dec 2025"
 OUTPUT_DIR = r"C:\Users\mike\Documents\Cursor AI Projects\large-ensemble-assistant\scores\Bora Lesson on 14 Dec 2025"
@@ -46,6 +87,11 @@ MOVEMENT_TITLES = [
     "V. Tintinnabuli Prayer (Epilogue)"
 ]
 
+# <attributes> a tacet part restates at the start of each movement
+TACET_ATTRIBUTES = ('staves', 'clef', 'transpose')
+# Characters copied per read when a part's spool is written out
+SPOOL_CHUNK = 1 << 20
+
 def count_measures(part_element):
     """Count measures in a part element"""
     measures = part_element.findall('.//measure')
@@ -86,8 +132,8 @@ def create_credit_element(page, text, font_size, valign="bottom", halign="center
     credit_words.text = text
     return credit
 
-def add_movement_title_direction(measure, title):
-    """Add movement title as direction element at start of measure"""
+def create_movement_title(title):
+    """Movement title direction (bold, centered, above the staff)"""
     direction = ET.Element('direction', placement='above')
     direction_type = ET.SubElement(direction, 'direction-type')
     
@@ -97,16 +143,7 @@ def add_movement_title_direction(measure, title):
     words.set('font-size', '16')
     words.set('justify', 'center')
     words.text = title
-    
-    # Insert at beginning of measure (after attributes if present)
-    children = list(measure)
-    insert_pos = 0
-    for i, child in enumerate(children):
-        if child.tag == 'attributes':
-            insert_pos = i + 1
-            break
-    
-    measure.insert(insert_pos, direction)
+    return direction
 
 def add_new_page_directive(measure):
     """Add print element for new page at start of movement"""
@@ -126,6 +163,411 @@ def add_new_page_directive(measure):
                 break
         measure.insert(insert_pos, print_elem)
 
+def suite_header():
+    """work, identification and title-page credits shared by both assembly modes"""
+    return [
+        create_work_element(),
+        create_identification(),
+        # Main title
+        create_credit_element(1, "PRISMS", 36, "top", "center"),
+        create_credit_element(1, "A Suite in Five Colours", 20, "top", "center"),
+        create_credit_element(1, "Music by Michael Bryant", 14, "top", "center"),
+        # Copyright on first page (10pt)
+        create_credit_element(1, "(C) 2025 Michael Bryant. All Rights Reserved.", 10, "bottom", "center"),
+    ]
+
+def print_verification_report(original_counts, assembled_counts):
+    """Per-movement and total measure counts, original vs assembled"""
+    print("VERIFICATION REPORT")
+    print("-" * 40)
+    total_original = sum(original_counts)
+    total_assembled = sum(assembled_counts)
+    
+    for i, (title, orig, asm) in enumerate(zip(MOVEMENT_TITLES, original_counts, assembled_counts)):
+        status = "OK" if orig == asm else "MISMATCH"
+        print(f"  {title}")
+        print(f"    Original: {orig} | Assembled: {asm} | {status}")
+    
+    print()
+    print(f"TOTAL MEASURES:")
+    print(f"  Original: {total_original}")
+    print(f"  Assembled: {total_assembled}")
+    
+    if total_original == total_assembled:
+        print()
+        print("STATUS: ALL MEASURES PRESERVED - NO DELETIONS")
+        print()
+        print("ENGRAVING FIXES APPLIED:")
+        print("  - Movement titles added (centered, bold)")
+        print("  - New page breaks at movement boundaries")
+        print("  - Copyright placed on page 1 (10pt)")
+        print("  - Suite title page credits added")
+        print("  - Measure numbers renumbered sequentially")
+        print()
+        print("CONTENT VERIFICATION:")
+        print("  - NO notes altered")
+        print("  - NO rhythms changed")
+        print("  - NO dynamics modified")
+        print("  - NO articulations removed")
+        print("  - NO measures deleted")
+        print("  - NO multi-rests collapsed")
+        print("  - NO movements merged")
+    else:
+        print()
+        print("WARNING: MEASURE COUNT DISCREPANCY DETECTED!")
+
+def print_time_base():
+    """Common <divisions> of the movements (reported when they differ)"""
+    divisions, used = suite_time_base(os.path.join(SOURCE_DIR, f) for f in MOVEMENT_FILES)
+    if len(used) > 1:
+        print(f"Time base: {divisions} divisions per quarter (LCM of {', '.join(map(str, used))})")
+        print()
+    return divisions
+
+def print_rescaled(result, divisions):
+    if result['rescaled']:
+        print(f"  Rescaled {result['rescaled']} durations to {divisions} divisions")
+
+def _int(text, default=0):
+    try:
+        return int(round(float(text)))
+    except (TypeError, ValueError):
+        return default
+
+def _bare(elem):
+    """Serialize an element without its tail"""
+    tail, elem.tail = elem.tail, None
+    text = ET.tostring(elem, encoding='unicode')
+    elem.tail = tail
+    return text
+
+def part_key(score_part):
+    """Match key of a <score-part>: its normalized name, or its id when unnamed"""
+    name = score_part.findtext('part-name') or score_part.findtext('score-instrument/instrument-name') or ''
+    return ' '.join(name.lower().split()) or score_part.get('id')
+
+def _measure_length(measure, nominal):
+    """Furthest cursor position reached in a measure (nominal if it has no notes)"""
+    cursor = extent = 0
+    for child in measure:
+        if child.tag == 'note':
+            if child.find('chord') is None and child.find('grace') is None:
+                cursor += _int(child.findtext('duration'))
+        elif child.tag == 'backup':
+            cursor -= _int(child.findtext('duration'))
+        elif child.tag == 'forward':
+            cursor += _int(child.findtext('duration'))
+        extent = max(extent, cursor)
+    return extent or nominal
+
+def _interval(transpose):
+    """(diatonic, chromatic) written -> sounding of a <transpose>, None if absent"""
+    if transpose is None:
+        return None
+    return _int(transpose.findtext('diatonic')), _int(transpose.findtext('chromatic'))
+
+def _concert_key(key, interval):
+    """Copy of a written <key> at concert pitch for a part transposing by interval"""
+    fifths = key.find('fifths')
+    if fifths is None:
+        return key
+    key = deepcopy(key)
+    key.find('fifths').text = str(_int(fifths.text) + interval_fifths(*interval))
+    return key
+
+def _written_key(key, interval):
+    """Copy of a concert <key> as written for a part transposing by interval"""
+    fifths = key.find('fifths')
+    if fifths is None:
+        return key
+    key = deepcopy(key)
+    key.find('fifths').text = str(choose_spelling(_int(fifths.text), -interval[0], -interval[1])[1])
+    return key
+
+def movement_layout(part, divisions):
+    """
+    Per measure of a part: (length in divisions, serialized <key> / <time>
+    taking effect there) - what a tacet part needs to stay in step with it.
+    Keys are given at concert pitch.
+    """
+    layout = []
+    beats, beat_type = 4, 4
+    interval = None
+    for measure in part.findall('measure'):
+        changes = []
+        for attributes in measure.findall('attributes'):
+            if attributes.find('transpose') is not None:
+                interval = _interval(attributes.find('transpose'))
+            for child in attributes:
+                if child.tag == 'key' and interval:
+                    changes.append(_bare(_concert_key(child, interval)))
+                elif child.tag in ('key', 'time'):
+                    changes.append(_bare(child))
+                if child.tag == 'time':
+                    beats = sum(_int(b) for b in (child.findtext('beats') or '').split('+')) or 4
+                    beat_type = _int(child.findtext('beat-type'), 4) or 4
+        layout.append((_measure_length(measure, beats * 4 * divisions // beat_type), changes))
+    return layout
+
+def part_attributes(part):
+    """Serialized <staves>, <clef> and <transpose> of a part's first measure"""
+    attributes = part.find('measure/attributes')
+    if attributes is None:
+        return []
+    return [_bare(child) for child in attributes if child.tag in TACET_ATTRIBUTES]
+
+def tacet_measure(length, changes, own, divisions, first, new_page):
+    """
+    Whole-bar rest <measure> (without a number) for a part that does not
+    play in a movement; the first bar of a movement restates the time base
+    and the part's staves / clef / transpose.
+    """
+    measure = ET.Element('measure')
+    own = [ET.fromstring(text) for text in own]
+    staves = next((_int(elem.text, 1) for elem in own if elem.tag == 'staves'), 1)
+    children = [ET.fromstring(text) for text in changes]
+    interval = _interval(next((elem for elem in own if elem.tag == 'transpose'), None))
+    if interval:
+        children = [_written_key(elem, interval) if elem.tag == 'key' else elem for elem in children]
+    if first:
+        divisions_elem = ET.Element('divisions')
+        divisions_elem.text = str(divisions)
+        children = [divisions_elem] + children + own
+    if children:
+        ET.SubElement(measure, 'attributes').extend(children)
+    if new_page:
+        add_new_page_directive(measure)
+    if length <= 0:
+        return measure
+    for staff in range(1, staves + 1):
+        if staff > 1:
+            ET.SubElement(ET.SubElement(measure, 'backup'), 'duration').text = str(length)
+        note = ET.SubElement(measure, 'note')
+        ET.SubElement(note, 'rest', measure='yes')
+        ET.SubElement(note, 'duration').text = str(length)
+        ET.SubElement(note, 'voice').text = str(staff)
+        if staves > 1:
+            ET.SubElement(note, 'staff').text = str(staff)
+    return measure
+
+class PartUnion:
+    """
+    The parts of every movement merged into one part-list, in score order.
+    
+    Parts match across movements by name (<part-name>, else the instrument
+    name; the n-th part of a name in a movement matches the n-th in the
+    union) and unnamed parts by id. A part new in a later movement is placed
+    after its predecessor in that movement and keeps its source id unless
+    that is taken. The first movement's <part-list> is the base.
+    """
+    
+    def __init__(self, divisions):
+        self.divisions = divisions
+        self.part_list = None
+        self.ids = []           # union part ids in score order
+        self.names = {}         # union id -> part name
+        self.playing = {}       # union id -> movement indices it plays in
+        self.own = {}           # union id -> serialized staves / clef / transpose
+        self.placed = []        # (movement index, first measure number, layout)
+        self._keys = {}         # (match key, occurrence) -> union id
+        self.new = []           # union ids first seen in the last movement added
+    
+    def add_movement(self, part_list, part_ids):
+        """
+        Match a movement's parts (ids in document order) against the union,
+        adding the ones it has not seen. Returns {source id: union id}.
+        """
+        score_parts = {}
+        if part_list is not None:
+            score_parts = {sp.get('id'): sp for sp in part_list.iter('score-part')}
+        first = self.part_list is None
+        if first:
+            self.part_list = part_list if part_list is not None else ET.Element('part-list')
+            # Listed parts without music are dropped
+            for child in list(self.part_list):
+                if child.tag == 'score-part' and child.get('id') not in part_ids:
+                    self.part_list.remove(child)
+        mapping = {}
+        seen = {}
+        previous = None
+        self.new = []
+        for source_id in part_ids:
+            score_part = score_parts.get(source_id)
+            in_place = first and score_part is not None
+            if score_part is None:
+                score_part = ET.Element('score-part', id=source_id)
+                ET.SubElement(score_part, 'part-name').text = source_id
+            key = part_key(score_part)
+            occurrence = seen.get(key, 0)
+            seen[key] = occurrence + 1
+            union_id = self._keys.get((key, occurrence))
+            if union_id is None:
+                union_id = self._add_part(score_part, previous, in_place)
+                self._keys[(key, occurrence)] = union_id
+                self.new.append(union_id)
+            mapping[source_id] = union_id
+            previous = union_id
+        return mapping
+    
+    def _add_part(self, score_part, previous, in_place):
+        union_id = score_part.get('id')
+        if in_place:
+            self.ids.append(union_id)
+        else:
+            if union_id in self.ids:
+                n = len(self.ids) + 1
+                while f"P{n}" in self.ids:
+                    n += 1
+                union_id = f"P{n}"
+            score_part = deepcopy(score_part)
+            rename_part_ids(score_part, score_part.get('id'), union_id)
+            score_part.set('id', union_id)
+            # After its predecessor in the movement, else ahead of every part
+            children = list(self.part_list)
+            if previous is None:
+                position = next((i for i, c in enumerate(children) if c.tag == 'score-part'), len(children))
+                self.ids.insert(0, union_id)
+            else:
+                position = next(i for i, c in enumerate(children)
+                                if c.tag == 'score-part' and c.get('id') == previous) + 1
+                self.ids.insert(self.ids.index(previous) + 1, union_id)
+            self.part_list.insert(position, score_part)
+        self.names[union_id] = score_part.findtext('part-name') or union_id
+        self.playing[union_id] = []
+        return union_id
+    
+    def place(self, mvmt_idx, first_number, layout, own):
+        """Record a movement's measures; own maps the union ids playing to their attributes"""
+        self.placed.append((mvmt_idx, first_number, layout))
+        for union_id, attributes in own.items():
+            self.own[union_id] = attributes
+            self.playing[union_id].append(mvmt_idx)
+    
+    def tacet_measures(self, union_id, movement, start=0):
+        """(number, measure) tacet bars for a part in a placed movement"""
+        mvmt_idx, first_number, layout = movement
+        own = self.own.get(union_id, [])
+        for i in range(start, len(layout)):
+            length, changes = layout[i]
+            yield first_number + i, tacet_measure(length, changes, own, self.divisions,
+                                                  i == 0, i == 0 and mvmt_idx > 0)
+    
+    def schedule(self, counts):
+        """
+        Where every bar of the last placed movement goes, per part in order:
+        yields (union id, measure number, index into that part's measures, or
+        a tacet <measure>). counts gives the measures of each part playing;
+        parts new in this movement are first back-filled with tacet bars for
+        the earlier movements, and short parts are padded.
+        """
+        movement = self.placed[-1]
+        for union_id in self.new:
+            for earlier in self.placed[:-1]:
+                for number, measure in self.tacet_measures(union_id, earlier):
+                    yield union_id, number, measure
+        for union_id in self.ids:
+            count = min(counts.get(union_id, 0), len(movement[2]))
+            for i in range(count):
+                yield union_id, movement[1] + i, i
+            for number, measure in self.tacet_measures(union_id, movement, start=count):
+                yield union_id, number, measure
+    
+    def tacet_names(self, mvmt_idx):
+        return [self.names[i] for i in self.ids if mvmt_idx not in self.playing[i]]
+
+def rename_part_ids(elem, old, new):
+    """Re-point score-instrument / midi ids of the P1-I1 form to a new part id"""
+    if old == new:
+        return
+    prefix = f"{old}-"
+    for child in elem.iter():
+        value = child.get('id')
+        if value and value.startswith(prefix):
+            child.set('id', f"{new}-{value[len(prefix):]}")
+
+def _has_part_ids(elem, part_id):
+    """True if rename_part_ids() would change anything under elem"""
+    prefix = f"{part_id}-"
+    return any((child.get('id') or '').startswith(prefix) for child in elem.iter())
+
+def _rename_body(body, old, new):
+    """rename_part_ids() on a serialized measure body"""
+    measure = ET.fromstring(f'<measure>{body}</measure>')
+    rename_part_ids(measure, old, new)
+    return ''.join(ET.tostring(child, encoding='unicode') for child in measure)
+
+def split_movement(mvmt_root, mvmt_idx, divisions):
+    """
+    Normalize a parsed movement and split it into its parts' measures.
+    
+    Returns a dict: divisions (normalize_divisions() result), part_ids (in
+    document order), measures ({part id: [<measure>s without numbers],
+    the first with a new-page break after the first movement}),
+    own ({part id: serialized staves / clef / transpose}) and layout (the
+    longest part's movement_layout()). None if the movement has no parts.
+    """
+    parts = mvmt_root.findall('part')
+    if not parts:
+        return None
+    result = {'divisions': normalize_divisions(mvmt_root, divisions), 'part_ids': [],
+              'measures': {}, 'own': {}}
+    longest = max(parts, key=lambda part: len(part.findall('measure')))
+    result['layout'] = movement_layout(longest, divisions)
+    for p_idx, part in enumerate(parts):
+        part_id = part.get('id', f"P{p_idx + 1}")
+        result['part_ids'].append(part_id)
+        result['own'][part_id] = part_attributes(part)
+        measures = []
+        for m_idx, measure in enumerate(part.findall('measure')):
+            new_measure = ET.Element('measure')
+            if m_idx == 0 and mvmt_idx > 0:
+                add_new_page_directive(new_measure)
+            for child in measure:
+                new_measure.append(child)
+            measures.append(new_measure)
+        result['measures'][part_id] = measures
+    return result
+
+def print_parts(union, mapping, mvmt_idx):
+    new = [union.names[i] for i in union.new]
+    tacet = union.tacet_names(mvmt_idx)
+    print(f"  Parts: {len(mapping)} playing" + (f", {len(tacet)} tacet" if tacet else ""))
+    if new and mvmt_idx > 0:
+        print(f"  New parts: {', '.join(new)}")
+
+def print_padded(union, measures, count):
+    short = [union.names[i] for i, m in measures.items() if len(m) < count]
+    if short:
+        print(f"  Short parts padded with tacet bars: {', '.join(short)}")
+
+def verify_movement(union, measures, appended, count):
+    """
+    Check the bars appended to every part for a movement against its length.
+    Returns the assembled count: count, or the first differing part's.
+    """
+    wrong = [(union_id, appended.get(union_id, 0)) for union_id in union.ids
+             if appended.get(union_id, 0) != count]
+    assembled = wrong[0][1] if wrong else count
+    print(f"  Assembled measures: {assembled}")
+    print_padded(union, measures, count)
+    if wrong:
+        print(f"  WARNING: Measure count mismatch! "
+              + ', '.join(f"{union.names[union_id]}: {n}" for union_id, n in wrong))
+    else:
+        print(f"  VERIFIED: All measures preserved")
+    return assembled
+
+def print_part_report(union):
+    """Which movements each part of the union plays in"""
+    print("PARTS")
+    print("-" * 40)
+    for union_id in union.ids:
+        playing = union.playing[union_id]
+        movements = ', '.join(str(i + 1) for i in playing)
+        note = "all movements" if len(playing) == len(union.placed) else f"movements {movements}"
+        print(f"  {union_id:<5} {union.names[union_id]:<28} {note}")
+    print()
+
 def assemble_suite():
     """Main assembly function"""
     print("=" * 60)
@@ -137,35 +579,17 @@ def assemble_suite():
     original_counts = []
     assembled_counts = []
     
+    divisions = print_time_base()
+    
     # Create root element
     root = ET.Element('score-partwise', version='3.1')
     
-    # Add work element
-    root.append(create_work_element())
-    
-    # Add identification
-    root.append(create_identification())
+    # Add work, identification and credits (title page)
+    root.extend(suite_header())
     
-    # Add credits (title page)
-    # Main title
-    root.append(create_credit_element(1, "PRISMS", 36, "top", "center"))
-    root.append(create_credit_element(1, "A Suite in Five Colours", 20, "top", "center"))
-    root.append(create_credit_element(1, "Music by Michael Bryant", 14, "top", "center"))
-    
-    # Copyright on first page (10pt)
-    root.append(create_credit_element(1, "(C) 2025 Michael Bryant. All Rights Reserved.", 10, "bottom", "center"))
-    
-    # Part list (from first movement as template)
-    first_file = os.path.join(SOURCE_DIR, MOVEMENT_FILES[0])
-    first_tree = ET.parse(first_file)
-    first_root = first_tree.getroot()
-    
-    part_list = first_root.find('part-list')
-    if part_list is not None:
-        root.append(part_list)
-    
-    # Create the combined part
-    combined_part = ET.Element('part', id='P1')
+    # Union part-list (first movement's, plus parts new in later movements)
+    union = PartUnion(divisions)
+    parts = {}
     
     global_measure_number = 0
     
@@ -177,74 +601,61 @@ def assemble_suite():
         print(f"  Source: {filename}")
         
         try:
-            tree = ET.parse(filepath)
+            tree = parse_score(filepath)
             mvmt_root = tree.getroot()
         except Exception as e:
             print(f"  ERROR: Failed to parse {filename}: {e}")
             continue
         
-        # Find the part
-        part = mvmt_root.find('.//part')
-        if part is None:
+        movement = split_movement(mvmt_root, mvmt_idx, divisions)
+        if movement is None:
             print(f"  ERROR: No part found in {filename}")
             continue
+        print_rescaled(movement['divisions'], divisions)
         
         # Count original measures
-        measures = part.findall('measure')
-        original_count = len(measures)
+        original_count = len(movement['layout'])
         original_counts.append(original_count)
         print(f"  Original measures: {original_count}")
         
-        mvmt_measure_count = 0
+        mapping = union.add_movement(mvmt_root.find('part-list'), movement['part_ids'])
+        union.place(mvmt_idx, global_measure_number + 1, movement['layout'],
+                    {mapping[i]: movement['own'][i] for i in movement['part_ids']})
+        measures = {}
+        for part_id, union_id in mapping.items():
+            measures[union_id] = movement['measures'][part_id]
+            for measure in measures[union_id]:
+                rename_part_ids(measure, part_id, union_id)
+        print_parts(union, mapping, mvmt_idx)
         
-        for m_idx, measure in enumerate(measures):
-            global_measure_number += 1
-            mvmt_measure_count += 1
-            
-            # Create a copy of the measure
-            new_measure = ET.Element('measure', number=str(global_measure_number))
-            
-            # For first measure of movement (except first movement)
-            if m_idx == 0:
-                # Add new page directive
-                if mvmt_idx > 0:
-                    add_new_page_directive(new_measure)
-                
-                # Add movement title
-                add_movement_title_direction(new_measure, title)
-            
-            # Copy all children from original measure
-            for child in measure:
-                new_measure.append(child)
-            
-            combined_part.append(new_measure)
+        appended = {}
+        for union_id, number, measure in union.schedule({i: len(m) for i, m in measures.items()}):
+            if union_id not in parts:
+                parts[union_id] = ET.Element('part', id=union_id)
+            if number > global_measure_number:
+                appended[union_id] = appended.get(union_id, 0) + 1
+            if isinstance(measure, int):
+                measure = measures[union_id][measure]
+            if number == global_measure_number + 1 and union_id == union.ids[0]:
+                # Movement title on the top staff, ahead of the bar's content
+                measure.insert(0, create_movement_title(title))
+            measure.set('number', str(number))
+            parts[union_id].append(measure)
         
-        assembled_counts.append(mvmt_measure_count)
-        print(f"  Assembled measures: {mvmt_measure_count}")
-        
-        # Verify no measures were lost
-        if original_count != mvmt_measure_count:
-            print(f"  WARNING: Measure count mismatch!")
-        else:
-            print(f"  VERIFIED: All measures preserved")
+        global_measure_number += original_count
+        assembled_counts.append(verify_movement(union, measures, appended, original_count))
         print()
     
-    root.append(combined_part)
+    if union.part_list is not None:
+        root.append(union.part_list)
+    for union_id in union.ids:
+        root.append(parts[union_id])
     
     # Create output
     output_file = os.path.join(OUTPUT_DIR, "PRISMS-FullScore-Orchestrated-Hybrid.musicxml")
     
-    # Write XML with declaration
-    xml_str = ET.tostring(root, encoding='unicode')
-    
-    # Add XML declaration and DOCTYPE
-    full_xml = '<?xml version="1.0" encoding="UTF-8"?>\n'
-    full_xml += '<!DOCTYPE score-partwise PUBLIC "-//Recordare//DTD MusicXML 3.1 Partwise//EN" '
-    full_xml += '"http://www.musicxml.org/dtds/partwise.dtd">\n'
-    full_xml += xml_str
-    
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(full_xml)
+    # Write XML with declaration and DOCTYPE
+    output_file = write_tree(root, output_file, indent=None)
     
     print("=" * 60)
     print("ASSEMBLY COMPLETE")
@@ -253,47 +664,174 @@ def assemble_suite():
     print(f"Output: {output_file}")
     print()
     
-    # Final verification report
-    print("VERIFICATION REPORT")
-    print("-" * 40)
-    total_original = sum(original_counts)
-    total_assembled = sum(assembled_counts)
+    print_part_report(union)
+    print_verification_report(original_counts, assembled_counts)
     
-    for i, (title, orig, asm) in enumerate(zip(MOVEMENT_TITLES, original_counts, assembled_counts)):
-        status = "OK" if orig == asm else "MISMATCH"
-        print(f"  {title}")
-        print(f"    Original: {orig} | Assembled: {asm} | {status}")
+    return output_file
+
+def prepare_movement(task):
+    """
+    Parse one movement and render its parts (runs in a worker process).
     
-    print()
-    print(f"TOTAL MEASURES:")
-    print(f"  Original: {total_original}")
-    print(f"  Assembled: {total_assembled}")
+    Returns a dict: error (message or None), part_list (serialized
+    <part-list>, without its tail), part_list_tail, and the split_movement()
+    result with each measure's children serialized (the caller adds the
+    numbered <measure> wrapper) and renamable ({part id: indices of the
+    measures holding ids to re-point with rename_part_ids()}).
+    """
+    mvmt_idx, filepath, _, divisions = task
+    result = {'error': None, 'part_list': None, 'part_list_tail': None}
+    try:
+        mvmt_root = parse_score(filepath).getroot()
+    except Exception as e:
+        result['error'] = f"Failed to parse {os.path.basename(filepath)}: {e}"
+        return result
     
-    if total_original == total_assembled:
-        print()
-        print("STATUS: ALL MEASURES PRESERVED - NO DELETIONS")
-        print()
-        print("ENGRAVING FIXES APPLIED:")
-        print("  - Movement titles added (centered, bold)")
-        print("  - New page breaks at movement boundaries")
-        print("  - Copyright placed on page 1 (10pt)")
-        print("  - Suite title page credits added")
-        print("  - Measure numbers renumbered sequentially")
-        print()
-        print("CONTENT VERIFICATION:")
-        print("  - NO notes altered")
-        print("  - NO rhythms changed")
-        print("  - NO dynamics modified")
-        print("  - NO articulations removed")
-        print("  - NO measures deleted")
-        print("  - NO multi-rests collapsed")
-        print("  - NO movements merged")
-    else:
+    part_list = mvmt_root.find('part-list')
+    if part_list is not None:
+        result['part_list'] = _bare(part_list)
+        result['part_list_tail'] = part_list.tail
+    
+    movement = split_movement(mvmt_root, mvmt_idx, divisions)
+    if movement is None:
+        result['error'] = f"No part found in {os.path.basename(filepath)}"
+        return result
+    # Measures holding P1-I1 style ids, renamed on elements if the part's
+    # union id differs (the union is only known to the caller)
+    movement['renamable'] = {
+        part_id: [index for index, measure in enumerate(measures) if _has_part_ids(measure, part_id)]
+        for part_id, measures in movement['measures'].items()}
+    # tostring() of a child includes its tail, as in the whole-tree write
+    movement['measures'] = {
+        part_id: [''.join(ET.tostring(child, encoding='unicode') for child in measure)
+                  for measure in measures]
+        for part_id, measures in movement['measures'].items()}
+    result.update(movement)
+    return result
+
+def _in_order(tasks, jobs):
+    """prepare_movement() results in task order, at most `jobs` in flight"""
+    if jobs <= 1:
+        for task in tasks:
+            yield prepare_movement(task)
+        return
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        pending = deque()
+        for task in tasks:
+            pending.append(pool.submit(prepare_movement, task))
+            if len(pending) >= jobs:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+def _measure_xml(number, body):
+    if body:
+        return f'<measure number="{number}">{body}</measure>'
+    return f'<measure number="{number}" />'
+
+def assemble_suite_streaming(jobs=1):
+    """Assembly with parallel parsing, spooling each part's measures to disk"""
+    print("=" * 60)
+    print("PRISMS: A Suite in Five Colours - Assembly Engine (streaming)")
+    print("=" * 60)
+    print()
+    if jobs > 1:
+        print(f"Parallel parse: {jobs} worker processes")
         print()
-        print("WARNING: MEASURE COUNT DISCREPANCY DETECTED!")
+    
+    original_counts = []
+    assembled_counts = []
+    
+    divisions = print_time_base()
+    tasks = [(mvmt_idx, os.path.join(SOURCE_DIR, filename), title, divisions)
+             for mvmt_idx, (filename, title) in enumerate(zip(MOVEMENT_FILES, MOVEMENT_TITLES))]
+    output_file = output_path(os.path.join(OUTPUT_DIR, "PRISMS-FullScore-Orchestrated-Hybrid.musicxml"))
+    
+    union = PartUnion(divisions)
+    # One spool file per union part; the parts are concatenated at the end
+    spools = {}
+    global_measure_number = 0
+    try:
+        for (mvmt_idx, filepath, title, _), result in zip(tasks, _in_order(tasks, jobs)):
+            print(f"Processing: {title}")
+            print(f"  Source: {os.path.basename(filepath)}")
+            if result['error']:
+                print(f"  ERROR: {result['error']}")
+                continue
+            print_rescaled(result['divisions'], divisions)
+            
+            count = len(result['layout'])
+            original_counts.append(count)
+            print(f"  Original measures: {count}")
+            
+            part_list = None
+            if result['part_list'] is not None:
+                part_list = ET.fromstring(result['part_list'])
+                part_list.tail = result['part_list_tail']
+            mapping = union.add_movement(part_list, result['part_ids'])
+            union.place(mvmt_idx, global_measure_number + 1, result['layout'],
+                        {mapping[i]: result['own'][i] for i in result['part_ids']})
+            measures = {}
+            for part_id, union_id in mapping.items():
+                measures[union_id] = result['measures'][part_id]
+                if part_id != union_id:
+                    measures[union_id] = list(measures[union_id])
+                    for index in result['renamable'][part_id]:
+                        measures[union_id][index] = _rename_body(measures[union_id][index], part_id, union_id)
+            print_parts(union, mapping, mvmt_idx)
+            
+            appended = {}
+            for union_id, number, measure in union.schedule({i: len(m) for i, m in measures.items()}):
+                if union_id not in spools:
+                    spools[union_id] = tempfile.TemporaryFile('w+', encoding='utf-8')
+                if number > global_measure_number:
+                    appended[union_id] = appended.get(union_id, 0) + 1
+                if isinstance(measure, int):
+                    body = measures[union_id][measure]
+                else:
+                    body = ''.join(ET.tostring(child, encoding='unicode') for child in measure)
+                if number == global_measure_number + 1 and union_id == union.ids[0]:
+                    body = ET.tostring(create_movement_title(title), encoding='unicode') + body
+                spools[union_id].write(_measure_xml(number, body))
+            
+            global_measure_number += count
+            assembled_counts.append(verify_movement(union, measures, appended, count))
+            print()
+        
+        with open_score(output_file) as f, ScoreWriter(f) as out:
+            out += '<?xml version="1.0" encoding="UTF-8"?>\n' + MUSICXML_DOCTYPE + '\n'
+            out += '<score-partwise version="3.1">'
+            for elem in suite_header():
+                out += ET.tostring(elem, encoding='unicode')
+            if union.part_list is not None:
+                out += ET.tostring(union.part_list, encoding='unicode')
+            for union_id in union.ids:
+                out += f'<part id="{union_id}">'
+                spool = spools[union_id]
+                spool.seek(0)
+                for chunk in iter(lambda: spool.read(SPOOL_CHUNK), ''):
+                    out += chunk
+                out += '</part>'
+            out += '</score-partwise>'
+    finally:
+        for spool in spools.values():
+            spool.close()
+    
+    print("=" * 60)
+    print("ASSEMBLY COMPLETE")
+    print("=" * 60)
+    print()
+    print(f"Output: {output_file}")
+    print()
+    
+    print_part_report(union)
+    print_verification_report(original_counts, assembled_counts)
     
     return output_file
 
 if __name__ == '__main__':
-    assemble_suite()
-
+    configure_output(sys.argv[1:])
+    if '--stream' in sys.argv[1:]:
+        assemble_suite_streaming(parse_jobs(sys.argv[1:]))
+    else:
+        assemble_suite()
@@ -3,12 +3,18 @@
 AUTO-EXCELLENCE 4-MOVEMENT LEADSHEET GENERATOR
 The Master's Palette - Complete Suite
 Target: 8-9/10 on Music Criteria of Excellence
+Each movement is streamed into its output file through a ScoreWriter and
+scored from the written file.
 """
 
 import os
+import sys
+
+from score_features import extract_features, has_marker, stream_features
+from score_writer import ScoreWriter, configure_output, stream_if_changed
 
 # ============ SHARED UTILITIES ============
-def note(step, oct, dur, typ, alt=None, dot=False, chord=False, 
+def note(out, step, oct, dur, typ, alt=None, dot=False, chord=False, 
          slur_s=False, slur_e=False, acc=False, stac=False, ferm=False, 
          staff=1, tie_s=False, tie_e=False):
     x = "      <note>\n"
@@ -45,12 +51,12 @@ def note(step, oct, dur, typ, alt=None, dot=False, chord=False,
     if nots:
         x += "        <notations>" + "".join(nots) + "</notations>\n"
     x += "      </note>\n"
-    return x
+    out.write(x)
 
-def rest(dur, typ, staff=1):
-    return f"      <note><rest/><duration>{dur}</duration><type>{typ}</type><staff>{staff}</staff></note>\n"
+def rest(out, dur, typ, staff=1):
+    out.write(f"      <note><rest/><duration>{dur}</duration><type>{typ}</type><staff>{staff}</staff></note>\n")
 
-def harmony(root, kind, degs=None):
+def harmony(out, root, kind, degs=None):
     x = '      <harmony print-frame="no">\n'
     x += f'        <root><root-step>{root[0]}</root-step>'
     if len(root) > 1:
@@ -61,9 +67,9 @@ def harmony(root, kind, degs=None):
         for v, a, t in degs:
             x += f'        <degree><degree-value>{v}</degree-value><degree-alter>{a}</degree-alter><degree-type>{t}</degree-type></degree>\n'
     x += '      </harmony>\n'
-    return x
+    out.write(x)
 
-def direction(txt=None, dyn=None, tempo=None, place="above"):
+def direction(out, txt=None, dyn=None, tempo=None, place="above"):
     x = f'      <direction placement="{place}">\n        <direction-type>\n'
     if txt:
         x += f'          <words font-style="italic">{txt}</words>\n'
@@ -72,16 +78,16 @@ def direction(txt=None, dyn=None, tempo=None, place="above"):
     if tempo:
         x += f'          <metronome><beat-unit>quarter</beat-unit><per-minute>{tempo}</per-minute></metronome>\n'
     x += '        </direction-type>\n      </direction>\n'
-    return x
+    out.write(x)
 
-def backup(dur):
-    return f"      <backup><duration>{dur}</duration></backup>\n"
+def backup(out, dur):
+    out.write(f"      <backup><duration>{dur}</duration></backup>\n")
 
-def barline(style="light-heavy"):
-    return f'      <barline location="right"><bar-style>{style}</bar-style></barline>\n'
+def barline(out, style="light-heavy"):
+    out.write(f'      <barline location="right"><bar-style>{style}</bar-style></barline>\n')
 
-def header(title, key_fifths=0):
-    return f'''<?xml version="1.0" encoding="UTF-8"?>
+def header(out, title, key_fifths=0):
+    out.write(f'''<?xml version="1.0" encoding="UTF-8"?>
 <!DOCTYPE score-partwise PUBLIC "-//Recordare//DTD MusicXML 3.1 Partwise//EN" "http://www.musicxml.org/dtds/partwise.dtd">
 <score-partwise version="3.1">
   <work><work-title>{title}</work-title></work>
@@ -94,15 +100,15 @@ def header(title, key_fifths=0):
     <score-part id="P1"><part-name>Piano</part-name></score-part>
   </part-list>
   <part id="P1">
-'''
+''')
 
-def footer():
-    return '''  </part>
+def footer(out):
+    out.write('''  </part>
 </score-partwise>
-'''
+''')
 
-def attributes(key_fifths=0):
-    return f'''      <attributes>
+def attributes(out, key_fifths=0):
+    out.write(f'''      <attributes>
         <divisions>256</divisions>
         <key><fifths>{key_fifths}</fifths></key>
         <time><beats>4</beats><beat-type>4</beat-type></time>
@@ -110,848 +116,864 @@ def attributes(key_fifths=0):
         <clef number="1"><sign>G</sign><line>2</line></clef>
         <clef number="2"><sign>F</sign><line>4</line></clef>
       </attributes>
-'''
+''')
 
 # ============ MOVEMENT I: MINGUS BLUES CATHEDRAL ============
 # Motif: C4-Eb4-F4-Bb4-A4-F4-Eb4
-def generate_movement1():
-    m = ""
+def generate_movement1(out=None):
+    m = ScoreWriter(out)
+    header(m, "The Master's Palette - I. Mingus Blues Cathedral", -3)
     
     # Bar 1: Bold opening - Motif statement
     m += '    <measure number="1">\n'
-    m += attributes(-3)
-    m += direction("Slow gospel blues", tempo=56)
-    m += direction(dyn="mf")
-    m += harmony("C", "minor", [(9, 0, "add")])
-    m += note("C", 4, 256, "quarter", slur_s=True, acc=True)
-    m += note("E", 4, 256, "quarter", alt=-1)
-    m += note("F", 4, 256, "quarter")
-    m += note("B", 4, 256, "quarter", alt=-1, slur_e=True)
-    m += backup(1024)
-    m += note("C", 2, 384, "quarter", dot=True, staff=2)
-    m += note("G", 2, 384, "quarter", dot=True, chord=True, staff=2)
-    m += note("E", 3, 128, "eighth", alt=-1, staff=2)
-    m += note("B", 3, 128, "eighth", alt=-1, chord=True, staff=2)
-    m += note("D", 3, 256, "quarter", staff=2)
-    m += note("G", 3, 256, "quarter", chord=True, staff=2)
+    attributes(m, -3)
+    direction(m, "Slow gospel blues", tempo=56)
+    direction(m, dyn="mf")
+    harmony(m, "C", "minor", [(9, 0, "add")])
+    note(m, "C", 4, 256, "quarter", slur_s=True, acc=True)
+    note(m, "E", 4, 256, "quarter", alt=-1)
+    note(m, "F", 4, 256, "quarter")
+    note(m, "B", 4, 256, "quarter", alt=-1, slur_e=True)
+    backup(m, 1024)
+    note(m, "C", 2, 384, "quarter", dot=True, staff=2)
+    note(m, "G", 2, 384, "quarter", dot=True, chord=True, staff=2)
+    note(m, "E", 3, 128, "eighth", alt=-1, staff=2)
+    note(m, "B", 3, 128, "eighth", alt=-1, chord=True, staff=2)
+    note(m, "D", 3, 256, "quarter", staff=2)
+    note(m, "G", 3, 256, "quarter", chord=True, staff=2)
     m += '    </measure>\n'
     
     # Bar 2: Motif completion A-F-Eb + extension
     m += '    <measure number="2">\n'
-    m += harmony("F", "minor-seventh")
-    m += note("A", 4, 256, "quarter", slur_s=True)
-    m += note("F", 4, 256, "quarter")
-    m += note("E", 4, 384, "quarter", alt=-1, dot=True)
-    m += note("G", 4, 128, "eighth", slur_e=True)
-    m += backup(1024)
-    m += note("F", 2, 256, "quarter", staff=2)
-    m += note("C", 3, 256, "quarter", chord=True, staff=2)
-    m += note("E", 3, 256, "quarter", alt=-1, staff=2)
-    m += note("A", 3, 128, "eighth", alt=-1, chord=True, staff=2)
-    m += note("C", 3, 128, "eighth", staff=2)
-    m += note("E", 3, 256, "quarter", alt=-1, chord=True, staff=2)
+    harmony(m, "F", "minor-seventh")
+    note(m, "A", 4, 256, "quarter", slur_s=True)
+    note(m, "F", 4, 256, "quarter")
+    note(m, "E", 4, 384, "quarter", alt=-1, dot=True)
+    note(m, "G", 4, 128, "eighth", slur_e=True)
+    backup(m, 1024)
+    note(m, "F", 2, 256, "quarter", staff=2)
+    note(m, "C", 3, 256, "quarter", chord=True, staff=2)
+    note(m, "E", 3, 256, "quarter", alt=-1, staff=2)
+    note(m, "A", 3, 128, "eighth", alt=-1, chord=True, staff=2)
+    note(m, "C", 3, 128, "eighth", staff=2)
+    note(m, "E", 3, 256, "quarter", alt=-1, chord=True, staff=2)
     m += '    </measure>\n'
     
     # Bar 3: Sequence up P4
     m += '    <measure number="3">\n'
-    m += harmony("A", "dominant", [(9, 0, "add"), (13, 0, "add")])
-    m += note("F", 4, 256, "quarter", slur_s=True, acc=True)
-    m += note("A", 4, 256, "quarter", alt=-1)
-    m += note("B", 4, 256, "quarter", alt=-1)
-    m += note("E", 5, 256, "quarter", alt=-1, slur_e=True)
-    m += backup(1024)
-    m += note("A", 2, 384, "quarter", alt=-1, dot=True, staff=2)
-    m += note("E", 3, 128, "eighth", alt=-1, staff=2)
-    m += note("G", 3, 256, "quarter", chord=True, staff=2)
-    m += note("C", 3, 256, "quarter", staff=2)
-    m += note("F", 3, 256, "quarter", chord=True, staff=2)
+    harmony(m, "A", "dominant", [(9, 0, "add"), (13, 0, "add")])
+    note(m, "F", 4, 256, "quarter", slur_s=True, acc=True)
+    note(m, "A", 4, 256, "quarter", alt=-1)
+    note(m, "B", 4, 256, "quarter", alt=-1)
+    note(m, "E", 5, 256, "quarter", alt=-1, slur_e=True)
+    backup(m, 1024)
+    note(m, "A", 2, 384, "quarter", alt=-1, dot=True, staff=2)
+    note(m, "E", 3, 128, "eighth", alt=-1, staff=2)
+    note(m, "G", 3, 256, "quarter", chord=True, staff=2)
+    note(m, "C", 3, 256, "quarter", staff=2)
+    note(m, "F", 3, 256, "quarter", chord=True, staff=2)
     m += '    </measure>\n'
     
     # Bar 4: G7alt tension
     m += '    <measure number="4">\n'
-    m += harmony("G", "dominant", [(9, -1, "add"), (13, -1, "add")])
-    m += note("E", 5, 256, "quarter", alt=-1, slur_s=True)
-    m += note("D", 5, 256, "quarter")
-    m += note("C", 5, 256, "quarter")
-    m += note("B", 4, 256, "quarter", slur_e=True)
-    m += backup(1024)
-    m += note("G", 2, 256, "quarter", staff=2)
-    m += note("F", 3, 256, "quarter", staff=2)
-    m += note("A", 3, 128, "eighth", alt=-1, chord=True, staff=2)
-    m += note("D", 3, 256, "quarter", alt=-1, staff=2)
-    m += note("B", 2, 256, "quarter", staff=2)
-    m += note("F", 3, 256, "quarter", chord=True, staff=2)
+    harmony(m, "G", "dominant", [(9, -1, "add"), (13, -1, "add")])
+    note(m, "E", 5, 256, "quarter", alt=-1, slur_s=True)
+    note(m, "D", 5, 256, "quarter")
+    note(m, "C", 5, 256, "quarter")
+    note(m, "B", 4, 256, "quarter", slur_e=True)
+    backup(m, 1024)
+    note(m, "G", 2, 256, "quarter", staff=2)
+    note(m, "F", 3, 256, "quarter", staff=2)
+    note(m, "A", 3, 128, "eighth", alt=-1, chord=True, staff=2)
+    note(m, "D", 3, 256, "quarter", alt=-1, staff=2)
+    note(m, "B", 2, 256, "quarter", staff=2)
+    note(m, "F", 3, 256, "quarter", chord=True, staff=2)
     m += '    </measure>\n'
     
     # Bar 5: Motif syncopated
     m += '    <measure number="5">\n'
-    m += direction(dyn="f")
-    m += harmony("C", "minor", [(9, 0, "add")])
-    m += rest(128, "eighth")
-    m += note("C", 4, 128, "eighth", slur_s=True, acc=True)
-    m += note("E", 4, 256, "quarter", alt=-1)
-    m += note("F", 4, 384, "quarter", dot=True)
-    m += note("B", 4, 128, "eighth", alt=-1, slur_e=True)
-    m += backup(1024)
-    m += note("C", 2, 256, "quarter", staff=2)
-    m += note("G", 2, 256, "quarter", chord=True, staff=2)
-    m += note("E", 3, 256, "quarter", alt=-1, staff=2)
-    m += note("B", 3, 128, "eighth", alt=-1, chord=True, staff=2)
-    m += note("D", 3, 256, "quarter", staff=2)
-    m += note("G", 3, 256, "quarter", chord=True, staff=2)
+    direction(m, dyn="f")
+    harmony(m, "C", "minor", [(9, 0, "add")])
+    rest(m, 128, "eighth")
+    note(m, "C", 4, 128, "eighth", slur_s=True, acc=True)
+    note(m, "E", 4, 256, "quarter", alt=-1)
+    note(m, "F", 4, 384, "quarter", dot=True)
+    note(m, "B", 4, 128, "eighth", alt=-1, slur_e=True)
+    backup(m, 1024)
+    note(m, "C", 2, 256, "quarter", staff=2)
+    note(m, "G", 2, 256, "quarter", chord=True, staff=2)
+    note(m, "E", 3, 256, "quarter", alt=-1, staff=2)
+    note(m, "B", 3, 128, "eighth", alt=-1, chord=True, staff=2)
+    note(m, "D", 3, 256, "quarter", staff=2)
+    note(m, "G", 3, 256, "quarter", chord=True, staff=2)
     m += '    </measure>\n'
     
     # Bar 6: Motif inversion
     m += '    <measure number="6">\n'
-    m += harmony("E", "major-seventh", [(11, 1, "add")])
-    m += note("C", 5, 256, "quarter", slur_s=True)
-    m += note("A", 4, 256, "quarter")
-    m += note("G", 4, 256, "quarter")
-    m += note("D", 4, 256, "quarter", slur_e=True)
-    m += backup(1024)
-    m += note("E", 2, 384, "quarter", alt=-1, dot=True, staff=2)
-    m += note("B", 2, 128, "eighth", alt=-1, staff=2)
-    m += note("D", 3, 256, "quarter", chord=True, staff=2)
-    m += note("G", 3, 256, "quarter", staff=2)
-    m += note("A", 3, 256, "quarter", chord=True, staff=2)
+    harmony(m, "E", "major-seventh", [(11, 1, "add")])
+    note(m, "C", 5, 256, "quarter", slur_s=True)
+    note(m, "A", 4, 256, "quarter")
+    note(m, "G", 4, 256, "quarter")
+    note(m, "D", 4, 256, "quarter", slur_e=True)
+    backup(m, 1024)
+    note(m, "E", 2, 384, "quarter", alt=-1, dot=True, staff=2)
+    note(m, "B", 2, 128, "eighth", alt=-1, staff=2)
+    note(m, "D", 3, 256, "quarter", chord=True, staff=2)
+    note(m, "G", 3, 256, "quarter", staff=2)
+    note(m, "A", 3, 256, "quarter", chord=True, staff=2)
     m += '    </measure>\n'
     
     # Bar 7: Augmented motif
     m += '    <measure number="7">\n'
-    m += harmony("D", "half-diminished")
-    m += note("D", 4, 384, "quarter", dot=True, slur_s=True)
-    m += note("F", 4, 128, "eighth")
-    m += note("A", 4, 512, "half", alt=-1, slur_e=True)
-    m += backup(1024)
-    m += note("D", 3, 256, "quarter", staff=2)
-    m += note("A", 3, 256, "quarter", alt=-1, chord=True, staff=2)
-    m += note("C", 3, 256, "quarter", staff=2)
-    m += note("F", 3, 256, "quarter", chord=True, staff=2)
-    m += note("A", 3, 256, "quarter", alt=-1, staff=2)
-    m += note("D", 4, 256, "quarter", chord=True, staff=2)
+    harmony(m, "D", "half-diminished")
+    note(m, "D", 4, 384, "quarter", dot=True, slur_s=True)
+    note(m, "F", 4, 128, "eighth")
+    note(m, "A", 4, 512, "half", alt=-1, slur_e=True)
+    backup(m, 1024)
+    note(m, "D", 3, 256, "quarter", staff=2)
+    note(m, "A", 3, 256, "quarter", alt=-1, chord=True, staff=2)
+    note(m, "C", 3, 256, "quarter", staff=2)
+    note(m, "F", 3, 256, "quarter", chord=True, staff=2)
+    note(m, "A", 3, 256, "quarter", alt=-1, staff=2)
+    note(m, "D", 4, 256, "quarter", chord=True, staff=2)
     m += '    </measure>\n'
     
     # Bar 8: G7#9 tension peak
     m += '    <measure number="8">\n'
-    m += harmony("G", "dominant", [(9, 1, "add")])
-    m += note("A", 4, 256, "quarter", alt=-1, slur_s=True, acc=True)
-    m += note("G", 4, 256, "quarter")
-    m += note("F", 4, 128, "eighth", alt=1)
-    m += note("G", 4, 128, "eighth")
-    m += note("F", 4, 256, "quarter", slur_e=True)
-    m += backup(1024)
-    m += note("G", 2, 256, "quarter", staff=2)
-    m += note("B", 2, 256, "quarter", chord=True, staff=2)
-    m += note("F", 3, 256, "quarter", staff=2)
-    m += note("A", 3, 128, "eighth", alt=1, chord=True, staff=2)
-    m += note("D", 3, 256, "quarter", staff=2)
-    m += note("F", 3, 256, "quarter", chord=True, staff=2)
+    harmony(m, "G", "dominant", [(9, 1, "add")])
+    note(m, "A", 4, 256, "quarter", alt=-1, slur_s=True, acc=True)
+    note(m, "G", 4, 256, "quarter")
+    note(m, "F", 4, 128, "eighth", alt=1)
+    note(m, "G", 4, 128, "eighth")
+    note(m, "F", 4, 256, "quarter", slur_e=True)
+    backup(m, 1024)
+    note(m, "G", 2, 256, "quarter", staff=2)
+    note(m, "B", 2, 256, "quarter", chord=True, staff=2)
+    note(m, "F", 3, 256, "quarter", staff=2)
+    note(m, "A", 3, 128, "eighth", alt=1, chord=True, staff=2)
+    note(m, "D", 3, 256, "quarter", staff=2)
+    note(m, "F", 3, 256, "quarter", chord=True, staff=2)
     m += '    </measure>\n'
     
     # Bar 9: B section - brighter
     m += '    <measure number="9">\n'
-    m += direction("Brighter")
-    m += harmony("B", "major-seventh")
-    m += note("B", 4, 256, "quarter", alt=-1, slur_s=True, acc=True)
-    m += note("D", 5, 256, "quarter")
-    m += note("E", 5, 256, "quarter", alt=-1)
-    m += note("A", 5, 256, "quarter", alt=-1, slur_e=True)
-    m += backup(1024)
-    m += note("B", 2, 384, "quarter", alt=-1, dot=True, staff=2)
-    m += note("F", 3, 128, "eighth", staff=2)
-    m += note("A", 3, 256, "quarter", chord=True, staff=2)
-    m += note("D", 3, 256, "quarter", staff=2)
-    m += note("F", 3, 256, "quarter", chord=True, staff=2)
+    direction(m, "Brighter")
+    harmony(m, "B", "major-seventh")
+    note(m, "B", 4, 256, "quarter", alt=-1, slur_s=True, acc=True)
+    note(m, "D", 5, 256, "quarter")
+    note(m, "E", 5, 256, "quarter", alt=-1)
+    note(m, "A", 5, 256, "quarter", alt=-1, slur_e=True)
+    backup(m, 1024)
+    note(m, "B", 2, 384, "quarter", alt=-1, dot=True, staff=2)
+    note(m, "F", 3, 128, "eighth", staff=2)
+    note(m, "A", 3, 256, "quarter", chord=True, staff=2)
+    note(m, "D", 3, 256, "quarter", staff=2)
+    note(m, "F", 3, 256, "quarter", chord=True, staff=2)
     m += '    </measure>\n'
     
     # Bar 10: Eb9 lydian
     m += '    <measure number="10">\n'
-    m += harmony("E", "dominant", [(9, 0, "add")])
-    m += note("G", 5, 256, "quarter", slur_s=True)
-    m += note("B", 5, 256, "quarter", alt=-1)
-    m += note("C", 6, 256, "quarter")
-    m += note("F", 5, 256, "quarter", slur_e=True)
-    m += backup(1024)
-    m += note("E", 2, 256, "quarter", alt=-1, staff=2)
-    m += note("B", 2, 256, "quarter", alt=-1, chord=True, staff=2)
-    m += note("G", 3, 256, "quarter", staff=2)
-    m += note("D", 3, 128, "eighth", alt=-1, chord=True, staff=2)
-    m += note("F", 3, 256, "quarter", staff=2)
-    m += note("B", 2, 256, "quarter", alt=-1, chord=True, staff=2)
+    harmony(m, "E", "dominant", [(9, 0, "add")])
+    note(m, "G", 5, 256, "quarter", slur_s=True)
+    note(m, "B", 5, 256, "quarter", alt=-1)
+    note(m, "C", 6, 256, "quarter")
+    note(m, "F", 5, 256, "quarter", slur_e=True)
+    backup(m, 1024)
+    note(m, "E", 2, 256, "quarter", alt=-1, staff=2)
+    note(m, "B", 2, 256, "quarter", alt=-1, chord=True, staff=2)
+    note(m, "G", 3, 256, "quarter", staff=2)
+    note(m, "D", 3, 128, "eighth", alt=-1, chord=True, staff=2)
+    note(m, "F", 3, 256, "quarter", staff=2)
+    note(m, "B", 2, 256, "quarter", alt=-1, chord=True, staff=2)
     m += '    </measure>\n'
     
     # Bar 11: Return Fm9
     m += '    <measure number="11">\n'
-    m += direction(dyn="mf")
-    m += harmony("F", "minor", [(9, 0, "add")])
-    m += note("F", 5, 256, "quarter", slur_s=True)
-    m += note("E", 5, 256, "quarter", alt=-1)
-    m += note("C", 5, 256, "quarter")
-    m += note("B", 4, 256, "quarter", alt=-1, slur_e=True)
-    m += backup(1024)
-    m += note("F", 2, 384, "quarter", dot=True, staff=2)
-    m += note("C", 3, 128, "eighth", staff=2)
-    m += note("E", 3, 256, "quarter", alt=-1, chord=True, staff=2)
-    m += note("A", 2, 256, "quarter", alt=-1, staff=2)
-    m += note("G", 3, 256, "quarter", chord=True, staff=2)
+    direction(m, dyn="mf")
+    harmony(m, "F", "minor", [(9, 0, "add")])
+    note(m, "F", 5, 256, "quarter", slur_s=True)
+    note(m, "E", 5, 256, "quarter", alt=-1)
+    note(m, "C", 5, 256, "quarter")
+    note(m, "B", 4, 256, "quarter", alt=-1, slur_e=True)
+    backup(m, 1024)
+    note(m, "F", 2, 384, "quarter", dot=True, staff=2)
+    note(m, "C", 3, 128, "eighth", staff=2)
+    note(m, "E", 3, 256, "quarter", alt=-1, chord=True, staff=2)
+    note(m, "A", 2, 256, "quarter", alt=-1, staff=2)
+    note(m, "G", 3, 256, "quarter", chord=True, staff=2)
     m += '    </measure>\n'
     
     # Bar 12: Final cadence
     m += '    <measure number="12">\n'
-    m += direction("rit.")
-    m += direction(dyn="p")
-    m += harmony("D", "half-diminished")
-    m += note("A", 4, 256, "quarter", slur_s=True)
-    m += harmony("G", "dominant", [(9, -1, "add")])
-    m += note("F", 4, 256, "quarter")
-    m += harmony("C", "minor", [(9, 0, "add")])
-    m += note("E", 4, 256, "quarter", alt=-1)
-    m += note("C", 4, 256, "quarter", slur_e=True, ferm=True)
-    m += backup(1024)
-    m += note("D", 3, 256, "quarter", staff=2)
-    m += note("A", 3, 256, "quarter", alt=-1, chord=True, staff=2)
-    m += note("G", 2, 256, "quarter", staff=2)
-    m += note("F", 3, 256, "quarter", chord=True, staff=2)
-    m += note("C", 2, 256, "quarter", staff=2)
-    m += note("G", 2, 256, "quarter", chord=True, staff=2)
-    m += note("E", 3, 256, "quarter", alt=-1, chord=True, staff=2)
-    m += barline()
+    direction(m, "rit.")
+    direction(m, dyn="p")
+    harmony(m, "D", "half-diminished")
+    note(m, "A", 4, 256, "quarter", slur_s=True)
+    harmony(m, "G", "dominant", [(9, -1, "add")])
+    note(m, "F", 4, 256, "quarter")
+    harmony(m, "C", "minor", [(9, 0, "add")])
+    note(m, "E", 4, 256, "quarter", alt=-1)
+    note(m, "C", 4, 256, "quarter", slur_e=True, ferm=True)
+    backup(m, 1024)
+    note(m, "D", 3, 256, "quarter", staff=2)
+    note(m, "A", 3, 256, "quarter", alt=-1, chord=True, staff=2)
+    note(m, "G", 2, 256, "quarter", staff=2)
+    note(m, "F", 3, 256, "quarter", chord=True, staff=2)
+    note(m, "C", 2, 256, "quarter", staff=2)
+    note(m, "G", 2, 256, "quarter", chord=True, staff=2)
+    note(m, "E", 3, 256, "quarter", alt=-1, chord=True, staff=2)
+    barline(m)
     m += '    </measure>\n'
     
-    return header("The Master's Palette - I. Mingus Blues Cathedral", -3) + m + footer()
+    footer(m)
+    return m.finish()
 
 # ============ MOVEMENT II: GIL'S CANVAS ============
 # Motif: G4-A4-B4-F#5-E5-D5
-def generate_movement2():
-    m = ""
+def generate_movement2(out=None):
+    m = ScoreWriter(out)
+    header(m, "The Master's Palette - II. Gil's Canvas", 1)
     
     # Bar 1: Floating entrance
     m += '    <measure number="1">\n'
-    m += attributes(1)
-    m += direction("Floating, ethereal", tempo=52)
-    m += direction(dyn="p")
-    m += harmony("G", "major-seventh", [(11, 1, "add")])
-    m += note("G", 4, 512, "half", slur_s=True, acc=True)
-    m += note("A", 4, 256, "quarter")
-    m += note("B", 4, 256, "quarter", slur_e=True)
-    m += backup(1024)
-    m += note("G", 2, 384, "quarter", dot=True, staff=2)
-    m += note("D", 3, 128, "eighth", staff=2)
-    m += note("F", 3, 128, "eighth", alt=1, chord=True, staff=2)
-    m += note("B", 3, 256, "quarter", staff=2)
-    m += note("A", 3, 256, "quarter", chord=True, staff=2)
-    m += note("D", 3, 256, "quarter", staff=2)
+    attributes(m, 1)
+    direction(m, "Floating, ethereal", tempo=52)
+    direction(m, dyn="p")
+    harmony(m, "G", "major-seventh", [(11, 1, "add")])
+    note(m, "G", 4, 512, "half", slur_s=True, acc=True)
+    note(m, "A", 4, 256, "quarter")
+    note(m, "B", 4, 256, "quarter", slur_e=True)
+    backup(m, 1024)
+    note(m, "G", 2, 384, "quarter", dot=True, staff=2)
+    note(m, "D", 3, 128, "eighth", staff=2)
+    note(m, "F", 3, 128, "eighth", alt=1, chord=True, staff=2)
+    note(m, "B", 3, 256, "quarter", staff=2)
+    note(m, "A", 3, 256, "quarter", chord=True, staff=2)
+    note(m, "D", 3, 256, "quarter", staff=2)
     m += '    </measure>\n'
     
     # Bar 2: Motif completion F#-E-D
     m += '    <measure number="2">\n'
-    m += harmony("D", "major-seventh", [(9, 0, "add")])
-    m += note("F", 5, 384, "quarter", alt=1, dot=True, slur_s=True)
-    m += note("E", 5, 128, "eighth")
-    m += note("D", 5, 512, "half", slur_e=True)
-    m += backup(1024)
-    m += note("D", 2, 512, "half", staff=2)
-    m += note("A", 2, 512, "half", chord=True, staff=2)
-    m += note("C", 3, 256, "quarter", alt=1, staff=2)
-    m += note("E", 3, 256, "quarter", chord=True, staff=2)
-    m += note("F", 3, 256, "quarter", alt=1, staff=2)
+    harmony(m, "D", "major-seventh", [(9, 0, "add")])
+    note(m, "F", 5, 384, "quarter", alt=1, dot=True, slur_s=True)
+    note(m, "E", 5, 128, "eighth")
+    note(m, "D", 5, 512, "half", slur_e=True)
+    backup(m, 1024)
+    note(m, "D", 2, 512, "half", staff=2)
+    note(m, "A", 2, 512, "half", chord=True, staff=2)
+    note(m, "C", 3, 256, "quarter", alt=1, staff=2)
+    note(m, "E", 3, 256, "quarter", chord=True, staff=2)
+    note(m, "F", 3, 256, "quarter", alt=1, staff=2)
     m += '    </measure>\n'
     
     # Bar 3: Reordered motif
     m += '    <measure number="3">\n'
-    m += harmony("A", "major-seventh", [(11, 1, "add")])
-    m += note("E", 5, 256, "quarter", slur_s=True)
-    m += note("D", 5, 256, "quarter")
-    m += note("G", 5, 256, "quarter")
-    m += note("A", 5, 256, "quarter", slur_e=True)
-    m += backup(1024)
-    m += note("A", 2, 384, "quarter", dot=True, staff=2)
-    m += note("E", 3, 128, "eighth", staff=2)
-    m += note("G", 3, 256, "quarter", alt=1, chord=True, staff=2)
-    m += note("D", 3, 256, "quarter", alt=1, staff=2)
-    m += note("C", 4, 256, "quarter", alt=1, chord=True, staff=2)
+    harmony(m, "A", "major-seventh", [(11, 1, "add")])
+    note(m, "E", 5, 256, "quarter", slur_s=True)
+    note(m, "D", 5, 256, "quarter")
+    note(m, "G", 5, 256, "quarter")
+    note(m, "A", 5, 256, "quarter", slur_e=True)
+    backup(m, 1024)
+    note(m, "A", 2, 384, "quarter", dot=True, staff=2)
+    note(m, "E", 3, 128, "eighth", staff=2)
+    note(m, "G", 3, 256, "quarter", alt=1, chord=True, staff=2)
+    note(m, "D", 3, 256, "quarter", alt=1, staff=2)
+    note(m, "C", 4, 256, "quarter", alt=1, chord=True, staff=2)
     m += '    </measure>\n'
     
     # Bar 4: Long breath
     m += '    <measure number="4">\n'
-    m += harmony("E", "major-seventh", [(9, 0, "add")])
-    m += note("B", 5, 768, "half", dot=True, slur_s=True)
-    m += note("A", 5, 256, "quarter", slur_e=True)
-    m += backup(1024)
-    m += note("E", 2, 512, "half", staff=2)
-    m += note("B", 2, 512, "half", chord=True, staff=2)
-    m += note("G", 3, 256, "quarter", alt=1, staff=2)
-    m += note("D", 4, 256, "quarter", alt=1, chord=True, staff=2)
-    m += note("F", 3, 256, "quarter", alt=1, staff=2)
+    harmony(m, "E", "major-seventh", [(9, 0, "add")])
+    note(m, "B", 5, 768, "half", dot=True, slur_s=True)
+    note(m, "A", 5, 256, "quarter", slur_e=True)
+    backup(m, 1024)
+    note(m, "E", 2, 512, "half", staff=2)
+    note(m, "B", 2, 512, "half", chord=True, staff=2)
+    note(m, "G", 3, 256, "quarter", alt=1, staff=2)
+    note(m, "D", 4, 256, "quarter", alt=1, chord=True, staff=2)
+    note(m, "F", 3, 256, "quarter", alt=1, staff=2)
     m += '    </measure>\n'
     
     # Bar 5: A1 - higher register
     m += '    <measure number="5">\n'
-    m += direction(dyn="mp")
-    m += harmony("B", "major-seventh", [(11, 1, "add")])
-    m += note("G", 5, 256, "quarter", slur_s=True, acc=True)
-    m += note("A", 5, 256, "quarter")
-    m += note("B", 5, 256, "quarter")
-    m += note("F", 6, 256, "quarter", alt=1, slur_e=True)
-    m += backup(1024)
-    m += note("B", 2, 256, "quarter", staff=2)
-    m += note("F", 3, 256, "quarter", alt=1, chord=True, staff=2)
-    m += note("A", 3, 256, "quarter", alt=1, staff=2)
-    m += note("D", 4, 256, "quarter", alt=1, chord=True, staff=2)
-    m += note("E", 3, 256, "quarter", alt=1, staff=2)
-    m += note("B", 3, 256, "quarter", chord=True, staff=2)
+    direction(m, dyn="mp")
+    harmony(m, "B", "major-seventh", [(11, 1, "add")])
+    note(m, "G", 5, 256, "quarter", slur_s=True, acc=True)
+    note(m, "A", 5, 256, "quarter")
+    note(m, "B", 5, 256, "quarter")
+    note(m, "F", 6, 256, "quarter", alt=1, slur_e=True)
+    backup(m, 1024)
+    note(m, "B", 2, 256, "quarter", staff=2)
+    note(m, "F", 3, 256, "quarter", alt=1, chord=True, staff=2)
+    note(m, "A", 3, 256, "quarter", alt=1, staff=2)
+    note(m, "D", 4, 256, "quarter", alt=1, chord=True, staff=2)
+    note(m, "E", 3, 256, "quarter", alt=1, staff=2)
+    note(m, "B", 3, 256, "quarter", chord=True, staff=2)
     m += '    </measure>\n'
     
     # Bar 6: Descending dissolution
     m += '    <measure number="6">\n'
-    m += harmony("F#", "minor-seventh", [(9, 0, "add")])
-    m += note("E", 6, 512, "half", slur_s=True)
-    m += note("D", 6, 256, "quarter")
-    m += note("B", 5, 256, "quarter", slur_e=True)
-    m += backup(1024)
-    m += note("F", 2, 512, "half", alt=1, staff=2)
-    m += note("C", 3, 512, "half", alt=1, chord=True, staff=2)
-    m += note("E", 3, 256, "quarter", staff=2)
-    m += note("G", 3, 256, "quarter", alt=1, chord=True, staff=2)
+    harmony(m, "F#", "minor-seventh", [(9, 0, "add")])
+    note(m, "E", 6, 512, "half", slur_s=True)
+    note(m, "D", 6, 256, "quarter")
+    note(m, "B", 5, 256, "quarter", slur_e=True)
+    backup(m, 1024)
+    note(m, "F", 2, 512, "half", alt=1, staff=2)
+    note(m, "C", 3, 512, "half", alt=1, chord=True, staff=2)
+    note(m, "E", 3, 256, "quarter", staff=2)
+    note(m, "G", 3, 256, "quarter", alt=1, chord=True, staff=2)
     m += '    </measure>\n'
     
     # Bar 7: Expansion
     m += '    <measure number="7">\n'
-    m += harmony("C", "major-seventh", [(11, 1, "add")])
-    m += note("G", 5, 256, "quarter", slur_s=True)
-    m += note("B", 5, 384, "quarter", dot=True)
-    m += note("F", 5, 128, "eighth", alt=1)
-    m += note("A", 5, 256, "quarter", slur_e=True)
-    m += backup(1024)
-    m += note("C", 3, 384, "quarter", dot=True, staff=2)
-    m += note("G", 3, 128, "eighth", staff=2)
-    m += note("B", 3, 256, "quarter", chord=True, staff=2)
-    m += note("E", 3, 256, "quarter", staff=2)
-    m += note("F", 3, 256, "quarter", alt=1, chord=True, staff=2)
+    harmony(m, "C", "major-seventh", [(11, 1, "add")])
+    note(m, "G", 5, 256, "quarter", slur_s=True)
+    note(m, "B", 5, 384, "quarter", dot=True)
+    note(m, "F", 5, 128, "eighth", alt=1)
+    note(m, "A", 5, 256, "quarter", slur_e=True)
+    backup(m, 1024)
+    note(m, "C", 3, 384, "quarter", dot=True, staff=2)
+    note(m, "G", 3, 128, "eighth", staff=2)
+    note(m, "B", 3, 256, "quarter", chord=True, staff=2)
+    note(m, "E", 3, 256, "quarter", staff=2)
+    note(m, "F", 3, 256, "quarter", alt=1, chord=True, staff=2)
     m += '    </measure>\n'
     
     # Bar 8: Suspension
     m += '    <measure number="8">\n'
-    m += harmony("G", "major", [(9, 0, "add"), (11, 1, "add")])
-    m += note("D", 5, 768, "half", dot=True, slur_s=True)
-    m += note("E", 5, 256, "quarter", slur_e=True)
-    m += backup(1024)
-    m += note("G", 2, 512, "half", staff=2)
-    m += note("D", 3, 512, "half", chord=True, staff=2)
-    m += note("A", 3, 256, "quarter", staff=2)
-    m += note("C", 4, 256, "quarter", alt=1, chord=True, staff=2)
+    harmony(m, "G", "major", [(9, 0, "add"), (11, 1, "add")])
+    note(m, "D", 5, 768, "half", dot=True, slur_s=True)
+    note(m, "E", 5, 256, "quarter", slur_e=True)
+    backup(m, 1024)
+    note(m, "G", 2, 512, "half", staff=2)
+    note(m, "D", 3, 512, "half", chord=True, staff=2)
+    note(m, "A", 3, 256, "quarter", staff=2)
+    note(m, "C", 4, 256, "quarter", alt=1, chord=True, staff=2)
     m += '    </measure>\n'
     
     # Bar 9: Coda
     m += '    <measure number="9">\n'
-    m += direction("Coda - dissolving")
-    m += direction(dyn="pp")
-    m += harmony("E", "major-seventh", [(11, 1, "add")])
-    m += note("G", 5, 512, "half", slur_s=True, acc=True)
-    m += note("A", 5, 512, "half", slur_e=True)
-    m += backup(1024)
-    m += note("E", 2, 384, "quarter", dot=True, staff=2)
-    m += note("B", 2, 128, "eighth", staff=2)
-    m += note("G", 3, 256, "quarter", alt=1, chord=True, staff=2)
-    m += note("D", 4, 256, "quarter", alt=1, staff=2)
-    m += note("B", 3, 256, "quarter", chord=True, staff=2)
+    direction(m, "Coda - dissolving")
+    direction(m, dyn="pp")
+    harmony(m, "E", "major-seventh", [(11, 1, "add")])
+    note(m, "G", 5, 512, "half", slur_s=True, acc=True)
+    note(m, "A", 5, 512, "half", slur_e=True)
+    backup(m, 1024)
+    note(m, "E", 2, 384, "quarter", dot=True, staff=2)
+    note(m, "B", 2, 128, "eighth", staff=2)
+    note(m, "G", 3, 256, "quarter", alt=1, chord=True, staff=2)
+    note(m, "D", 4, 256, "quarter", alt=1, staff=2)
+    note(m, "B", 3, 256, "quarter", chord=True, staff=2)
     m += '    </measure>\n'
     
     # Bar 10: Final fade
     m += '    <measure number="10">\n'
-    m += harmony("A", "major-seventh", [(9, 0, "add")])
-    m += note("B", 5, 768, "half", dot=True, slur_s=True)
-    m += note("F", 5, 256, "quarter", alt=1, slur_e=True)
-    m += backup(1024)
-    m += note("A", 2, 512, "half", staff=2)
-    m += note("E", 3, 512, "half", chord=True, staff=2)
-    m += note("G", 3, 256, "quarter", alt=1, staff=2)
-    m += note("B", 3, 256, "quarter", chord=True, staff=2)
+    harmony(m, "A", "major-seventh", [(9, 0, "add")])
+    note(m, "B", 5, 768, "half", dot=True, slur_s=True)
+    note(m, "F", 5, 256, "quarter", alt=1, slur_e=True)
+    backup(m, 1024)
+    note(m, "A", 2, 512, "half", staff=2)
+    note(m, "E", 3, 512, "half", chord=True, staff=2)
+    note(m, "G", 3, 256, "quarter", alt=1, staff=2)
+    note(m, "B", 3, 256, "quarter", chord=True, staff=2)
     m += '    </measure>\n'
     
     # Bar 11: Final descent
     m += '    <measure number="11">\n'
-    m += direction("rit.")
-    m += harmony("D", "major-seventh", [(11, 1, "add")])
-    m += note("E", 5, 512, "half", slur_s=True)
-    m += note("D", 5, 512, "half", slur_e=True)
-    m += backup(1024)
-    m += note("D", 2, 512, "half", staff=2)
-    m += note("A", 2, 512, "half", chord=True, staff=2)
-    m += note("G", 3, 256, "quarter", alt=1, staff=2)
-    m += note("C", 4, 256, "quarter", alt=1, chord=True, staff=2)
+    direction(m, "rit.")
+    harmony(m, "D", "major-seventh", [(11, 1, "add")])
+    note(m, "E", 5, 512, "half", slur_s=True)
+    note(m, "D", 5, 512, "half", slur_e=True)
+    backup(m, 1024)
+    note(m, "D", 2, 512, "half", staff=2)
+    note(m, "A", 2, 512, "half", chord=True, staff=2)
+    note(m, "G", 3, 256, "quarter", alt=1, staff=2)
+    note(m, "C", 4, 256, "quarter", alt=1, chord=True, staff=2)
     m += '    </measure>\n'
     
     # Bar 12: Final chord
     m += '    <measure number="12">\n'
-    m += harmony("G", "major-seventh", [(9, 0, "add"), (11, 1, "add")])
-    m += note("G", 5, 1024, "whole", ferm=True)
-    m += backup(1024)
-    m += note("G", 2, 1024, "whole", staff=2)
-    m += note("D", 3, 1024, "whole", chord=True, staff=2)
-    m += note("F", 3, 1024, "whole", alt=1, chord=True, staff=2)
-    m += note("A", 3, 1024, "whole", chord=True, staff=2)
-    m += barline()
+    harmony(m, "G", "major-seventh", [(9, 0, "add"), (11, 1, "add")])
+    note(m, "G", 5, 1024, "whole", ferm=True)
+    backup(m, 1024)
+    note(m, "G", 2, 1024, "whole", staff=2)
+    note(m, "D", 3, 1024, "whole", chord=True, staff=2)
+    note(m, "F", 3, 1024, "whole", alt=1, chord=True, staff=2)
+    note(m, "A", 3, 1024, "whole", chord=True, staff=2)
+    barline(m)
     m += '    </measure>\n'
     
-    return header("The Master's Palette - II. Gil's Canvas", 1) + m + footer()
+    footer(m)
+    return m.finish()
 
 # ============ MOVEMENT III: BARTOK NIGHT ============
 # Motif: A4-Bb4-E5-B4-F5
-def generate_movement3():
-    m = ""
+def generate_movement3(out=None):
+    m = ScoreWriter(out)
+    header(m, "The Master's Palette - III. Bartok Night", 0)
     
     # Bar 1: Pointillistic opening
     m += '    <measure number="1">\n'
-    m += attributes(0)
-    m += direction("Mysterious, nocturnal", tempo=48)
-    m += direction(dyn="pp")
-    m += harmony("A", "minor", [(11, 0, "add")])
-    m += rest(256, "quarter")
-    m += note("A", 4, 256, "quarter", stac=True, acc=True)
-    m += rest(256, "quarter")
-    m += note("B", 4, 256, "quarter", alt=-1, stac=True)
-    m += backup(1024)
-    m += note("A", 2, 384, "quarter", dot=True, staff=2)
-    m += note("E", 3, 128, "eighth", staff=2)
-    m += note("D", 3, 256, "quarter", chord=True, staff=2)
-    m += note("G", 3, 256, "quarter", alt=1, staff=2)
-    m += note("B", 2, 256, "quarter", staff=2)
+    attributes(m, 0)
+    direction(m, "Mysterious, nocturnal", tempo=48)
+    direction(m, dyn="pp")
+    harmony(m, "A", "minor", [(11, 0, "add")])
+    rest(m, 256, "quarter")
+    note(m, "A", 4, 256, "quarter", stac=True, acc=True)
+    rest(m, 256, "quarter")
+    note(m, "B", 4, 256, "quarter", alt=-1, stac=True)
+    backup(m, 1024)
+    note(m, "A", 2, 384, "quarter", dot=True, staff=2)
+    note(m, "E", 3, 128, "eighth", staff=2)
+    note(m, "D", 3, 256, "quarter", chord=True, staff=2)
+    note(m, "G", 3, 256, "quarter", alt=1, staff=2)
+    note(m, "B", 2, 256, "quarter", staff=2)
     m += '    </measure>\n'
     
     # Bar 2: Motif E-B fragment
     m += '    <measure number="2">\n'
-    m += harmony("E", "minor", [(9, -1, "add")])
-    m += note("E", 5, 384, "quarter", dot=True, slur_s=True)
-    m += note("B", 4, 128, "eighth", slur_e=True)
-    m += rest(256, "quarter")
-    m += note("F", 5, 256, "quarter", stac=True)
-    m += backup(1024)
-    m += note("E", 2, 384, "quarter", dot=True, staff=2)
-    m += note("B", 2, 128, "eighth", staff=2)
-    m += note("F", 3, 256, "quarter", chord=True, staff=2)
-    m += note("G", 3, 256, "quarter", alt=1, staff=2)
-    m += note("D", 3, 256, "quarter", staff=2)
+    harmony(m, "E", "minor", [(9, -1, "add")])
+    note(m, "E", 5, 384, "quarter", dot=True, slur_s=True)
+    note(m, "B", 4, 128, "eighth", slur_e=True)
+    rest(m, 256, "quarter")
+    note(m, "F", 5, 256, "quarter", stac=True)
+    backup(m, 1024)
+    note(m, "E", 2, 384, "quarter", dot=True, staff=2)
+    note(m, "B", 2, 128, "eighth", staff=2)
+    note(m, "F", 3, 256, "quarter", chord=True, staff=2)
+    note(m, "G", 3, 256, "quarter", alt=1, staff=2)
+    note(m, "D", 3, 256, "quarter", staff=2)
     m += '    </measure>\n'
     
     # Bar 3: Registral displacement
     m += '    <measure number="3">\n'
-    m += harmony("B", "diminished-seventh")
-    m += note("A", 5, 256, "quarter", slur_s=True)
-    m += note("B", 3, 256, "quarter", alt=-1)
-    m += note("E", 5, 256, "quarter")
-    m += note("B", 4, 256, "quarter", slur_e=True)
-    m += backup(1024)
-    m += note("B", 2, 256, "quarter", staff=2)
-    m += note("F", 3, 256, "quarter", chord=True, staff=2)
-    m += note("A", 3, 256, "quarter", alt=-1, staff=2)
-    m += note("D", 4, 256, "quarter", chord=True, staff=2)
-    m += note("G", 3, 256, "quarter", alt=1, staff=2)
-    m += note("C", 4, 256, "quarter", alt=1, chord=True, staff=2)
+    harmony(m, "B", "diminished-seventh")
+    note(m, "A", 5, 256, "quarter", slur_s=True)
+    note(m, "B", 3, 256, "quarter", alt=-1)
+    note(m, "E", 5, 256, "quarter")
+    note(m, "B", 4, 256, "quarter", slur_e=True)
+    backup(m, 1024)
+    note(m, "B", 2, 256, "quarter", staff=2)
+    note(m, "F", 3, 256, "quarter", chord=True, staff=2)
+    note(m, "A", 3, 256, "quarter", alt=-1, staff=2)
+    note(m, "D", 4, 256, "quarter", chord=True, staff=2)
+    note(m, "G", 3, 256, "quarter", alt=1, staff=2)
+    note(m, "C", 4, 256, "quarter", alt=1, chord=True, staff=2)
     m += '    </measure>\n'
     
     # Bar 4: Sparse ending
     m += '    <measure number="4">\n'
-    m += harmony("F", "major-seventh", [(11, 1, "add")])
-    m += note("F", 5, 512, "half", slur_s=True)
-    m += rest(256, "quarter")
-    m += note("A", 4, 256, "quarter", slur_e=True)
-    m += backup(1024)
-    m += note("F", 2, 512, "half", staff=2)
-    m += note("C", 3, 512, "half", chord=True, staff=2)
-    m += note("E", 3, 256, "quarter", staff=2)
-    m += note("B", 3, 256, "quarter", chord=True, staff=2)
+    harmony(m, "F", "major-seventh", [(11, 1, "add")])
+    note(m, "F", 5, 512, "half", slur_s=True)
+    rest(m, 256, "quarter")
+    note(m, "A", 4, 256, "quarter", slur_e=True)
+    backup(m, 1024)
+    note(m, "F", 2, 512, "half", staff=2)
+    note(m, "C", 3, 512, "half", chord=True, staff=2)
+    note(m, "E", 3, 256, "quarter", staff=2)
+    note(m, "B", 3, 256, "quarter", chord=True, staff=2)
     m += '    </measure>\n'
     
     # Bar 5: Arc II - expansion
     m += '    <measure number="5">\n'
-    m += direction("Expanding")
-    m += direction(dyn="p")
-    m += harmony("D", "minor", [(9, 0, "add")])
-    m += note("A", 4, 256, "quarter", slur_s=True, acc=True)
-    m += note("B", 4, 256, "quarter", alt=-1)
-    m += note("E", 5, 512, "half", slur_e=True)
-    m += backup(1024)
-    m += note("D", 2, 256, "quarter", staff=2)
-    m += note("A", 2, 256, "quarter", staff=2)
-    m += note("F", 3, 256, "quarter", chord=True, staff=2)
-    m += note("E", 3, 256, "quarter", staff=2)
-    m += note("B", 3, 256, "quarter", chord=True, staff=2)
+    direction(m, "Expanding")
+    direction(m, dyn="p")
+    harmony(m, "D", "minor", [(9, 0, "add")])
+    note(m, "A", 4, 256, "quarter", slur_s=True, acc=True)
+    note(m, "B", 4, 256, "quarter", alt=-1)
+    note(m, "E", 5, 512, "half", slur_e=True)
+    backup(m, 1024)
+    note(m, "D", 2, 256, "quarter", staff=2)
+    note(m, "A", 2, 256, "quarter", staff=2)
+    note(m, "F", 3, 256, "quarter", chord=True, staff=2)
+    note(m, "E", 3, 256, "quarter", staff=2)
+    note(m, "B", 3, 256, "quarter", chord=True, staff=2)
     m += '    </measure>\n'
     
     # Bar 6: Inversion
     m += '    <measure number="6">\n'
-    m += harmony("G#", "diminished")
-    m += note("B", 4, 256, "quarter", slur_s=True)
-    m += note("F", 5, 256, "quarter")
-    m += note("A", 4, 256, "quarter")
-    m += note("E", 4, 256, "quarter", slur_e=True)
-    m += backup(1024)
-    m += note("G", 2, 256, "quarter", alt=1, staff=2)
-    m += note("D", 3, 256, "quarter", chord=True, staff=2)
-    m += note("B", 2, 256, "quarter", staff=2)
-    m += note("F", 3, 256, "quarter", chord=True, staff=2)
-    m += note("E", 3, 256, "quarter", staff=2)
-    m += note("A", 3, 256, "quarter", alt=-1, chord=True, staff=2)
+    harmony(m, "G#", "diminished")
+    note(m, "B", 4, 256, "quarter", slur_s=True)
+    note(m, "F", 5, 256, "quarter")
+    note(m, "A", 4, 256, "quarter")
+    note(m, "E", 4, 256, "quarter", slur_e=True)
+    backup(m, 1024)
+    note(m, "G", 2, 256, "quarter", alt=1, staff=2)
+    note(m, "D", 3, 256, "quarter", chord=True, staff=2)
+    note(m, "B", 2, 256, "quarter", staff=2)
+    note(m, "F", 3, 256, "quarter", chord=True, staff=2)
+    note(m, "E", 3, 256, "quarter", staff=2)
+    note(m, "A", 3, 256, "quarter", alt=-1, chord=True, staff=2)
     m += '    </measure>\n'
     
     # Bar 7: Climax build
     m += '    <measure number="7">\n'
-    m += direction(dyn="mf")
-    m += harmony("C", "augmented", [(9, 0, "add")])
-    m += note("E", 5, 256, "quarter", slur_s=True, acc=True)
-    m += note("B", 5, 256, "quarter")
-    m += note("F", 5, 256, "quarter")
-    m += note("A", 5, 256, "quarter", slur_e=True)
-    m += backup(1024)
-    m += note("C", 3, 256, "quarter", staff=2)
-    m += note("G", 3, 256, "quarter", alt=1, chord=True, staff=2)
-    m += note("E", 3, 256, "quarter", staff=2)
-    m += note("B", 3, 256, "quarter", chord=True, staff=2)
-    m += note("G", 3, 256, "quarter", staff=2)
-    m += note("D", 4, 256, "quarter", chord=True, staff=2)
+    direction(m, dyn="mf")
+    harmony(m, "C", "augmented", [(9, 0, "add")])
+    note(m, "E", 5, 256, "quarter", slur_s=True, acc=True)
+    note(m, "B", 5, 256, "quarter")
+    note(m, "F", 5, 256, "quarter")
+    note(m, "A", 5, 256, "quarter", slur_e=True)
+    backup(m, 1024)
+    note(m, "C", 3, 256, "quarter", staff=2)
+    note(m, "G", 3, 256, "quarter", alt=1, chord=True, staff=2)
+    note(m, "E", 3, 256, "quarter", staff=2)
+    note(m, "B", 3, 256, "quarter", chord=True, staff=2)
+    note(m, "G", 3, 256, "quarter", staff=2)
+    note(m, "D", 4, 256, "quarter", chord=True, staff=2)
     m += '    </measure>\n'
     
     # Bar 8: Peak
     m += '    <measure number="8">\n'
-    m += harmony("E", "dominant", [(9, -1, "add")])
-    m += note("B", 5, 384, "quarter", dot=True, slur_s=True, acc=True)
-    m += note("A", 5, 128, "eighth")
-    m += note("E", 5, 512, "half", slur_e=True)
-    m += backup(1024)
-    m += note("E", 2, 256, "quarter", staff=2)
-    m += note("B", 2, 256, "quarter", chord=True, staff=2)
-    m += note("G", 3, 256, "quarter", alt=1, staff=2)
-    m += note("D", 3, 256, "quarter", chord=True, staff=2)
-    m += note("F", 3, 256, "quarter", staff=2)
-    m += note("A", 3, 256, "quarter", alt=-1, chord=True, staff=2)
+    harmony(m, "E", "dominant", [(9, -1, "add")])
+    note(m, "B", 5, 384, "quarter", dot=True, slur_s=True, acc=True)
+    note(m, "A", 5, 128, "eighth")
+    note(m, "E", 5, 512, "half", slur_e=True)
+    backup(m, 1024)
+    note(m, "E", 2, 256, "quarter", staff=2)
+    note(m, "B", 2, 256, "quarter", chord=True, staff=2)
+    note(m, "G", 3, 256, "quarter", alt=1, staff=2)
+    note(m, "D", 3, 256, "quarter", chord=True, staff=2)
+    note(m, "F", 3, 256, "quarter", staff=2)
+    note(m, "A", 3, 256, "quarter", alt=-1, chord=True, staff=2)
     m += '    </measure>\n'
     
     # Bar 9: Arc III - dissolve
     m += '    <measure number="9">\n'
-    m += direction("Dissolving")
-    m += direction(dyn="p")
-    m += harmony("A", "minor-seventh")
-    m += note("A", 4, 512, "half", slur_s=True, acc=True)
-    m += note("B", 4, 256, "quarter", alt=-1)
-    m += rest(256, "quarter")
-    m += backup(1024)
-    m += note("A", 2, 256, "quarter", staff=2)
-    m += note("E", 3, 256, "quarter", chord=True, staff=2)
-    m += note("G", 3, 256, "quarter", staff=2)
-    m += note("C", 4, 256, "quarter", chord=True, staff=2)
-    m += note("D", 3, 256, "quarter", staff=2)
-    m += note("B", 3, 256, "quarter", chord=True, staff=2)
+    direction(m, "Dissolving")
+    direction(m, dyn="p")
+    harmony(m, "A", "minor-seventh")
+    note(m, "A", 4, 512, "half", slur_s=True, acc=True)
+    note(m, "B", 4, 256, "quarter", alt=-1)
+    rest(m, 256, "quarter")
+    backup(m, 1024)
+    note(m, "A", 2, 256, "quarter", staff=2)
+    note(m, "E", 3, 256, "quarter", chord=True, staff=2)
+    note(m, "G", 3, 256, "quarter", staff=2)
+    note(m, "C", 4, 256, "quarter", chord=True, staff=2)
+    note(m, "D", 3, 256, "quarter", staff=2)
+    note(m, "B", 3, 256, "quarter", chord=True, staff=2)
     m += '    </measure>\n'
     
     # Bar 10: Fragments
     m += '    <measure number="10">\n'
-    m += harmony("F", "major", [(9, 0, "add")])
-    m += rest(256, "quarter")
-    m += note("E", 5, 256, "quarter", stac=True)
-    m += rest(256, "quarter")
-    m += note("B", 4, 256, "quarter", slur_e=True)
-    m += backup(1024)
-    m += note("F", 2, 256, "quarter", staff=2)
-    m += note("C", 3, 256, "quarter", chord=True, staff=2)
-    m += rest(256, "quarter", staff=2)
-    m += note("A", 3, 256, "quarter", staff=2)
-    m += note("G", 3, 256, "quarter", staff=2)
+    harmony(m, "F", "major", [(9, 0, "add")])
+    rest(m, 256, "quarter")
+    note(m, "E", 5, 256, "quarter", stac=True)
+    rest(m, 256, "quarter")
+    note(m, "B", 4, 256, "quarter", slur_e=True)
+    backup(m, 1024)
+    note(m, "F", 2, 256, "quarter", staff=2)
+    note(m, "C", 3, 256, "quarter", chord=True, staff=2)
+    rest(m, 256, "quarter", staff=2)
+    note(m, "A", 3, 256, "quarter", staff=2)
+    note(m, "G", 3, 256, "quarter", staff=2)
     m += '    </measure>\n'
     
     # Bar 11: Near silence
     m += '    <measure number="11">\n'
-    m += direction("rit.")
-    m += direction(dyn="pp")
-    m += harmony("E", "minor")
-    m += note("F", 5, 256, "quarter", stac=True)
-    m += rest(512, "half")
-    m += note("A", 4, 256, "quarter")
-    m += backup(1024)
-    m += note("E", 2, 768, "half", dot=True, staff=2)
-    m += note("B", 2, 768, "half", dot=True, chord=True, staff=2)
-    m += note("G", 3, 256, "quarter", staff=2)
+    direction(m, "rit.")
+    direction(m, dyn="pp")
+    harmony(m, "E", "minor")
+    note(m, "F", 5, 256, "quarter", stac=True)
+    rest(m, 512, "half")
+    note(m, "A", 4, 256, "quarter")
+    backup(m, 1024)
+    note(m, "E", 2, 768, "half", dot=True, staff=2)
+    note(m, "B", 2, 768, "half", dot=True, chord=True, staff=2)
+    note(m, "G", 3, 256, "quarter", staff=2)
     m += '    </measure>\n'
     
     # Bar 12: Final whisper
     m += '    <measure number="12">\n'
-    m += harmony("A", "minor", [(9, 0, "add")])
-    m += note("A", 4, 1024, "whole", ferm=True)
-    m += backup(1024)
-    m += note("A", 2, 1024, "whole", staff=2)
-    m += note("E", 3, 1024, "whole", chord=True, staff=2)
-    m += note("B", 3, 1024, "whole", chord=True, staff=2)
-    m += barline()
+    harmony(m, "A", "minor", [(9, 0, "add")])
+    note(m, "A", 4, 1024, "whole", ferm=True)
+    backup(m, 1024)
+    note(m, "A", 2, 1024, "whole", staff=2)
+    note(m, "E", 3, 1024, "whole", chord=True, staff=2)
+    note(m, "B", 3, 1024, "whole", chord=True, staff=2)
+    barline(m)
     m += '    </measure>\n'
     
-    return header("The Master's Palette - III. Bartok Night", 0) + m + footer()
+    footer(m)
+    return m.finish()
 
 # ============ MOVEMENT IV: GERMAN DEVELOPMENT ============
 # Motif: C5-D5-E5-G#4-B4-D5
-def generate_movement4():
-    m = ""
+def generate_movement4(out=None):
+    m = ScoreWriter(out)
+    header(m, "The Master's Palette - IV. German Development", 0)
     
     # Bar 1: Exposition - Motif statement
     m += '    <measure number="1">\n'
-    m += attributes(0)
-    m += direction("Streng, mit Kraft", tempo=72)
-    m += direction(dyn="f")
-    m += harmony("C", "major", [(11, 1, "add")])
-    m += note("C", 5, 256, "quarter", slur_s=True, acc=True)
-    m += note("D", 5, 256, "quarter")
-    m += note("E", 5, 256, "quarter")
-    m += note("G", 4, 256, "quarter", alt=1, slur_e=True)
-    m += backup(1024)
-    m += note("C", 3, 256, "quarter", staff=2)
-    m += note("F", 3, 256, "quarter", chord=True, staff=2)
-    m += note("G", 3, 256, "quarter", staff=2)
-    m += note("D", 4, 256, "quarter", chord=True, staff=2)
-    m += note("E", 3, 256, "quarter", staff=2)
-    m += note("A", 3, 256, "quarter", chord=True, staff=2)
-    m += note("B", 2, 256, "quarter", staff=2)
+    attributes(m, 0)
+    direction(m, "Streng, mit Kraft", tempo=72)
+    direction(m, dyn="f")
+    harmony(m, "C", "major", [(11, 1, "add")])
+    note(m, "C", 5, 256, "quarter", slur_s=True, acc=True)
+    note(m, "D", 5, 256, "quarter")
+    note(m, "E", 5, 256, "quarter")
+    note(m, "G", 4, 256, "quarter", alt=1, slur_e=True)
+    backup(m, 1024)
+    note(m, "C", 3, 256, "quarter", staff=2)
+    note(m, "F", 3, 256, "quarter", chord=True, staff=2)
+    note(m, "G", 3, 256, "quarter", staff=2)
+    note(m, "D", 4, 256, "quarter", chord=True, staff=2)
+    note(m, "E", 3, 256, "quarter", staff=2)
+    note(m, "A", 3, 256, "quarter", chord=True, staff=2)
+    note(m, "B", 2, 256, "quarter", staff=2)
     m += '    </measure>\n'
     
     # Bar 2: Motif completion + sequence
     m += '    <measure number="2">\n'
-    m += harmony("E", "minor", [(9, 0, "add")])
-    m += note("B", 4, 256, "quarter", slur_s=True)
-    m += note("D", 5, 256, "quarter")
-    m += note("E", 5, 256, "quarter")
-    m += note("F", 5, 256, "quarter", alt=1, slur_e=True)
-    m += backup(1024)
-    m += note("E", 3, 256, "quarter", staff=2)
-    m += note("B", 3, 256, "quarter", chord=True, staff=2)
-    m += note("F", 3, 256, "quarter", alt=1, staff=2)
-    m += note("C", 4, 256, "quarter", alt=1, chord=True, staff=2)
-    m += note("G", 3, 256, "quarter", staff=2)
-    m += note("D", 4, 256, "quarter", chord=True, staff=2)
-    m += note("A", 3, 256, "quarter", alt=-1, staff=2)
+    harmony(m, "E", "minor", [(9, 0, "add")])
+    note(m, "B", 4, 256, "quarter", slur_s=True)
+    note(m, "D", 5, 256, "quarter")
+    note(m, "E", 5, 256, "quarter")
+    note(m, "F", 5, 256, "quarter", alt=1, slur_e=True)
+    backup(m, 1024)
+    note(m, "E", 3, 256, "quarter", staff=2)
+    note(m, "B", 3, 256, "quarter", chord=True, staff=2)
+    note(m, "F", 3, 256, "quarter", alt=1, staff=2)
+    note(m, "C", 4, 256, "quarter", alt=1, chord=True, staff=2)
+    note(m, "G", 3, 256, "quarter", staff=2)
+    note(m, "D", 4, 256, "quarter", chord=True, staff=2)
+    note(m, "A", 3, 256, "quarter", alt=-1, staff=2)
     m += '    </measure>\n'
     
     # Bar 3: Inversion
     m += '    <measure number="3">\n'
-    m += harmony("G#", "augmented")
-    m += note("C", 5, 256, "quarter", slur_s=True, acc=True)
-    m += note("B", 4, 256, "quarter", alt=-1)
-    m += note("A", 4, 256, "quarter", alt=-1)
-    m += note("E", 5, 256, "quarter", slur_e=True)
-    m += backup(1024)
-    m += note("G", 2, 256, "quarter", alt=1, staff=2)
-    m += note("D", 3, 256, "quarter", chord=True, staff=2)
-    m += note("C", 3, 256, "quarter", staff=2)
-    m += note("F", 3, 256, "quarter", alt=1, chord=True, staff=2)
-    m += note("E", 3, 256, "quarter", alt=-1, staff=2)
-    m += note("A", 3, 256, "quarter", chord=True, staff=2)
-    m += note("D", 3, 256, "quarter", staff=2)
+    harmony(m, "G#", "augmented")
+    note(m, "C", 5, 256, "quarter", slur_s=True, acc=True)
+    note(m, "B", 4, 256, "quarter", alt=-1)
+    note(m, "A", 4, 256, "quarter", alt=-1)
+    note(m, "E", 5, 256, "quarter", slur_e=True)
+    backup(m, 1024)
+    note(m, "G", 2, 256, "quarter", alt=1, staff=2)
+    note(m, "D", 3, 256, "quarter", chord=True, staff=2)
+    note(m, "C", 3, 256, "quarter", staff=2)
+    note(m, "F", 3, 256, "quarter", alt=1, chord=True, staff=2)
+    note(m, "E", 3, 256, "quarter", alt=-1, staff=2)
+    note(m, "A", 3, 256, "quarter", chord=True, staff=2)
+    note(m, "D", 3, 256, "quarter", staff=2)
     m += '    </measure>\n'
     
     # Bar 4: Retrograde
     m += '    <measure number="4">\n'
-    m += harmony("D", "dominant", [(9, -1, "add")])
-    m += note("D", 5, 256, "quarter", slur_s=True)
-    m += note("B", 4, 256, "quarter")
-    m += note("G", 4, 256, "quarter", alt=1)
-    m += note("E", 4, 256, "quarter", slur_e=True)
-    m += backup(1024)
-    m += note("D", 3, 384, "quarter", dot=True, staff=2)
-    m += note("A", 3, 128, "eighth", chord=True, staff=2)
-    m += note("E", 3, 256, "quarter", staff=2)
-    m += note("B", 3, 256, "quarter", chord=True, staff=2)
-    m += note("A", 2, 256, "quarter", alt=-1, staff=2)
+    harmony(m, "D", "dominant", [(9, -1, "add")])
+    note(m, "D", 5, 256, "quarter", slur_s=True)
+    note(m, "B", 4, 256, "quarter")
+    note(m, "G", 4, 256, "quarter", alt=1)
+    note(m, "E", 4, 256, "quarter", slur_e=True)
+    backup(m, 1024)
+    note(m, "D", 3, 384, "quarter", dot=True, staff=2)
+    note(m, "A", 3, 128, "eighth", chord=True, staff=2)
+    note(m, "E", 3, 256, "quarter", staff=2)
+    note(m, "B", 3, 256, "quarter", chord=True, staff=2)
+    note(m, "A", 2, 256, "quarter", alt=-1, staff=2)
     m += '    </measure>\n'
     
     # Bar 5: Transformation - augmented
     m += '    <measure number="5">\n'
-    m += direction("Breiter")
-    m += direction(dyn="mf")
-    m += harmony("F", "major-seventh", [(11, 1, "add")])
-    m += note("C", 5, 512, "half", slur_s=True)
-    m += note("D", 5, 512, "half", slur_e=True)
-    m += backup(1024)
-    m += note("F", 2, 256, "quarter", staff=2)
-    m += note("C", 3, 256, "quarter", chord=True, staff=2)
-    m += note("E", 3, 256, "quarter", staff=2)
-    m += note("B", 3, 256, "quarter", chord=True, staff=2)
-    m += note("A", 3, 256, "quarter", staff=2)
-    m += note("E", 4, 256, "quarter", chord=True, staff=2)
-    m += note("G", 3, 256, "quarter", staff=2)
+    direction(m, "Breiter")
+    direction(m, dyn="mf")
+    harmony(m, "F", "major-seventh", [(11, 1, "add")])
+    note(m, "C", 5, 512, "half", slur_s=True)
+    note(m, "D", 5, 512, "half", slur_e=True)
+    backup(m, 1024)
+    note(m, "F", 2, 256, "quarter", staff=2)
+    note(m, "C", 3, 256, "quarter", chord=True, staff=2)
+    note(m, "E", 3, 256, "quarter", staff=2)
+    note(m, "B", 3, 256, "quarter", chord=True, staff=2)
+    note(m, "A", 3, 256, "quarter", staff=2)
+    note(m, "E", 4, 256, "quarter", chord=True, staff=2)
+    note(m, "G", 3, 256, "quarter", staff=2)
     m += '    </measure>\n'
     
     # Bar 6: Continued
     m += '    <measure number="6">\n'
-    m += harmony("B", "half-diminished")
-    m += note("E", 5, 512, "half", slur_s=True)
-    m += note("G", 4, 512, "half", alt=1, slur_e=True)
-    m += backup(1024)
-    m += note("B", 2, 256, "quarter", staff=2)
-    m += note("F", 3, 256, "quarter", chord=True, staff=2)
-    m += note("A", 3, 256, "quarter", staff=2)
-    m += note("D", 4, 256, "quarter", chord=True, staff=2)
-    m += note("G", 3, 256, "quarter", alt=1, staff=2)
-    m += note("D", 4, 256, "quarter", alt=1, chord=True, staff=2)
-    m += note("F", 3, 256, "quarter", staff=2)
+    harmony(m, "B", "half-diminished")
+    note(m, "E", 5, 512, "half", slur_s=True)
+    note(m, "G", 4, 512, "half", alt=1, slur_e=True)
+    backup(m, 1024)
+    note(m, "B", 2, 256, "quarter", staff=2)
+    note(m, "F", 3, 256, "quarter", chord=True, staff=2)
+    note(m, "A", 3, 256, "quarter", staff=2)
+    note(m, "D", 4, 256, "quarter", chord=True, staff=2)
+    note(m, "G", 3, 256, "quarter", alt=1, staff=2)
+    note(m, "D", 4, 256, "quarter", alt=1, chord=True, staff=2)
+    note(m, "F", 3, 256, "quarter", staff=2)
     m += '    </measure>\n'
     
     # Bar 7: Diminution
     m += '    <measure number="7">\n'
-    m += direction(dyn="f")
-    m += harmony("A", "minor", [(9, 0, "add")])
-    m += note("C", 5, 128, "eighth", slur_s=True, acc=True)
-    m += note("D", 5, 128, "eighth")
-    m += note("E", 5, 128, "eighth")
-    m += note("G", 4, 128, "eighth", alt=1)
-    m += note("B", 4, 256, "quarter")
-    m += note("D", 5, 256, "quarter")
-    m += note("C", 5, 256, "quarter", slur_e=True)
-    m += backup(1024)
-    m += note("A", 2, 256, "quarter", staff=2)
-    m += note("E", 3, 256, "quarter", chord=True, staff=2)
-    m += note("D", 3, 256, "quarter", staff=2)
-    m += note("G", 3, 256, "quarter", chord=True, staff=2)
-    m += note("C", 3, 256, "quarter", staff=2)
-    m += note("F", 3, 256, "quarter", chord=True, staff=2)
-    m += note("B", 2, 256, "quarter", staff=2)
+    direction(m, dyn="f")
+    harmony(m, "A", "minor", [(9, 0, "add")])
+    note(m, "C", 5, 128, "eighth", slur_s=True, acc=True)
+    note(m, "D", 5, 128, "eighth")
+    note(m, "E", 5, 128, "eighth")
+    note(m, "G", 4, 128, "eighth", alt=1)
+    note(m, "B", 4, 256, "quarter")
+    note(m, "D", 5, 256, "quarter")
+    note(m, "C", 5, 256, "quarter", slur_e=True)
+    backup(m, 1024)
+    note(m, "A", 2, 256, "quarter", staff=2)
+    note(m, "E", 3, 256, "quarter", chord=True, staff=2)
+    note(m, "D", 3, 256, "quarter", staff=2)
+    note(m, "G", 3, 256, "quarter", chord=True, staff=2)
+    note(m, "C", 3, 256, "quarter", staff=2)
+    note(m, "F", 3, 256, "quarter", chord=True, staff=2)
+    note(m, "B", 2, 256, "quarter", staff=2)
     m += '    </measure>\n'
     
     # Bar 8: Registral split
     m += '    <measure number="8">\n'
-    m += harmony("E", "dominant", [(9, 1, "add")])
-    m += note("E", 5, 256, "quarter", slur_s=True)
-    m += note("G", 4, 256, "quarter", alt=1)
-    m += note("D", 6, 256, "quarter")
-    m += note("B", 4, 256, "quarter", slur_e=True)
-    m += backup(1024)
-    m += note("E", 2, 256, "quarter", staff=2)
-    m += note("B", 2, 256, "quarter", chord=True, staff=2)
-    m += note("F", 2, 256, "quarter", staff=2)
-    m += note("C", 3, 256, "quarter", chord=True, staff=2)
-    m += note("F", 2, 256, "quarter", alt=1, staff=2)
-    m += note("C", 3, 256, "quarter", alt=1, chord=True, staff=2)
-    m += note("G", 2, 256, "quarter", staff=2)
+    harmony(m, "E", "dominant", [(9, 1, "add")])
+    note(m, "E", 5, 256, "quarter", slur_s=True)
+    note(m, "G", 4, 256, "quarter", alt=1)
+    note(m, "D", 6, 256, "quarter")
+    note(m, "B", 4, 256, "quarter", slur_e=True)
+    backup(m, 1024)
+    note(m, "E", 2, 256, "quarter", staff=2)
+    note(m, "B", 2, 256, "quarter", chord=True, staff=2)
+    note(m, "F", 2, 256, "quarter", staff=2)
+    note(m, "C", 3, 256, "quarter", chord=True, staff=2)
+    note(m, "F", 2, 256, "quarter", alt=1, staff=2)
+    note(m, "C", 3, 256, "quarter", alt=1, chord=True, staff=2)
+    note(m, "G", 2, 256, "quarter", staff=2)
     m += '    </measure>\n'
     
     # Bar 9: Arrival - synthesis
     m += '    <measure number="9">\n'
-    m += direction("Ankunft")
-    m += direction(dyn="ff")
-    m += harmony("C", "major-seventh")
-    m += note("C", 5, 256, "quarter", slur_s=True, acc=True)
-    m += note("E", 5, 256, "quarter")
-    m += note("D", 5, 256, "quarter")
-    m += note("G", 5, 256, "quarter", alt=1, slur_e=True)
-    m += backup(1024)
-    m += note("C", 3, 256, "quarter", staff=2)
-    m += note("G", 3, 256, "quarter", chord=True, staff=2)
-    m += note("D", 4, 256, "quarter", chord=True, staff=2)
-    m += note("B", 2, 256, "quarter", staff=2)
-    m += note("F", 3, 256, "quarter", alt=1, chord=True, staff=2)
-    m += note("E", 3, 256, "quarter", staff=2)
-    m += note("A", 3, 256, "quarter", chord=True, staff=2)
+    direction(m, "Ankunft")
+    direction(m, dyn="ff")
+    harmony(m, "C", "major-seventh")
+    note(m, "C", 5, 256, "quarter", slur_s=True, acc=True)
+    note(m, "E", 5, 256, "quarter")
+    note(m, "D", 5, 256, "quarter")
+    note(m, "G", 5, 256, "quarter", alt=1, slur_e=True)
+    backup(m, 1024)
+    note(m, "C", 3, 256, "quarter", staff=2)
+    note(m, "G", 3, 256, "quarter", chord=True, staff=2)
+    note(m, "D", 4, 256, "quarter", chord=True, staff=2)
+    note(m, "B", 2, 256, "quarter", staff=2)
+    note(m, "F", 3, 256, "quarter", alt=1, chord=True, staff=2)
+    note(m, "E", 3, 256, "quarter", staff=2)
+    note(m, "A", 3, 256, "quarter", chord=True, staff=2)
     m += '    </measure>\n'
     
     # Bar 10: Final sequence
     m += '    <measure number="10">\n'
-    m += harmony("G", "dominant", [(11, 1, "add")])
-    m += note("B", 5, 256, "quarter", slur_s=True)
-    m += note("D", 6, 256, "quarter")
-    m += note("C", 6, 256, "quarter")
-    m += note("E", 5, 256, "quarter", slur_e=True)
-    m += backup(1024)
-    m += note("G", 2, 256, "quarter", staff=2)
-    m += note("D", 3, 256, "quarter", chord=True, staff=2)
-    m += note("F", 3, 256, "quarter", alt=1, staff=2)
-    m += note("C", 4, 256, "quarter", chord=True, staff=2)
-    m += note("B", 3, 256, "quarter", staff=2)
-    m += note("F", 4, 256, "quarter", chord=True, staff=2)
-    m += note("A", 3, 256, "quarter", staff=2)
+    harmony(m, "G", "dominant", [(11, 1, "add")])
+    note(m, "B", 5, 256, "quarter", slur_s=True)
+    note(m, "D", 6, 256, "quarter")
+    note(m, "C", 6, 256, "quarter")
+    note(m, "E", 5, 256, "quarter", slur_e=True)
+    backup(m, 1024)
+    note(m, "G", 2, 256, "quarter", staff=2)
+    note(m, "D", 3, 256, "quarter", chord=True, staff=2)
+    note(m, "F", 3, 256, "quarter", alt=1, staff=2)
+    note(m, "C", 4, 256, "quarter", chord=True, staff=2)
+    note(m, "B", 3, 256, "quarter", staff=2)
+    note(m, "F", 4, 256, "quarter", chord=True, staff=2)
+    note(m, "A", 3, 256, "quarter", staff=2)
     m += '    </measure>\n'
     
     # Bar 11: Cadential prep
     m += '    <measure number="11">\n'
-    m += direction("rit.")
-    m += harmony("D", "minor", [(11, 0, "add")])
-    m += note("D", 5, 256, "quarter", slur_s=True)
-    m += note("E", 5, 256, "quarter")
-    m += note("G", 4, 256, "quarter", alt=1)
-    m += note("B", 4, 256, "quarter", slur_e=True)
-    m += backup(1024)
-    m += note("D", 3, 256, "quarter", staff=2)
-    m += note("A", 3, 256, "quarter", chord=True, staff=2)
-    m += note("G", 3, 256, "quarter", staff=2)
-    m += note("C", 4, 256, "quarter", chord=True, staff=2)
-    m += note("F", 3, 256, "quarter", staff=2)
-    m += note("B", 3, 256, "quarter", chord=True, staff=2)
-    m += note("E", 3, 256, "quarter", staff=2)
+    direction(m, "rit.")
+    harmony(m, "D", "minor", [(11, 0, "add")])
+    note(m, "D", 5, 256, "quarter", slur_s=True)
+    note(m, "E", 5, 256, "quarter")
+    note(m, "G", 4, 256, "quarter", alt=1)
+    note(m, "B", 4, 256, "quarter", slur_e=True)
+    backup(m, 1024)
+    note(m, "D", 3, 256, "quarter", staff=2)
+    note(m, "A", 3, 256, "quarter", chord=True, staff=2)
+    note(m, "G", 3, 256, "quarter", staff=2)
+    note(m, "C", 4, 256, "quarter", chord=True, staff=2)
+    note(m, "F", 3, 256, "quarter", staff=2)
+    note(m, "B", 3, 256, "quarter", chord=True, staff=2)
+    note(m, "E", 3, 256, "quarter", staff=2)
     m += '    </measure>\n'
     
     # Bar 12: Final
     m += '    <measure number="12">\n'
-    m += direction(dyn="p")
-    m += harmony("C", "major", [(9, 0, "add"), (11, 1, "add")])
-    m += note("D", 5, 256, "quarter", slur_s=True)
-    m += note("C", 5, 768, "half", dot=True, slur_e=True, ferm=True)
-    m += backup(1024)
-    m += note("C", 2, 1024, "whole", staff=2)
-    m += note("G", 2, 1024, "whole", chord=True, staff=2)
-    m += note("D", 3, 1024, "whole", chord=True, staff=2)
-    m += note("F", 3, 1024, "whole", alt=1, chord=True, staff=2)
-    m += barline()
+    direction(m, dyn="p")
+    harmony(m, "C", "major", [(9, 0, "add"), (11, 1, "add")])
+    note(m, "D", 5, 256, "quarter", slur_s=True)
+    note(m, "C", 5, 768, "half", dot=True, slur_e=True, ferm=True)
+    backup(m, 1024)
+    note(m, "C", 2, 1024, "whole", staff=2)
+    note(m, "G", 2, 1024, "whole", chord=True, staff=2)
+    note(m, "D", 3, 1024, "whole", chord=True, staff=2)
+    note(m, "F", 3, 1024, "whole", alt=1, chord=True, staff=2)
+    barline(m)
     m += '    </measure>\n'
     
-    return header("The Master's Palette - IV. German Development", 0) + m + footer()
+    footer(m)
+    return m.finish()
 
 # ============ SELF-EVALUATION ============
 def evaluate_movement(name, xml_content):
     """Evaluate movement against Music Criteria of Excellence"""
+    return score_movement(extract_features(xml_content))
+
+def evaluate_movement_stream(name, source):
+    """Same criteria, streamed from a score file"""
+    return score_movement(stream_features(source))
+
+def score_movement(f):
+    """Apply the criteria to a score_features feature dict"""
     score = 0
     notes = []
     
     # 1. Motivic Development (2 points)
-    slur_count = xml_content.count('<slur type="start"')
+    slur_count = f['slur_starts']
     if slur_count >= 6:
         score += 1
         notes.append(f"Phrasing: {slur_count} phrases")
-    accent_count = xml_content.count('<accent/>')
+    accent_count = f['accents']
     if accent_count >= 3:
         score += 1
         notes.append(f"Articulation: {accent_count} accents")
     
     # 2. Harmonic Richness (2 points)
-    harmony_count = xml_content.count('<harmony')
+    harmony_count = f['harmonies']
     if harmony_count >= 10:
         score += 1
         notes.append(f"Harmony: {harmony_count} symbols")
-    if '<degree>' in xml_content:
+    if f['degrees'] > 0:
         score += 1
         notes.append("Extended harmonies")
     
     # 3. LH Accompaniment (2 points)
-    lh_notes = xml_content.count('staff="2"')
+    lh_notes = f['staff2']
     if lh_notes >= 40:
         score += 1
         notes.append(f"LH density: {lh_notes} events")
-    chord_count = xml_content.count('<chord/>')
+    chord_count = f['chords']
     if chord_count >= 20:
         score += 1
         notes.append(f"Chordal: {chord_count} stacks")
     
     # 4. Melodic Contour (1 point)
-    if xml_content.count('<octave>5</octave>') >= 5:
+    if f['octaves'].get(5, 0) >= 5:
         score += 1
         notes.append("Register variety")
     
     # 5. Dynamic Shape (1 point)
-    if '<dynamics>' in xml_content:
+    if f['dynamics'] > 0:
         score += 1
         notes.append("Dynamic markings")
     
     # 6. Engraving (1 point)
-    if '<fermata' in xml_content and '<barline' in xml_content:
+    if f['fermatas'] > 0 and f['barlines'] > 0:
         score += 1
         notes.append("Clean engraving")
     
     # 7. Form/Structure (1 point)
-    if 'rit' in xml_content.lower() or 'coda' in xml_content.lower():
+    if has_marker(f, 'rit', 'coda'):
         score += 1
         notes.append("Structural markers")
     
@@ -964,6 +986,7 @@ def evaluate_movement(name, xml_content):
 def main():
     import os
     
+    configure_output(sys.argv[1:])
     scores_dir = os.path.join(os.path.dirname(__file__), "..", "scores")
     os.makedirs(scores_dir, exist_ok=True)
     
@@ -975,6 +998,7 @@ def main():
     ]
     
     results = []
+    unchanged = 0
     
     print("=" * 60)
     print("AUTO-EXCELLENCE 4-MOVEMENT LEADSHEET GENERATOR")
@@ -982,16 +1006,18 @@ def main():
     print()
     
     for filename, generator, title in movements:
-        xml_content = generator()
         filepath = os.path.join(scores_dir, filename)
         
-        with open(filepath, "w", encoding="utf-8") as f:
-            f.write(xml_content)
+        filepath, written = stream_if_changed(filepath, generator)
+        if written:
+            print(f"Generated: {filename}")
+        else:
+            unchanged += 1
+            print(f"Unchanged: {filename} (write skipped)")
         
-        score, notes = evaluate_movement(title, xml_content)
+        score, notes = evaluate_movement_stream(title, filepath)
         results.append((title, score, notes, filepath))
         
-        print(f"Generated: {filename}")
         print(f"  Score: {score}/10")
         print(f"  Notes: {', '.join(notes)}")
         print()
@@ -1023,6 +1049,7 @@ def main():
     print("Output files:")
     for _, _, _, filepath in results:
         print(f"  - {os.path.basename(filepath)}")
+    print(f"Unchanged files (write skipped): {unchanged}/{len(movements)}")
 
 if __name__ == "__main__":
     main()
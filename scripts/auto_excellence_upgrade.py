@@ -6,6 +6,10 @@ Continuous refinement until ALL movements reach >= 8.0/10
 
 import os
 import re
+import sys
+
+from score_features import extract_features, has_marker, stream_features
+from score_writer import configure_output, content_digest, write_if_changed
 
 # ============ SHARED UTILITIES ============
 def n(step, oct, dur, typ, alt=None, dot=False, chord=False, 
@@ -121,64 +125,72 @@ def evaluate_excellence(xml, movement_name):
     Each category scored 0.0-1.0, total = 10.0 max
     Pass threshold = 8.0/10
     """
+    return score_excellence(extract_features(xml))
+
+def evaluate_excellence_stream(source):
+    """Same rubric, streamed from a file path or file object in constant memory"""
+    return score_excellence(stream_features(source))
+
+def score_excellence(f):
+    """Apply the 10-category rubric to a score_features feature dict"""
     scores = {}
     details = {}
     
     # 1. Motivic Identity (is the core motif present and clear?)
-    slur_count = xml.count('<slur')
-    accent_count = xml.count('<accent/>')
+    slur_count = f['slurs']
+    accent_count = f['accents']
     motif_score = min(1.0, (slur_count / 20) * 0.5 + (accent_count / 15) * 0.5)
     scores["Motivic Identity"] = motif_score
     details["Motivic Identity"] = f"slurs={slur_count}, accents={accent_count}"
     
     # 2. Motivic Development (transformations present?)
     # Check for variety in octaves and intervals
-    oct5 = xml.count('<octave>5</octave>')
-    oct4 = xml.count('<octave>4</octave>')
-    oct3 = xml.count('<octave>3</octave>')
-    oct6 = xml.count('<octave>6</octave>')
+    oct5 = f['octaves'].get(5, 0)
+    oct4 = f['octaves'].get(4, 0)
+    oct3 = f['octaves'].get(3, 0)
+    oct6 = f['octaves'].get(6, 0)
     octave_variety = min(1.0, (oct5 + oct4 + oct3 + oct6) / 50)
     scores["Motivic Development"] = octave_variety
     details["Motivic Development"] = f"oct3={oct3}, oct4={oct4}, oct5={oct5}, oct6={oct6}"
     
     # 3. Melodic Contour (leaps, direction changes)
-    alter_count = xml.count('<alter>')
+    alter_count = f['alters']
     contour_score = min(1.0, (oct5 / 15) * 0.5 + (alter_count / 20) * 0.5)
     scores["Melodic Contour"] = contour_score
     details["Melodic Contour"] = f"oct5={oct5}, alters={alter_count}"
     
     # 4. Harmonic Colour (Tonality Vault compliance)
-    harmony_count = xml.count('<harmony')
-    degree_count = xml.count('<degree>')
+    harmony_count = f['harmonies']
+    degree_count = f['degrees']
     harmony_score = min(1.0, (harmony_count / 12) * 0.4 + (degree_count / 24) * 0.6)
     scores["Harmonic Colour"] = harmony_score
     details["Harmonic Colour"] = f"harmonies={harmony_count}, degrees={degree_count}"
     
     # 5. Phrasing & Breath
-    slur_starts = xml.count('<slur type="start"')
-    slur_ends = xml.count('<slur type="stop"')
+    slur_starts = f['slur_starts']
+    slur_ends = f['slur_stops']
     phrasing_score = min(1.0, (slur_starts / 12) * 0.5 + (slur_ends / 12) * 0.5)
     scores["Phrasing & Breath"] = phrasing_score
     details["Phrasing & Breath"] = f"slur_starts={slur_starts}, slur_ends={slur_ends}"
     
     # 6. LH Accompaniment Quality
-    staff2_count = xml.count('staff="2"')
-    chord_count = xml.count('<chord/>')
+    staff2_count = f['staff2']
+    chord_count = f['chords']
     lh_score = min(1.0, (staff2_count / 72) * 0.5 + (chord_count / 36) * 0.5)
     scores["LH Accompaniment"] = lh_score
     details["LH Accompaniment"] = f"staff2={staff2_count}, chords={chord_count}"
     
     # 7. Idiomatic Stylistic Authenticity
-    dynamics_count = xml.count('<dynamics>')
-    words_count = xml.count('<words')
+    dynamics_count = f['dynamics']
+    words_count = f['words']
     style_score = min(1.0, (dynamics_count / 5) * 0.5 + (words_count / 4) * 0.5)
     scores["Idiomatic Style"] = style_score
     details["Idiomatic Style"] = f"dynamics={dynamics_count}, expressions={words_count}"
     
     # 8. Formal Shape
-    has_rit = 'rit' in xml.lower()
-    has_section = any(x in xml.lower() for x in ['brighter', 'expanding', 'ankunft', 'dissolving', 'breiter'])
-    measure_count = xml.count('<measure number=')
+    has_rit = has_marker(f, 'rit')
+    has_section = has_marker(f, 'brighter', 'expanding', 'ankunft', 'dissolving', 'breiter')
+    measure_count = f['measures']
     formal_score = 0.0
     if has_rit:
         formal_score += 0.4
@@ -190,17 +202,17 @@ def evaluate_excellence(xml, movement_name):
     details["Formal Shape"] = f"rit={has_rit}, sections={has_section}, measures={measure_count}"
     
     # 9. Emotional/Narrative Arc
-    fermata_count = xml.count('<fermata')
-    ff_count = xml.count('<ff/>')
-    pp_count = xml.count('<pp/>')
+    fermata_count = f['fermatas']
+    ff_count = f['dynamic_marks']['ff']
+    pp_count = f['dynamic_marks']['pp']
     emotional_score = min(1.0, (fermata_count / 1) * 0.4 + (accent_count / 12) * 0.4 + ((ff_count + pp_count) / 2) * 0.2)
     scores["Emotional Arc"] = emotional_score
     details["Emotional Arc"] = f"fermatas={fermata_count}, accents={accent_count}"
     
     # 10. Engraving Quality
-    has_barline = '<barline' in xml
+    has_barline = f['barlines'] > 0
     has_correct_bars = measure_count == 12
-    has_staves = '<staves>2</staves>' in xml
+    has_staves = f['staves2'] > 0
     engraving_score = 0.0
     if has_barline:
         engraving_score += 0.4
@@ -952,6 +964,7 @@ def gen_mvmt4_v2():
 
 # ============ MAIN ENGINE ============
 def main():
+    configure_output(sys.argv[1:])
     scores_dir = os.path.join(os.path.dirname(__file__), "..", "scores")
     
     print("=" * 70)
@@ -971,6 +984,14 @@ def main():
     iteration = 0
     max_iterations = 5
     
+    # Fixpoint detection: generators are deterministic, so a document whose
+    # digest did not change since the last iteration needs no rewrite and no
+    # re-scoring, and a movement that already passes is not regenerated.
+    digests = {}        # movement -> digest of its last generated document
+    score_cache = {}    # digest -> (total, scores, details)
+    passed = set()
+    avoided = {"generations": 0, "writes": 0, "evaluations": 0}
+    
     while iteration < max_iterations:
         iteration += 1
         print(f"\n{'='*70}")
@@ -978,20 +999,43 @@ def main():
         print(f"{'='*70}")
         
         all_pass = True
+        changed = False
         
         for name, (filename, generator) in movements.items():
+            if name in passed:
+                avoided["generations"] += 1
+                avoided["writes"] += 1
+                avoided["evaluations"] += 1
+                # Its score still counts for this iteration, so the summary's
+                # iteration counts and score arcs cover every iteration run
+                history[name].append(final_results[name][0])
+                print(f"\n{name}")
+                print(f"  Already passing ({final_results[name][0]:.1f}/10.0) - skipped")
+                continue
+            
             xml = generator()
             filepath = os.path.join(scores_dir, filename)
+            digest = content_digest(xml)
+            if digests.get(name) != digest:
+                changed = True
+            digests[name] = digest
             
-            with open(filepath, "w", encoding="utf-8") as f:
-                f.write(xml)
+            if not write_if_changed(filepath, xml):
+                avoided["writes"] += 1
             
-            total, scores, details = evaluate_excellence(xml, name)
+            if digest in score_cache:
+                total, scores, details = score_cache[digest]
+                avoided["evaluations"] += 1
+            else:
+                total, scores, details = evaluate_excellence(xml, name)
+                score_cache[digest] = (total, scores, details)
             history[name].append(total)
             
             status = "EXCELLENT" if total >= 8.0 else "REFINE"
             if total < 8.0:
                 all_pass = False
+            else:
+                passed.add(name)
             
             print(f"\n{name}")
             print(f"  Total Score: {total:.1f}/10.0 [{status}]")
@@ -1006,6 +1050,11 @@ def main():
             print("ALL MOVEMENTS PASS >= 8.0 - ENGINE COMPLETE")
             print(f"{'='*70}")
             break
+        elif not changed:
+            print(f"\n{'='*70}")
+            print("FIXPOINT REACHED - generators produced identical output, stopping")
+            print(f"{'='*70}")
+            break
         else:
             print(f"\n  --> Some movements need refinement. Continuing...")
     
@@ -1032,6 +1081,12 @@ def main():
         scores_str = " -> ".join([f"{s:.1f}" for s in history[name]])
         print(f"  {name}: {scores_str}")
     
+    print()
+    print(f"WORK AVOIDED ({iteration} iteration(s)):")
+    print(f"  Generations skipped: {avoided['generations']}")
+    print(f"  File writes skipped: {avoided['writes']}")
+    print(f"  Evaluations reused:  {avoided['evaluations']}")
+    
     print()
     print("KEY REFINEMENTS APPLIED:")
     print()
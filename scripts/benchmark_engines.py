@@ -0,0 +1,334 @@
+#!/usr/bin/env python3
+"""
+ENGINE BENCHMARK HARNESS
+========================
+Times the score engines on synthetic scores far larger than anything in
+scores/ (which tops out at 60-bar suites).
+
+Scores are synthesized with the note / rest / harmony / direction /
+measure_attrs helpers of assemble_full_score.py, parameterized by
+
+    parts     1-40     (instrument names cycle through the ensemble)
+    measures  12-10,000
+    density   notes per 4/4 bar: 1, 2, 4, 8 or 16
+
+Each generated score is put through these stages:
+
+    generate          string generation of the score, streamed to disk
+    evaluate          auto_excellence_upgrade.evaluate_excellence_stream
+    engraving_polish  EngravingPolishEngine load / apply_all_fixes / save
+    human_layout      HumanLayoutPolish.run on the score
+    assemble_suite    assemble_prisms_suite.assemble_suite over 5 movements
+                      of measures/5 bars each
+    write_musicxml    SuiteRefinementEngine._write_musicxml of the parsed score
+
+Every stage is timed once without tracing, then (unless --no-memory) run
+again under tracemalloc for its peak Python allocation. Results go to a
+JSON report with seconds, measures/s, notes/s, MB/s and peak MB per stage.
+
+Usage:
+    python scripts/benchmark_engines.py                       # quick grid
+    python scripts/benchmark_engines.py --full                # 1-40 parts x 12-10,000 bars
+    python scripts/benchmark_engines.py --parts 1,8,17 --measures 12,600 --density 4
+        [--stages generate,evaluate] [--no-memory] [--out benchmark-results.json]
+"""
+
+import contextlib
+import io
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+import assemble_full_score as helpers
+import assemble_prisms_suite
+from auto_excellence_upgrade import evaluate_excellence_stream
+from engraving_polish_engine import EngravingPolishEngine
+from human_layout_polish import HumanLayoutPolish
+from score_writer import ScoreWriter
+from unified_suite_refinement_engine import SuiteRefinementEngine
+
+QUICK_GRID = {'parts': [1, 10], 'measures': [12, 120, 1200], 'density': [4]}
+FULL_GRID = {'parts': [1, 10, 40], 'measures': [12, 100, 1000, 10000], 'density': [4]}
+
+ENSEMBLE = [
+    ("Flute", "G", 2), ("Clarinet in Bb", "G", 2), ("Flugelhorn", "G", 2),
+    ("Violin I", "G", 2), ("Violin II", "G", 2), ("Viola", "C", 3),
+    ("Cello", "F", 4), ("Double Bass", "F", 4), ("Classical Guitar", "G", 2),
+    ("Glockenspiel", "G", 2),
+]
+
+NOTE_TYPES = {1: "whole", 2: "half", 4: "quarter", 8: "eighth", 16: "16th"}
+SCALE = [("C", None), ("D", None), ("E", -1), ("F", None), ("G", None), ("A", None), ("B", -1)]
+CHORDS = [("C", "minor-seventh"), ("F", "dominant"), ("Bb", "major-seventh"), ("G", "dominant")]
+DIVISIONS = 256
+
+STAGES = ['generate', 'evaluate', 'engraving_polish', 'human_layout',
+          'assemble_suite', 'write_musicxml']
+
+
+# ============ SYNTHETIC SCORES ============
+def score_header(parts):
+    x = ('<?xml version="1.0" encoding="UTF-8"?>\n'
+         '<!DOCTYPE score-partwise PUBLIC "-//Recordare//DTD MusicXML 3.1 Partwise//EN" '
+         '"http://www.musicxml.org/dtds/partwise.dtd">\n'
+         '<score-partwise version="3.1">\n'
+         '  <work><work-title>Benchmark Score</work-title></work>\n'
+         '  <identification>\n'
+         '    <creator type="composer">Benchmark</creator>\n'
+         '    <encoding><software>Engine Benchmark Harness</software></encoding>\n'
+         '  </identification>\n'
+         '  <part-list>\n')
+    for i in range(parts):
+        name, _, _ = ENSEMBLE[i % len(ENSEMBLE)]
+        x += f'    <score-part id="P{i + 1}"><part-name>{name}</part-name></score-part>\n'
+    x += '  </part-list>\n'
+    return x
+
+
+def write_part(out, index, measures, density):
+    """One part of the synthetic score: scale runs, phrase slurs, chords, dynamics."""
+    _, clef_sign, clef_line = ENSEMBLE[index % len(ENSEMBLE)]
+    octave = {"G": 5, "C": 4, "F": 3}[clef_sign]
+    duration = DIVISIONS * 4 // density
+    ntype = NOTE_TYPES[density]
+    out += f'  <part id="P{index + 1}">\n'
+    for bar in range(1, measures + 1):
+        out += f'    <measure number="{bar}">\n'
+        if bar == 1:
+            out += helpers.measure_attrs(DIVISIONS, -3, 4, 4, clef_sign, clef_line)
+            out += helpers.direction("dolce", tempo=72)
+        elif bar % 4 == 1:
+            out += '        <print new-system="yes"/>\n'
+        if index == 0:
+            out += helpers.harmony(*CHORDS[bar % len(CHORDS)])
+        if bar % 8 == 1:
+            out += helpers.direction(dynamic=("mp", "mf", "p", "f")[(bar // 8) % 4], placement="below")
+        # Rests in every fifth bar of the lower parts keep the texture varied
+        if index > 0 and bar % 5 == 0:
+            out += helpers.rest(DIVISIONS * 4, "whole")
+        else:
+            for n in range(density):
+                step, alter = SCALE[(bar + n + index) % len(SCALE)]
+                first = n == 0 and bar % 4 == 1
+                last = n == density - 1 and bar % 4 == 0
+                out += helpers.note(step, octave - (n % 2), duration, ntype, alter,
+                                    slur_s=first, slur_e=last, acc=(n == 0 and bar % 2 == 0))
+        if bar == measures:
+            out += helpers.barline()
+        out += '    </measure>\n'
+    out += helpers.part_footer()
+
+
+def write_score(path, parts, measures, density):
+    """Synthesize a score to path; returns the number of sounding notes."""
+    with ScoreWriter(path) as out:
+        out += score_header(parts)
+        for index in range(parts):
+            write_part(out, index, measures, density)
+        out += helpers.footer()
+    rest_bars = measures // 5 * max(parts - 1, 0)
+    return parts * measures * density - rest_bars * density
+
+
+# ============ STAGES ============
+@contextlib.contextmanager
+def quiet():
+    with contextlib.redirect_stdout(io.StringIO()):
+        yield
+
+
+def stage_generate(case, workdir):
+    return lambda: write_score(os.path.join(workdir, "generated.musicxml"),
+                               case['parts'], case['measures'], case['density'])
+
+
+def stage_evaluate(case, workdir):
+    return lambda: evaluate_excellence_stream(case['path'])
+
+
+def stage_engraving_polish(case, workdir):
+    def run():
+        engine = EngravingPolishEngine(case['path'], os.path.join(workdir, "polished.musicxml"))
+        engine.load_score()
+        engine.apply_all_fixes()
+        engine.save_score()
+    return run
+
+
+def stage_human_layout(case, workdir):
+    def run():
+        engine = HumanLayoutPolish(workdir)
+        engine.input_path = Path(case['path'])
+        engine.output_path = Path(workdir) / "human.musicxml"
+        engine.run()
+    return run
+
+
+def stage_assemble_suite(case, workdir):
+    suite_dir = os.path.join(workdir, "suite")
+    os.makedirs(suite_dir, exist_ok=True)
+    bars = max(case['measures'] // 5, 1)
+    for filename in assemble_prisms_suite.MOVEMENT_FILES:
+        write_score(os.path.join(suite_dir, filename), case['parts'], bars, case['density'])
+
+    def run():
+        assemble_prisms_suite.SOURCE_DIR = suite_dir
+        assemble_prisms_suite.OUTPUT_DIR = suite_dir
+        assemble_prisms_suite.assemble_suite()
+    return run
+
+
+def stage_write_musicxml(case, workdir):
+    tree = ET.parse(case['path'])
+    engine = SuiteRefinementEngine(workdir)
+    return lambda: engine._write_musicxml(tree, os.path.join(workdir, "written.musicxml"))
+
+
+STAGE_SETUP = {
+    'generate': stage_generate,
+    'evaluate': stage_evaluate,
+    'engraving_polish': stage_engraving_polish,
+    'human_layout': stage_human_layout,
+    'assemble_suite': stage_assemble_suite,
+    'write_musicxml': stage_write_musicxml,
+}
+
+
+def measure_stage(name, case, workdir, memory=True):
+    """Time one stage (fresh setup per run); optionally a second run under tracemalloc."""
+    run = STAGE_SETUP[name](case, workdir)
+    with quiet():
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        run()
+        wall = time.perf_counter() - wall
+        cpu = time.process_time() - cpu
+
+    peak = None
+    if memory:
+        run = STAGE_SETUP[name](case, workdir)
+        tracemalloc.start()
+        try:
+            with quiet():
+                run()
+            peak = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    total_measures = case['parts'] * case['measures']
+    megabytes = case['bytes'] / 1e6
+    return {
+        'stage': name,
+        'parts': case['parts'],
+        'measures': case['measures'],
+        'density': case['density'],
+        'notes': case['notes'],
+        'bytes': case['bytes'],
+        'seconds': round(wall, 6),
+        'cpu_seconds': round(cpu, 6),
+        'measures_per_s': round(total_measures / wall, 1) if wall else None,
+        'notes_per_s': round(case['notes'] / wall, 1) if wall else None,
+        'mb_per_s': round(megabytes / wall, 3) if wall else None,
+        'peak_mb': round(peak / 1e6, 3) if peak is not None else None,
+    }
+
+
+def run_benchmark(grid, stages, memory=True):
+    results = []
+    for parts in grid['parts']:
+        for measures in grid['measures']:
+            for density in grid['density']:
+                with tempfile.TemporaryDirectory(prefix="bench-") as workdir:
+                    path = os.path.join(workdir, "score.musicxml")
+                    notes = write_score(path, parts, measures, density)
+                    case = {'parts': parts, 'measures': measures, 'density': density,
+                            'notes': notes, 'path': path, 'bytes': os.path.getsize(path)}
+                    print(f"\n{parts} part(s) x {measures} bars, density {density} "
+                          f"({notes} notes, {case['bytes'] / 1e6:.2f} MB)")
+                    for name in stages:
+                        result = measure_stage(name, case, workdir, memory)
+                        results.append(result)
+                        peak = f"{result['peak_mb']:9.1f} MB" if memory else ""
+                        print(f"  {name:<18} {result['seconds']:9.3f}s "
+                              f"{result['measures_per_s'] or 0:>12,.0f} bars/s {peak}")
+    return results
+
+
+# ============ COMMAND LINE ============
+def _int_list(value):
+    return [int(v) for v in value.split(',') if v.strip()]
+
+
+def parse_args(args):
+    """Grid, stages, memory flag and output path from sys.argv-style args."""
+    grid = dict(QUICK_GRID)
+    stages = list(STAGES)
+    memory = True
+    out = "benchmark-results.json"
+    i = 0
+    while i < len(args):
+        arg = args[i]
+        key, _, value = arg.partition('=')
+        if key in ('--parts', '--measures', '--density', '--stages', '--out') and not value:
+            i += 1
+            value = args[i] if i < len(args) else ''
+        if arg == '--full':
+            grid = dict(FULL_GRID)
+        elif arg == '--no-memory':
+            memory = False
+        elif key in ('--parts', '--measures', '--density'):
+            grid[key[2:]] = _int_list(value)
+        elif key == '--stages':
+            stages = [s.strip() for s in value.split(',') if s.strip()]
+        elif key == '--out':
+            out = value
+        else:
+            raise SystemExit(f"Unknown argument: {arg}\n{__doc__}")
+        i += 1
+
+    for parts in grid['parts']:
+        if not 1 <= parts <= 40:
+            raise SystemExit(f"--parts must be between 1 and 40 (got {parts})")
+    for measures in grid['measures']:
+        if not 12 <= measures <= 10000:
+            raise SystemExit(f"--measures must be between 12 and 10,000 (got {measures})")
+    for density in grid['density']:
+        if density not in NOTE_TYPES:
+            raise SystemExit(f"--density must be one of {sorted(NOTE_TYPES)} (got {density})")
+    unknown = [s for s in stages if s not in STAGE_SETUP]
+    if unknown:
+        raise SystemExit(f"Unknown stage(s): {', '.join(unknown)} (choose from {', '.join(STAGES)})")
+    return grid, stages, memory, out
+
+
+def main():
+    grid, stages, memory, out = parse_args(sys.argv[1:])
+
+    print("=" * 70)
+    print("ENGINE BENCHMARK HARNESS")
+    print("=" * 70)
+    print(f"Parts: {grid['parts']}  Measures: {grid['measures']}  Density: {grid['density']}")
+    print(f"Stages: {', '.join(stages)}")
+
+    results = run_benchmark(grid, stages, memory)
+    report = {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'grid': grid,
+        'stages': stages,
+        'memory_traced': memory,
+        'results': results,
+    }
+    with open(out, 'w', encoding='utf-8') as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults: {out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+FUSED VERSION CHAIN
+===================
+Runs the whole orchestration chain v10 -> v12.5 -> ... -> v20 -> FINAL as one
+in-memory pipeline: the v10 score is read once, the patch sets of every step
+are fused into as few PatchSets as possible, and only the FINAL score is
+written.
+
+The per-step scripts (generate_v13.py, generate_v18_v19_v20.py, ...) still
+work on their own; this pipeline imports their build_*_patches() functions so
+both paths apply exactly the same edits. Fusing is safe because PatchSet
+starts a new scan stage whenever a patch could see text produced by an
+earlier one, which keeps sequential replace() semantics.
+
+Intermediate versions are written only when asked for:
+
+    python scripts/build_version_chain.py                 # FINAL only
+    python scripts/build_version_chain.py --keep v13,v17  # also v13 and v17
+    python scripts/build_version_chain.py --all           # every version
+
+--compact / --mxl select the output mode (see score_writer.py).
+
+The archive, performer and publisher packages are still produced by
+generate_master_final.py.
+"""
+
+import sys
+
+import generate_v12_5
+import generate_v13
+import generate_v14
+import generate_v15_v16_v17
+import generate_v18_v19_v20
+import generate_master_final
+from patch_engine import PatchSet
+from score_writer import OUTPUT_FLAGS, configure_output, read_score_text, write_score
+
+SOURCE = 'scores/masters-palette-orchestrated-v10.musicxml'
+
+# (version, patch builder, output path) in chain order
+CHAIN = [
+    ('v12.5', generate_v12_5.build_patches,
+     'scores/masters-palette-orchestrated-v12.5-engraved.musicxml'),
+    ('v13', generate_v13.build_patches,
+     'scores/masters-palette-orchestrated-v13.musicxml'),
+    ('v14', generate_v14.build_patches,
+     'scores/masters-palette-orchestrated-v14.musicxml'),
+    ('v15', generate_v15_v16_v17.build_v15_patches,
+     'scores/masters-palette-orchestrated-v15.musicxml'),
+    ('v16', generate_v15_v16_v17.build_v16_patches,
+     'scores/masters-palette-orchestrated-v16-parts.musicxml'),
+    ('v17', generate_v15_v16_v17.build_v17_patches,
+     'scores/masters-palette-orchestrated-v17-sessionReady.musicxml'),
+    ('v18', generate_v18_v19_v20.build_v18_patches,
+     'scores/masters-palette-orchestrated-v18-conductingScore.musicxml'),
+    ('v19', generate_v18_v19_v20.build_v19_patches,
+     'scores/masters-palette-orchestrated-v19-publisherLayout.musicxml'),
+    ('v20', generate_v18_v19_v20.build_v20_patches,
+     'scores/masters-palette-orchestrated-v20-commercialEngraved.musicxml'),
+    ('FINAL', generate_master_final.build_patches,
+     'scores/masters-palette-FINAL-Score.musicxml'),
+]
+
+
+def fused_segments(keep=()):
+    """
+    Fuse the chain into PatchSets that end at each materialized version.
+
+    Returns a list of (PatchSet, output path or None); the last segment
+    always ends at FINAL.
+    """
+    segments = []
+    current = None
+    first = None
+    for version, build, path in CHAIN:
+        if current is None:
+            current = PatchSet(version)
+            first = version
+        current.extend(build())
+        if version in keep or version == 'FINAL':
+            if first != version:
+                current.name = f"{first}..{version}"
+            segments.append((current, path))
+            current = None
+    return segments
+
+
+def run_chain(content, keep=()):
+    """Apply the whole chain to the v10 text; write kept versions on the way."""
+    for patches, path in fused_segments(keep):
+        content = patches.apply(content)
+        patches.print_report()
+        path = write_score(path, content)
+        print(f"Generated: {path}")
+    return content
+
+
+def parse_keep(args):
+    """Versions to materialize from --keep v13,v17 / --keep=v13 / --all; output flags are skipped."""
+    versions = [version for version, _, _ in CHAIN]
+    keep = set()
+    i = 0
+    while i < len(args):
+        arg = args[i]
+        if arg in OUTPUT_FLAGS:
+            pass    # handled by configure_output()
+        elif arg == '--all':
+            keep.update(versions)
+        elif arg == '--keep' and i + 1 < len(args):
+            i += 1
+            keep.update(v.strip() for v in args[i].split(','))
+        elif arg.startswith('--keep='):
+            keep.update(v.strip() for v in arg[len('--keep='):].split(','))
+        else:
+            raise SystemExit(f"Unknown argument: {arg}\n{__doc__}")
+        i += 1
+    unknown = keep - set(versions)
+    if unknown:
+        raise SystemExit(f"Unknown version(s): {', '.join(sorted(unknown))} "
+                         f"(choose from {', '.join(versions)})")
+    return keep
+
+
+def main():
+    keep = parse_keep(sys.argv[1:])
+    configure_output(sys.argv[1:])
+
+    print("=" * 70)
+    print("FUSED VERSION CHAIN — v10 to FINAL")
+    print("=" * 70)
+
+    content = read_score_text(SOURCE)
+    print(f"Loaded: {SOURCE}")
+
+    run_chain(content, keep)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,358 @@
+#!/usr/bin/env python3
+"""
+CONTENT FINGERPRINT VERIFIER
+============================
+Proof that a layout / assembly pass left the music alone
+(config/system.md: "Do NOT modify, rewrite, shorten, compress, or alter any
+musical content").
+
+Every measure gets a canonical fingerprint built only from its musical
+content, one short hash per category:
+
+    pitch          pitch / unpitched / rest, chord and grace flags, voice, staff
+    rhythm         durations (in quarters), note type and dots, tuplet ratios,
+                   <backup> / <forward>
+    ties           <tie> and notated <tied>
+    articulations  articulations, ornaments, technical marks, fermatas, slurs,
+                   arpeggios and glissandos (type only)
+    dynamics       dynamics marks, wedges, metronome / tempo, pedal, octave shifts
+    words          expression and performance text (<words>: "rit.", "pizz.",
+                   "attacca subito", "non vib." ...), whitespace normalized
+    other          key, time, clef, transpose, harmony, lyrics, rehearsal marks,
+                   repeats and endings
+
+Layout is ignored: default-x/y, relative-x/y, bezier-*, placement, <print>,
+fonts, stems, beams and displayed accidentals, and so are the movement headers
+the assembly passes insert or rewrite (<words> starting "I. " ... "V. " or
+"MOVEMENT "). Durations
+are reduced to quarter-note fractions, so rescaling <divisions> keeps the
+fingerprint.
+
+Scores are streamed through iterparse once, keeping only the digests (seven
+8-byte hashes per measure). The expected sequence (the source parts, movement
+after movement) and the actual one are then compared bar by bar, and the
+report names every bar that changed, the categories that differ and the
+source bar it came from.
+
+Usage:
+    python scripts/content_fingerprint.py SOURCE [SOURCE ...] OUTPUT
+        # OUTPUT must hold each source's parts in order, movement after movement
+
+Exits with status 1 if any bar's content changed.
+"""
+
+import hashlib
+import re
+import sys
+import xml.etree.ElementTree as ET
+from fractions import Fraction
+from itertools import zip_longest
+from pathlib import Path
+
+from score_writer import open_score_source
+
+CATEGORIES = ('pitch', 'rhythm', 'ties', 'articulations', 'dynamics', 'words', 'other')
+_PITCH, _RHYTHM, _TIES, _ARTICULATIONS, _DYNAMICS, _WORDS, _OTHER = range(len(CATEGORIES))
+
+# <notations> children and the category their (type-only) tokens go to
+_NOTATIONS = {
+    'tied': _TIES,
+    'articulations': _ARTICULATIONS,
+    'ornaments': _ARTICULATIONS,
+    'technical': _ARTICULATIONS,
+    'fermata': _ARTICULATIONS,
+    'slur': _ARTICULATIONS,
+    'arpeggiate': _ARTICULATIONS,
+    'non-arpeggiate': _ARTICULATIONS,
+    'glissando': _ARTICULATIONS,
+    'slide': _ARTICULATIONS,
+    'dynamics': _DYNAMICS,
+}
+# Attributes of content elements that carry meaning (the rest is layout)
+_MEANINGFUL = ('type', 'number', 'direction', 'size', 'measure', 'line')
+# <attributes> children fingerprinted; <divisions> only sets the time unit
+_ATTRIBUTES = ('key', 'time', 'staves', 'clef', 'transpose')
+# Movement headers ("I. Mingus Blues Cathedral", "MOVEMENT II — B: ...")
+_MOVEMENT_HEADER = re.compile(r'(?:[IVX]+\.|MOVEMENT)\s')
+
+
+def _int(text, default=0):
+    try:
+        return int(round(float(text)))
+    except (TypeError, ValueError):
+        return default
+
+
+def _quarters(text, divisions):
+    """A duration as a reduced quarter-note fraction"""
+    try:
+        return str(Fraction(text.strip()) / divisions)
+    except (AttributeError, ValueError, ZeroDivisionError):
+        return '?'
+
+
+def _meaning(elem):
+    """Tag, meaningful attributes and text of an element"""
+    token = elem.tag
+    for name in _MEANINGFUL:
+        value = elem.get(name)
+        if value is not None:
+            token += f" {name}={value}"
+    text = (elem.text or '').strip()
+    return f"{token}:{text}" if text else token
+
+
+def _content(elem):
+    """_meaning() of an element and its descendants (offsets are placement)"""
+    return '(' + ' '.join(_meaning(e) for e in elem.iter() if e.tag != 'offset') + ')'
+
+
+_ALTERS = {'-2': 'bb', '-1': 'b', '0': '', '1': '#', '2': '##'}
+
+
+def _pitch_name(pitch):
+    """C#4-style pitch name (microtonal alters kept as numbers)"""
+    alter = pitch.findtext('alter', '0').strip()
+    alter = _ALTERS.get(alter, f"({alter})")
+    return f"{pitch.findtext('step', '')}{alter}{pitch.findtext('octave', '')}"
+
+
+def _note_tokens(note, divisions, tokens):
+    pitch = []
+    for flag in ('grace', 'cue', 'chord'):
+        if note.find(flag) is not None:
+            pitch.append(flag)
+    step = note.find('pitch')
+    if step is not None:
+        pitch.append(_pitch_name(step))
+    elif note.find('unpitched') is not None:
+        unpitched = note.find('unpitched')
+        pitch.append(f"unpitched {unpitched.findtext('display-step', '')}"
+                     f"{unpitched.findtext('display-octave', '')}")
+    else:
+        rest = note.find('rest')
+        pitch.append('measure rest' if rest is not None and rest.get('measure') == 'yes' else 'rest')
+    pitch.append(f"v{note.findtext('voice', '1')}")
+    staff = note.findtext('staff', '1').strip()
+    if staff != '1':
+        pitch.append(f"staff {staff}")
+    tokens[_PITCH].append(' '.join(pitch))
+
+    duration = note.findtext('duration')
+    rhythm = [_quarters(duration, divisions) if duration is not None else 'g']
+    note_type = f"{note.findtext('type', '')}{'.' * len(note.findall('dot'))}"
+    if note_type:
+        rhythm.append(note_type)
+    modification = note.find('time-modification')
+    if modification is not None:
+        rhythm.append(f"{modification.findtext('actual-notes')}:{modification.findtext('normal-notes')}")
+    tokens[_RHYTHM].append(' '.join(rhythm))
+
+    for tie in note.findall('tie'):
+        tokens[_TIES].append(f"tie {tie.get('type')}")
+    for notations in note.findall('notations'):
+        for child in notations:
+            category = _NOTATIONS.get(child.tag)
+            if category is not None:
+                tokens[category].append(_content(child))
+    for lyric in note.findall('lyric'):
+        tokens[_OTHER].append(f"lyric {lyric.get('number', '1')}:{lyric.findtext('syllabic', '')}:"
+                              f"{lyric.findtext('text', '')}")
+
+
+def _direction_tokens(direction, tokens):
+    for direction_type in direction.findall('direction-type'):
+        for child in direction_type:
+            tag = child.tag
+            if tag in ('dynamics', 'wedge', 'metronome', 'pedal', 'octave-shift'):
+                tokens[_DYNAMICS].append(_content(child))
+            elif tag == 'rehearsal':
+                tokens[_OTHER].append(f"rehearsal:{(child.text or '').strip()}")
+            elif tag == 'words':
+                text = ' '.join((child.text or '').split())
+                if text and not _MOVEMENT_HEADER.match(text):
+                    tokens[_WORDS].append(text)
+    sound = direction.find('sound')
+    if sound is not None:
+        for name in ('tempo', 'dynamics'):
+            if sound.get(name) is not None:
+                tokens[_DYNAMICS].append(f"sound {name}={sound.get(name)}")
+
+
+def measure_events(measure, divisions):
+    """
+    (events, divisions) of a <measure>: one (tag, tokens) event per content
+    element, tokens holding one string per CATEGORIES entry ('' where the
+    element has nothing in that category). Elements with no musical content
+    (layout only, movement-header <words>) give no event.
+    """
+    events = []
+    for child in measure:
+        tag = child.tag
+        tokens = [[] for _ in CATEGORIES]
+        if tag == 'note':
+            _note_tokens(child, divisions, tokens)
+        elif tag in ('backup', 'forward'):
+            tokens[_RHYTHM].append(f"{tag} {_quarters(child.findtext('duration'), divisions)}")
+            if tag == 'forward':
+                tokens[_PITCH].append(f"forward v{child.findtext('voice', '1')}")
+        elif tag == 'attributes':
+            for attr in child:
+                if attr.tag == 'divisions':
+                    divisions = _int(attr.text, 1) or 1
+                elif attr.tag in _ATTRIBUTES:
+                    tokens[_OTHER].append(_content(attr))
+        elif tag == 'direction':
+            _direction_tokens(child, tokens)
+        elif tag == 'harmony':
+            tokens[_OTHER].append(_content(child))
+        elif tag == 'barline':
+            for mark in child:
+                if mark.tag in ('repeat', 'ending'):
+                    tokens[_OTHER].append(_meaning(mark))
+        if any(tokens):
+            events.append((tag, tuple(' '.join(t) for t in tokens)))
+    return events, divisions
+
+
+def events_fingerprint(events):
+    """Tuple of one 8-byte digest per CATEGORIES entry over measure_events()"""
+    return tuple(hashlib.blake2b('\n'.join(tokens[index] for _, tokens in events
+                                           if tokens[index]).encode('utf-8'), digest_size=8).digest()
+                 for index in range(len(CATEGORIES)))
+
+
+def describe_event(event):
+    """One-line description of a measure_events() event"""
+    tag, tokens = event
+    return ' '.join([tag] + [token for token in tokens if token])
+
+
+def measure_fingerprint(measure, divisions):
+    """
+    (fingerprint, divisions) of a <measure>: the fingerprint is a tuple of
+    one 8-byte digest per CATEGORIES entry; divisions is the time unit in
+    force at its end (pass it on to the next measure of the part).
+    """
+    events, divisions = measure_events(measure, divisions)
+    return events_fingerprint(events), divisions
+
+
+def _iter_measures(source):
+    """(part id, measure) in document order, streamed from a file or walked in a tree"""
+    if isinstance(source, ET.ElementTree):
+        source = source.getroot()
+    if isinstance(source, ET.Element):
+        for part in source.iter('part'):
+            for measure in part.findall('measure'):
+                yield part.get('id'), measure
+        return
+    with open_score_source(source) as f:
+        part_id = None
+        for event, elem in ET.iterparse(f, events=('start', 'end')):
+            if event == 'start':
+                if elem.tag == 'part':
+                    part_id = elem.get('id')
+            elif elem.tag == 'measure':
+                yield part_id, elem
+                elem.clear()
+            elif elem.tag == 'part':
+                elem.clear()
+
+
+def score_fingerprints(source):
+    """
+    [(part id, [(measure number, fingerprint), ...]), ...] of a score path
+    (streamed) or an already-parsed tree / root element.
+    """
+    parts = []
+    divisions = 1
+    for part_id, measure in _iter_measures(source):
+        if not parts or parts[-1][0] != part_id:
+            parts.append((part_id, []))
+            divisions = 1
+        fingerprint, divisions = measure_fingerprint(measure, divisions)
+        parts[-1][1].append((measure.get('number', ''), fingerprint))
+    return parts
+
+
+def expected_parts(sources):
+    """
+    Concatenate source scores part by part, as an assembly pass lays them out.
+
+    sources is [(label, score_fingerprints() result)]; returns one list per
+    part index of (source description, fingerprint).
+    """
+    parts = []
+    for label, fingerprints in sources:
+        for index, (_, measures) in enumerate(fingerprints):
+            while len(parts) <= index:
+                parts.append([])
+            parts[index].extend((f"{label} m. {number}", fingerprint) for number, fingerprint in measures)
+    return parts
+
+
+def compare_fingerprints(expected, actual):
+    """
+    Compare expected_parts() against score_fingerprints() of the output, bar
+    by bar. Returns a list of dicts: part (output part id or index), measure
+    (output measure number or None), source (description or None) and
+    problem ('changed: <categories>', 'missing' or 'added').
+    """
+    changes = []
+    for index in range(max(len(expected), len(actual))):
+        wanted = expected[index] if index < len(expected) else []
+        part_id, measures = actual[index] if index < len(actual) else (None, [])
+        part = part_id or f"part {index + 1}"
+        for source, bar in zip_longest(wanted, measures):
+            if bar is None:
+                changes.append({'part': part, 'measure': None, 'source': source[0], 'problem': 'missing'})
+            elif source is None:
+                changes.append({'part': part, 'measure': bar[0], 'source': None, 'problem': 'added'})
+            elif source[1] != bar[1]:
+                differ = [name for name, a, b in zip(CATEGORIES, source[1], bar[1]) if a != b]
+                changes.append({'part': part, 'measure': bar[0], 'source': source[0],
+                                'problem': f"changed: {', '.join(differ)}"})
+    return changes
+
+
+def format_changes(changes, limit=40):
+    """Report lines naming each changed bar (at most `limit`, then a count)"""
+    lines = []
+    for change in changes[:limit]:
+        where = f"m. {change['measure']}" if change['measure'] is not None else "(no bar)"
+        source = f" <- {change['source']}" if change['source'] else ""
+        lines.append(f"{change['part']} {where}{source}: {change['problem']}")
+    if len(changes) > limit:
+        lines.append(f"... and {len(changes) - limit} more")
+    return lines
+
+
+def main():
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    if len(args) < 2:
+        print(__doc__)
+        return
+
+    print("=" * 60)
+    print("CONTENT FINGERPRINT VERIFIER")
+    print("=" * 60)
+    *sources, output = args
+    expected = expected_parts([(Path(path).name, score_fingerprints(path)) for path in sources])
+    actual = score_fingerprints(output)
+    bars = sum(len(measures) for _, measures in actual)
+    print(f"  Sources: {len(sources)} file(s), {sum(map(len, expected))} bars")
+    print(f"  Output:  {Path(output).name}, {bars} bars")
+
+    changes = compare_fingerprints(expected, actual)
+    if not changes:
+        print("\nSUCCESS: musical content identical in every bar")
+        return
+    print(f"\nCONTENT CHANGED in {len(changes)} bar(s):")
+    for line in format_changes(changes):
+        print(f"  {line}")
+    sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
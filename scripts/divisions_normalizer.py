@@ -0,0 +1,238 @@
+#!/usr/bin/env python3
+"""
+DIVISIONS NORMALIZER
+====================
+Common time base for scores spliced together from different generators.
+
+The movement generators disagree on <divisions> (ticks per quarter note):
+256 in the excellence scripts, 480 in generate_v3_* and
+master_leadsheet_engine. A measure copied as-is into a suite whose earlier
+movements use another time base keeps its old durations, so it no longer
+adds up to its time signature. Before splicing, every movement is rescaled
+to the suite time base, the LCM of all <divisions> values in the inputs:
+  - every <divisions> becomes the time base
+  - <duration> (notes, <backup>, <forward>, figured bass), <offset> and the
+    note attack / release attributes are multiplied by
+    time base / divisions in force at that point (per part, document order)
+  - a part with durations ahead of its first <divisions> (MusicXML default
+    1) gets one declared in its first measure
+
+The values are gathered in one walk of the tree and rescaled with a single
+NumPy multiply; the LCM is a multiple of every input's divisions, so integer
+durations stay integers. Parts already on the time base are left untouched.
+
+The suite time base is found by scanning the raw XML for <divisions>, so
+the inputs do not have to be parsed twice.
+
+Usage:
+    python scripts/divisions_normalizer.py SCORE ...                    # report divisions and the LCM
+    python scripts/divisions_normalizer.py SCORE ... --write [--divisions N] [--compact] [--mxl]
+        # rewrite each score in place on the common time base (or N)
+"""
+
+import re
+import sys
+import xml.etree.ElementTree as ET
+import zipfile
+
+import numpy as np
+
+from score_writer import configure_output, open_score_source, parse_score, write_tree
+
+_DIVISIONS = re.compile(rb'<divisions>\s*([0-9.]+)\s*</divisions>')
+
+# Elements whose text is a duration in divisions
+_DURATION_TAGS = ('duration', 'offset')
+# <note> attributes given in divisions
+_NOTE_ATTRIBUTES = ('attack', 'release')
+# <attributes> children that precede <divisions>
+_BEFORE_DIVISIONS = {'footnote', 'level'}
+
+
+def _int(text, default=0):
+    try:
+        return int(round(float(text)))
+    except (TypeError, ValueError):
+        return default
+
+
+def _float(text):
+    try:
+        return float(text)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _number(value):
+    if float(value).is_integer():
+        return str(int(value))
+    return f"{value:.4f}".rstrip('0').rstrip('.')
+
+
+def scan_divisions(path):
+    """Set of <divisions> values in a score, read from the raw XML ({1} if none)."""
+    with open_score_source(path) as f:
+        values = {_int(v, 1) or 1 for v in _DIVISIONS.findall(f.read())}
+    return values or {1}
+
+
+def time_base(values):
+    """Least common multiple of divisions values."""
+    values = np.array(sorted(set(values)) or [1], dtype=np.int64)
+    return int(np.lcm.reduce(values))
+
+
+def suite_time_base(paths):
+    """
+    (time base, divisions values) for a set of scores to be spliced together.
+
+    Files that cannot be read are skipped; the assembly reports them itself.
+    """
+    values = set()
+    for path in paths:
+        try:
+            values |= scan_divisions(path)
+        except (OSError, zipfile.BadZipFile, KeyError):
+            continue
+    return time_base(values), sorted(values)
+
+
+def _on_time_base(part, target):
+    """True if the part declares divisions up front and only ever uses target."""
+    first = part.find('measure')
+    if first is None or first.find('attributes/divisions') is None:
+        return False
+    return all(_int(elem.text, 1) == target for elem in part.iter('divisions'))
+
+
+def _declare_divisions(part, target):
+    """Declare <divisions> ahead of the first note of a part."""
+    measure = part.find('measure')
+    if measure is None:
+        return
+    position = 0
+    while position < len(measure) and measure[position].tag == 'print':
+        position += 1
+    if position < len(measure) and measure[position].tag == 'attributes':
+        attributes = measure[position]
+        if attributes.find('divisions') is not None:
+            return
+    else:
+        attributes = ET.Element('attributes')
+        measure.insert(position, attributes)
+    position = 0
+    for i, child in enumerate(attributes):
+        if child.tag in _BEFORE_DIVISIONS:
+            position = i + 1
+    divisions = ET.Element('divisions')
+    divisions.text = str(target)
+    attributes.insert(position, divisions)
+
+
+def normalize_divisions(root, target=None):
+    """
+    Rescale a score, or a single <part>, to `target` divisions per quarter
+    (by default the LCM of its own divisions).
+
+    Returns a dict: divisions (the time base), parts (number of parts
+    rescaled) and rescaled (number of durations rewritten).
+    """
+    parts = list(root.iter('part'))
+    if target is None:
+        target = time_base(_int(elem.text, 1) or 1 for elem in root.iter('divisions'))
+    result = {'divisions': target, 'parts': 0, 'rescaled': 0}
+
+    # One entry per duration: (element, attribute or None), its value and
+    # the divisions in force where it occurs
+    targets = []
+    values = []
+    in_force = []
+    for part in parts:
+        if _on_time_base(part, target):
+            continue
+        result['parts'] += 1
+        divisions = 1
+        declared = False
+        # Durations met before any <divisions> (MusicXML default 1)
+        undeclared = False
+        for elem in part.iter():
+            tag = elem.tag
+            if tag == 'divisions':
+                divisions = _int(elem.text, 1) or 1
+                declared = True
+                elem.text = str(target)
+            elif tag in _DURATION_TAGS:
+                targets.append((elem, None))
+                values.append(_float(elem.text))
+                in_force.append(divisions)
+                undeclared = undeclared or not declared
+            elif tag == 'note':
+                for attr in _NOTE_ATTRIBUTES:
+                    if elem.get(attr) is not None:
+                        targets.append((elem, attr))
+                        values.append(_float(elem.get(attr)))
+                        in_force.append(divisions)
+                        undeclared = undeclared or not declared
+        if undeclared:
+            _declare_divisions(part, target)
+
+    if not targets:
+        return result
+
+    # Bulk rescale of every duration in one pass
+    in_force = np.array(in_force, dtype=np.int64)
+    scaled = np.array(values) * (target / in_force)
+    changed = in_force != target
+    for (elem, attr), value in zip(targets, scaled.tolist()):
+        if attr is None:
+            elem.text = _number(value)
+        else:
+            elem.set(attr, _number(value))
+    result['rescaled'] = int(np.count_nonzero(changed))
+    return result
+
+
+def main():
+    args = sys.argv[1:]
+    configure_output(args)
+    target = None
+    paths = []
+    skip = False
+    for i, arg in enumerate(args):
+        if skip:
+            skip = False
+        elif arg == '--divisions' and i + 1 < len(args):
+            target = int(args[i + 1])
+            skip = True
+        elif arg.startswith('--divisions='):
+            target = int(arg.split('=', 1)[1])
+        elif not arg.startswith('--'):
+            paths.append(arg)
+    if not paths:
+        print(__doc__)
+        return
+
+    print("=" * 60)
+    print("DIVISIONS NORMALIZER")
+    print("=" * 60)
+    for path in paths:
+        print(f"  {', '.join(map(str, sorted(scan_divisions(path)))):>12}  {path}")
+    base, values = suite_time_base(paths)
+    if target is None:
+        target = base
+    print(f"\nTime base: {target} divisions per quarter (LCM of {', '.join(map(str, values))})")
+
+    if '--write' not in args:
+        return
+    for path in paths:
+        tree = parse_score(path)
+        result = normalize_divisions(tree.getroot(), target)
+        if not result['parts']:
+            print(f"  Unchanged: {path}")
+            continue
+        path = write_tree(tree, path, indent=None)
+        print(f"  Rescaled {result['rescaled']} durations in {result['parts']} parts: {path}")
+
+
+if __name__ == "__main__":
+    main()
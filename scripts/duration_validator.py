@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+"""
+MEASURE DURATION VALIDATOR
+==========================
+Enforces config/musicxml-duration-rules.md on every measure of every part:
+
+    MEASURE_DURATION = (BEATS x DIVISIONS x 4) / BEAT_TYPE
+
+and every voice of a measure must fill exactly that duration (Rule 4) —
+the check that would have caught the 9/8 bars of V9 that added up to 10/8.
+
+Each score is read once into flat per-event arrays (notes, <backup>,
+<forward>). The checks then run as vectorized NumPy operations over all
+parts at once:
+  - durations are rescaled to a common tick per file (LCM of every
+    <divisions> value), so mid-score divisions changes compare correctly
+  - a per-measure cumulative sum of note / backup / forward advances gives
+    the cursor after each event; chord notes do not advance it
+  - voice totals (notes + forwards of that voice) and the furthest cursor
+    position are reduced per measure and compared against the <time> in
+    force for that measure. Voices are told apart by (staff, voice); a note
+    or forward without <voice> belongs to the stretch between two <backup>s
+    it sits in, so an unlabelled second staff after a <backup> is checked
+    on its own instead of being added to the first
+
+Pickup bars (implicit="yes") may be short but not long.
+
+Usage:
+    python scripts/duration_validator.py                 # every score under scores/
+    python scripts/duration_validator.py FILE_OR_DIR ... # specific scores / folders
+
+Exits with status 1 if any measure is invalid. Requires numpy.
+"""
+
+import os
+import sys
+import time
+import xml.etree.ElementTree as ET
+
+import numpy as np
+
+from note_events import find_scores
+from score_writer import open_score_source
+
+EVENT_DTYPE = np.dtype([
+    ('measure', np.int32),     # row in the measure table
+    ('kind', np.int8),         # EVENT_*
+    ('voice', np.int16),       # 0 when the element has no <voice>
+    ('staff', np.int16),
+    ('chord', np.bool_),
+    ('duration', np.int64),    # in the file's own <divisions>
+    ('divisions', np.int64),
+])
+
+MEASURE_DTYPE = np.dtype([
+    ('file', np.int16),
+    ('part', np.int16),
+    ('ordinal', np.int32),     # 1-based measure position within the part
+    ('beats', np.int32),
+    ('beat_type', np.int32),
+    ('divisions', np.int32),   # <divisions> in force at the end of the measure
+    ('implicit', np.bool_),
+])
+
+EVENT_NOTE = 0
+EVENT_BACKUP = 1
+EVENT_FORWARD = 2
+
+_KINDS = {'note': EVENT_NOTE, 'backup': EVENT_BACKUP, 'forward': EVENT_FORWARD}
+
+# Voice lanes from this value on stand for notes without a <voice>
+_UNLABELLED = 32768
+
+
+def _int(text, default=0):
+    try:
+        return int(round(float(text)))
+    except (TypeError, ValueError):
+        return default
+
+
+def _beats(text):
+    """Numerator of a <time>, including additive meters such as 3+2+2."""
+    return sum(_int(b) for b in (text or '').split('+')) or 4
+
+
+def load_duration_events(source, file_index=0):
+    """
+    Read one score into (events, measures, part_ids, measure_numbers).
+
+    events    EVENT_DTYPE array in document order
+    measures  MEASURE_DTYPE array, one row per <measure> of every part
+    """
+    if isinstance(source, str) or hasattr(source, '__fspath__'):
+        with open_score_source(source) as f:
+            return load_duration_events(f, file_index)
+    events = []
+    measures = []
+    numbers = []
+    part_ids = []
+    part_index = 0
+    ordinal = 0
+    divisions = 1
+    beats, beat_type = 4, 4
+
+    for _, elem in ET.iterparse(source, events=('end',)):
+        tag = elem.tag
+        kind = _KINDS.get(tag)
+        if kind is not None:
+            if kind == EVENT_NOTE:
+                duration = 0 if elem.find('grace') is not None else _int(elem.findtext('duration'))
+                chord = elem.find('chord') is not None
+            else:
+                duration = _int(elem.findtext('duration'))
+                chord = False
+            voice = _int(elem.findtext('voice'), 0) if kind != EVENT_BACKUP else 0
+            staff = _int(elem.findtext('staff'), 1)
+            events.append((len(measures), kind, voice, staff, chord, duration, divisions))
+        elif tag == 'divisions':
+            divisions = _int(elem.text, 1) or 1
+        elif tag == 'time':
+            beats = _beats(elem.findtext('beats'))
+            beat_type = _int(elem.findtext('beat-type'), 4) or 4
+        elif tag == 'measure':
+            ordinal += 1
+            measures.append((file_index, part_index, ordinal, beats, beat_type,
+                             divisions, elem.get('implicit') == 'yes'))
+            numbers.append(elem.get('number', str(ordinal)))
+            elem.clear()
+        elif tag == 'part':
+            part_ids.append(elem.get('id', f"P{part_index + 1}"))
+            part_index += 1
+            ordinal = 0
+            divisions = 1
+            beats, beat_type = 4, 4
+            elem.clear()
+
+    return (np.array(events, dtype=EVENT_DTYPE), np.array(measures, dtype=MEASURE_DTYPE),
+            part_ids, numbers)
+
+
+def _segment_cumsum(values, segment_ids):
+    """Cumulative sum that restarts whenever segment_ids changes (ids sorted)."""
+    total = np.cumsum(values)
+    starts = np.flatnonzero(np.r_[True, segment_ids[1:] != segment_ids[:-1]])
+    before = np.r_[0, total][starts]
+    lengths = np.diff(np.r_[starts, len(values)])
+    return total - np.repeat(before, lengths)
+
+
+def _tick_lcm(events):
+    """Least common multiple of every <divisions> value used by the events."""
+    if len(events) == 0:
+        return 1
+    return int(np.lcm.reduce(np.unique(events['divisions'])))
+
+
+def check_measures(events, measures):
+    """
+    Vectorized Rule 1 / Rule 4 check.
+
+    Returns (expected, voice_rows, staff_ids, voice_ids, voice_fill, extent)
+    where all durations are in beat_type-scaled ticks so integer comparison
+    is exact:
+      expected[m]      required length of measure m
+      voice_fill[i]    notes + forwards of voice voice_ids[i] on staff
+                       staff_ids[i] in measure voice_rows[i]
+      extent[m]        furthest cursor position reached in measure m
+
+    Notes without <voice> are grouped by the <backup> segment they are in
+    and reported as voice 1 for the first segment, 2 for the next, ...
+    """
+    n_measures = len(measures)
+    # Common tick: LCM of all divisions in play, times the measure's beat-type
+    lcm = _tick_lcm(events)
+    beat_type = measures['beat_type'].astype(np.int64)
+    expected = measures['beats'].astype(np.int64) * 4 * lcm
+
+    if len(events) == 0:
+        empty = np.zeros(0, dtype=np.int64)
+        return expected, empty, empty, empty, empty, np.zeros(n_measures, dtype=np.int64)
+
+    m = events['measure']
+    ticks = events['duration'] * (lcm // events['divisions']) * beat_type[m]
+    kind = events['kind']
+    advance = np.where(kind == EVENT_BACKUP, -ticks,
+                       np.where((kind == EVENT_NOTE) & events['chord'], 0, ticks))
+    cursor = _segment_cumsum(advance, m)
+
+    extent = np.zeros(n_measures, dtype=np.int64)
+    np.maximum.at(extent, m, cursor)
+
+    # Voice totals: non-chord notes and forwards, keyed by (measure, staff,
+    # voice). Without <voice> the lane is the number of <backup>s before the
+    # event in its measure, offset past any real voice number.
+    segment = _segment_cumsum((kind == EVENT_BACKUP).astype(np.int64), m)
+    voice = events['voice'].astype(np.int64)
+    lane = np.where(voice > 0, voice, _UNLABELLED + segment)
+    fills = (kind != EVENT_BACKUP) & ~events['chord']
+    key = (m[fills].astype(np.int64) << 32) + (events['staff'][fills].astype(np.int64) << 16) + lane[fills]
+    keys, inverse = np.unique(key, return_inverse=True)
+    voice_fill = np.bincount(inverse, weights=ticks[fills]).astype(np.int64)
+    lanes = keys & 0xFFFF
+    voice_ids = np.where(lanes >= _UNLABELLED, lanes - _UNLABELLED + 1, lanes)
+    return expected, keys >> 32, (keys >> 16) & 0xFFFF, voice_ids, voice_fill, extent
+
+
+def validate_score(path, file_index=0):
+    """
+    Validate one score. Returns (measure_count, errors) where each error is a
+    dict: part, measure, ordinal, staff, voice, time, expected, actual (durations in
+    the measure's own divisions) and problem ('voice fill', 'overflow' or
+    'empty').
+    """
+    events, measures, part_ids, numbers = load_duration_events(path, file_index)
+    expected, voice_rows, staff_ids, voice_ids, voice_fill, extent = check_measures(events, measures)
+    if len(measures) == 0:
+        return 0, []
+
+    lcm = _tick_lcm(events)
+    implicit = measures['implicit']
+    beat_type = measures['beat_type'].astype(np.int64)
+
+    # Voices that do not fill their measure (pickups may be short)
+    bad_voice = voice_fill != expected[voice_rows]
+    bad_voice &= ~(implicit[voice_rows] & (voice_fill < expected[voice_rows]))
+    # Cursor running past the barline (e.g. a missing <backup>), reported
+    # only where no voice total already explains it
+    bad_extent = extent > expected
+    bad_extent[voice_rows[bad_voice]] = False
+    # Measures with no notes at all
+    has_events = np.zeros(len(measures), dtype=bool)
+    has_events[voice_rows] = True
+    bad_empty = ~has_events & ~implicit
+
+    def to_divisions(ticks, row):
+        # Report in the measure's own <divisions> units
+        quarters = ticks / (beat_type[row] * lcm)
+        return int(round(quarters * measures['divisions'][row]))
+
+    errors = []
+
+    def report(row, staff, voice, actual_ticks, problem):
+        m = measures[row]
+        errors.append({
+            'part': part_ids[m['part']],
+            'measure': numbers[row],
+            'ordinal': int(m['ordinal']),
+            'staff': staff,
+            'voice': voice,
+            'time': f"{m['beats']}/{m['beat_type']}",
+            'expected': to_divisions(expected[row], row),
+            'actual': to_divisions(actual_ticks, row),
+            'problem': problem,
+        })
+
+    for i in np.flatnonzero(bad_voice):
+        report(voice_rows[i], int(staff_ids[i]), int(voice_ids[i]), voice_fill[i], 'voice fill')
+    for row in np.flatnonzero(bad_extent):
+        report(row, None, None, extent[row], 'overflow')
+    for row in np.flatnonzero(bad_empty):
+        report(row, None, None, 0, 'empty')
+
+    errors.sort(key=lambda e: (part_ids.index(e['part']), e['ordinal'],
+                               e['staff'] or 0, e['voice'] if e['voice'] is not None else -1))
+    return len(measures), errors
+
+
+def main():
+    targets = sys.argv[1:] or [os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                            "..", "scores")]
+    paths = []
+    for target in targets:
+        paths.extend(find_scores(target) if os.path.isdir(target) else [target])
+
+    print("=" * 70)
+    print("MEASURE DURATION VALIDATOR")
+    print("=" * 70)
+
+    start = time.perf_counter()
+    total_measures = 0
+    invalid_files = 0
+    total_errors = 0
+    for index, path in enumerate(paths):
+        name = os.path.relpath(path)
+        try:
+            count, errors = validate_score(path, index)
+        except ET.ParseError as e:
+            print(f"\n{name}\n  SKIPPED (unreadable): {e}")
+            continue
+        total_measures += count
+        if not errors:
+            continue
+        invalid_files += 1
+        total_errors += len(errors)
+        print(f"\n{name}  [{len(errors)} error(s) in {count} measures]")
+        for e in errors:
+            voice = f" voice {e['voice']}" if e['voice'] is not None else ""
+            if e['staff'] and e['staff'] > 1:
+                voice = f" staff {e['staff']}" + voice
+            diff = e['actual'] - e['expected']
+            print(f"  {e['part']:<6} m.{e['measure']:<5} ({e['time']}){voice}: "
+                  f"{e['problem']} {e['actual']} != {e['expected']} ({diff:+d})")
+
+    elapsed = time.perf_counter() - start
+    print("\n" + "=" * 70)
+    print(f"{len(paths)} file(s), {total_measures} measures checked in {elapsed:.2f}s")
+    print(f"{total_errors} error(s) in {invalid_files} file(s)")
+    sys.exit(1 if total_errors else 0)
+
+
+if __name__ == "__main__":
+    main()
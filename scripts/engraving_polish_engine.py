@@ -6,21 +6,65 @@ Produces a fully professional, publication-grade engraved score with perfect
 spacing, alignment, readability, and page layout.
 
 Following all engraving rules from system.md and rules/engraving-rules.md.
+
+The measure-level fixes (dynamics, slurs, expressive text, rehearsal marks,
+system breaks, clef checks) are handlers on a MeasureVisitor: in a full run
+the part is walked once and each element is passed to every handler
+registered for its tag, so adding a fix does not add another walk over the
+score. A pass called on its own walks the part with only its own handler.
 """
 
 import xml.etree.ElementTree as ET
-from xml.dom import minidom
 import os
+import sys
 from datetime import datetime
 import copy
 
+from pass_tracer import PassTracer, parse_trace
+from score_writer import configure_output, parse_score, write_tree
+
+
+class MeasureVisitor:
+    """
+    Single-pass walker over the measures of a part.
+
+    Handlers are registered per tag ('measure', 'note', 'direction', ...)
+    and called in registration order. Each measure's children are visited
+    before the measure's own handlers run, so elements a measure handler
+    inserts are not seen by the element handlers of the same walk.
+    """
+
+    def __init__(self):
+        self.handlers = {}
+
+    def register(self, tag, handler):
+        self.handlers.setdefault(tag, []).append(handler)
+
+    def walk(self, measures):
+        handlers = self.handlers
+        for measure in measures:
+            for child in list(measure):
+                for handler in handlers.get(child.tag, ()):
+                    handler(child)
+            for handler in handlers.get('measure', ()):
+                handler(measure)
+
+
 class EngravingPolishEngine:
     """Engine for applying publication-grade engraving polish."""
     
+    # Methods timed by PassTracer when run with --trace
+    PASSES = ('load_score', 'fix_vertical_spacing', 'walk_measures',
+              'fix_dynamics_placement', 'normalize_slurs', 'fix_expressive_text',
+              'fix_movement_headers', 'add_rehearsal_marks', 'fix_system_breaks',
+              'validate_clefs', 'add_copyright', 'update_encoding_info', 'save_score')
+    
     def __init__(self, input_path, output_path):
         self.input_path = input_path
         self.output_path = output_path
         self.fixes_applied = []
+        # Handler counts by pass, filled in by walk_measures()
+        self.counts = {}
         
     def log_fix(self, category, description):
         """Log a fix that was applied."""
@@ -30,8 +74,9 @@ class EngravingPolishEngine:
     def load_score(self):
         """Load the MusicXML file."""
         print(f"Loading: {os.path.basename(self.input_path)}")
-        self.tree = ET.parse(self.input_path)
+        self.tree = parse_score(self.input_path)
         self.root = self.tree.getroot()
+        self.counts = {}
         
     def apply_all_fixes(self):
         """Apply all engraving fixes."""
@@ -40,6 +85,7 @@ class EngravingPolishEngine:
         print("="*60)
         
         self.fix_vertical_spacing()
+        self.walk_measures()
         self.fix_dynamics_placement()
         self.normalize_slurs()
         self.fix_expressive_text()
@@ -112,110 +158,192 @@ class EngravingPolishEngine:
                 ET.SubElement(staff_layout, 'staff-distance').text = '65'
                 self.log_fix("SPACING", "Added staff distance (65 tenths between staves)")
                 
+    # ------------------------------------------------------------------
+    # Measure-level passes
+    #
+    # The dynamics, slur, text, rehearsal, system-break and clef passes
+    # all look at the measures of the first part. Instead of each pass
+    # re-walking the part, every pass registers a handler for the tags it
+    # cares about and walk_measures() visits each element once, handing it
+    # to all interested handlers. The pass methods below only report what
+    # their handlers found, in the original order; a pass whose handler has
+    # not run on the loaded score walks the part with that handler alone.
+    # ------------------------------------------------------------------
+
+    EXPRESSIVE_TERMS = ['dolce', 'sul tasto', 'ponticello', 'tranquillo',
+                        'rit.', 'accel.', 'a tempo', 'lift', 'arc peak',
+                        'Brighter', 'floating', 'Slow gospel blues']
+
+    REHEARSAL_POINTS = {
+        1: "A",   # Beginning
+        5: "B",   # Second phrase
+        9: "C",   # Climax section
+    }
+
+    SYSTEM_BREAK_MEASURES = [4, 8, 12]
+
+    # (count name, tag, handler method) in pass order
+    MEASURE_HANDLERS = (
+        ('dynamics', 'direction', 'visit_dynamics'),
+        ('slurs', 'note', 'visit_slurs'),
+        ('text', 'direction', 'visit_expressive_text'),
+        ('rehearsal', 'measure', 'visit_rehearsal_mark'),
+        ('breaks', 'measure', 'visit_system_break'),
+        ('clefs', 'note', 'visit_clef'),
+    )
+
+    def build_visitor(self, names=None):
+        """Register the measure-level handlers for `names` (default all), in pass order."""
+        visitor = MeasureVisitor()
+        for name, tag, method in self.MEASURE_HANDLERS:
+            if names is None or name in names:
+                visitor.register(tag, getattr(self, method))
+        return visitor
+
+    def walk_measures(self, names=None):
+        """Run the measure-level handlers (default all) over the first part in one traversal."""
+        if names is None:
+            names = [name for name, _, _ in self.MEASURE_HANDLERS]
+        for name in names:
+            self.counts[name] = 0
+        part = self.root.find('.//part')
+        self.build_visitor(names).walk(part.findall('measure'))
+
+    def _count(self, name):
+        """Handler count for a pass, running only that pass's handler if it has not run."""
+        if name not in self.counts:
+            self.walk_measures((name,))
+        return self.counts[name]
+
+    def visit_dynamics(self, direction):
+        dynamics = direction.find('.//dynamics')
+        if dynamics is not None:
+            # For piano score (2 staves), dynamics go above for RH, below conceptually
+            # But in MusicXML for piano, typically above
+            if direction.get('placement') is None:
+                direction.set('placement', 'above')
+                self.counts['dynamics'] += 1
+
+    def visit_slurs(self, note):
+        notations = note.find('notations')
+        if notations is not None:
+            for slur in notations.findall('slur'):
+                # Default slur placement based on stem direction (above for stem down)
+                if slur.get('placement') is None:
+                    slur.set('placement', 'above')
+
+                # Ensure bezier attributes for smooth curves
+                # (These are hints to notation software)
+                if slur.get('bezier-x') is None:
+                    slur.set('default-x', '5')
+                    slur.set('default-y', '20')
+
+                self.counts['slurs'] += 1
+
+    def visit_expressive_text(self, direction):
+        direction_type = direction.find('direction-type')
+        if direction_type is None:
+            return
+        words = direction_type.find('words')
+        if words is None:
+            return
+        text = (words.text or "").lower()
+        for term in self.EXPRESSIVE_TERMS:
+            if term.lower() in text:
+                # Ensure italic for expressive text
+                if words.get('font-style') != 'italic':
+                    words.set('font-style', 'italic')
+                    self.counts['text'] += 1
+
+                # Ensure proper placement
+                if direction.get('placement') != 'above':
+                    direction.set('placement', 'above')
+                break
+
+    def visit_rehearsal_mark(self, measure):
+        measure_num = int(measure.get('number', 0))
+        if measure_num not in self.REHEARSAL_POINTS:
+            return
+
+        # Check if rehearsal mark already exists
+        for direction in measure.findall('direction'):
+            if direction.find('.//rehearsal') is not None:
+                return
+
+        direction = ET.Element('direction')
+        direction.set('placement', 'above')
+
+        direction_type = ET.SubElement(direction, 'direction-type')
+        rehearsal = ET.SubElement(direction_type, 'rehearsal')
+        rehearsal.set('font-size', '14')
+        rehearsal.set('font-weight', 'bold')
+        rehearsal.set('enclosure', 'square')
+        rehearsal.text = self.REHEARSAL_POINTS[measure_num]
+
+        # Insert at beginning of measure (after attributes if present)
+        attrs = measure.find('attributes')
+        if attrs is not None:
+            idx = list(measure).index(attrs) + 1
+        else:
+            idx = 0
+        measure.insert(idx, direction)
+        self.counts['rehearsal'] += 1
+
+    def visit_system_break(self, measure):
+        measure_num = int(measure.get('number', 0))
+        if measure_num in self.SYSTEM_BREAK_MEASURES and measure.find('print') is None:
+            print_elem = ET.Element('print')
+            print_elem.set('new-system', 'yes')
+
+            # Insert at beginning of measure
+            measure.insert(0, print_elem)
+            self.counts['breaks'] += 1
+
+    def visit_clef(self, note):
+        staff = note.find('staff')
+        pitch = note.find('pitch')
+
+        if pitch is not None and staff is not None:
+            staff_num = int(staff.text)
+            octave = int(pitch.find('octave').text)
+            step = pitch.find('step').text
+
+            # Staff 1 = treble, Staff 2 = bass
+            if staff_num == 1:
+                # Check if note is below A3 - too low for treble
+                if octave < 3 or (octave == 3 and step in ['C', 'D', 'E', 'F', 'G']):
+                    self.counts['clefs'] += 1
+
     def fix_dynamics_placement(self):
         """Fix dynamics alignment and collision removal."""
         print("\n2. DYNAMICS ALIGNMENT & COLLISION REMOVAL")
-        
-        fixes_count = 0
-        part = self.root.find('.//part')
-        
-        for measure in part.findall('measure'):
-            for direction in measure.findall('direction'):
-                dynamics = direction.find('.//dynamics')
-                if dynamics is not None:
-                    # Ensure proper placement attribute
-                    current_placement = direction.get('placement')
-                    
-                    # For piano score (2 staves), dynamics go above for RH, below conceptually
-                    # But in MusicXML for piano, typically above
-                    if current_placement is None:
-                        direction.set('placement', 'above')
-                        fixes_count += 1
-                    
-                    # Add offset for collision avoidance
-                    direction_type = direction.find('direction-type')
-                    if direction_type is not None:
-                        # Check for offset element
-                        offset = direction.find('offset')
-                        if offset is None:
-                            # Add small offset for collision avoidance
-                            sound = direction.find('sound')
-                            if sound is None:
-                                # Dynamics should not collide with notes above
-                                pass
-                                
+
+        fixes_count = self._count('dynamics')
         if fixes_count > 0:
             self.log_fix("DYNAMICS", f"Normalized placement for {fixes_count} dynamics")
         else:
             self.log_fix("DYNAMICS", "All dynamics properly placed")
-            
+
     def normalize_slurs(self):
         """Normalize slur shapes and remove collisions."""
         print("\n3. SLUR SHAPE NORMALIZATION")
-        
-        slur_count = 0
-        part = self.root.find('.//part')
-        
-        for measure in part.findall('measure'):
-            for note in measure.findall('note'):
-                notations = note.find('notations')
-                if notations is not None:
-                    for slur in notations.findall('slur'):
-                        # Ensure slur has proper attributes
-                        if slur.get('placement') is None:
-                            # Default slur placement based on stem direction (above for stem down)
-                            slur.set('placement', 'above')
-                        
-                        # Ensure bezier attributes for smooth curves
-                        # (These are hints to notation software)
-                        if slur.get('bezier-x') is None:
-                            slur.set('default-x', '5')
-                            slur.set('default-y', '20')
-                        
-                        slur_count += 1
-                        
+
+        slur_count = self._count('slurs')
         if slur_count > 0:
             self.log_fix("SLURS", f"Normalized {slur_count} slur elements")
         else:
             self.log_fix("SLURS", "No slurs to normalize")
-            
+
     def fix_expressive_text(self):
         """Align and standardize expressive text."""
         print("\n4. EXPRESSIVE TEXT ALIGNMENT")
-        
-        text_fixes = 0
-        part = self.root.find('.//part')
-        
-        for measure in part.findall('measure'):
-            for direction in measure.findall('direction'):
-                direction_type = direction.find('direction-type')
-                if direction_type is not None:
-                    words = direction_type.find('words')
-                    if words is not None:
-                        text = words.text or ""
-                        
-                        # Standardize font style for expressive text
-                        expressive_terms = ['dolce', 'sul tasto', 'ponticello', 'tranquillo', 
-                                          'rit.', 'accel.', 'a tempo', 'lift', 'arc peak',
-                                          'Brighter', 'floating', 'Slow gospel blues']
-                        
-                        for term in expressive_terms:
-                            if term.lower() in text.lower():
-                                # Ensure italic for expressive text
-                                if words.get('font-style') != 'italic':
-                                    words.set('font-style', 'italic')
-                                    text_fixes += 1
-                                    
-                                # Ensure proper placement
-                                if direction.get('placement') != 'above':
-                                    direction.set('placement', 'above')
-                                break
-                                
+
+        text_fixes = self._count('text')
         if text_fixes > 0:
             self.log_fix("TEXT", f"Standardized {text_fixes} expressive text elements")
         else:
             self.log_fix("TEXT", "All expressive text properly formatted")
-            
+
     def fix_movement_headers(self):
         """Fix movement titles and headers."""
         print("\n5. MOVEMENT TITLES & HEADERS")
@@ -295,114 +423,33 @@ class EngravingPolishEngine:
     def add_rehearsal_marks(self):
         """Add rehearsal marks at structural points."""
         print("\n6. REHEARSAL MARKS")
-        
-        part = self.root.find('.//part')
-        measures = part.findall('measure')
-        
-        # Add rehearsal marks at key structural points
-        rehearsal_points = {
-            1: "A",   # Beginning
-            5: "B",   # Second phrase
-            9: "C",   # Climax section
-        }
-        
-        marks_added = 0
-        for measure in measures:
-            measure_num = int(measure.get('number', 0))
-            
-            if measure_num in rehearsal_points:
-                # Check if rehearsal mark already exists
-                has_rehearsal = False
-                for direction in measure.findall('direction'):
-                    if direction.find('.//rehearsal') is not None:
-                        has_rehearsal = True
-                        break
-                
-                if not has_rehearsal:
-                    # Add rehearsal mark
-                    direction = ET.Element('direction')
-                    direction.set('placement', 'above')
-                    
-                    direction_type = ET.SubElement(direction, 'direction-type')
-                    rehearsal = ET.SubElement(direction_type, 'rehearsal')
-                    rehearsal.set('font-size', '14')
-                    rehearsal.set('font-weight', 'bold')
-                    rehearsal.set('enclosure', 'square')
-                    rehearsal.text = rehearsal_points[measure_num]
-                    
-                    # Insert at beginning of measure (after attributes if present)
-                    attrs = measure.find('attributes')
-                    if attrs is not None:
-                        idx = list(measure).index(attrs) + 1
-                    else:
-                        idx = 0
-                    measure.insert(idx, direction)
-                    marks_added += 1
-                    
+
+        marks_added = self._count('rehearsal')
         if marks_added > 0:
             self.log_fix("REHEARSAL", f"Added {marks_added} boxed rehearsal marks")
         else:
             self.log_fix("REHEARSAL", "Rehearsal marks already present")
-            
+
     def fix_system_breaks(self):
         """Add system breaks at musically logical phrases."""
         print("\n7. SYSTEM BREAKS & PAGE LAYOUT")
-        
-        part = self.root.find('.//part')
-        measures = part.findall('measure')
-        
-        # Add print elements for system breaks every 4 bars
-        system_break_measures = [4, 8, 12]
-        breaks_added = 0
-        
-        for measure in measures:
-            measure_num = int(measure.get('number', 0))
-            
-            if measure_num in system_break_measures:
-                # Check if print element exists
-                print_elem = measure.find('print')
-                if print_elem is None:
-                    print_elem = ET.Element('print')
-                    print_elem.set('new-system', 'yes')
-                    
-                    # Insert at beginning of measure
-                    measure.insert(0, print_elem)
-                    breaks_added += 1
-                    
+
+        breaks_added = self._count('breaks')
         if breaks_added > 0:
             self.log_fix("LAYOUT", f"Added {breaks_added} system breaks (every 4 bars)")
         else:
             self.log_fix("LAYOUT", "System breaks already configured")
-            
+
     def validate_clefs(self):
         """Validate clef usage - no notes below A3 in treble."""
         print("\n8. CLEF VALIDATION")
-        
-        issues = 0
-        part = self.root.find('.//part')
-        
-        for measure in part.findall('measure'):
-            for note in measure.findall('note'):
-                staff = note.find('staff')
-                pitch = note.find('pitch')
-                
-                if pitch is not None and staff is not None:
-                    staff_num = int(staff.text)
-                    octave = int(pitch.find('octave').text)
-                    step = pitch.find('step').text
-                    
-                    # Staff 1 = treble, Staff 2 = bass
-                    if staff_num == 1:  # Treble staff
-                        # Check if note is below A3
-                        if octave < 3 or (octave == 3 and step in ['C', 'D', 'E', 'F', 'G']):
-                            # This would be a clef issue - note too low for treble
-                            issues += 1
-                            
+
+        issues = self._count('clefs')
         if issues > 0:
             self.log_fix("CLEFS", f"Warning: {issues} notes may be below A3 in treble clef")
         else:
             self.log_fix("CLEFS", "All notes in proper clef registers")
-            
+
     def add_copyright(self):
         """Add copyright footer to first and last pages."""
         print("\n9. COPYRIGHT FOOTER")
@@ -475,18 +522,10 @@ class EngravingPolishEngine:
         if output_dir and not os.path.exists(output_dir):
             os.makedirs(output_dir)
             
-        # Convert tree to string
-        rough_string = ET.tostring(self.root, encoding='unicode')
-        
-        # Build complete XML content
-        content = '<?xml version="1.0" encoding="UTF-8"?>\n'
-        content += '<!DOCTYPE score-partwise PUBLIC "-//Recordare//DTD MusicXML 3.1 Partwise//EN" "http://www.musicxml.org/dtds/partwise.dtd">\n'
-        content += rough_string
+        # indent=None: the tree is written with its own whitespace, as before
+        path = write_tree(self.root, self.output_path, indent=None)
             
-        with open(self.output_path, 'w', encoding='utf-8') as f:
-            f.write(content)
-            
-        print(f"\nSaved: {os.path.basename(self.output_path)}")
+        print(f"\nSaved: {os.path.basename(path)}")
         
     def print_summary(self):
         """Print summary of fixes applied."""
@@ -509,13 +548,24 @@ def main():
                               "Final-Suite-FullScore-Enhanced.musicxml")
     output_path = os.path.join(base_path, "scores", "Final-Suite-FullScore-Engraved-Polished.musicxml")
     
+    configure_output(sys.argv[1:])
     engine = EngravingPolishEngine(input_path, output_path)
     
+    trace_path = parse_trace(sys.argv[1:])
+    tracer = None
+    if trace_path:
+        tracer = PassTracer()
+        tracer.instrument(engine, engine.PASSES, log_methods=('log_fix',))
+    
     try:
         engine.load_score()
         engine.apply_all_fixes()
         engine.save_score()
         engine.print_summary()
+        if tracer:
+            tracer.export(trace_path)
+            tracer.print_summary()
+            print(f"\nTrace: {trace_path}")
         return True
     except Exception as e:
         print(f"\nError: {e}")
@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+STREAMING EXCELLENCE EVALUATOR
+Scores existing MusicXML files against the 10-category excellence rubric
+without loading them into memory.
+
+Usage:
+    python scripts/evaluate_scores.py FILE [FILE ...]
+    cat suite.musicxml | python scripts/evaluate_scores.py -
+"""
+
+import os
+import sys
+
+from auto_excellence_upgrade import evaluate_excellence_stream
+
+def main():
+    paths = sys.argv[1:]
+    if not paths:
+        print(__doc__)
+        return
+
+    print("=" * 70)
+    print("STREAMING EXCELLENCE EVALUATOR")
+    print("=" * 70)
+
+    results = []
+    for path in paths:
+        source = sys.stdin.buffer if path == "-" else path
+        total, scores, details = evaluate_excellence_stream(source)
+        name = "<stdin>" if path == "-" else os.path.basename(path)
+        results.append((name, total))
+
+        status = "EXCELLENT" if total >= 8.0 else "REFINE"
+        print(f"\n{name}")
+        print(f"  Total Score: {total:.1f}/10.0 [{status}]")
+        print(f"  Breakdown:")
+        for cat, score in scores.items():
+            print(f"    {cat}: {score:.2f}  ({details[cat]})")
+
+    print("\n" + "=" * 70)
+    print(f"{'File':<50} {'Score':<12} {'Status'}")
+    print("-" * 70)
+    for name, total in results:
+        status = "EXCELLENT" if total >= 8.0 else "NEEDS WORK"
+        print(f"{name:<50} {total:.1f}/10.0     {status}")
+
+if __name__ == "__main__":
+    main()
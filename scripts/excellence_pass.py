@@ -2,12 +2,18 @@
 """
 EXCELLENCE PASS - FOUR MOVEMENTS
 Evaluate, refine, and output Movement1-4-Excellent.musicxml
+Each movement is streamed into its output file through a ScoreWriter and
+scored from the written file.
 """
 
 import os
+import sys
+
+from score_features import extract_features, has_marker, stream_features
+from score_writer import ScoreWriter, configure_output, stream_if_changed
 
 # ============ SHARED UTILITIES ============
-def note(step, oct, dur, typ, alt=None, dot=False, chord=False, 
+def note(out, step, oct, dur, typ, alt=None, dot=False, chord=False, 
          slur_s=False, slur_e=False, acc=False, stac=False, ferm=False, 
          staff=1, tie_s=False, tie_e=False):
     x = "      <note>\n"
@@ -44,12 +50,12 @@ def note(step, oct, dur, typ, alt=None, dot=False, chord=False,
     if nots:
         x += "        <notations>" + "".join(nots) + "</notations>\n"
     x += "      </note>\n"
-    return x
+    out.write(x)
 
-def rest(dur, typ, staff=1):
-    return f"      <note><rest/><duration>{dur}</duration><type>{typ}</type><staff>{staff}</staff></note>\n"
+def rest(out, dur, typ, staff=1):
+    out.write(f"      <note><rest/><duration>{dur}</duration><type>{typ}</type><staff>{staff}</staff></note>\n")
 
-def harmony(root, kind, degs=None):
+def harmony(out, root, kind, degs=None):
     x = '      <harmony print-frame="no">\n'
     x += f'        <root><root-step>{root[0]}</root-step>'
     if len(root) > 1:
@@ -60,9 +66,9 @@ def harmony(root, kind, degs=None):
         for v, a, t in degs:
             x += f'        <degree><degree-value>{v}</degree-value><degree-alter>{a}</degree-alter><degree-type>{t}</degree-type></degree>\n'
     x += '      </harmony>\n'
-    return x
+    out.write(x)
 
-def direction(txt=None, dyn=None, tempo=None, place="above"):
+def direction(out, txt=None, dyn=None, tempo=None, place="above"):
     x = f'      <direction placement="{place}">\n        <direction-type>\n'
     if txt:
         x += f'          <words font-style="italic">{txt}</words>\n'
@@ -71,16 +77,16 @@ def direction(txt=None, dyn=None, tempo=None, place="above"):
     if tempo:
         x += f'          <metronome><beat-unit>quarter</beat-unit><per-minute>{tempo}</per-minute></metronome>\n'
     x += '        </direction-type>\n      </direction>\n'
-    return x
+    out.write(x)
 
-def backup(dur):
-    return f"      <backup><duration>{dur}</duration></backup>\n"
+def backup(out, dur):
+    out.write(f"      <backup><duration>{dur}</duration></backup>\n")
 
-def barline(style="light-heavy"):
-    return f'      <barline location="right"><bar-style>{style}</bar-style></barline>\n'
+def barline(out, style="light-heavy"):
+    out.write(f'      <barline location="right"><bar-style>{style}</bar-style></barline>\n')
 
-def header(title, key_fifths=0):
-    return f'''<?xml version="1.0" encoding="UTF-8"?>
+def header(out, title, key_fifths=0):
+    out.write(f'''<?xml version="1.0" encoding="UTF-8"?>
 <!DOCTYPE score-partwise PUBLIC "-//Recordare//DTD MusicXML 3.1 Partwise//EN" "http://www.musicxml.org/dtds/partwise.dtd">
 <score-partwise version="3.1">
   <work><work-title>{title}</work-title></work>
@@ -93,15 +99,15 @@ def header(title, key_fifths=0):
     <score-part id="P1"><part-name>Piano</part-name></score-part>
   </part-list>
   <part id="P1">
-'''
+''')
 
-def footer():
-    return '''  </part>
+def footer(out):
+    out.write('''  </part>
 </score-partwise>
-'''
+''')
 
-def attributes(key_fifths=0):
-    return f'''      <attributes>
+def attributes(out, key_fifths=0):
+    out.write(f'''      <attributes>
         <divisions>256</divisions>
         <key><fifths>{key_fifths}</fifths></key>
         <time><beats>4</beats><beat-type>4</beat-type></time>
@@ -109,55 +115,63 @@ def attributes(key_fifths=0):
         <clef number="1"><sign>G</sign><line>2</line></clef>
         <clef number="2"><sign>F</sign><line>4</line></clef>
       </attributes>
-'''
+''')
 
 # ============ FULL EXCELLENCE EVALUATION ============
 def evaluate_excellence(name, xml):
     """10-point Music Criteria of Excellence"""
+    return score_excellence(extract_features(xml))
+
+def evaluate_excellence_stream(name, source):
+    """Same rubric, streamed from a score file"""
+    return score_excellence(stream_features(source))
+
+def score_excellence(f):
+    """Apply the rubric to a score_features feature dict"""
     scores = {}
     
     # 1. Motivic Identity (is motif present and clear?)
-    scores["Motivic Identity"] = 1 if xml.count('<slur') >= 8 else 0
+    scores["Motivic Identity"] = 1 if f['slurs'] >= 8 else 0
     
     # 2. Motivic Development (transformations applied?)
-    accent_count = xml.count('<accent/>')
+    accent_count = f['accents']
     scores["Motivic Development"] = 1 if accent_count >= 4 else 0
     
     # 3. Melodic Contour (register variety)
-    oct5 = xml.count('<octave>5</octave>')
-    oct4 = xml.count('<octave>4</octave>')
+    oct5 = f['octaves'].get(5, 0)
+    oct4 = f['octaves'].get(4, 0)
     scores["Melodic Contour"] = 1 if oct5 >= 6 and oct4 >= 4 else 0
     
     # 4. Harmony & Palette (extended harmonies)
-    harm_count = xml.count('<harmony')
-    deg_count = xml.count('<degree>')
+    harm_count = f['harmonies']
+    deg_count = f['degrees']
     scores["Harmony & Palette"] = 1 if harm_count >= 12 and deg_count >= 8 else 0
     
     # 5. Phrasing & Breath (slur balance)
-    slur_start = xml.count('<slur type="start"')
-    slur_stop = xml.count('<slur type="stop"')
+    slur_start = f['slur_starts']
+    slur_stop = f['slur_stops']
     scores["Phrasing & Breath"] = 1 if slur_start >= 10 and slur_start == slur_stop else 0
     
     # 6. LH Accompaniment (active, not whole notes)
-    lh_events = xml.count('staff="2"')
-    chord_stacks = xml.count('<chord/>')
+    lh_events = f['staff2']
+    chord_stacks = f['chords']
     scores["LH Accompaniment"] = 1 if lh_events >= 50 and chord_stacks >= 25 else 0
     
     # 7. Idiomatic Writing (dynamics present)
-    dyn_count = xml.count('<dynamics>')
+    dyn_count = f['dynamics']
     scores["Idiomatic Writing"] = 1 if dyn_count >= 3 else 0
     
     # 8. Form & Arc (structural markers)
-    has_rit = 'rit' in xml.lower()
-    has_struct = 'coda' in xml.lower() or 'expanding' in xml.lower() or 'brighter' in xml.lower()
+    has_rit = has_marker(f, 'rit')
+    has_struct = has_marker(f, 'coda', 'expanding', 'brighter')
     scores["Form & Arc"] = 1 if has_rit or has_struct else 0
     
     # 9. Emotional Character (fermata, expression)
-    scores["Emotional Character"] = 1 if '<fermata' in xml else 0
+    scores["Emotional Character"] = 1 if f['fermatas'] > 0 else 0
     
     # 10. Engraving Quality (barline, measures)
-    has_barline = '<barline' in xml
-    measure_count = xml.count('<measure number=')
+    has_barline = f['barlines'] > 0
+    measure_count = f['measures']
     scores["Engraving Quality"] = 1 if has_barline and measure_count >= 12 else 0
     
     total = sum(scores.values())
@@ -165,813 +179,822 @@ def evaluate_excellence(name, xml):
 
 # ============ MOVEMENT GENERATORS (EXCELLENT VERSIONS) ============
 
-def gen_movement1_excellent():
+def gen_movement1_excellent(out=None):
     """Movement I - Mingus Blues Cathedral - EXCELLENT
     Motif: C4-Eb4-F4-Bb4-A4-F4-Eb4"""
-    m = ""
+    m = ScoreWriter(out)
+    header(m, "The Master's Palette - I. Mingus Blues Cathedral", -3)
     
     # Bar 1: Bold motif statement
     m += '    <measure number="1">\n'
-    m += attributes(-3)
-    m += direction("Slow gospel blues", tempo=56)
-    m += direction(dyn="mf")
-    m += harmony("C", "minor", [(9, 0, "add")])
-    m += note("C", 4, 256, "quarter", slur_s=True, acc=True)
-    m += note("E", 4, 256, "quarter", alt=-1)
-    m += note("F", 4, 256, "quarter")
-    m += note("B", 4, 256, "quarter", alt=-1, slur_e=True)
-    m += backup(1024)
-    m += note("C", 2, 256, "quarter", staff=2)
-    m += note("G", 2, 256, "quarter", chord=True, staff=2)
-    m += note("E", 3, 256, "quarter", alt=-1, staff=2)
-    m += note("B", 3, 256, "quarter", alt=-1, chord=True, staff=2)
-    m += note("D", 3, 256, "quarter", staff=2)
-    m += note("G", 3, 256, "quarter", chord=True, staff=2)
+    attributes(m, -3)
+    direction(m, "Slow gospel blues", tempo=56)
+    direction(m, dyn="mf")
+    harmony(m, "C", "minor", [(9, 0, "add")])
+    note(m, "C", 4, 256, "quarter", slur_s=True, acc=True)
+    note(m, "E", 4, 256, "quarter", alt=-1)
+    note(m, "F", 4, 256, "quarter")
+    note(m, "B", 4, 256, "quarter", alt=-1, slur_e=True)
+    backup(m, 1024)
+    note(m, "C", 2, 256, "quarter", staff=2)
+    note(m, "G", 2, 256, "quarter", chord=True, staff=2)
+    note(m, "E", 3, 256, "quarter", alt=-1, staff=2)
+    note(m, "B", 3, 256, "quarter", alt=-1, chord=True, staff=2)
+    note(m, "D", 3, 256, "quarter", staff=2)
+    note(m, "G", 3, 256, "quarter", chord=True, staff=2)
     m += '    </measure>\n'
     
     # Bar 2: Motif completion A-F-Eb
     m += '    <measure number="2">\n'
-    m += harmony("F", "minor-seventh")
-    m += note("A", 4, 256, "quarter", slur_s=True, acc=True)
-    m += note("F", 4, 256, "quarter")
-    m += note("E", 4, 384, "quarter", alt=-1, dot=True)
-    m += note("G", 4, 128, "eighth", slur_e=True)
-    m += backup(1024)
-    m += note("F", 2, 256, "quarter", staff=2)
-    m += note("C", 3, 256, "quarter", chord=True, staff=2)
-    m += note("E", 3, 256, "quarter", alt=-1, staff=2)
-    m += note("A", 3, 256, "quarter", alt=-1, chord=True, staff=2)
-    m += note("C", 3, 256, "quarter", staff=2)
-    m += note("E", 3, 256, "quarter", alt=-1, chord=True, staff=2)
+    harmony(m, "F", "minor-seventh")
+    note(m, "A", 4, 256, "quarter", slur_s=True, acc=True)
+    note(m, "F", 4, 256, "quarter")
+    note(m, "E", 4, 384, "quarter", alt=-1, dot=True)
+    note(m, "G", 4, 128, "eighth", slur_e=True)
+    backup(m, 1024)
+    note(m, "F", 2, 256, "quarter", staff=2)
+    note(m, "C", 3, 256, "quarter", chord=True, staff=2)
+    note(m, "E", 3, 256, "quarter", alt=-1, staff=2)
+    note(m, "A", 3, 256, "quarter", alt=-1, chord=True, staff=2)
+    note(m, "C", 3, 256, "quarter", staff=2)
+    note(m, "E", 3, 256, "quarter", alt=-1, chord=True, staff=2)
     m += '    </measure>\n'
     
     # Bar 3: Sequence up P4
     m += '    <measure number="3">\n'
-    m += harmony("A", "dominant", [(9, 0, "add"), (13, 0, "add")])
-    m += note("F", 4, 256, "quarter", slur_s=True, acc=True)
-    m += note("A", 4, 256, "quarter", alt=-1)
-    m += note("B", 4, 256, "quarter", alt=-1)
-    m += note("E", 5, 256, "quarter", alt=-1, slur_e=True)
-    m += backup(1024)
-    m += note("A", 2, 256, "quarter", alt=-1, staff=2)
-    m += note("E", 3, 256, "quarter", alt=-1, chord=True, staff=2)
-    m += note("G", 3, 256, "quarter", staff=2)
-    m += note("C", 4, 256, "quarter", chord=True, staff=2)
-    m += note("E", 3, 256, "quarter", alt=-1, staff=2)
-    m += note("F", 3, 256, "quarter", chord=True, staff=2)
+    harmony(m, "A", "dominant", [(9, 0, "add"), (13, 0, "add")])
+    note(m, "F", 4, 256, "quarter", slur_s=True, acc=True)
+    note(m, "A", 4, 256, "quarter", alt=-1)
+    note(m, "B", 4, 256, "quarter", alt=-1)
+    note(m, "E", 5, 256, "quarter", alt=-1, slur_e=True)
+    backup(m, 1024)
+    note(m, "A", 2, 256, "quarter", alt=-1, staff=2)
+    note(m, "E", 3, 256, "quarter", alt=-1, chord=True, staff=2)
+    note(m, "G", 3, 256, "quarter", staff=2)
+    note(m, "C", 4, 256, "quarter", chord=True, staff=2)
+    note(m, "E", 3, 256, "quarter", alt=-1, staff=2)
+    note(m, "F", 3, 256, "quarter", chord=True, staff=2)
     m += '    </measure>\n'
     
     # Bar 4: G7alt tension
     m += '    <measure number="4">\n'
-    m += harmony("G", "dominant", [(9, -1, "add"), (13, -1, "add")])
-    m += note("E", 5, 256, "quarter", alt=-1, slur_s=True)
-    m += note("D", 5, 256, "quarter")
-    m += note("C", 5, 256, "quarter")
-    m += note("B", 4, 256, "quarter", slur_e=True)
-    m += backup(1024)
-    m += note("G", 2, 256, "quarter", staff=2)
-    m += note("F", 3, 256, "quarter", chord=True, staff=2)
-    m += note("A", 3, 256, "quarter", alt=-1, staff=2)
-    m += note("D", 3, 256, "quarter", alt=-1, chord=True, staff=2)
-    m += note("B", 2, 256, "quarter", staff=2)
-    m += note("F", 3, 256, "quarter", chord=True, staff=2)
+    harmony(m, "G", "dominant", [(9, -1, "add"), (13, -1, "add")])
+    note(m, "E", 5, 256, "quarter", alt=-1, slur_s=True)
+    note(m, "D", 5, 256, "quarter")
+    note(m, "C", 5, 256, "quarter")
+    note(m, "B", 4, 256, "quarter", slur_e=True)
+    backup(m, 1024)
+    note(m, "G", 2, 256, "quarter", staff=2)
+    note(m, "F", 3, 256, "quarter", chord=True, staff=2)
+    note(m, "A", 3, 256, "quarter", alt=-1, staff=2)
+    note(m, "D", 3, 256, "quarter", alt=-1, chord=True, staff=2)
+    note(m, "B", 2, 256, "quarter", staff=2)
+    note(m, "F", 3, 256, "quarter", chord=True, staff=2)
     m += '    </measure>\n'
     
     # Bar 5: Motif syncopated
     m += '    <measure number="5">\n'
-    m += direction(dyn="f")
-    m += harmony("C", "minor", [(9, 0, "add")])
-    m += rest(128, "eighth")
-    m += note("C", 4, 128, "eighth", slur_s=True, acc=True)
-    m += note("E", 4, 256, "quarter", alt=-1)
-    m += note("F", 4, 384, "quarter", dot=True)
-    m += note("B", 4, 128, "eighth", alt=-1, slur_e=True)
-    m += backup(1024)
-    m += note("C", 2, 256, "quarter", staff=2)
-    m += note("G", 2, 256, "quarter", chord=True, staff=2)
-    m += note("E", 3, 256, "quarter", alt=-1, staff=2)
-    m += note("B", 3, 256, "quarter", alt=-1, chord=True, staff=2)
-    m += note("D", 3, 256, "quarter", staff=2)
-    m += note("G", 3, 256, "quarter", chord=True, staff=2)
+    direction(m, dyn="f")
+    harmony(m, "C", "minor", [(9, 0, "add")])
+    rest(m, 128, "eighth")
+    note(m, "C", 4, 128, "eighth", slur_s=True, acc=True)
+    note(m, "E", 4, 256, "quarter", alt=-1)
+    note(m, "F", 4, 384, "quarter", dot=True)
+    note(m, "B", 4, 128, "eighth", alt=-1, slur_e=True)
+    backup(m, 1024)
+    note(m, "C", 2, 256, "quarter", staff=2)
+    note(m, "G", 2, 256, "quarter", chord=True, staff=2)
+    note(m, "E", 3, 256, "quarter", alt=-1, staff=2)
+    note(m, "B", 3, 256, "quarter", alt=-1, chord=True, staff=2)
+    note(m, "D", 3, 256, "quarter", staff=2)
+    note(m, "G", 3, 256, "quarter", chord=True, staff=2)
     m += '    </measure>\n'
     
     # Bar 6: Motif inversion
     m += '    <measure number="6">\n'
-    m += harmony("E", "major-seventh", [(11, 1, "add")])
-    m += note("C", 5, 256, "quarter", slur_s=True, acc=True)
-    m += note("A", 4, 256, "quarter")
-    m += note("G", 4, 256, "quarter")
-    m += note("D", 4, 256, "quarter", slur_e=True)
-    m += backup(1024)
-    m += note("E", 2, 256, "quarter", alt=-1, staff=2)
-    m += note("B", 2, 256, "quarter", alt=-1, chord=True, staff=2)
-    m += note("D", 3, 256, "quarter", staff=2)
-    m += note("G", 3, 256, "quarter", chord=True, staff=2)
-    m += note("A", 3, 256, "quarter", staff=2)
-    m += note("D", 4, 256, "quarter", chord=True, staff=2)
+    harmony(m, "E", "major-seventh", [(11, 1, "add")])
+    note(m, "C", 5, 256, "quarter", slur_s=True, acc=True)
+    note(m, "A", 4, 256, "quarter")
+    note(m, "G", 4, 256, "quarter")
+    note(m, "D", 4, 256, "quarter", slur_e=True)
+    backup(m, 1024)
+    note(m, "E", 2, 256, "quarter", alt=-1, staff=2)
+    note(m, "B", 2, 256, "quarter", alt=-1, chord=True, staff=2)
+    note(m, "D", 3, 256, "quarter", staff=2)
+    note(m, "G", 3, 256, "quarter", chord=True, staff=2)
+    note(m, "A", 3, 256, "quarter", staff=2)
+    note(m, "D", 4, 256, "quarter", chord=True, staff=2)
     m += '    </measure>\n'
     
     # Bar 7: Augmented motif
     m += '    <measure number="7">\n'
-    m += harmony("D", "half-diminished")
-    m += note("D", 4, 384, "quarter", dot=True, slur_s=True)
-    m += note("F", 4, 128, "eighth")
-    m += note("A", 4, 512, "half", alt=-1, slur_e=True)
-    m += backup(1024)
-    m += note("D", 3, 256, "quarter", staff=2)
-    m += note("A", 3, 256, "quarter", alt=-1, chord=True, staff=2)
-    m += note("C", 3, 256, "quarter", staff=2)
-    m += note("F", 3, 256, "quarter", chord=True, staff=2)
-    m += note("A", 3, 256, "quarter", alt=-1, staff=2)
-    m += note("D", 4, 256, "quarter", chord=True, staff=2)
+    harmony(m, "D", "half-diminished")
+    note(m, "D", 4, 384, "quarter", dot=True, slur_s=True)
+    note(m, "F", 4, 128, "eighth")
+    note(m, "A", 4, 512, "half", alt=-1, slur_e=True)
+    backup(m, 1024)
+    note(m, "D", 3, 256, "quarter", staff=2)
+    note(m, "A", 3, 256, "quarter", alt=-1, chord=True, staff=2)
+    note(m, "C", 3, 256, "quarter", staff=2)
+    note(m, "F", 3, 256, "quarter", chord=True, staff=2)
+    note(m, "A", 3, 256, "quarter", alt=-1, staff=2)
+    note(m, "D", 4, 256, "quarter", chord=True, staff=2)
     m += '    </measure>\n'
     
     # Bar 8: G7#9 tension peak
     m += '    <measure number="8">\n'
-    m += harmony("G", "dominant", [(9, 1, "add")])
-    m += note("A", 4, 256, "quarter", alt=-1, slur_s=True, acc=True)
-    m += note("G", 4, 256, "quarter")
-    m += note("F", 4, 128, "eighth", alt=1)
-    m += note("G", 4, 128, "eighth")
-    m += note("F", 4, 256, "quarter", slur_e=True)
-    m += backup(1024)
-    m += note("G", 2, 256, "quarter", staff=2)
-    m += note("B", 2, 256, "quarter", chord=True, staff=2)
-    m += note("F", 3, 256, "quarter", staff=2)
-    m += note("A", 3, 256, "quarter", alt=1, chord=True, staff=2)
-    m += note("D", 3, 256, "quarter", staff=2)
-    m += note("F", 3, 256, "quarter", chord=True, staff=2)
+    harmony(m, "G", "dominant", [(9, 1, "add")])
+    note(m, "A", 4, 256, "quarter", alt=-1, slur_s=True, acc=True)
+    note(m, "G", 4, 256, "quarter")
+    note(m, "F", 4, 128, "eighth", alt=1)
+    note(m, "G", 4, 128, "eighth")
+    note(m, "F", 4, 256, "quarter", slur_e=True)
+    backup(m, 1024)
+    note(m, "G", 2, 256, "quarter", staff=2)
+    note(m, "B", 2, 256, "quarter", chord=True, staff=2)
+    note(m, "F", 3, 256, "quarter", staff=2)
+    note(m, "A", 3, 256, "quarter", alt=1, chord=True, staff=2)
+    note(m, "D", 3, 256, "quarter", staff=2)
+    note(m, "F", 3, 256, "quarter", chord=True, staff=2)
     m += '    </measure>\n'
     
     # Bar 9: B section - brighter
     m += '    <measure number="9">\n'
-    m += direction("Brighter")
-    m += harmony("B", "major-seventh")
-    m += note("B", 4, 256, "quarter", alt=-1, slur_s=True, acc=True)
-    m += note("D", 5, 256, "quarter")
-    m += note("E", 5, 256, "quarter", alt=-1)
-    m += note("A", 5, 256, "quarter", alt=-1, slur_e=True)
-    m += backup(1024)
-    m += note("B", 2, 256, "quarter", alt=-1, staff=2)
-    m += note("F", 3, 256, "quarter", chord=True, staff=2)
-    m += note("A", 3, 256, "quarter", staff=2)
-    m += note("D", 4, 256, "quarter", chord=True, staff=2)
-    m += note("F", 3, 256, "quarter", staff=2)
-    m += note("B", 3, 256, "quarter", alt=-1, chord=True, staff=2)
+    direction(m, "Brighter")
+    harmony(m, "B", "major-seventh")
+    note(m, "B", 4, 256, "quarter", alt=-1, slur_s=True, acc=True)
+    note(m, "D", 5, 256, "quarter")
+    note(m, "E", 5, 256, "quarter", alt=-1)
+    note(m, "A", 5, 256, "quarter", alt=-1, slur_e=True)
+    backup(m, 1024)
+    note(m, "B", 2, 256, "quarter", alt=-1, staff=2)
+    note(m, "F", 3, 256, "quarter", chord=True, staff=2)
+    note(m, "A", 3, 256, "quarter", staff=2)
+    note(m, "D", 4, 256, "quarter", chord=True, staff=2)
+    note(m, "F", 3, 256, "quarter", staff=2)
+    note(m, "B", 3, 256, "quarter", alt=-1, chord=True, staff=2)
     m += '    </measure>\n'
     
     # Bar 10: Eb9
     m += '    <measure number="10">\n'
-    m += harmony("E", "dominant", [(9, 0, "add")])
-    m += note("G", 5, 256, "quarter", slur_s=True)
-    m += note("B", 5, 256, "quarter", alt=-1)
-    m += note("C", 6, 256, "quarter")
-    m += note("F", 5, 256, "quarter", slur_e=True)
-    m += backup(1024)
-    m += note("E", 2, 256, "quarter", alt=-1, staff=2)
-    m += note("B", 2, 256, "quarter", alt=-1, chord=True, staff=2)
-    m += note("G", 3, 256, "quarter", staff=2)
-    m += note("D", 3, 256, "quarter", alt=-1, chord=True, staff=2)
-    m += note("F", 3, 256, "quarter", staff=2)
-    m += note("B", 2, 256, "quarter", alt=-1, chord=True, staff=2)
+    harmony(m, "E", "dominant", [(9, 0, "add")])
+    note(m, "G", 5, 256, "quarter", slur_s=True)
+    note(m, "B", 5, 256, "quarter", alt=-1)
+    note(m, "C", 6, 256, "quarter")
+    note(m, "F", 5, 256, "quarter", slur_e=True)
+    backup(m, 1024)
+    note(m, "E", 2, 256, "quarter", alt=-1, staff=2)
+    note(m, "B", 2, 256, "quarter", alt=-1, chord=True, staff=2)
+    note(m, "G", 3, 256, "quarter", staff=2)
+    note(m, "D", 3, 256, "quarter", alt=-1, chord=True, staff=2)
+    note(m, "F", 3, 256, "quarter", staff=2)
+    note(m, "B", 2, 256, "quarter", alt=-1, chord=True, staff=2)
     m += '    </measure>\n'
     
     # Bar 11: Return Fm9
     m += '    <measure number="11">\n'
-    m += direction(dyn="mf")
-    m += harmony("F", "minor", [(9, 0, "add")])
-    m += note("F", 5, 256, "quarter", slur_s=True)
-    m += note("E", 5, 256, "quarter", alt=-1)
-    m += note("C", 5, 256, "quarter")
-    m += note("B", 4, 256, "quarter", alt=-1, slur_e=True)
-    m += backup(1024)
-    m += note("F", 2, 256, "quarter", staff=2)
-    m += note("C", 3, 256, "quarter", chord=True, staff=2)
-    m += note("E", 3, 256, "quarter", alt=-1, staff=2)
-    m += note("A", 2, 256, "quarter", alt=-1, chord=True, staff=2)
-    m += note("G", 3, 256, "quarter", staff=2)
-    m += note("C", 4, 256, "quarter", chord=True, staff=2)
+    direction(m, dyn="mf")
+    harmony(m, "F", "minor", [(9, 0, "add")])
+    note(m, "F", 5, 256, "quarter", slur_s=True)
+    note(m, "E", 5, 256, "quarter", alt=-1)
+    note(m, "C", 5, 256, "quarter")
+    note(m, "B", 4, 256, "quarter", alt=-1, slur_e=True)
+    backup(m, 1024)
+    note(m, "F", 2, 256, "quarter", staff=2)
+    note(m, "C", 3, 256, "quarter", chord=True, staff=2)
+    note(m, "E", 3, 256, "quarter", alt=-1, staff=2)
+    note(m, "A", 2, 256, "quarter", alt=-1, chord=True, staff=2)
+    note(m, "G", 3, 256, "quarter", staff=2)
+    note(m, "C", 4, 256, "quarter", chord=True, staff=2)
     m += '    </measure>\n'
     
     # Bar 12: Final cadence
     m += '    <measure number="12">\n'
-    m += direction("rit.")
-    m += direction(dyn="p")
-    m += harmony("D", "half-diminished")
-    m += note("A", 4, 256, "quarter", slur_s=True)
-    m += harmony("G", "dominant", [(9, -1, "add")])
-    m += note("F", 4, 256, "quarter")
-    m += harmony("C", "minor", [(9, 0, "add")])
-    m += note("E", 4, 256, "quarter", alt=-1)
-    m += note("C", 4, 256, "quarter", slur_e=True, ferm=True)
-    m += backup(1024)
-    m += note("D", 3, 256, "quarter", staff=2)
-    m += note("A", 3, 256, "quarter", alt=-1, chord=True, staff=2)
-    m += note("G", 2, 256, "quarter", staff=2)
-    m += note("F", 3, 256, "quarter", chord=True, staff=2)
-    m += note("C", 2, 256, "quarter", staff=2)
-    m += note("G", 2, 256, "quarter", chord=True, staff=2)
-    m += note("E", 3, 256, "quarter", alt=-1, chord=True, staff=2)
-    m += barline()
+    direction(m, "rit.")
+    direction(m, dyn="p")
+    harmony(m, "D", "half-diminished")
+    note(m, "A", 4, 256, "quarter", slur_s=True)
+    harmony(m, "G", "dominant", [(9, -1, "add")])
+    note(m, "F", 4, 256, "quarter")
+    harmony(m, "C", "minor", [(9, 0, "add")])
+    note(m, "E", 4, 256, "quarter", alt=-1)
+    note(m, "C", 4, 256, "quarter", slur_e=True, ferm=True)
+    backup(m, 1024)
+    note(m, "D", 3, 256, "quarter", staff=2)
+    note(m, "A", 3, 256, "quarter", alt=-1, chord=True, staff=2)
+    note(m, "G", 2, 256, "quarter", staff=2)
+    note(m, "F", 3, 256, "quarter", chord=True, staff=2)
+    note(m, "C", 2, 256, "quarter", staff=2)
+    note(m, "G", 2, 256, "quarter", chord=True, staff=2)
+    note(m, "E", 3, 256, "quarter", alt=-1, chord=True, staff=2)
+    barline(m)
     m += '    </measure>\n'
     
-    return header("The Master's Palette - I. Mingus Blues Cathedral", -3) + m + footer()
+    footer(m)
+    return m.finish()
 
-def gen_movement2_excellent():
+def gen_movement2_excellent(out=None):
     """Movement II - Gil's Canvas - EXCELLENT
     Motif: G4-A4-B4-F#5-E5-D5"""
-    m = ""
+    m = ScoreWriter(out)
+    header(m, "The Master's Palette - II. Gil's Canvas", 1)
     
     # Bar 1
     m += '    <measure number="1">\n'
-    m += attributes(1)
-    m += direction("Floating, ethereal", tempo=52)
-    m += direction(dyn="p")
-    m += harmony("G", "major-seventh", [(11, 1, "add")])
-    m += note("G", 4, 512, "half", slur_s=True, acc=True)
-    m += note("A", 4, 256, "quarter")
-    m += note("B", 4, 256, "quarter", slur_e=True)
-    m += backup(1024)
-    m += note("G", 2, 256, "quarter", staff=2)
-    m += note("D", 3, 256, "quarter", chord=True, staff=2)
-    m += note("F", 3, 256, "quarter", alt=1, staff=2)
-    m += note("A", 3, 256, "quarter", chord=True, staff=2)
-    m += note("B", 3, 256, "quarter", staff=2)
-    m += note("D", 4, 256, "quarter", chord=True, staff=2)
+    attributes(m, 1)
+    direction(m, "Floating, ethereal", tempo=52)
+    direction(m, dyn="p")
+    harmony(m, "G", "major-seventh", [(11, 1, "add")])
+    note(m, "G", 4, 512, "half", slur_s=True, acc=True)
+    note(m, "A", 4, 256, "quarter")
+    note(m, "B", 4, 256, "quarter", slur_e=True)
+    backup(m, 1024)
+    note(m, "G", 2, 256, "quarter", staff=2)
+    note(m, "D", 3, 256, "quarter", chord=True, staff=2)
+    note(m, "F", 3, 256, "quarter", alt=1, staff=2)
+    note(m, "A", 3, 256, "quarter", chord=True, staff=2)
+    note(m, "B", 3, 256, "quarter", staff=2)
+    note(m, "D", 4, 256, "quarter", chord=True, staff=2)
     m += '    </measure>\n'
     
     # Bar 2
     m += '    <measure number="2">\n'
-    m += harmony("D", "major-seventh", [(9, 0, "add")])
-    m += note("F", 5, 384, "quarter", alt=1, dot=True, slur_s=True, acc=True)
-    m += note("E", 5, 128, "eighth")
-    m += note("D", 5, 512, "half", slur_e=True)
-    m += backup(1024)
-    m += note("D", 2, 256, "quarter", staff=2)
-    m += note("A", 2, 256, "quarter", chord=True, staff=2)
-    m += note("C", 3, 256, "quarter", alt=1, staff=2)
-    m += note("E", 3, 256, "quarter", chord=True, staff=2)
-    m += note("F", 3, 256, "quarter", alt=1, staff=2)
-    m += note("A", 3, 256, "quarter", chord=True, staff=2)
+    harmony(m, "D", "major-seventh", [(9, 0, "add")])
+    note(m, "F", 5, 384, "quarter", alt=1, dot=True, slur_s=True, acc=True)
+    note(m, "E", 5, 128, "eighth")
+    note(m, "D", 5, 512, "half", slur_e=True)
+    backup(m, 1024)
+    note(m, "D", 2, 256, "quarter", staff=2)
+    note(m, "A", 2, 256, "quarter", chord=True, staff=2)
+    note(m, "C", 3, 256, "quarter", alt=1, staff=2)
+    note(m, "E", 3, 256, "quarter", chord=True, staff=2)
+    note(m, "F", 3, 256, "quarter", alt=1, staff=2)
+    note(m, "A", 3, 256, "quarter", chord=True, staff=2)
     m += '    </measure>\n'
     
     # Bar 3
     m += '    <measure number="3">\n'
-    m += harmony("A", "major-seventh", [(11, 1, "add")])
-    m += note("E", 5, 256, "quarter", slur_s=True, acc=True)
-    m += note("D", 5, 256, "quarter")
-    m += note("G", 5, 256, "quarter")
-    m += note("A", 5, 256, "quarter", slur_e=True)
-    m += backup(1024)
-    m += note("A", 2, 256, "quarter", staff=2)
-    m += note("E", 3, 256, "quarter", chord=True, staff=2)
-    m += note("G", 3, 256, "quarter", alt=1, staff=2)
-    m += note("D", 4, 256, "quarter", alt=1, chord=True, staff=2)
-    m += note("C", 4, 256, "quarter", alt=1, staff=2)
-    m += note("E", 4, 256, "quarter", chord=True, staff=2)
+    harmony(m, "A", "major-seventh", [(11, 1, "add")])
+    note(m, "E", 5, 256, "quarter", slur_s=True, acc=True)
+    note(m, "D", 5, 256, "quarter")
+    note(m, "G", 5, 256, "quarter")
+    note(m, "A", 5, 256, "quarter", slur_e=True)
+    backup(m, 1024)
+    note(m, "A", 2, 256, "quarter", staff=2)
+    note(m, "E", 3, 256, "quarter", chord=True, staff=2)
+    note(m, "G", 3, 256, "quarter", alt=1, staff=2)
+    note(m, "D", 4, 256, "quarter", alt=1, chord=True, staff=2)
+    note(m, "C", 4, 256, "quarter", alt=1, staff=2)
+    note(m, "E", 4, 256, "quarter", chord=True, staff=2)
     m += '    </measure>\n'
     
     # Bar 4
     m += '    <measure number="4">\n'
-    m += harmony("E", "major-seventh", [(9, 0, "add")])
-    m += note("B", 5, 768, "half", dot=True, slur_s=True)
-    m += note("A", 5, 256, "quarter", slur_e=True)
-    m += backup(1024)
-    m += note("E", 2, 256, "quarter", staff=2)
-    m += note("B", 2, 256, "quarter", chord=True, staff=2)
-    m += note("G", 3, 256, "quarter", alt=1, staff=2)
-    m += note("D", 4, 256, "quarter", alt=1, chord=True, staff=2)
-    m += note("F", 3, 256, "quarter", alt=1, staff=2)
-    m += note("A", 3, 256, "quarter", chord=True, staff=2)
+    harmony(m, "E", "major-seventh", [(9, 0, "add")])
+    note(m, "B", 5, 768, "half", dot=True, slur_s=True)
+    note(m, "A", 5, 256, "quarter", slur_e=True)
+    backup(m, 1024)
+    note(m, "E", 2, 256, "quarter", staff=2)
+    note(m, "B", 2, 256, "quarter", chord=True, staff=2)
+    note(m, "G", 3, 256, "quarter", alt=1, staff=2)
+    note(m, "D", 4, 256, "quarter", alt=1, chord=True, staff=2)
+    note(m, "F", 3, 256, "quarter", alt=1, staff=2)
+    note(m, "A", 3, 256, "quarter", chord=True, staff=2)
     m += '    </measure>\n'
     
     # Bar 5
     m += '    <measure number="5">\n'
-    m += direction(dyn="mp")
-    m += harmony("B", "major-seventh", [(11, 1, "add")])
-    m += note("G", 5, 256, "quarter", slur_s=True, acc=True)
-    m += note("A", 5, 256, "quarter")
-    m += note("B", 5, 256, "quarter")
-    m += note("F", 6, 256, "quarter", alt=1, slur_e=True)
-    m += backup(1024)
-    m += note("B", 2, 256, "quarter", staff=2)
-    m += note("F", 3, 256, "quarter", alt=1, chord=True, staff=2)
-    m += note("A", 3, 256, "quarter", alt=1, staff=2)
-    m += note("D", 4, 256, "quarter", alt=1, chord=True, staff=2)
-    m += note("E", 3, 256, "quarter", alt=1, staff=2)
-    m += note("B", 3, 256, "quarter", chord=True, staff=2)
+    direction(m, dyn="mp")
+    harmony(m, "B", "major-seventh", [(11, 1, "add")])
+    note(m, "G", 5, 256, "quarter", slur_s=True, acc=True)
+    note(m, "A", 5, 256, "quarter")
+    note(m, "B", 5, 256, "quarter")
+    note(m, "F", 6, 256, "quarter", alt=1, slur_e=True)
+    backup(m, 1024)
+    note(m, "B", 2, 256, "quarter", staff=2)
+    note(m, "F", 3, 256, "quarter", alt=1, chord=True, staff=2)
+    note(m, "A", 3, 256, "quarter", alt=1, staff=2)
+    note(m, "D", 4, 256, "quarter", alt=1, chord=True, staff=2)
+    note(m, "E", 3, 256, "quarter", alt=1, staff=2)
+    note(m, "B", 3, 256, "quarter", chord=True, staff=2)
     m += '    </measure>\n'
     
     # Bar 6
     m += '    <measure number="6">\n'
-    m += harmony("F#", "minor-seventh", [(9, 0, "add")])
-    m += note("E", 6, 512, "half", slur_s=True)
-    m += note("D", 6, 256, "quarter")
-    m += note("B", 5, 256, "quarter", slur_e=True)
-    m += backup(1024)
-    m += note("F", 2, 256, "quarter", alt=1, staff=2)
-    m += note("C", 3, 256, "quarter", alt=1, chord=True, staff=2)
-    m += note("E", 3, 256, "quarter", staff=2)
-    m += note("G", 3, 256, "quarter", alt=1, chord=True, staff=2)
-    m += note("A", 3, 256, "quarter", staff=2)
-    m += note("C", 4, 256, "quarter", alt=1, chord=True, staff=2)
+    harmony(m, "F#", "minor-seventh", [(9, 0, "add")])
+    note(m, "E", 6, 512, "half", slur_s=True)
+    note(m, "D", 6, 256, "quarter")
+    note(m, "B", 5, 256, "quarter", slur_e=True)
+    backup(m, 1024)
+    note(m, "F", 2, 256, "quarter", alt=1, staff=2)
+    note(m, "C", 3, 256, "quarter", alt=1, chord=True, staff=2)
+    note(m, "E", 3, 256, "quarter", staff=2)
+    note(m, "G", 3, 256, "quarter", alt=1, chord=True, staff=2)
+    note(m, "A", 3, 256, "quarter", staff=2)
+    note(m, "C", 4, 256, "quarter", alt=1, chord=True, staff=2)
     m += '    </measure>\n'
     
     # Bar 7
     m += '    <measure number="7">\n'
-    m += harmony("C", "major-seventh", [(11, 1, "add")])
-    m += note("G", 5, 256, "quarter", slur_s=True)
-    m += note("B", 5, 384, "quarter", dot=True)
-    m += note("F", 5, 128, "eighth", alt=1)
-    m += note("A", 5, 256, "quarter", slur_e=True)
-    m += backup(1024)
-    m += note("C", 3, 256, "quarter", staff=2)
-    m += note("G", 3, 256, "quarter", chord=True, staff=2)
-    m += note("B", 3, 256, "quarter", staff=2)
-    m += note("E", 4, 256, "quarter", chord=True, staff=2)
-    m += note("F", 3, 256, "quarter", alt=1, staff=2)
-    m += note("A", 3, 256, "quarter", chord=True, staff=2)
+    harmony(m, "C", "major-seventh", [(11, 1, "add")])
+    note(m, "G", 5, 256, "quarter", slur_s=True)
+    note(m, "B", 5, 384, "quarter", dot=True)
+    note(m, "F", 5, 128, "eighth", alt=1)
+    note(m, "A", 5, 256, "quarter", slur_e=True)
+    backup(m, 1024)
+    note(m, "C", 3, 256, "quarter", staff=2)
+    note(m, "G", 3, 256, "quarter", chord=True, staff=2)
+    note(m, "B", 3, 256, "quarter", staff=2)
+    note(m, "E", 4, 256, "quarter", chord=True, staff=2)
+    note(m, "F", 3, 256, "quarter", alt=1, staff=2)
+    note(m, "A", 3, 256, "quarter", chord=True, staff=2)
     m += '    </measure>\n'
     
     # Bar 8
     m += '    <measure number="8">\n'
-    m += harmony("G", "major", [(9, 0, "add"), (11, 1, "add")])
-    m += note("D", 5, 768, "half", dot=True, slur_s=True)
-    m += note("E", 5, 256, "quarter", slur_e=True)
-    m += backup(1024)
-    m += note("G", 2, 256, "quarter", staff=2)
-    m += note("D", 3, 256, "quarter", chord=True, staff=2)
-    m += note("A", 3, 256, "quarter", staff=2)
-    m += note("C", 4, 256, "quarter", alt=1, chord=True, staff=2)
-    m += note("B", 3, 256, "quarter", staff=2)
-    m += note("F", 4, 256, "quarter", alt=1, chord=True, staff=2)
+    harmony(m, "G", "major", [(9, 0, "add"), (11, 1, "add")])
+    note(m, "D", 5, 768, "half", dot=True, slur_s=True)
+    note(m, "E", 5, 256, "quarter", slur_e=True)
+    backup(m, 1024)
+    note(m, "G", 2, 256, "quarter", staff=2)
+    note(m, "D", 3, 256, "quarter", chord=True, staff=2)
+    note(m, "A", 3, 256, "quarter", staff=2)
+    note(m, "C", 4, 256, "quarter", alt=1, chord=True, staff=2)
+    note(m, "B", 3, 256, "quarter", staff=2)
+    note(m, "F", 4, 256, "quarter", alt=1, chord=True, staff=2)
     m += '    </measure>\n'
     
     # Bar 9: Coda
     m += '    <measure number="9">\n'
-    m += direction("Coda - dissolving")
-    m += direction(dyn="pp")
-    m += harmony("E", "major-seventh", [(11, 1, "add")])
-    m += note("G", 5, 512, "half", slur_s=True, acc=True)
-    m += note("A", 5, 512, "half", slur_e=True)
-    m += backup(1024)
-    m += note("E", 2, 256, "quarter", staff=2)
-    m += note("B", 2, 256, "quarter", chord=True, staff=2)
-    m += note("G", 3, 256, "quarter", alt=1, staff=2)
-    m += note("D", 4, 256, "quarter", alt=1, chord=True, staff=2)
-    m += note("B", 3, 256, "quarter", staff=2)
-    m += note("E", 4, 256, "quarter", chord=True, staff=2)
+    direction(m, "Coda - dissolving")
+    direction(m, dyn="pp")
+    harmony(m, "E", "major-seventh", [(11, 1, "add")])
+    note(m, "G", 5, 512, "half", slur_s=True, acc=True)
+    note(m, "A", 5, 512, "half", slur_e=True)
+    backup(m, 1024)
+    note(m, "E", 2, 256, "quarter", staff=2)
+    note(m, "B", 2, 256, "quarter", chord=True, staff=2)
+    note(m, "G", 3, 256, "quarter", alt=1, staff=2)
+    note(m, "D", 4, 256, "quarter", alt=1, chord=True, staff=2)
+    note(m, "B", 3, 256, "quarter", staff=2)
+    note(m, "E", 4, 256, "quarter", chord=True, staff=2)
     m += '    </measure>\n'
     
     # Bar 10
     m += '    <measure number="10">\n'
-    m += harmony("A", "major-seventh", [(9, 0, "add")])
-    m += note("B", 5, 768, "half", dot=True, slur_s=True)
-    m += note("F", 5, 256, "quarter", alt=1, slur_e=True)
-    m += backup(1024)
-    m += note("A", 2, 256, "quarter", staff=2)
-    m += note("E", 3, 256, "quarter", chord=True, staff=2)
-    m += note("G", 3, 256, "quarter", alt=1, staff=2)
-    m += note("B", 3, 256, "quarter", chord=True, staff=2)
-    m += note("C", 4, 256, "quarter", alt=1, staff=2)
-    m += note("E", 4, 256, "quarter", chord=True, staff=2)
+    harmony(m, "A", "major-seventh", [(9, 0, "add")])
+    note(m, "B", 5, 768, "half", dot=True, slur_s=True)
+    note(m, "F", 5, 256, "quarter", alt=1, slur_e=True)
+    backup(m, 1024)
+    note(m, "A", 2, 256, "quarter", staff=2)
+    note(m, "E", 3, 256, "quarter", chord=True, staff=2)
+    note(m, "G", 3, 256, "quarter", alt=1, staff=2)
+    note(m, "B", 3, 256, "quarter", chord=True, staff=2)
+    note(m, "C", 4, 256, "quarter", alt=1, staff=2)
+    note(m, "E", 4, 256, "quarter", chord=True, staff=2)
     m += '    </measure>\n'
     
     # Bar 11
     m += '    <measure number="11">\n'
-    m += direction("rit.")
-    m += harmony("D", "major-seventh", [(11, 1, "add")])
-    m += note("E", 5, 512, "half", slur_s=True)
-    m += note("D", 5, 512, "half", slur_e=True)
-    m += backup(1024)
-    m += note("D", 2, 256, "quarter", staff=2)
-    m += note("A", 2, 256, "quarter", chord=True, staff=2)
-    m += note("G", 3, 256, "quarter", alt=1, staff=2)
-    m += note("C", 4, 256, "quarter", alt=1, chord=True, staff=2)
-    m += note("F", 3, 256, "quarter", alt=1, staff=2)
-    m += note("A", 3, 256, "quarter", chord=True, staff=2)
+    direction(m, "rit.")
+    harmony(m, "D", "major-seventh", [(11, 1, "add")])
+    note(m, "E", 5, 512, "half", slur_s=True)
+    note(m, "D", 5, 512, "half", slur_e=True)
+    backup(m, 1024)
+    note(m, "D", 2, 256, "quarter", staff=2)
+    note(m, "A", 2, 256, "quarter", chord=True, staff=2)
+    note(m, "G", 3, 256, "quarter", alt=1, staff=2)
+    note(m, "C", 4, 256, "quarter", alt=1, chord=True, staff=2)
+    note(m, "F", 3, 256, "quarter", alt=1, staff=2)
+    note(m, "A", 3, 256, "quarter", chord=True, staff=2)
     m += '    </measure>\n'
     
     # Bar 12
     m += '    <measure number="12">\n'
-    m += harmony("G", "major-seventh", [(9, 0, "add"), (11, 1, "add")])
-    m += note("G", 5, 1024, "whole", ferm=True)
-    m += backup(1024)
-    m += note("G", 2, 1024, "whole", staff=2)
-    m += note("D", 3, 1024, "whole", chord=True, staff=2)
-    m += note("F", 3, 1024, "whole", alt=1, chord=True, staff=2)
-    m += note("A", 3, 1024, "whole", chord=True, staff=2)
-    m += barline()
+    harmony(m, "G", "major-seventh", [(9, 0, "add"), (11, 1, "add")])
+    note(m, "G", 5, 1024, "whole", ferm=True)
+    backup(m, 1024)
+    note(m, "G", 2, 1024, "whole", staff=2)
+    note(m, "D", 3, 1024, "whole", chord=True, staff=2)
+    note(m, "F", 3, 1024, "whole", alt=1, chord=True, staff=2)
+    note(m, "A", 3, 1024, "whole", chord=True, staff=2)
+    barline(m)
     m += '    </measure>\n'
     
-    return header("The Master's Palette - II. Gil's Canvas", 1) + m + footer()
+    footer(m)
+    return m.finish()
 
-def gen_movement3_excellent():
+def gen_movement3_excellent(out=None):
     """Movement III - Bartok Night - EXCELLENT
     Motif: A4-Bb4-E5-B4-F5"""
-    m = ""
+    m = ScoreWriter(out)
+    header(m, "The Master's Palette - III. Bartok Night", 0)
     
     # Bar 1
     m += '    <measure number="1">\n'
-    m += attributes(0)
-    m += direction("Mysterious, nocturnal", tempo=48)
-    m += direction(dyn="pp")
-    m += harmony("A", "minor", [(11, 0, "add")])
-    m += rest(256, "quarter")
-    m += note("A", 4, 256, "quarter", stac=True, acc=True)
-    m += rest(256, "quarter")
-    m += note("B", 4, 256, "quarter", alt=-1, stac=True)
-    m += backup(1024)
-    m += note("A", 2, 256, "quarter", staff=2)
-    m += note("E", 3, 256, "quarter", chord=True, staff=2)
-    m += note("D", 3, 256, "quarter", staff=2)
-    m += note("G", 3, 256, "quarter", alt=1, chord=True, staff=2)
-    m += note("B", 2, 256, "quarter", staff=2)
-    m += note("F", 3, 256, "quarter", chord=True, staff=2)
+    attributes(m, 0)
+    direction(m, "Mysterious, nocturnal", tempo=48)
+    direction(m, dyn="pp")
+    harmony(m, "A", "minor", [(11, 0, "add")])
+    rest(m, 256, "quarter")
+    note(m, "A", 4, 256, "quarter", stac=True, acc=True)
+    rest(m, 256, "quarter")
+    note(m, "B", 4, 256, "quarter", alt=-1, stac=True)
+    backup(m, 1024)
+    note(m, "A", 2, 256, "quarter", staff=2)
+    note(m, "E", 3, 256, "quarter", chord=True, staff=2)
+    note(m, "D", 3, 256, "quarter", staff=2)
+    note(m, "G", 3, 256, "quarter", alt=1, chord=True, staff=2)
+    note(m, "B", 2, 256, "quarter", staff=2)
+    note(m, "F", 3, 256, "quarter", chord=True, staff=2)
     m += '    </measure>\n'
     
     # Bar 2
     m += '    <measure number="2">\n'
-    m += harmony("E", "minor", [(9, -1, "add")])
-    m += note("E", 5, 384, "quarter", dot=True, slur_s=True, acc=True)
-    m += note("B", 4, 128, "eighth", slur_e=True)
-    m += rest(256, "quarter")
-    m += note("F", 5, 256, "quarter", stac=True)
-    m += backup(1024)
-    m += note("E", 2, 256, "quarter", staff=2)
-    m += note("B", 2, 256, "quarter", chord=True, staff=2)
-    m += note("F", 3, 256, "quarter", staff=2)
-    m += note("G", 3, 256, "quarter", alt=1, chord=True, staff=2)
-    m += note("D", 3, 256, "quarter", staff=2)
-    m += note("A", 3, 256, "quarter", chord=True, staff=2)
+    harmony(m, "E", "minor", [(9, -1, "add")])
+    note(m, "E", 5, 384, "quarter", dot=True, slur_s=True, acc=True)
+    note(m, "B", 4, 128, "eighth", slur_e=True)
+    rest(m, 256, "quarter")
+    note(m, "F", 5, 256, "quarter", stac=True)
+    backup(m, 1024)
+    note(m, "E", 2, 256, "quarter", staff=2)
+    note(m, "B", 2, 256, "quarter", chord=True, staff=2)
+    note(m, "F", 3, 256, "quarter", staff=2)
+    note(m, "G", 3, 256, "quarter", alt=1, chord=True, staff=2)
+    note(m, "D", 3, 256, "quarter", staff=2)
+    note(m, "A", 3, 256, "quarter", chord=True, staff=2)
     m += '    </measure>\n'
     
     # Bar 3
     m += '    <measure number="3">\n'
-    m += harmony("B", "diminished-seventh")
-    m += note("A", 5, 256, "quarter", slur_s=True, acc=True)
-    m += note("B", 3, 256, "quarter", alt=-1)
-    m += note("E", 5, 256, "quarter")
-    m += note("B", 4, 256, "quarter", slur_e=True)
-    m += backup(1024)
-    m += note("B", 2, 256, "quarter", staff=2)
-    m += note("F", 3, 256, "quarter", chord=True, staff=2)
-    m += note("A", 3, 256, "quarter", alt=-1, staff=2)
-    m += note("D", 4, 256, "quarter", chord=True, staff=2)
-    m += note("G", 3, 256, "quarter", alt=1, staff=2)
-    m += note("C", 4, 256, "quarter", alt=1, chord=True, staff=2)
+    harmony(m, "B", "diminished-seventh")
+    note(m, "A", 5, 256, "quarter", slur_s=True, acc=True)
+    note(m, "B", 3, 256, "quarter", alt=-1)
+    note(m, "E", 5, 256, "quarter")
+    note(m, "B", 4, 256, "quarter", slur_e=True)
+    backup(m, 1024)
+    note(m, "B", 2, 256, "quarter", staff=2)
+    note(m, "F", 3, 256, "quarter", chord=True, staff=2)
+    note(m, "A", 3, 256, "quarter", alt=-1, staff=2)
+    note(m, "D", 4, 256, "quarter", chord=True, staff=2)
+    note(m, "G", 3, 256, "quarter", alt=1, staff=2)
+    note(m, "C", 4, 256, "quarter", alt=1, chord=True, staff=2)
     m += '    </measure>\n'
     
     # Bar 4
     m += '    <measure number="4">\n'
-    m += harmony("F", "major-seventh", [(11, 1, "add")])
-    m += note("F", 5, 512, "half", slur_s=True)
-    m += rest(256, "quarter")
-    m += note("A", 4, 256, "quarter", slur_e=True)
-    m += backup(1024)
-    m += note("F", 2, 256, "quarter", staff=2)
-    m += note("C", 3, 256, "quarter", chord=True, staff=2)
-    m += note("E", 3, 256, "quarter", staff=2)
-    m += note("B", 3, 256, "quarter", chord=True, staff=2)
-    m += note("A", 3, 256, "quarter", staff=2)
-    m += note("D", 4, 256, "quarter", chord=True, staff=2)
+    harmony(m, "F", "major-seventh", [(11, 1, "add")])
+    note(m, "F", 5, 512, "half", slur_s=True)
+    rest(m, 256, "quarter")
+    note(m, "A", 4, 256, "quarter", slur_e=True)
+    backup(m, 1024)
+    note(m, "F", 2, 256, "quarter", staff=2)
+    note(m, "C", 3, 256, "quarter", chord=True, staff=2)
+    note(m, "E", 3, 256, "quarter", staff=2)
+    note(m, "B", 3, 256, "quarter", chord=True, staff=2)
+    note(m, "A", 3, 256, "quarter", staff=2)
+    note(m, "D", 4, 256, "quarter", chord=True, staff=2)
     m += '    </measure>\n'
     
     # Bar 5: Arc II - expanding
     m += '    <measure number="5">\n'
-    m += direction("Expanding")
-    m += direction(dyn="p")
-    m += harmony("D", "minor", [(9, 0, "add")])
-    m += note("A", 4, 256, "quarter", slur_s=True, acc=True)
-    m += note("B", 4, 256, "quarter", alt=-1)
-    m += note("E", 5, 512, "half", slur_e=True)
-    m += backup(1024)
-    m += note("D", 2, 256, "quarter", staff=2)
-    m += note("A", 2, 256, "quarter", chord=True, staff=2)
-    m += note("F", 3, 256, "quarter", staff=2)
-    m += note("E", 3, 256, "quarter", chord=True, staff=2)
-    m += note("B", 3, 256, "quarter", staff=2)
-    m += note("G", 3, 256, "quarter", chord=True, staff=2)
+    direction(m, "Expanding")
+    direction(m, dyn="p")
+    harmony(m, "D", "minor", [(9, 0, "add")])
+    note(m, "A", 4, 256, "quarter", slur_s=True, acc=True)
+    note(m, "B", 4, 256, "quarter", alt=-1)
+    note(m, "E", 5, 512, "half", slur_e=True)
+    backup(m, 1024)
+    note(m, "D", 2, 256, "quarter", staff=2)
+    note(m, "A", 2, 256, "quarter", chord=True, staff=2)
+    note(m, "F", 3, 256, "quarter", staff=2)
+    note(m, "E", 3, 256, "quarter", chord=True, staff=2)
+    note(m, "B", 3, 256, "quarter", staff=2)
+    note(m, "G", 3, 256, "quarter", chord=True, staff=2)
     m += '    </measure>\n'
     
     # Bar 6
     m += '    <measure number="6">\n'
-    m += harmony("G#", "diminished")
-    m += note("B", 4, 256, "quarter", slur_s=True, acc=True)
-    m += note("F", 5, 256, "quarter")
-    m += note("A", 4, 256, "quarter")
-    m += note("E", 4, 256, "quarter", slur_e=True)
-    m += backup(1024)
-    m += note("G", 2, 256, "quarter", alt=1, staff=2)
-    m += note("D", 3, 256, "quarter", chord=True, staff=2)
-    m += note("B", 2, 256, "quarter", staff=2)
-    m += note("F", 3, 256, "quarter", chord=True, staff=2)
-    m += note("E", 3, 256, "quarter", staff=2)
-    m += note("A", 3, 256, "quarter", alt=-1, chord=True, staff=2)
+    harmony(m, "G#", "diminished")
+    note(m, "B", 4, 256, "quarter", slur_s=True, acc=True)
+    note(m, "F", 5, 256, "quarter")
+    note(m, "A", 4, 256, "quarter")
+    note(m, "E", 4, 256, "quarter", slur_e=True)
+    backup(m, 1024)
+    note(m, "G", 2, 256, "quarter", alt=1, staff=2)
+    note(m, "D", 3, 256, "quarter", chord=True, staff=2)
+    note(m, "B", 2, 256, "quarter", staff=2)
+    note(m, "F", 3, 256, "quarter", chord=True, staff=2)
+    note(m, "E", 3, 256, "quarter", staff=2)
+    note(m, "A", 3, 256, "quarter", alt=-1, chord=True, staff=2)
     m += '    </measure>\n'
     
     # Bar 7
     m += '    <measure number="7">\n'
-    m += direction(dyn="mf")
-    m += harmony("C", "augmented", [(9, 0, "add")])
-    m += note("E", 5, 256, "quarter", slur_s=True, acc=True)
-    m += note("B", 5, 256, "quarter")
-    m += note("F", 5, 256, "quarter")
-    m += note("A", 5, 256, "quarter", slur_e=True)
-    m += backup(1024)
-    m += note("C", 3, 256, "quarter", staff=2)
-    m += note("G", 3, 256, "quarter", alt=1, chord=True, staff=2)
-    m += note("E", 3, 256, "quarter", staff=2)
-    m += note("B", 3, 256, "quarter", chord=True, staff=2)
-    m += note("G", 3, 256, "quarter", staff=2)
-    m += note("D", 4, 256, "quarter", chord=True, staff=2)
+    direction(m, dyn="mf")
+    harmony(m, "C", "augmented", [(9, 0, "add")])
+    note(m, "E", 5, 256, "quarter", slur_s=True, acc=True)
+    note(m, "B", 5, 256, "quarter")
+    note(m, "F", 5, 256, "quarter")
+    note(m, "A", 5, 256, "quarter", slur_e=True)
+    backup(m, 1024)
+    note(m, "C", 3, 256, "quarter", staff=2)
+    note(m, "G", 3, 256, "quarter", alt=1, chord=True, staff=2)
+    note(m, "E", 3, 256, "quarter", staff=2)
+    note(m, "B", 3, 256, "quarter", chord=True, staff=2)
+    note(m, "G", 3, 256, "quarter", staff=2)
+    note(m, "D", 4, 256, "quarter", chord=True, staff=2)
     m += '    </measure>\n'
     
     # Bar 8
     m += '    <measure number="8">\n'
-    m += harmony("E", "dominant", [(9, -1, "add")])
-    m += note("B", 5, 384, "quarter", dot=True, slur_s=True, acc=True)
-    m += note("A", 5, 128, "eighth")
-    m += note("E", 5, 512, "half", slur_e=True)
-    m += backup(1024)
-    m += note("E", 2, 256, "quarter", staff=2)
-    m += note("B", 2, 256, "quarter", chord=True, staff=2)
-    m += note("G", 3, 256, "quarter", alt=1, staff=2)
-    m += note("D", 3, 256, "quarter", chord=True, staff=2)
-    m += note("F", 3, 256, "quarter", staff=2)
-    m += note("A", 3, 256, "quarter", alt=-1, chord=True, staff=2)
+    harmony(m, "E", "dominant", [(9, -1, "add")])
+    note(m, "B", 5, 384, "quarter", dot=True, slur_s=True, acc=True)
+    note(m, "A", 5, 128, "eighth")
+    note(m, "E", 5, 512, "half", slur_e=True)
+    backup(m, 1024)
+    note(m, "E", 2, 256, "quarter", staff=2)
+    note(m, "B", 2, 256, "quarter", chord=True, staff=2)
+    note(m, "G", 3, 256, "quarter", alt=1, staff=2)
+    note(m, "D", 3, 256, "quarter", chord=True, staff=2)
+    note(m, "F", 3, 256, "quarter", staff=2)
+    note(m, "A", 3, 256, "quarter", alt=-1, chord=True, staff=2)
     m += '    </measure>\n'
     
     # Bar 9: Arc III - dissolving
     m += '    <measure number="9">\n'
-    m += direction("Dissolving")
-    m += direction(dyn="p")
-    m += harmony("A", "minor-seventh")
-    m += note("A", 4, 512, "half", slur_s=True, acc=True)
-    m += note("B", 4, 256, "quarter", alt=-1)
-    m += rest(256, "quarter")
-    m += backup(1024)
-    m += note("A", 2, 256, "quarter", staff=2)
-    m += note("E", 3, 256, "quarter", chord=True, staff=2)
-    m += note("G", 3, 256, "quarter", staff=2)
-    m += note("C", 4, 256, "quarter", chord=True, staff=2)
-    m += note("D", 3, 256, "quarter", staff=2)
-    m += note("B", 3, 256, "quarter", chord=True, staff=2)
+    direction(m, "Dissolving")
+    direction(m, dyn="p")
+    harmony(m, "A", "minor-seventh")
+    note(m, "A", 4, 512, "half", slur_s=True, acc=True)
+    note(m, "B", 4, 256, "quarter", alt=-1)
+    rest(m, 256, "quarter")
+    backup(m, 1024)
+    note(m, "A", 2, 256, "quarter", staff=2)
+    note(m, "E", 3, 256, "quarter", chord=True, staff=2)
+    note(m, "G", 3, 256, "quarter", staff=2)
+    note(m, "C", 4, 256, "quarter", chord=True, staff=2)
+    note(m, "D", 3, 256, "quarter", staff=2)
+    note(m, "B", 3, 256, "quarter", chord=True, staff=2)
     m += '    </measure>\n'
     
     # Bar 10
     m += '    <measure number="10">\n'
-    m += harmony("F", "major", [(9, 0, "add")])
-    m += rest(256, "quarter")
-    m += note("E", 5, 256, "quarter", stac=True)
-    m += rest(256, "quarter")
-    m += note("B", 4, 256, "quarter", slur_e=True)
-    m += backup(1024)
-    m += note("F", 2, 256, "quarter", staff=2)
-    m += note("C", 3, 256, "quarter", chord=True, staff=2)
-    m += note("A", 3, 256, "quarter", staff=2)
-    m += note("G", 3, 256, "quarter", chord=True, staff=2)
-    m += note("E", 3, 256, "quarter", staff=2)
-    m += note("B", 3, 256, "quarter", chord=True, staff=2)
+    harmony(m, "F", "major", [(9, 0, "add")])
+    rest(m, 256, "quarter")
+    note(m, "E", 5, 256, "quarter", stac=True)
+    rest(m, 256, "quarter")
+    note(m, "B", 4, 256, "quarter", slur_e=True)
+    backup(m, 1024)
+    note(m, "F", 2, 256, "quarter", staff=2)
+    note(m, "C", 3, 256, "quarter", chord=True, staff=2)
+    note(m, "A", 3, 256, "quarter", staff=2)
+    note(m, "G", 3, 256, "quarter", chord=True, staff=2)
+    note(m, "E", 3, 256, "quarter", staff=2)
+    note(m, "B", 3, 256, "quarter", chord=True, staff=2)
     m += '    </measure>\n'
     
     # Bar 11
     m += '    <measure number="11">\n'
-    m += direction("rit.")
-    m += direction(dyn="pp")
-    m += harmony("E", "minor")
-    m += note("F", 5, 256, "quarter", stac=True)
-    m += rest(512, "half")
-    m += note("A", 4, 256, "quarter")
-    m += backup(1024)
-    m += note("E", 2, 256, "quarter", staff=2)
-    m += note("B", 2, 256, "quarter", chord=True, staff=2)
-    m += note("G", 3, 256, "quarter", staff=2)
-    m += note("D", 3, 256, "quarter", chord=True, staff=2)
-    m += note("F", 3, 256, "quarter", staff=2)
-    m += note("A", 3, 256, "quarter", chord=True, staff=2)
+    direction(m, "rit.")
+    direction(m, dyn="pp")
+    harmony(m, "E", "minor")
+    note(m, "F", 5, 256, "quarter", stac=True)
+    rest(m, 512, "half")
+    note(m, "A", 4, 256, "quarter")
+    backup(m, 1024)
+    note(m, "E", 2, 256, "quarter", staff=2)
+    note(m, "B", 2, 256, "quarter", chord=True, staff=2)
+    note(m, "G", 3, 256, "quarter", staff=2)
+    note(m, "D", 3, 256, "quarter", chord=True, staff=2)
+    note(m, "F", 3, 256, "quarter", staff=2)
+    note(m, "A", 3, 256, "quarter", chord=True, staff=2)
     m += '    </measure>\n'
     
     # Bar 12
     m += '    <measure number="12">\n'
-    m += harmony("A", "minor", [(9, 0, "add")])
-    m += note("A", 4, 1024, "whole", ferm=True)
-    m += backup(1024)
-    m += note("A", 2, 1024, "whole", staff=2)
-    m += note("E", 3, 1024, "whole", chord=True, staff=2)
-    m += note("B", 3, 1024, "whole", chord=True, staff=2)
-    m += barline()
+    harmony(m, "A", "minor", [(9, 0, "add")])
+    note(m, "A", 4, 1024, "whole", ferm=True)
+    backup(m, 1024)
+    note(m, "A", 2, 1024, "whole", staff=2)
+    note(m, "E", 3, 1024, "whole", chord=True, staff=2)
+    note(m, "B", 3, 1024, "whole", chord=True, staff=2)
+    barline(m)
     m += '    </measure>\n'
     
-    return header("The Master's Palette - III. Bartok Night", 0) + m + footer()
+    footer(m)
+    return m.finish()
 
-def gen_movement4_excellent():
+def gen_movement4_excellent(out=None):
     """Movement IV - German Development - EXCELLENT
     Motif: C5-D5-E5-G#4-B4-D5"""
-    m = ""
+    m = ScoreWriter(out)
+    header(m, "The Master's Palette - IV. German Development", 0)
     
     # Bar 1
     m += '    <measure number="1">\n'
-    m += attributes(0)
-    m += direction("Streng, mit Kraft", tempo=72)
-    m += direction(dyn="f")
-    m += harmony("C", "major", [(11, 1, "add")])
-    m += note("C", 5, 256, "quarter", slur_s=True, acc=True)
-    m += note("D", 5, 256, "quarter")
-    m += note("E", 5, 256, "quarter")
-    m += note("G", 4, 256, "quarter", alt=1, slur_e=True)
-    m += backup(1024)
-    m += note("C", 3, 256, "quarter", staff=2)
-    m += note("F", 3, 256, "quarter", chord=True, staff=2)
-    m += note("G", 3, 256, "quarter", staff=2)
-    m += note("D", 4, 256, "quarter", chord=True, staff=2)
-    m += note("E", 3, 256, "quarter", staff=2)
-    m += note("A", 3, 256, "quarter", chord=True, staff=2)
+    attributes(m, 0)
+    direction(m, "Streng, mit Kraft", tempo=72)
+    direction(m, dyn="f")
+    harmony(m, "C", "major", [(11, 1, "add")])
+    note(m, "C", 5, 256, "quarter", slur_s=True, acc=True)
+    note(m, "D", 5, 256, "quarter")
+    note(m, "E", 5, 256, "quarter")
+    note(m, "G", 4, 256, "quarter", alt=1, slur_e=True)
+    backup(m, 1024)
+    note(m, "C", 3, 256, "quarter", staff=2)
+    note(m, "F", 3, 256, "quarter", chord=True, staff=2)
+    note(m, "G", 3, 256, "quarter", staff=2)
+    note(m, "D", 4, 256, "quarter", chord=True, staff=2)
+    note(m, "E", 3, 256, "quarter", staff=2)
+    note(m, "A", 3, 256, "quarter", chord=True, staff=2)
     m += '    </measure>\n'
     
     # Bar 2
     m += '    <measure number="2">\n'
-    m += harmony("E", "minor", [(9, 0, "add")])
-    m += note("B", 4, 256, "quarter", slur_s=True, acc=True)
-    m += note("D", 5, 256, "quarter")
-    m += note("E", 5, 256, "quarter")
-    m += note("F", 5, 256, "quarter", alt=1, slur_e=True)
-    m += backup(1024)
-    m += note("E", 3, 256, "quarter", staff=2)
-    m += note("B", 3, 256, "quarter", chord=True, staff=2)
-    m += note("F", 3, 256, "quarter", alt=1, staff=2)
-    m += note("C", 4, 256, "quarter", alt=1, chord=True, staff=2)
-    m += note("G", 3, 256, "quarter", staff=2)
-    m += note("D", 4, 256, "quarter", chord=True, staff=2)
+    harmony(m, "E", "minor", [(9, 0, "add")])
+    note(m, "B", 4, 256, "quarter", slur_s=True, acc=True)
+    note(m, "D", 5, 256, "quarter")
+    note(m, "E", 5, 256, "quarter")
+    note(m, "F", 5, 256, "quarter", alt=1, slur_e=True)
+    backup(m, 1024)
+    note(m, "E", 3, 256, "quarter", staff=2)
+    note(m, "B", 3, 256, "quarter", chord=True, staff=2)
+    note(m, "F", 3, 256, "quarter", alt=1, staff=2)
+    note(m, "C", 4, 256, "quarter", alt=1, chord=True, staff=2)
+    note(m, "G", 3, 256, "quarter", staff=2)
+    note(m, "D", 4, 256, "quarter", chord=True, staff=2)
     m += '    </measure>\n'
     
     # Bar 3
     m += '    <measure number="3">\n'
-    m += harmony("G#", "augmented")
-    m += note("C", 5, 256, "quarter", slur_s=True, acc=True)
-    m += note("B", 4, 256, "quarter", alt=-1)
-    m += note("A", 4, 256, "quarter", alt=-1)
-    m += note("E", 5, 256, "quarter", slur_e=True)
-    m += backup(1024)
-    m += note("G", 2, 256, "quarter", alt=1, staff=2)
-    m += note("D", 3, 256, "quarter", chord=True, staff=2)
-    m += note("C", 3, 256, "quarter", staff=2)
-    m += note("F", 3, 256, "quarter", alt=1, chord=True, staff=2)
-    m += note("E", 3, 256, "quarter", alt=-1, staff=2)
-    m += note("A", 3, 256, "quarter", chord=True, staff=2)
+    harmony(m, "G#", "augmented")
+    note(m, "C", 5, 256, "quarter", slur_s=True, acc=True)
+    note(m, "B", 4, 256, "quarter", alt=-1)
+    note(m, "A", 4, 256, "quarter", alt=-1)
+    note(m, "E", 5, 256, "quarter", slur_e=True)
+    backup(m, 1024)
+    note(m, "G", 2, 256, "quarter", alt=1, staff=2)
+    note(m, "D", 3, 256, "quarter", chord=True, staff=2)
+    note(m, "C", 3, 256, "quarter", staff=2)
+    note(m, "F", 3, 256, "quarter", alt=1, chord=True, staff=2)
+    note(m, "E", 3, 256, "quarter", alt=-1, staff=2)
+    note(m, "A", 3, 256, "quarter", chord=True, staff=2)
     m += '    </measure>\n'
     
     # Bar 4
     m += '    <measure number="4">\n'
-    m += harmony("D", "dominant", [(9, -1, "add")])
-    m += note("D", 5, 256, "quarter", slur_s=True, acc=True)
-    m += note("B", 4, 256, "quarter")
-    m += note("G", 4, 256, "quarter", alt=1)
-    m += note("E", 4, 256, "quarter", slur_e=True)
-    m += backup(1024)
-    m += note("D", 3, 256, "quarter", staff=2)
-    m += note("A", 3, 256, "quarter", chord=True, staff=2)
-    m += note("E", 3, 256, "quarter", staff=2)
-    m += note("B", 3, 256, "quarter", chord=True, staff=2)
-    m += note("A", 2, 256, "quarter", alt=-1, staff=2)
-    m += note("E", 3, 256, "quarter", alt=-1, chord=True, staff=2)
+    harmony(m, "D", "dominant", [(9, -1, "add")])
+    note(m, "D", 5, 256, "quarter", slur_s=True, acc=True)
+    note(m, "B", 4, 256, "quarter")
+    note(m, "G", 4, 256, "quarter", alt=1)
+    note(m, "E", 4, 256, "quarter", slur_e=True)
+    backup(m, 1024)
+    note(m, "D", 3, 256, "quarter", staff=2)
+    note(m, "A", 3, 256, "quarter", chord=True, staff=2)
+    note(m, "E", 3, 256, "quarter", staff=2)
+    note(m, "B", 3, 256, "quarter", chord=True, staff=2)
+    note(m, "A", 2, 256, "quarter", alt=-1, staff=2)
+    note(m, "E", 3, 256, "quarter", alt=-1, chord=True, staff=2)
     m += '    </measure>\n'
     
     # Bar 5: Transformation
     m += '    <measure number="5">\n'
-    m += direction("Breiter")
-    m += direction(dyn="mf")
-    m += harmony("F", "major-seventh", [(11, 1, "add")])
-    m += note("C", 5, 512, "half", slur_s=True)
-    m += note("D", 5, 512, "half", slur_e=True)
-    m += backup(1024)
-    m += note("F", 2, 256, "quarter", staff=2)
-    m += note("C", 3, 256, "quarter", chord=True, staff=2)
-    m += note("E", 3, 256, "quarter", staff=2)
-    m += note("B", 3, 256, "quarter", chord=True, staff=2)
-    m += note("A", 3, 256, "quarter", staff=2)
-    m += note("E", 4, 256, "quarter", chord=True, staff=2)
+    direction(m, "Breiter")
+    direction(m, dyn="mf")
+    harmony(m, "F", "major-seventh", [(11, 1, "add")])
+    note(m, "C", 5, 512, "half", slur_s=True)
+    note(m, "D", 5, 512, "half", slur_e=True)
+    backup(m, 1024)
+    note(m, "F", 2, 256, "quarter", staff=2)
+    note(m, "C", 3, 256, "quarter", chord=True, staff=2)
+    note(m, "E", 3, 256, "quarter", staff=2)
+    note(m, "B", 3, 256, "quarter", chord=True, staff=2)
+    note(m, "A", 3, 256, "quarter", staff=2)
+    note(m, "E", 4, 256, "quarter", chord=True, staff=2)
     m += '    </measure>\n'
     
     # Bar 6
     m += '    <measure number="6">\n'
-    m += harmony("B", "half-diminished")
-    m += note("E", 5, 512, "half", slur_s=True)
-    m += note("G", 4, 512, "half", alt=1, slur_e=True)
-    m += backup(1024)
-    m += note("B", 2, 256, "quarter", staff=2)
-    m += note("F", 3, 256, "quarter", chord=True, staff=2)
-    m += note("A", 3, 256, "quarter", staff=2)
-    m += note("D", 4, 256, "quarter", chord=True, staff=2)
-    m += note("G", 3, 256, "quarter", alt=1, staff=2)
-    m += note("D", 4, 256, "quarter", alt=1, chord=True, staff=2)
+    harmony(m, "B", "half-diminished")
+    note(m, "E", 5, 512, "half", slur_s=True)
+    note(m, "G", 4, 512, "half", alt=1, slur_e=True)
+    backup(m, 1024)
+    note(m, "B", 2, 256, "quarter", staff=2)
+    note(m, "F", 3, 256, "quarter", chord=True, staff=2)
+    note(m, "A", 3, 256, "quarter", staff=2)
+    note(m, "D", 4, 256, "quarter", chord=True, staff=2)
+    note(m, "G", 3, 256, "quarter", alt=1, staff=2)
+    note(m, "D", 4, 256, "quarter", alt=1, chord=True, staff=2)
     m += '    </measure>\n'
     
     # Bar 7: Diminution
     m += '    <measure number="7">\n'
-    m += direction(dyn="f")
-    m += harmony("A", "minor", [(9, 0, "add")])
-    m += note("C", 5, 128, "eighth", slur_s=True, acc=True)
-    m += note("D", 5, 128, "eighth")
-    m += note("E", 5, 128, "eighth")
-    m += note("G", 4, 128, "eighth", alt=1)
-    m += note("B", 4, 256, "quarter")
-    m += note("D", 5, 256, "quarter")
-    m += note("C", 5, 256, "quarter", slur_e=True)
-    m += backup(1024)
-    m += note("A", 2, 256, "quarter", staff=2)
-    m += note("E", 3, 256, "quarter", chord=True, staff=2)
-    m += note("D", 3, 256, "quarter", staff=2)
-    m += note("G", 3, 256, "quarter", chord=True, staff=2)
-    m += note("C", 3, 256, "quarter", staff=2)
-    m += note("F", 3, 256, "quarter", chord=True, staff=2)
+    direction(m, dyn="f")
+    harmony(m, "A", "minor", [(9, 0, "add")])
+    note(m, "C", 5, 128, "eighth", slur_s=True, acc=True)
+    note(m, "D", 5, 128, "eighth")
+    note(m, "E", 5, 128, "eighth")
+    note(m, "G", 4, 128, "eighth", alt=1)
+    note(m, "B", 4, 256, "quarter")
+    note(m, "D", 5, 256, "quarter")
+    note(m, "C", 5, 256, "quarter", slur_e=True)
+    backup(m, 1024)
+    note(m, "A", 2, 256, "quarter", staff=2)
+    note(m, "E", 3, 256, "quarter", chord=True, staff=2)
+    note(m, "D", 3, 256, "quarter", staff=2)
+    note(m, "G", 3, 256, "quarter", chord=True, staff=2)
+    note(m, "C", 3, 256, "quarter", staff=2)
+    note(m, "F", 3, 256, "quarter", chord=True, staff=2)
     m += '    </measure>\n'
     
     # Bar 8
     m += '    <measure number="8">\n'
-    m += harmony("E", "dominant", [(9, 1, "add")])
-    m += note("E", 5, 256, "quarter", slur_s=True, acc=True)
-    m += note("G", 4, 256, "quarter", alt=1)
-    m += note("D", 6, 256, "quarter")
-    m += note("B", 4, 256, "quarter", slur_e=True)
-    m += backup(1024)
-    m += note("E", 2, 256, "quarter", staff=2)
-    m += note("B", 2, 256, "quarter", chord=True, staff=2)
-    m += note("F", 2, 256, "quarter", staff=2)
-    m += note("C", 3, 256, "quarter", chord=True, staff=2)
-    m += note("F", 2, 256, "quarter", alt=1, staff=2)
-    m += note("C", 3, 256, "quarter", alt=1, chord=True, staff=2)
+    harmony(m, "E", "dominant", [(9, 1, "add")])
+    note(m, "E", 5, 256, "quarter", slur_s=True, acc=True)
+    note(m, "G", 4, 256, "quarter", alt=1)
+    note(m, "D", 6, 256, "quarter")
+    note(m, "B", 4, 256, "quarter", slur_e=True)
+    backup(m, 1024)
+    note(m, "E", 2, 256, "quarter", staff=2)
+    note(m, "B", 2, 256, "quarter", chord=True, staff=2)
+    note(m, "F", 2, 256, "quarter", staff=2)
+    note(m, "C", 3, 256, "quarter", chord=True, staff=2)
+    note(m, "F", 2, 256, "quarter", alt=1, staff=2)
+    note(m, "C", 3, 256, "quarter", alt=1, chord=True, staff=2)
     m += '    </measure>\n'
     
     # Bar 9: Arrival
     m += '    <measure number="9">\n'
-    m += direction("Ankunft")
-    m += direction(dyn="ff")
-    m += harmony("C", "major-seventh")
-    m += note("C", 5, 256, "quarter", slur_s=True, acc=True)
-    m += note("E", 5, 256, "quarter")
-    m += note("D", 5, 256, "quarter")
-    m += note("G", 5, 256, "quarter", alt=1, slur_e=True)
-    m += backup(1024)
-    m += note("C", 3, 256, "quarter", staff=2)
-    m += note("G", 3, 256, "quarter", chord=True, staff=2)
-    m += note("D", 4, 256, "quarter", chord=True, staff=2)
-    m += note("B", 2, 256, "quarter", staff=2)
-    m += note("F", 3, 256, "quarter", alt=1, chord=True, staff=2)
-    m += note("E", 3, 256, "quarter", staff=2)
+    direction(m, "Ankunft")
+    direction(m, dyn="ff")
+    harmony(m, "C", "major-seventh")
+    note(m, "C", 5, 256, "quarter", slur_s=True, acc=True)
+    note(m, "E", 5, 256, "quarter")
+    note(m, "D", 5, 256, "quarter")
+    note(m, "G", 5, 256, "quarter", alt=1, slur_e=True)
+    backup(m, 1024)
+    note(m, "C", 3, 256, "quarter", staff=2)
+    note(m, "G", 3, 256, "quarter", chord=True, staff=2)
+    note(m, "D", 4, 256, "quarter", chord=True, staff=2)
+    note(m, "B", 2, 256, "quarter", staff=2)
+    note(m, "F", 3, 256, "quarter", alt=1, chord=True, staff=2)
+    note(m, "E", 3, 256, "quarter", staff=2)
     m += '    </measure>\n'
     
     # Bar 10
     m += '    <measure number="10">\n'
-    m += harmony("G", "dominant", [(11, 1, "add")])
-    m += note("B", 5, 256, "quarter", slur_s=True)
-    m += note("D", 6, 256, "quarter")
-    m += note("C", 6, 256, "quarter")
-    m += note("E", 5, 256, "quarter", slur_e=True)
-    m += backup(1024)
-    m += note("G", 2, 256, "quarter", staff=2)
-    m += note("D", 3, 256, "quarter", chord=True, staff=2)
-    m += note("F", 3, 256, "quarter", alt=1, staff=2)
-    m += note("C", 4, 256, "quarter", chord=True, staff=2)
-    m += note("B", 3, 256, "quarter", staff=2)
-    m += note("F", 4, 256, "quarter", chord=True, staff=2)
+    harmony(m, "G", "dominant", [(11, 1, "add")])
+    note(m, "B", 5, 256, "quarter", slur_s=True)
+    note(m, "D", 6, 256, "quarter")
+    note(m, "C", 6, 256, "quarter")
+    note(m, "E", 5, 256, "quarter", slur_e=True)
+    backup(m, 1024)
+    note(m, "G", 2, 256, "quarter", staff=2)
+    note(m, "D", 3, 256, "quarter", chord=True, staff=2)
+    note(m, "F", 3, 256, "quarter", alt=1, staff=2)
+    note(m, "C", 4, 256, "quarter", chord=True, staff=2)
+    note(m, "B", 3, 256, "quarter", staff=2)
+    note(m, "F", 4, 256, "quarter", chord=True, staff=2)
     m += '    </measure>\n'
     
     # Bar 11
     m += '    <measure number="11">\n'
-    m += direction("rit.")
-    m += harmony("D", "minor", [(11, 0, "add")])
-    m += note("D", 5, 256, "quarter", slur_s=True)
-    m += note("E", 5, 256, "quarter")
-    m += note("G", 4, 256, "quarter", alt=1)
-    m += note("B", 4, 256, "quarter", slur_e=True)
-    m += backup(1024)
-    m += note("D", 3, 256, "quarter", staff=2)
-    m += note("A", 3, 256, "quarter", chord=True, staff=2)
-    m += note("G", 3, 256, "quarter", staff=2)
-    m += note("C", 4, 256, "quarter", chord=True, staff=2)
-    m += note("F", 3, 256, "quarter", staff=2)
-    m += note("B", 3, 256, "quarter", chord=True, staff=2)
+    direction(m, "rit.")
+    harmony(m, "D", "minor", [(11, 0, "add")])
+    note(m, "D", 5, 256, "quarter", slur_s=True)
+    note(m, "E", 5, 256, "quarter")
+    note(m, "G", 4, 256, "quarter", alt=1)
+    note(m, "B", 4, 256, "quarter", slur_e=True)
+    backup(m, 1024)
+    note(m, "D", 3, 256, "quarter", staff=2)
+    note(m, "A", 3, 256, "quarter", chord=True, staff=2)
+    note(m, "G", 3, 256, "quarter", staff=2)
+    note(m, "C", 4, 256, "quarter", chord=True, staff=2)
+    note(m, "F", 3, 256, "quarter", staff=2)
+    note(m, "B", 3, 256, "quarter", chord=True, staff=2)
     m += '    </measure>\n'
     
     # Bar 12
     m += '    <measure number="12">\n'
-    m += direction(dyn="p")
-    m += harmony("C", "major", [(9, 0, "add"), (11, 1, "add")])
-    m += note("D", 5, 256, "quarter", slur_s=True)
-    m += note("C", 5, 768, "half", dot=True, slur_e=True, ferm=True)
-    m += backup(1024)
-    m += note("C", 2, 1024, "whole", staff=2)
-    m += note("G", 2, 1024, "whole", chord=True, staff=2)
-    m += note("D", 3, 1024, "whole", chord=True, staff=2)
-    m += note("F", 3, 1024, "whole", alt=1, chord=True, staff=2)
-    m += barline()
+    direction(m, dyn="p")
+    harmony(m, "C", "major", [(9, 0, "add"), (11, 1, "add")])
+    note(m, "D", 5, 256, "quarter", slur_s=True)
+    note(m, "C", 5, 768, "half", dot=True, slur_e=True, ferm=True)
+    backup(m, 1024)
+    note(m, "C", 2, 1024, "whole", staff=2)
+    note(m, "G", 2, 1024, "whole", chord=True, staff=2)
+    note(m, "D", 3, 1024, "whole", chord=True, staff=2)
+    note(m, "F", 3, 1024, "whole", alt=1, chord=True, staff=2)
+    barline(m)
     m += '    </measure>\n'
     
-    return header("The Master's Palette - IV. German Development", 0) + m + footer()
+    footer(m)
+    return m.finish()
 
 # ============ MAIN EXECUTION ============
 def main():
+    configure_output(sys.argv[1:])
     scores_dir = os.path.join(os.path.dirname(__file__), "..", "scores")
     os.makedirs(scores_dir, exist_ok=True)
     
@@ -983,6 +1006,7 @@ def main():
     ]
     
     results = []
+    unchanged = 0
     
     print("=" * 65)
     print("EXCELLENCE PASS - FOUR MOVEMENTS")
@@ -990,13 +1014,13 @@ def main():
     print()
     
     for filename, generator, title in generators:
-        xml = generator()
         filepath = os.path.join(scores_dir, filename)
         
-        with open(filepath, "w", encoding="utf-8") as f:
-            f.write(xml)
+        filepath, written = stream_if_changed(filepath, generator)
+        if not written:
+            unchanged += 1
         
-        score, details = evaluate_excellence(title, xml)
+        score, details = evaluate_excellence_stream(title, filepath)
         passed = [k for k, v in details.items() if v == 1]
         results.append((title, score, passed, filepath))
         
@@ -1033,6 +1057,7 @@ def main():
         print(f"  - {os.path.basename(filepath)}")
     print()
     print("Refinement cycles: 1 (all passed on enhanced generation)")
+    print(f"Unchanged files (write skipped): {unchanged}/{len(generators)}")
 
 if __name__ == "__main__":
     main()
@@ -6,6 +6,10 @@ Do NOT modify Movements I, II, or V
 """
 
 import os
+import sys
+
+from score_features import extract_features, has_marker
+from score_writer import configure_output, write_score
 
 # ============ UTILITIES ============
 def note(step, octave, duration, ntype, alter=None, voice=1, staff=1, 
@@ -122,52 +126,53 @@ def measure_attrs(divisions=256, fifths=0, beats=4, beat_type=4, clef_sign="G",
 
 # ============ EVALUATION ENGINE ============
 def evaluate(xml, name):
+    f = extract_features(xml)
     scores = {}
     
-    slur_count = xml.count('<slur')
-    accent_count = xml.count('<accent/>')
+    slur_count = f['slurs']
+    accent_count = f['accents']
     scores["Motivic Identity"] = min(1.0, (slur_count / 35) * 0.5 + (accent_count / 30) * 0.5)
     
-    oct5 = xml.count('<octave>5</octave>')
-    oct4 = xml.count('<octave>4</octave>')
-    oct3 = xml.count('<octave>3</octave>')
-    oct6 = xml.count('<octave>6</octave>')
-    oct2 = xml.count('<octave>2</octave>')
+    oct5 = f['octaves'].get(5, 0)
+    oct4 = f['octaves'].get(4, 0)
+    oct3 = f['octaves'].get(3, 0)
+    oct6 = f['octaves'].get(6, 0)
+    oct2 = f['octaves'].get(2, 0)
     scores["Motivic Development"] = min(1.0, (oct5 + oct4 + oct3 + oct6 + oct2) / 100)
     
-    part_count = xml.count('<part id=')
-    note_count = xml.count('<note>')
+    part_count = f['parts']
+    note_count = f['notes']
     scores["Orchestration Colour"] = min(1.0, (part_count / 10) * 0.3 + (note_count / 500) * 0.7)
     
-    alter_count = xml.count('<alter>')
-    harmonic_count = xml.count('<harmonic/>')
+    alter_count = f['alters']
+    harmonic_count = f['harmonics']
     scores["Register & Timbre"] = min(1.0, (oct6 + oct2) / 30 * 0.4 + (alter_count / 40) * 0.4 + (harmonic_count / 10) * 0.2)
     
-    harmony_count = xml.count('<harmony')
-    degree_count = xml.count('<degree>')
+    harmony_count = f['harmonies']
+    degree_count = f['degrees']
     scores["Harmonic Colour"] = min(1.0, (harmony_count / 15) * 0.4 + (degree_count / 40) * 0.6)
     
-    dynamics_count = xml.count('<dynamics>')
-    words_count = xml.count('<words')
-    stac_count = xml.count('<staccato/>')
+    dynamics_count = f['dynamics']
+    words_count = f['words']
+    stac_count = f['staccatos']
     scores["Idiomatic Writing"] = min(1.0, (dynamics_count / 10) * 0.4 + (words_count / 8) * 0.3 + (stac_count / 15) * 0.3)
     
-    has_rit = 'rit' in xml.lower()
-    has_section = any(x in xml.lower() for x in ['expanding', 'dissolving', 'ankunft', 'breiter', 'nocturnal', 'insect'])
-    measure_count = xml.count('<measure number=')
+    has_rit = has_marker(f, 'rit')
+    has_section = has_marker(f, 'expanding', 'dissolving', 'ankunft', 'breiter', 'nocturnal', 'insect')
+    measure_count = f['measures']
     scores["Formal Shape"] = 0.4 + (0.3 if has_rit else 0) + (0.3 if has_section else 0)
     
-    fermata_count = xml.count('<fermata')
-    ff_count = xml.count('<ff/>')
-    pp_count = xml.count('<pp/>')
-    ppp_count = xml.count('<ppp/>')
+    fermata_count = f['fermatas']
+    ff_count = f['dynamic_marks']['ff']
+    pp_count = f['dynamic_marks']['pp']
+    ppp_count = f['dynamic_marks']['ppp']
     scores["Emotional Impact"] = min(1.0, (fermata_count / 1) * 0.2 + (accent_count / 25) * 0.4 + ((ff_count + pp_count + ppp_count) / 4) * 0.4)
     
-    rest_count = xml.count('<rest/>')
-    chord_count = xml.count('<chord/>')
+    rest_count = f['rests']
+    chord_count = f['chords']
     scores["Ensemble Balance"] = min(1.0, (rest_count / 60) * 0.3 + (chord_count / 50) * 0.3 + (note_count / 450) * 0.4)
     
-    has_barline = '<barline' in xml
+    has_barline = f['barlines'] > 0
     scores["Engraving"] = 0.7 + (0.3 if has_barline else 0)
     
     total = sum(scores.values())
@@ -563,6 +568,7 @@ def orchestrate_mvmt4_excellent():
 
 # ============ MAIN ============
 def main():
+    configure_output(sys.argv[1:])
     scores_dir = os.path.join(os.path.dirname(__file__), "..", "scores")
     
     print("=" * 70)
@@ -587,8 +593,7 @@ def main():
         # Movement III
         xml3 = orchestrate_mvmt3_excellent()
         filepath3 = os.path.join(scores_dir, "Movement3-Orchestrated-Excellent-Final.musicxml")
-        with open(filepath3, "w", encoding="utf-8") as f:
-            f.write(xml3)
+        filepath3 = write_score(filepath3, xml3)
         total3, scores3 = evaluate(xml3, "III. Bartok Night")
         history["III. Bartok Night"].append(total3)
         results["III. Bartok Night"] = (total3, scores3)
@@ -600,8 +605,7 @@ def main():
         # Movement IV
         xml4 = orchestrate_mvmt4_excellent()
         filepath4 = os.path.join(scores_dir, "Movement4-Orchestrated-Excellent-Final.musicxml")
-        with open(filepath4, "w", encoding="utf-8") as f:
-            f.write(xml4)
+        filepath4 = write_score(filepath4, xml4)
         total4, scores4 = evaluate(xml4, "IV. German Development")
         history["IV. German Development"].append(total4)
         results["IV. German Development"] = (total4, scores4)
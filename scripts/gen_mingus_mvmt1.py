@@ -7,6 +7,9 @@ Motif B: descending blues-inflected 4-note cell
 """
 
 import os
+import sys
+
+from score_writer import ScoreWriter, configure_output
 
 # MusicXML Header
 def get_header():
@@ -156,8 +159,8 @@ def backup(dur):
     return f"      <backup><duration>{dur}</duration></backup>\n"
 
 # ============ SECTION A (bars 1-16): Brooding, building intensity ============
-def section_a():
-    measures = ""
+def section_a(out=None):
+    measures = ScoreWriter(out)
     
     # Bar 1: Cm9 - Motif A intro (rising m3 to tritone)
     measures += '    <measure number="1">\n'
@@ -413,11 +416,11 @@ def section_a():
     measures += note("B", 2, 256, "quarter", alter=-1, chord=True, staff=2)
     measures += '    </measure>\n'
     
-    return measures
+    return measures.finish()
 
 # ============ SECTION B (bars 17-32): Contrasting, more turbulent ============
-def section_b():
-    measures = ""
+def section_b(out=None):
+    measures = ScoreWriter(out)
     
     # Bar 17: Ebm9 - new key area
     measures += '    <measure number="17">\n'
@@ -662,11 +665,11 @@ def section_b():
     measures += note("E", 3, 256, "quarter", alter=-1, staff=2)
     measures += '    </measure>\n'
     
-    return measures
+    return measures.finish()
 
 # ============ SECTION A' (bars 33-48): Return, transformed ============
-def section_a_prime():
-    measures = ""
+def section_a_prime(out=None):
+    measures = ScoreWriter(out)
     
     # Bar 33: Cm9 - return of opening
     measures += '    <measure number="33">\n'
@@ -912,24 +915,22 @@ def section_a_prime():
     measures += barline("light-heavy")
     measures += '    </measure>\n'
     
-    return measures
+    return measures.finish()
 
 def main():
-    # Build complete MusicXML
-    xml = get_header()
-    xml += section_a()
-    xml += section_b()
-    xml += section_a_prime()
-    xml += get_footer()
-    
-    # Write file
+    configure_output(sys.argv[1:])
     output_path = os.path.join(os.path.dirname(__file__), "..", "scores", "testV1-Mingus.musicxml")
     output_path = os.path.normpath(output_path)
     
-    with open(output_path, "w", encoding="utf-8") as f:
-        f.write(xml)
+    # Stream the complete MusicXML straight to the file
+    with ScoreWriter(output_path) as xml:
+        xml += get_header()
+        section_a(xml)
+        section_b(xml)
+        section_a_prime(xml)
+        xml += get_footer()
     
-    print(f"Generated: {output_path}")
+    print(f"Generated: {xml.path}")
     print("48-bar Mingus-inspired lead sheet complete.")
     print("Form: A(16) - B(16) - A'(16)")
     print("Key: C minor, Tempo: Slow (q=54)")
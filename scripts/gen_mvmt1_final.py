@@ -1,6 +1,10 @@
 #!/usr/bin/env python3
 """Movement I - Mingus Gospel Cathedral - FINAL with Criteria of Excellence"""
 
+import sys
+
+from score_writer import configure_output, write_score
+
 # Chord symbol helper - Sibelius-compatible format
 def ch(root, kind, alter=0, text=''):
     s = f'<harmony><root><root-step>{root}</root-step>'
@@ -358,8 +362,8 @@ mvmt += f'''<measure number="32">
 mvmt += '''</part>
 </score-partwise>'''
 
-with open('scores/MastersPalette-Mvmt1-Excellent.musicxml', 'w', encoding='utf-8') as f:
-    f.write(mvmt)
+configure_output(sys.argv[1:])
+write_score('scores/MastersPalette-Mvmt1-Excellent.musicxml', mvmt)
 print("Created: MastersPalette-Mvmt1-Excellent.musicxml (32 bars)")
 
 
@@ -7,6 +7,9 @@ Form: A(4) - A1(4) - Coda(4)
 """
 
 import os
+import sys
+
+from score_writer import configure_output, write_score
 
 def n(step, oct, dur, typ, alt=None, dot=False, chord=False, 
       slur_s=False, slur_e=False, acc=False, ferm=False, staff=1, tie_s=False, tie_e=False):
@@ -308,11 +311,11 @@ def gen():
     return m
 
 def main():
+    configure_output(sys.argv[1:])
     xml = HDR + gen() + FTR
     out = os.path.join(os.path.dirname(__file__), "..", "scores", "V2-Gil-Mvmt2-11-Dec-2025.musicxml")
     out = os.path.normpath(out)
-    with open(out, "w", encoding="utf-8") as f:
-        f.write(xml)
+    out = write_score(out, xml)
     print(f"Generated: {out}")
 
 if __name__ == "__main__":
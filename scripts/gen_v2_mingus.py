@@ -6,6 +6,9 @@ Form: A(4) - A1(4) - B(4)
 """
 
 import os
+import sys
+
+from score_writer import configure_output, write_score
 
 def n(step, oct, dur, typ, alt=None, dot=False, chord=False, 
       slur_s=False, slur_e=False, acc=False, stac=False, ferm=False, staff=1):
@@ -335,11 +338,11 @@ def gen():
     return m
 
 def main():
+    configure_output(sys.argv[1:])
     xml = HDR + gen() + FTR
     out = os.path.join(os.path.dirname(__file__), "..", "scores", "V2-Mingus-Mvmt1-11-Dec-2025.musicxml")
     out = os.path.normpath(out)
-    with open(out, "w", encoding="utf-8") as f:
-        f.write(xml)
+    out = write_score(out, xml)
     print(f"Generated: {out}")
 
 if __name__ == "__main__":
@@ -5,6 +5,9 @@ Each movement: 24-32 bars with motivic development
 """
 
 import os
+import sys
+
+from score_writer import configure_output, write_score
 
 os.makedirs('scores', exist_ok=True)
 
@@ -289,8 +292,8 @@ mvmt1 = '''<?xml version="1.0" encoding="UTF-8"?>
 </part>
 </score-partwise>'''
 
-with open('scores/MastersPalette-Mvmt1-Mingus-LeadSheet.musicxml', 'w', encoding='utf-8') as f:
-    f.write(mvmt1)
+configure_output(sys.argv[1:])
+write_score('scores/MastersPalette-Mvmt1-Mingus-LeadSheet.musicxml', mvmt1)
 print("Created: MastersPalette-Mvmt1-Mingus-LeadSheet.musicxml (32 bars)")
 
 # Continue with other movements in separate files due to size...
@@ -6,45 +6,42 @@ The Master's Palette - FINAL Production
 
 import os
 import json
+import sys
 from datetime import datetime
 
+from patch_engine import PatchSet
+from score_writer import configure_output, read_score_text, write_score
+
 COPYRIGHT = "© 2025 Michael Bryant. All Rights Reserved."
 DATE = datetime.now().strftime("%Y-%m-%d")
 
-print("="*70)
-print("MASTER COMPLETION PASS — V21 through V29 Combined")
-print("="*70)
-
-# ============================================================
-# READ SOURCE FILE
-# ============================================================
-print("\n[1/9] Loading V20 source...")
-with open('scores/masters-palette-orchestrated-v20-commercialEngraved.musicxml', 'r', encoding='utf-8') as f:
-    final = f.read()
-
-# ============================================================
-# V21 — PERFORMANCE NOTES
-# ============================================================
-print("[2/9] V21: Adding Performance Notes...")
-
-# Update title to FINAL
-final = final.replace(
-    '<work-title>The Master\'s Palette</work-title>',
-    '<work-title>The Master\'s Palette - FINAL EDITION</work-title>'
-)
-final = final.replace(
-    '<encoder>V20 Final Commercial Engraving</encoder>',
-    '<encoder>FINAL Master Completion Pass (V21-V29)</encoder>'
-)
-final = final.replace(
-    '<software>V20 Commercial Grade - Publication Standard</software>',
-    '<software>FINAL Edition - Performance/Recording/Publication Ready</software>'
-)
-
-# Add performance notes as miscellaneous field
-final = final.replace(
-    '<miscellaneous><miscellaneous-field name="part-score-agreement">Verified - all markings consistent between score and parts</miscellaneous-field></miscellaneous>',
-    '''<miscellaneous>
+
+def build_patches():
+    """V21-V25 patch set, built without touching any files."""
+    patches = PatchSet("V21-V25")
+
+    # ============================================================
+    # V21 — PERFORMANCE NOTES
+    # ============================================================
+
+    # Update title to FINAL
+    patches.replace(
+        '<work-title>The Master\'s Palette</work-title>',
+        '<work-title>The Master\'s Palette - FINAL EDITION</work-title>'
+    )
+    patches.replace(
+        '<encoder>V20 Final Commercial Engraving</encoder>',
+        '<encoder>FINAL Master Completion Pass (V21-V29)</encoder>'
+    )
+    patches.replace(
+        '<software>V20 Commercial Grade - Publication Standard</software>',
+        '<software>FINAL Edition - Performance/Recording/Publication Ready</software>'
+    )
+
+    # Add performance notes as miscellaneous field
+    patches.replace(
+        '<miscellaneous><miscellaneous-field name="part-score-agreement">Verified - all markings consistent between score and parts</miscellaneous-field></miscellaneous>',
+        '''<miscellaneous>
 <miscellaneous-field name="part-score-agreement">Verified - all markings consistent between score and parts</miscellaneous-field>
 <miscellaneous-field name="performance-notes">See accompanying Performance Notes document for detailed interpretation guidance.</miscellaneous-field>
 <miscellaneous-field name="movement-I">Mingus Blues Cathedral: Gospel warmth, syncopated blues feel, q=92. Flugelhorn leads with singing espressivo.</miscellaneous-field>
@@ -54,189 +51,208 @@ final = final.replace(
 <miscellaneous-field name="balance">Primary lines always lead. Supporting voices pp-mp. Guitar sempre sotto voce except Chorale.</miscellaneous-field>
 <miscellaneous-field name="tempo-flexibility">Rubato encouraged at transitions. Fermatas should breathe. Attacca between III and IV.</miscellaneous-field>
 </miscellaneous>'''
-)
-
-# ============================================================
-# V22 — PLAYABILITY OPTIMIZATION
-# ============================================================
-print("[3/9] V22: Optimizing Playability...")
-
-# Add final bowing refinements
-final = final.replace(
-    'cantabile, portato (V-n-V bowing)',
-    'cantabile, portato (V-n-V, stay in lower half)'
-)
-
-final = final.replace(
-    'Bass Poetry - cantabile (down-bow, stay 1st pos.)',
-    'Bass Poetry - cantabile (down-bow, 1st-4th pos., no shifts during phrase)'
-)
-
-# Add string technique clarification
-final = final.replace(
-    'CLIMAX I - con forza, detache, full bow',
-    'CLIMAX I - con forza, detache, full bow (WB to tip)'
-)
-
-# ============================================================
-# V23 — COLOUR & TIMBRE POLISH
-# ============================================================
-print("[4/9] V23: Polishing Colour/Timbre...")
-
-# Refine timbral markings
-final = final.replace(
-    'sul tasto, poco vib., quasi niente',
-    'sul tasto (over fingerboard), poco vib., quasi niente, dying away'
-)
-
-final = final.replace(
-    'STRUCTURAL SILENCE - niente (strings: harmonics)',
-    'STRUCTURAL SILENCE - niente (strings: natural harmonics, touch lightly)'
-)
-
-final = final.replace(
-    'shimmer, harmonics, con pedale',
-    'shimmer (harmonics XII), con pedale, let ring sempre'
-)
-
-final = final.replace(
-    'Cello pedal - sul pont., down-bow attack, sostenuto',
-    'Cello pedal - sul pont. (near bridge), down-bow attack, sostenuto, growling'
-)
-
-# ============================================================
-# V24 — REHEARSAL-READY PARTS
-# ============================================================
-print("[5/9] V24: Making Parts Rehearsal-Ready...")
-
-# Enhanced cue labeling
-final = final.replace(
-    '[cue: Flhn.]',
-    '[CUE: Flugelhorn m.4]'
-)
-
-final = final.replace(
-    '[cue: Flhn. beat 4]',
-    '[CUE: Flugelhorn enters beat 4]'
-)
-
-final = final.replace(
-    '[cue: Flhn. phrase ending]',
-    '[CUE: Flugelhorn phrase ending]'
-)
-
-# ============================================================
-# V25 — MIDI/PLAYBACK OPTIMIZATION
-# ============================================================
-print("[6/9] V25: Optimizing MIDI Playback...")
-
-# Add sound elements for playback
-final = final.replace(
-    '<score-instrument id="P1-I1"><instrument-name>Flute</instrument-name></score-instrument>',
-    '<score-instrument id="P1-I1"><instrument-name>Flute</instrument-name><instrument-sound>wind.flutes.flute</instrument-sound></score-instrument><midi-instrument id="P1-I1"><midi-channel>1</midi-channel><midi-program>74</midi-program><volume>80</volume><pan>-40</pan></midi-instrument>'
-)
-
-final = final.replace(
-    '<score-instrument id="P2-I1"><instrument-name>Clarinet in Bb</instrument-name></score-instrument>',
-    '<score-instrument id="P2-I1"><instrument-name>Clarinet in Bb</instrument-name><instrument-sound>wind.reed.clarinet</instrument-sound></score-instrument><midi-instrument id="P2-I1"><midi-channel>2</midi-channel><midi-program>72</midi-program><volume>80</volume><pan>40</pan></midi-instrument>'
-)
-
-final = final.replace(
-    '<score-instrument id="P3-I1"><instrument-name>Flugelhorn in Bb</instrument-name></score-instrument>',
-    '<score-instrument id="P3-I1"><instrument-name>Flugelhorn in Bb</instrument-name><instrument-sound>brass.flugelhorn</instrument-sound></score-instrument><midi-instrument id="P3-I1"><midi-channel>3</midi-channel><midi-program>60</midi-program><volume>85</volume><pan>0</pan></midi-instrument>'
-)
-
-final = final.replace(
-    '<score-instrument id="P4-I1"><instrument-name>Violin</instrument-name></score-instrument>',
-    '<score-instrument id="P4-I1"><instrument-name>Violin</instrument-name><instrument-sound>strings.violin</instrument-sound></score-instrument><midi-instrument id="P4-I1"><midi-channel>4</midi-channel><midi-program>41</midi-program><volume>85</volume><pan>-30</pan></midi-instrument>'
-)
-
-final = final.replace(
-    '<score-instrument id="P5-I1"><instrument-name>Viola</instrument-name></score-instrument>',
-    '<score-instrument id="P5-I1"><instrument-name>Viola</instrument-name><instrument-sound>strings.viola</instrument-sound></score-instrument><midi-instrument id="P5-I1"><midi-channel>5</midi-channel><midi-program>42</midi-program><volume>75</volume><pan>30</pan></midi-instrument>'
-)
-
-final = final.replace(
-    '<score-instrument id="P6-I1"><instrument-name>Violoncello</instrument-name></score-instrument>',
-    '<score-instrument id="P6-I1"><instrument-name>Violoncello</instrument-name><instrument-sound>strings.cello</instrument-sound></score-instrument><midi-instrument id="P6-I1"><midi-channel>6</midi-channel><midi-program>43</midi-program><volume>80</volume><pan>20</pan></midi-instrument>'
-)
-
-final = final.replace(
-    '<score-instrument id="P7-I1"><instrument-name>Double Bass</instrument-name></score-instrument>',
-    '<score-instrument id="P7-I1"><instrument-name>Double Bass</instrument-name><instrument-sound>strings.contrabass</instrument-sound></score-instrument><midi-instrument id="P7-I1"><midi-channel>7</midi-channel><midi-program>44</midi-program><volume>75</volume><pan>0</pan></midi-instrument>'
-)
-
-final = final.replace(
-    '<score-instrument id="P8-I1"><instrument-name>Classical Guitar</instrument-name></score-instrument>',
-    '<score-instrument id="P8-I1"><instrument-name>Classical Guitar</instrument-name><instrument-sound>pluck.guitar.nylon-string</instrument-sound></score-instrument><midi-instrument id="P8-I1"><midi-channel>8</midi-channel><midi-program>25</midi-program><volume>70</volume><pan>-20</pan></midi-instrument>'
-)
-
-# ============================================================
-# V26 — PUBLISHER LAYOUT (Already done in V19-V20, verify)
-# ============================================================
-print("[7/9] V26: Verifying Publisher Layout...")
-# Layout already optimized in V19-V20
-
-# ============================================================
-# WRITE FINAL SCORE
-# ============================================================
-print("[8/9] Writing Final Score...")
-
-# Create output directories
-os.makedirs('scores/masters-palette-FINAL-Parts', exist_ok=True)
-os.makedirs('scores/masters-palette-Archive', exist_ok=True)
-os.makedirs('scores/masters-palette-PerformerPack', exist_ok=True)
-os.makedirs('scores/masters-palette-PublisherPack', exist_ok=True)
-
-# Write final score
-with open('scores/masters-palette-FINAL-Score.musicxml', 'w', encoding='utf-8') as f:
-    f.write(final)
-
-# ============================================================
-# V27 — ARCHIVAL PACKAGE
-# ============================================================
-print("[9/9] V27-V29: Creating Archive & Performer Packages...")
-
-# Metadata JSON
-metadata = {
-    "title": "The Master's Palette (Reimagined)",
-    "composer": "Michael Bryant",
-    "year": 2025,
-    "copyright": COPYRIGHT,
-    "catalog_number": "MB-2025-001",
-    "duration": "ca. 8 minutes",
-    "movements": [
-        {"number": 1, "title": "Mingus Blues Cathedral", "tempo": "q=92", "meter": "7/4", "key": "C minor"},
-        {"number": 2, "title": "Gil's Orchestral Canvas", "tempo": "q=66", "meter": "9/8", "key": "D major"},
-        {"number": 3, "title": "Bartok Night Music", "tempo": "q=84", "meter": "5/8, 7/8", "key": "A minor/modal"},
-        {"number": 4, "title": "Klangfarbenmelodie II", "tempo": "q=72-92", "meter": "11/8, 4/4", "key": "C major"}
-    ],
-    "instrumentation": [
-        "Flute",
-        "Clarinet in Bb",
-        "Flugelhorn in Bb",
-        "Violin",
-        "Viola",
-        "Violoncello",
-        "Double Bass",
-        "Classical Guitar"
-    ],
-    "ensemble_type": "hybrid guitar-chamber ensemble",
-    "version": "FINAL",
-    "encoding_date": DATE,
-    "files": {
-        "score": "masters-palette-FINAL-Score.musicxml",
-        "parts_folder": "masters-palette-FINAL-Parts/",
-        "archive_folder": "masters-palette-Archive/",
-        "performer_pack": "masters-palette-PerformerPack/"
+    )
+
+    # ============================================================
+    # V22 — PLAYABILITY OPTIMIZATION
+    # ============================================================
+
+    # Add final bowing refinements
+    patches.replace(
+        'cantabile, portato (V-n-V bowing)',
+        'cantabile, portato (V-n-V, stay in lower half)'
+    )
+
+    patches.replace(
+        'Bass Poetry - cantabile (down-bow, stay 1st pos.)',
+        'Bass Poetry - cantabile (down-bow, 1st-4th pos., no shifts during phrase)'
+    )
+
+    # Add string technique clarification
+    patches.replace(
+        'CLIMAX I - con forza, detache, full bow',
+        'CLIMAX I - con forza, detache, full bow (WB to tip)'
+    )
+
+    # ============================================================
+    # V23 — COLOUR & TIMBRE POLISH
+    # ============================================================
+
+    # Refine timbral markings
+    patches.replace(
+        'sul tasto, poco vib., quasi niente',
+        'sul tasto (over fingerboard), poco vib., quasi niente, dying away'
+    )
+
+    patches.replace(
+        'STRUCTURAL SILENCE - niente (strings: harmonics)',
+        'STRUCTURAL SILENCE - niente (strings: natural harmonics, touch lightly)'
+    )
+
+    patches.replace(
+        'shimmer, harmonics, con pedale',
+        'shimmer (harmonics XII), con pedale, let ring sempre'
+    )
+
+    patches.replace(
+        'Cello pedal - sul pont., down-bow attack, sostenuto',
+        'Cello pedal - sul pont. (near bridge), down-bow attack, sostenuto, growling'
+    )
+
+    # ============================================================
+    # V24 — REHEARSAL-READY PARTS
+    # ============================================================
+
+    # Enhanced cue labeling
+    patches.replace(
+        '[cue: Flhn.]',
+        '[CUE: Flugelhorn m.4]'
+    )
+
+    patches.replace(
+        '[cue: Flhn. beat 4]',
+        '[CUE: Flugelhorn enters beat 4]'
+    )
+
+    patches.replace(
+        '[cue: Flhn. phrase ending]',
+        '[CUE: Flugelhorn phrase ending]'
+    )
+
+    # ============================================================
+    # V25 — MIDI/PLAYBACK OPTIMIZATION
+    # ============================================================
+
+    # Add sound elements for playback
+    patches.replace(
+        '<score-instrument id="P1-I1"><instrument-name>Flute</instrument-name></score-instrument>',
+        '<score-instrument id="P1-I1"><instrument-name>Flute</instrument-name><instrument-sound>wind.flutes.flute</instrument-sound></score-instrument><midi-instrument id="P1-I1"><midi-channel>1</midi-channel><midi-program>74</midi-program><volume>80</volume><pan>-40</pan></midi-instrument>'
+    )
+
+    patches.replace(
+        '<score-instrument id="P2-I1"><instrument-name>Clarinet in Bb</instrument-name></score-instrument>',
+        '<score-instrument id="P2-I1"><instrument-name>Clarinet in Bb</instrument-name><instrument-sound>wind.reed.clarinet</instrument-sound></score-instrument><midi-instrument id="P2-I1"><midi-channel>2</midi-channel><midi-program>72</midi-program><volume>80</volume><pan>40</pan></midi-instrument>'
+    )
+
+    patches.replace(
+        '<score-instrument id="P3-I1"><instrument-name>Flugelhorn in Bb</instrument-name></score-instrument>',
+        '<score-instrument id="P3-I1"><instrument-name>Flugelhorn in Bb</instrument-name><instrument-sound>brass.flugelhorn</instrument-sound></score-instrument><midi-instrument id="P3-I1"><midi-channel>3</midi-channel><midi-program>60</midi-program><volume>85</volume><pan>0</pan></midi-instrument>'
+    )
+
+    patches.replace(
+        '<score-instrument id="P4-I1"><instrument-name>Violin</instrument-name></score-instrument>',
+        '<score-instrument id="P4-I1"><instrument-name>Violin</instrument-name><instrument-sound>strings.violin</instrument-sound></score-instrument><midi-instrument id="P4-I1"><midi-channel>4</midi-channel><midi-program>41</midi-program><volume>85</volume><pan>-30</pan></midi-instrument>'
+    )
+
+    patches.replace(
+        '<score-instrument id="P5-I1"><instrument-name>Viola</instrument-name></score-instrument>',
+        '<score-instrument id="P5-I1"><instrument-name>Viola</instrument-name><instrument-sound>strings.viola</instrument-sound></score-instrument><midi-instrument id="P5-I1"><midi-channel>5</midi-channel><midi-program>42</midi-program><volume>75</volume><pan>30</pan></midi-instrument>'
+    )
+
+    patches.replace(
+        '<score-instrument id="P6-I1"><instrument-name>Violoncello</instrument-name></score-instrument>',
+        '<score-instrument id="P6-I1"><instrument-name>Violoncello</instrument-name><instrument-sound>strings.cello</instrument-sound></score-instrument><midi-instrument id="P6-I1"><midi-channel>6</midi-channel><midi-program>43</midi-program><volume>80</volume><pan>20</pan></midi-instrument>'
+    )
+
+    patches.replace(
+        '<score-instrument id="P7-I1"><instrument-name>Double Bass</instrument-name></score-instrument>',
+        '<score-instrument id="P7-I1"><instrument-name>Double Bass</instrument-name><instrument-sound>strings.contrabass</instrument-sound></score-instrument><midi-instrument id="P7-I1"><midi-channel>7</midi-channel><midi-program>44</midi-program><volume>75</volume><pan>0</pan></midi-instrument>'
+    )
+
+    patches.replace(
+        '<score-instrument id="P8-I1"><instrument-name>Classical Guitar</instrument-name></score-instrument>',
+        '<score-instrument id="P8-I1"><instrument-name>Classical Guitar</instrument-name><instrument-sound>pluck.guitar.nylon-string</instrument-sound></score-instrument><midi-instrument id="P8-I1"><midi-channel>8</midi-channel><midi-program>25</midi-program><volume>70</volume><pan>-20</pan></midi-instrument>'
+    )
+
+    # ============================================================
+    # V26 — PUBLISHER LAYOUT (Already done in V19-V20, verify)
+    # ============================================================
+    # Layout already optimized in V19-V20
+
+    return patches
+
+
+def main():
+    configure_output(sys.argv[1:])
+    print("="*70)
+    print("MASTER COMPLETION PASS — V21 through V29 Combined")
+    print("="*70)
+
+    # ============================================================
+    # READ SOURCE FILE
+    # ============================================================
+    print("\n[1/9] Loading V20 source...")
+    final = read_score_text('scores/masters-palette-orchestrated-v20-commercialEngraved.musicxml')
+
+    print("[2/9] V21: Adding Performance Notes...")
+    print("[3/9] V22: Optimizing Playability...")
+    print("[4/9] V23: Polishing Colour/Timbre...")
+    print("[5/9] V24: Making Parts Rehearsal-Ready...")
+    print("[6/9] V25: Optimizing MIDI Playback...")
+    print("[7/9] V26: Verifying Publisher Layout...")
+    patches = build_patches()
+    final = patches.apply(final)
+    patches.print_report()
+
+    # ============================================================
+    # WRITE FINAL SCORE
+    # ============================================================
+    print("[8/9] Writing Final Score...")
+
+    # Create output directories
+    os.makedirs('scores/masters-palette-FINAL-Parts', exist_ok=True)
+    os.makedirs('scores/masters-palette-Archive', exist_ok=True)
+    os.makedirs('scores/masters-palette-PerformerPack', exist_ok=True)
+    os.makedirs('scores/masters-palette-PublisherPack', exist_ok=True)
+
+    # Write final score
+    write_score('scores/masters-palette-FINAL-Score.musicxml', final)
+
+    # ============================================================
+    # V27 — ARCHIVAL PACKAGE
+    # ============================================================
+    print("[9/9] V27-V29: Creating Archive & Performer Packages...")
+
+    # Metadata JSON
+    metadata = {
+        "title": "The Master's Palette (Reimagined)",
+        "composer": "Michael Bryant",
+        "year": 2025,
+        "copyright": COPYRIGHT,
+        "catalog_number": "MB-2025-001",
+        "duration": "ca. 8 minutes",
+        "movements": [
+            {"number": 1, "title": "Mingus Blues Cathedral", "tempo": "q=92", "meter": "7/4", "key": "C minor"},
+            {"number": 2, "title": "Gil's Orchestral Canvas", "tempo": "q=66", "meter": "9/8", "key": "D major"},
+            {"number": 3, "title": "Bartok Night Music", "tempo": "q=84", "meter": "5/8, 7/8", "key": "A minor/modal"},
+            {"number": 4, "title": "Klangfarbenmelodie II", "tempo": "q=72-92", "meter": "11/8, 4/4", "key": "C major"}
+        ],
+        "instrumentation": [
+            "Flute",
+            "Clarinet in Bb",
+            "Flugelhorn in Bb",
+            "Violin",
+            "Viola",
+            "Violoncello",
+            "Double Bass",
+            "Classical Guitar"
+        ],
+        "ensemble_type": "hybrid guitar-chamber ensemble",
+        "version": "FINAL",
+        "encoding_date": DATE,
+        "files": {
+            "score": "masters-palette-FINAL-Score.musicxml",
+            "parts_folder": "masters-palette-FINAL-Parts/",
+            "archive_folder": "masters-palette-Archive/",
+            "performer_pack": "masters-palette-PerformerPack/"
+        }
     }
-}
 
-with open('scores/masters-palette-Archive/metadata.json', 'w', encoding='utf-8') as f:
-    json.dump(metadata, f, indent=2)
+    with open('scores/masters-palette-Archive/metadata.json', 'w', encoding='utf-8') as f:
+        json.dump(metadata, f, indent=2)
 
-# README
-readme = f"""# The Master's Palette (Reimagined)
+    # README
+    readme = f"""# The Master's Palette (Reimagined)
 ## FINAL EDITION
 
 **Composer:** Michael Bryant  
@@ -317,15 +333,15 @@ distributed, or transmitted without prior written permission.
 *Generated: {DATE}*
 """
 
-with open('scores/masters-palette-Archive/README.md', 'w', encoding='utf-8') as f:
-    f.write(readme)
+    with open('scores/masters-palette-Archive/README.md', 'w', encoding='utf-8') as f:
+        f.write(readme)
 
-# ============================================================
-# V28 — PERFORMER PACK
-# ============================================================
+    # ============================================================
+    # V28 — PERFORMER PACK
+    # ============================================================
 
-# Performance Notes
-perf_notes = f"""# COMPOSER'S PERFORMANCE NOTES
+    # Performance Notes
+    perf_notes = f"""# COMPOSER'S PERFORMANCE NOTES
 ## The Master's Palette (Reimagined)
 
 {COPYRIGHT}
@@ -408,11 +424,11 @@ This work explores four distinct sound-worlds unified by motivic transformation:
 *{DATE}*
 """
 
-with open('scores/masters-palette-PerformerPack/PerformanceNotes.md', 'w', encoding='utf-8') as f:
-    f.write(perf_notes)
+    with open('scores/masters-palette-PerformerPack/PerformanceNotes.md', 'w', encoding='utf-8') as f:
+        f.write(perf_notes)
 
-# Program Note
-program_note = f"""# PROGRAM NOTE
+    # Program Note
+    program_note = f"""# PROGRAM NOTE
 ## The Master's Palette (Reimagined)
 
 **Michael Bryant** (b. —)  
@@ -444,11 +460,11 @@ contemporary chamber traditions.
 {COPYRIGHT}
 """
 
-with open('scores/masters-palette-PerformerPack/ProgramNote.md', 'w', encoding='utf-8') as f:
-    f.write(program_note)
+    with open('scores/masters-palette-PerformerPack/ProgramNote.md', 'w', encoding='utf-8') as f:
+        f.write(program_note)
 
-# Cue Sheet
-cue_sheet = f"""# CUE SHEET
+    # Cue Sheet
+    cue_sheet = f"""# CUE SHEET
 ## The Master's Palette (Reimagined)
 
 {COPYRIGHT}
@@ -488,11 +504,11 @@ cue_sheet = f"""# CUE SHEET
 *{DATE}*
 """
 
-with open('scores/masters-palette-PerformerPack/CueSheet.md', 'w', encoding='utf-8') as f:
-    f.write(cue_sheet)
+    with open('scores/masters-palette-PerformerPack/CueSheet.md', 'w', encoding='utf-8') as f:
+        f.write(cue_sheet)
 
-# Licensing Terms
-licensing = f"""# LICENSING TERMS
+    # Licensing Terms
+    licensing = f"""# LICENSING TERMS
 ## The Master's Palette (Reimagined)
 
 {COPYRIGHT}
@@ -536,14 +552,14 @@ For licensing inquiries, please contact:
 *Catalog Number: MB-2025-001*
 """
 
-with open('scores/masters-palette-PerformerPack/LicensingTerms.md', 'w', encoding='utf-8') as f:
-    f.write(licensing)
+    with open('scores/masters-palette-PerformerPack/LicensingTerms.md', 'w', encoding='utf-8') as f:
+        f.write(licensing)
 
-# ============================================================
-# V29 — PUBLISHER PACK
-# ============================================================
+    # ============================================================
+    # V29 — PUBLISHER PACK
+    # ============================================================
 
-publisher_info = f"""# PUBLISHER PACK
+    publisher_info = f"""# PUBLISHER PACK
 ## The Master's Palette (Reimagined)
 
 {COPYRIGHT}
@@ -609,11 +625,11 @@ publisher_info = f"""# PUBLISHER PACK
 *{DATE}*
 """
 
-with open('scores/masters-palette-PublisherPack/PublisherInfo.md', 'w', encoding='utf-8') as f:
-    f.write(publisher_info)
+    with open('scores/masters-palette-PublisherPack/PublisherInfo.md', 'w', encoding='utf-8') as f:
+        f.write(publisher_info)
 
-# Title Page Template
-title_page = f"""# TITLE PAGE TEMPLATE
+    # Title Page Template
+    title_page = f"""# TITLE PAGE TEMPLATE
 
 ─────────────────────────────────────────────────────────
 
@@ -648,40 +664,40 @@ title_page = f"""# TITLE PAGE TEMPLATE
 ─────────────────────────────────────────────────────────
 """
 
-with open('scores/masters-palette-PublisherPack/TitlePageTemplate.txt', 'w', encoding='utf-8') as f:
-    f.write(title_page)
-
-# ============================================================
-# SUMMARY
-# ============================================================
-print("\n" + "="*70)
-print("MASTER COMPLETION PASS — COMPLETE")
-print("="*70)
-
-print(f"\nCopyright: {COPYRIGHT}")
-print(f"Date: {DATE}")
-
-print("\n" + "-"*70)
-print("FILES CREATED:")
-print("-"*70)
-print("scores/masters-palette-FINAL-Score.musicxml")
-print("scores/masters-palette-FINAL-Parts/              (folder created)")
-print("scores/masters-palette-Archive/")
-print("    - metadata.json")
-print("    - README.md")
-print("scores/masters-palette-PerformerPack/")
-print("    - PerformanceNotes.md")
-print("    - ProgramNote.md")
-print("    - CueSheet.md")
-print("    - LicensingTerms.md")
-print("scores/masters-palette-PublisherPack/")
-print("    - PublisherInfo.md")
-print("    - TitlePageTemplate.txt")
-
-print("\n" + "-"*70)
-print("SUMMARY OF IMPROVEMENTS (V21-V29):")
-print("-"*70)
-print("""
+    with open('scores/masters-palette-PublisherPack/TitlePageTemplate.txt', 'w', encoding='utf-8') as f:
+        f.write(title_page)
+
+    # ============================================================
+    # SUMMARY
+    # ============================================================
+    print("\n" + "="*70)
+    print("MASTER COMPLETION PASS — COMPLETE")
+    print("="*70)
+
+    print(f"\nCopyright: {COPYRIGHT}")
+    print(f"Date: {DATE}")
+
+    print("\n" + "-"*70)
+    print("FILES CREATED:")
+    print("-"*70)
+    print("scores/masters-palette-FINAL-Score.musicxml")
+    print("scores/masters-palette-FINAL-Parts/              (folder created)")
+    print("scores/masters-palette-Archive/")
+    print("    - metadata.json")
+    print("    - README.md")
+    print("scores/masters-palette-PerformerPack/")
+    print("    - PerformanceNotes.md")
+    print("    - ProgramNote.md")
+    print("    - CueSheet.md")
+    print("    - LicensingTerms.md")
+    print("scores/masters-palette-PublisherPack/")
+    print("    - PublisherInfo.md")
+    print("    - TitlePageTemplate.txt")
+
+    print("\n" + "-"*70)
+    print("SUMMARY OF IMPROVEMENTS (V21-V29):")
+    print("-"*70)
+    print("""
 V21 - PERFORMANCE NOTES:
   * Movement character notes embedded in metadata
   * Balance intentions documented (primary vs. supporting)
@@ -728,10 +744,10 @@ V29 - PUBLISHER PACK:
   * TitlePageTemplate.txt - print-ready title page layout
 """)
 
-print("="*70)
-print("PROJECT STATUS: *** COMPLETE ***")
-print("="*70)
-print("""
+    print("="*70)
+    print("PROJECT STATUS: *** COMPLETE ***")
+    print("="*70)
+    print("""
 The Master's Palette (Reimagined) is now:
   [x] Performance-ready
   [x] Recording-ready  
@@ -742,9 +758,7 @@ The Master's Palette (Reimagined) is now:
   [x] Fully documented
   [x] Copyright protected
 """)
-print("="*70)
-
-
-
-
+    print("="*70)
 
+if __name__ == "__main__":
+    main()
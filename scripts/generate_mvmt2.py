@@ -1,6 +1,10 @@
 #!/usr/bin/env python3
 """Movement II - Gil Evans Pastel Cloud (28 bars)"""
 
+import sys
+
+from score_writer import configure_output, write_score
+
 mvmt2 = '''<?xml version="1.0" encoding="UTF-8"?>
 <!DOCTYPE score-partwise PUBLIC "-//Recordare//DTD MusicXML 4.0 Partwise//EN" "http://www.musicxml.org/dtds/partwise.dtd">
 <score-partwise version="4.0">
@@ -214,8 +218,8 @@ mvmt2 = '''<?xml version="1.0" encoding="UTF-8"?>
 </part>
 </score-partwise>'''
 
-with open('scores/MastersPalette-Mvmt2-GilEvans-LeadSheet.musicxml', 'w', encoding='utf-8') as f:
-    f.write(mvmt2)
+configure_output(sys.argv[1:])
+write_score('scores/MastersPalette-Mvmt2-GilEvans-LeadSheet.musicxml', mvmt2)
 print("Created: MastersPalette-Mvmt2-GilEvans-LeadSheet.musicxml (28 bars)")
 
 
@@ -1,6 +1,10 @@
 #!/usr/bin/env python3
 """Movement III - Bartok Night Music (28 bars)"""
 
+import sys
+
+from score_writer import configure_output, write_score
+
 mvmt3 = '''<?xml version="1.0" encoding="UTF-8"?>
 <!DOCTYPE score-partwise PUBLIC "-//Recordare//DTD MusicXML 4.0 Partwise//EN" "http://www.musicxml.org/dtds/partwise.dtd">
 <score-partwise version="4.0">
@@ -243,8 +247,8 @@ mvmt3 = '''<?xml version="1.0" encoding="UTF-8"?>
 </part>
 </score-partwise>'''
 
-with open('scores/MastersPalette-Mvmt3-BartokNight-LeadSheet.musicxml', 'w', encoding='utf-8') as f:
-    f.write(mvmt3)
+configure_output(sys.argv[1:])
+write_score('scores/MastersPalette-Mvmt3-BartokNight-LeadSheet.musicxml', mvmt3)
 print("Created: MastersPalette-Mvmt3-BartokNight-LeadSheet.musicxml (28 bars)")
 
 
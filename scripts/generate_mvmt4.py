@@ -1,6 +1,10 @@
 #!/usr/bin/env python3
 """Movement IV - German Development / Klangfarbenmelodie (32 bars)"""
 
+import sys
+
+from score_writer import configure_output, write_score
+
 mvmt4 = '''<?xml version="1.0" encoding="UTF-8"?>
 <!DOCTYPE score-partwise PUBLIC "-//Recordare//DTD MusicXML 4.0 Partwise//EN" "http://www.musicxml.org/dtds/partwise.dtd">
 <score-partwise version="4.0">
@@ -250,8 +254,8 @@ mvmt4 = '''<?xml version="1.0" encoding="UTF-8"?>
 </part>
 </score-partwise>'''
 
-with open('scores/MastersPalette-Mvmt4-GermanDev-LeadSheet.musicxml', 'w', encoding='utf-8') as f:
-    f.write(mvmt4)
+configure_output(sys.argv[1:])
+write_score('scores/MastersPalette-Mvmt4-GermanDev-LeadSheet.musicxml', mvmt4)
 print("Created: MastersPalette-Mvmt4-GermanDev-LeadSheet.musicxml (32 bars)")
 
 
@@ -4,366 +4,401 @@ Generate V18, V19, V20 passes - Commercial Publication Pipeline
 The Master's Palette - Final Production
 """
 
+import sys
+
+from patch_engine import PatchSet
+from score_writer import configure_output, read_score_text, write_score
+
 COPYRIGHT = "© 2025 Michael Bryant. All Rights Reserved."
 
-# ============================================================
-# V18 CONDUCTING SCORE PASS
-# ============================================================
-print("=== GENERATING V18 CONDUCTING SCORE ===")
-
-with open('scores/masters-palette-orchestrated-v17-sessionReady.musicxml', 'r', encoding='utf-8') as f:
-    v18 = f.read()
-
-# Update title and encoder
-v18 = v18.replace(
-    '<work-title>The Master\'s Palette (Reimagined) - v17 SESSION READY</work-title>',
-    '<work-title>The Master\'s Palette (Reimagined) - v18 CONDUCTING SCORE</work-title>'
-)
-v18 = v18.replace(
-    '<encoder>V17 Recording Session Pass</encoder>',
-    '<encoder>V18 Conducting Score Pass</encoder>'
-)
-v18 = v18.replace(
-    '<software>V17 Session Ready - Studio Recording</software>',
-    '<software>V18 Conducting Score - Rehearsal Optimized</software>'
-)
-
-# V18 RULE 1: Enlarged staff size and spacing
-v18 = v18.replace(
-    '<scaling><millimeters>6.5</millimeters><tenths>40</tenths></scaling>',
-    '<scaling><millimeters>7.5</millimeters><tenths>40</tenths></scaling><!-- V18: Enlarged for conductor -->'
-)
-
-v18 = v18.replace(
-    '<system-distance>120</system-distance>',
-    '<system-distance>180</system-distance><!-- V18: Extra family spacing -->'
-)
-
-v18 = v18.replace(
-    '<staff-distance>65</staff-distance>',
-    '<staff-distance>80</staff-distance><!-- V18: Clearer staff separation -->'
-)
-
-# V18 RULE 2: Bold rehearsal marks - already have A-E, add conductor-specific marks
-v18 = v18.replace(
-    '<rehearsal font-weight="bold" font-size="14" halign="center" valign="top">A</rehearsal>',
-    '<rehearsal font-weight="bold" font-size="18" halign="center" valign="top" enclosure="rectangle">A</rehearsal>'
-)
-v18 = v18.replace(
-    '<rehearsal font-weight="bold" font-size="14" halign="center" valign="top">B</rehearsal>',
-    '<rehearsal font-weight="bold" font-size="18" halign="center" valign="top" enclosure="rectangle">B</rehearsal>'
-)
-v18 = v18.replace(
-    '<rehearsal font-weight="bold" font-size="14" halign="center" valign="top">C</rehearsal>',
-    '<rehearsal font-weight="bold" font-size="18" halign="center" valign="top" enclosure="rectangle">C</rehearsal>'
-)
-v18 = v18.replace(
-    '<rehearsal font-weight="bold" font-size="14" halign="center" valign="top">D</rehearsal>',
-    '<rehearsal font-weight="bold" font-size="18" halign="center" valign="top" enclosure="rectangle">D</rehearsal>'
-)
-v18 = v18.replace(
-    '<rehearsal font-weight="bold" font-size="14" halign="center" valign="top">E</rehearsal>',
-    '<rehearsal font-weight="bold" font-size="18" halign="center" valign="top" enclosure="rectangle">E</rehearsal>'
-)
-
-# V18 RULE 3: Bar numbers - add measure-numbering
-v18 = v18.replace(
-    '<top-system-distance>70</top-system-distance>',
-    '<top-system-distance>90</top-system-distance><!-- V18: Room for bar numbers -->'
-)
-
-# V18 RULE 4: Enhanced conductor cues
-v18 = v18.replace(
-    '<direction placement="above"><direction-type><words font-style="italic" font-size="8">[CONDUCTOR: new tempo, breathe]</words></direction-type></direction>',
-    '<direction placement="above"><direction-type><words font-style="bold" font-size="10">[CONDUCTOR: New tempo - breathe - shape the phrase]</words></direction-type></direction>'
-)
-
-v18 = v18.replace(
-    '<direction placement="above"><direction-type><words font-style="italic" font-size="8">[CONDUCTOR: sudden shift, pointillistic]</words></direction-type></direction>',
-    '<direction placement="above"><direction-type><words font-style="bold" font-size="10">[CONDUCTOR: Sudden shift - sparse - hold back]</words></direction-type></direction>'
-)
-
-v18 = v18.replace(
-    '<direction placement="above"><direction-type><words font-style="italic" font-size="8">[CONDUCTOR: flowing, pass the melody]</words></direction-type></direction>',
-    '<direction placement="above"><direction-type><words font-style="bold" font-size="10">[CONDUCTOR: Flowing - cue each handoff]</words></direction-type></direction>'
-)
-
-v18 = v18.replace(
-    '<direction placement="above"><direction-type><words font-style="italic" font-size="8">[CONDUCTOR: broadening, full ensemble]</words></direction-type></direction>',
-    '<direction placement="above"><direction-type><words font-style="bold" font-size="10">[CONDUCTOR: Broadening - unified attack - CLIMAX]</words></direction-type></direction>'
-)
-
-# V18 RULE 5: Add phrasing hints
-v18 = v18.replace(
-    '<direction><direction-type><words font-weight="bold">I. Mingus Blues Cathedral</words></direction-type></direction>',
-    '<direction><direction-type><words font-weight="bold" font-size="14">I. Mingus Blues Cathedral</words></direction-type></direction>\n<direction placement="above"><direction-type><words font-style="bold" font-size="9">[Shape: blues inflection, syncopated feel]</words></direction-type></direction>'
-)
-
-v18 = v18.replace(
-    '<direction><direction-type><words font-weight="bold">II. Gil\'s Orchestral Canvas</words></direction-type></direction>',
-    '<direction><direction-type><words font-weight="bold" font-size="14">II. Gil\'s Orchestral Canvas</words></direction-type></direction>\n<direction placement="above"><direction-type><words font-style="bold" font-size="9">[Shape: floating, pastel - relax tempo]</words></direction-type></direction>'
-)
-
-v18 = v18.replace(
-    '<direction placement="above"><direction-type><words font-style="italic">Bartok cell - flutter-tongue, insect tremors</words></direction-type></direction>',
-    '<direction placement="above"><direction-type><words font-style="italic">Bartok cell - flutter-tongue, insect tremors</words></direction-type></direction>\n<direction placement="above"><direction-type><words font-style="bold" font-size="9">[Shape: pointillistic - wait for each entry]</words></direction-type></direction>'
-)
-
-v18 = v18.replace(
-    '<direction><direction-type><words font-weight="bold">IV. Klangfarbenmelodie II</words></direction-type></direction>',
-    '<direction><direction-type><words font-weight="bold" font-size="14">IV. Klangfarbenmelodie II</words></direction-type></direction>\n<direction placement="above"><direction-type><words font-style="bold" font-size="9">[Shape: continuous line - press forward to Chorale]</words></direction-type></direction>'
-)
-
-# Add gesture hints at key moments
-v18 = v18.replace(
-    '<direction placement="above"><direction-type><words font-style="italic" font-weight="bold">CLIMAX I - con forza, detache, full bow</words></direction-type></direction>',
-    '<direction placement="above"><direction-type><words font-style="italic" font-weight="bold">CLIMAX I - con forza, detache, full bow</words></direction-type></direction>\n<direction placement="above"><direction-type><words font-style="bold" font-size="9">[Gesture: expansive downbeat - unified attack]</words></direction-type></direction>'
-)
-
-v18 = v18.replace(
-    '<direction placement="above"><direction-type><words font-style="italic" font-weight="bold">luminoso - gentle release, morendo</words></direction-type></direction>',
-    '<direction placement="above"><direction-type><words font-style="italic" font-weight="bold">luminoso - gentle release, morendo</words></direction-type></direction>\n<direction placement="above"><direction-type><words font-style="bold" font-size="9">[Gesture: slow release - hold fermata - cut cleanly]</words></direction-type></direction>'
-)
-
-# V18 RULE 6: Page layout - 1-2 systems per page
-v18 = v18.replace(
-    '<measure number="5"><note><rest/>',
-    '<measure number="5"><print new-system="yes"/><note><rest/>'
-)
-
-v18 = v18.replace(
-    '<measure number="9"><direction><direction-type><wedge type="stop"/>',
-    '<measure number="9"><print new-system="yes"/><direction><direction-type><wedge type="stop"/>'
-)
-
-# Write V18
-with open('scores/masters-palette-orchestrated-v18-conductingScore.musicxml', 'w', encoding='utf-8') as f:
-    f.write(v18)
-print("Created: scores/masters-palette-orchestrated-v18-conductingScore.musicxml")
-
-# ============================================================
-# V19 PUBLISHER LAYOUT PASS
-# ============================================================
-print("\n=== GENERATING V19 PUBLISHER LAYOUT ===")
-
-v19 = v18  # Start from V18
-
-# Update title
-v19 = v19.replace(
-    '<work-title>The Master\'s Palette (Reimagined) - v18 CONDUCTING SCORE</work-title>',
-    '<work-title>The Master\'s Palette (Reimagined)</work-title>'
-)
-v19 = v19.replace(
-    '<encoder>V18 Conducting Score Pass</encoder>',
-    '<encoder>V19 Publisher Layout Pass</encoder>'
-)
-v19 = v19.replace(
-    '<software>V18 Conducting Score - Rehearsal Optimized</software>',
-    '<software>V19 Publisher Layout - Print Ready</software>'
-)
-
-# V19 RULE 1: Enhanced title page credits
-v19 = v19.replace(
-    f'<credit page="1"><credit-type>rights</credit-type><credit-words font-size="8" justify="center" valign="bottom">{COPYRIGHT}</credit-words></credit>',
-    f'''<credit page="1"><credit-type>title</credit-type><credit-words font-size="28" font-weight="bold" font-family="Times New Roman" justify="center" valign="top" default-y="180">The Master's Palette</credit-words></credit>
+
+def build_v18_patches():
+    """V18 patch set, built without touching any files."""
+    v18_patches = PatchSet("V18")
+
+    # Update title and encoder
+    v18_patches.replace(
+        '<work-title>The Master\'s Palette (Reimagined) - v17 SESSION READY</work-title>',
+        '<work-title>The Master\'s Palette (Reimagined) - v18 CONDUCTING SCORE</work-title>'
+    )
+    v18_patches.replace(
+        '<encoder>V17 Recording Session Pass</encoder>',
+        '<encoder>V18 Conducting Score Pass</encoder>'
+    )
+    v18_patches.replace(
+        '<software>V17 Session Ready - Studio Recording</software>',
+        '<software>V18 Conducting Score - Rehearsal Optimized</software>'
+    )
+
+    # V18 RULE 1: Enlarged staff size and spacing
+    v18_patches.replace(
+        '<scaling><millimeters>6.5</millimeters><tenths>40</tenths></scaling>',
+        '<scaling><millimeters>7.5</millimeters><tenths>40</tenths></scaling><!-- V18: Enlarged for conductor -->'
+    )
+
+    v18_patches.replace(
+        '<system-distance>120</system-distance>',
+        '<system-distance>180</system-distance><!-- V18: Extra family spacing -->'
+    )
+
+    v18_patches.replace(
+        '<staff-distance>65</staff-distance>',
+        '<staff-distance>80</staff-distance><!-- V18: Clearer staff separation -->'
+    )
+
+    # V18 RULE 2: Bold rehearsal marks - already have A-E, add conductor-specific marks
+    v18_patches.replace(
+        '<rehearsal font-weight="bold" font-size="14" halign="center" valign="top">A</rehearsal>',
+        '<rehearsal font-weight="bold" font-size="18" halign="center" valign="top" enclosure="rectangle">A</rehearsal>'
+    )
+    v18_patches.replace(
+        '<rehearsal font-weight="bold" font-size="14" halign="center" valign="top">B</rehearsal>',
+        '<rehearsal font-weight="bold" font-size="18" halign="center" valign="top" enclosure="rectangle">B</rehearsal>'
+    )
+    v18_patches.replace(
+        '<rehearsal font-weight="bold" font-size="14" halign="center" valign="top">C</rehearsal>',
+        '<rehearsal font-weight="bold" font-size="18" halign="center" valign="top" enclosure="rectangle">C</rehearsal>'
+    )
+    v18_patches.replace(
+        '<rehearsal font-weight="bold" font-size="14" halign="center" valign="top">D</rehearsal>',
+        '<rehearsal font-weight="bold" font-size="18" halign="center" valign="top" enclosure="rectangle">D</rehearsal>'
+    )
+    v18_patches.replace(
+        '<rehearsal font-weight="bold" font-size="14" halign="center" valign="top">E</rehearsal>',
+        '<rehearsal font-weight="bold" font-size="18" halign="center" valign="top" enclosure="rectangle">E</rehearsal>'
+    )
+
+    # V18 RULE 3: Bar numbers - add measure-numbering
+    v18_patches.replace(
+        '<top-system-distance>70</top-system-distance>',
+        '<top-system-distance>90</top-system-distance><!-- V18: Room for bar numbers -->'
+    )
+
+    # V18 RULE 4: Enhanced conductor cues
+    v18_patches.replace(
+        '<direction placement="above"><direction-type><words font-style="italic" font-size="8">[CONDUCTOR: new tempo, breathe]</words></direction-type></direction>',
+        '<direction placement="above"><direction-type><words font-style="bold" font-size="10">[CONDUCTOR: New tempo - breathe - shape the phrase]</words></direction-type></direction>'
+    )
+
+    v18_patches.replace(
+        '<direction placement="above"><direction-type><words font-style="italic" font-size="8">[CONDUCTOR: sudden shift, pointillistic]</words></direction-type></direction>',
+        '<direction placement="above"><direction-type><words font-style="bold" font-size="10">[CONDUCTOR: Sudden shift - sparse - hold back]</words></direction-type></direction>'
+    )
+
+    v18_patches.replace(
+        '<direction placement="above"><direction-type><words font-style="italic" font-size="8">[CONDUCTOR: flowing, pass the melody]</words></direction-type></direction>',
+        '<direction placement="above"><direction-type><words font-style="bold" font-size="10">[CONDUCTOR: Flowing - cue each handoff]</words></direction-type></direction>'
+    )
+
+    v18_patches.replace(
+        '<direction placement="above"><direction-type><words font-style="italic" font-size="8">[CONDUCTOR: broadening, full ensemble]</words></direction-type></direction>',
+        '<direction placement="above"><direction-type><words font-style="bold" font-size="10">[CONDUCTOR: Broadening - unified attack - CLIMAX]</words></direction-type></direction>'
+    )
+
+    # V18 RULE 5: Add phrasing hints
+    v18_patches.replace(
+        '<direction><direction-type><words font-weight="bold">I. Mingus Blues Cathedral</words></direction-type></direction>',
+        '<direction><direction-type><words font-weight="bold" font-size="14">I. Mingus Blues Cathedral</words></direction-type></direction>\n<direction placement="above"><direction-type><words font-style="bold" font-size="9">[Shape: blues inflection, syncopated feel]</words></direction-type></direction>'
+    )
+
+    v18_patches.replace(
+        '<direction><direction-type><words font-weight="bold">II. Gil\'s Orchestral Canvas</words></direction-type></direction>',
+        '<direction><direction-type><words font-weight="bold" font-size="14">II. Gil\'s Orchestral Canvas</words></direction-type></direction>\n<direction placement="above"><direction-type><words font-style="bold" font-size="9">[Shape: floating, pastel - relax tempo]</words></direction-type></direction>'
+    )
+
+    v18_patches.replace(
+        '<direction placement="above"><direction-type><words font-style="italic">Bartok cell - flutter-tongue, insect tremors</words></direction-type></direction>',
+        '<direction placement="above"><direction-type><words font-style="italic">Bartok cell - flutter-tongue, insect tremors</words></direction-type></direction>\n<direction placement="above"><direction-type><words font-style="bold" font-size="9">[Shape: pointillistic - wait for each entry]</words></direction-type></direction>'
+    )
+
+    v18_patches.replace(
+        '<direction><direction-type><words font-weight="bold">IV. Klangfarbenmelodie II</words></direction-type></direction>',
+        '<direction><direction-type><words font-weight="bold" font-size="14">IV. Klangfarbenmelodie II</words></direction-type></direction>\n<direction placement="above"><direction-type><words font-style="bold" font-size="9">[Shape: continuous line - press forward to Chorale]</words></direction-type></direction>'
+    )
+
+    # Add gesture hints at key moments
+    v18_patches.replace(
+        '<direction placement="above"><direction-type><words font-style="italic" font-weight="bold">CLIMAX I - con forza, detache, full bow</words></direction-type></direction>',
+        '<direction placement="above"><direction-type><words font-style="italic" font-weight="bold">CLIMAX I - con forza, detache, full bow</words></direction-type></direction>\n<direction placement="above"><direction-type><words font-style="bold" font-size="9">[Gesture: expansive downbeat - unified attack]</words></direction-type></direction>'
+    )
+
+    v18_patches.replace(
+        '<direction placement="above"><direction-type><words font-style="italic" font-weight="bold">luminoso - gentle release, morendo</words></direction-type></direction>',
+        '<direction placement="above"><direction-type><words font-style="italic" font-weight="bold">luminoso - gentle release, morendo</words></direction-type></direction>\n<direction placement="above"><direction-type><words font-style="bold" font-size="9">[Gesture: slow release - hold fermata - cut cleanly]</words></direction-type></direction>'
+    )
+
+    # V18 RULE 6: Page layout - 1-2 systems per page
+    v18_patches.replace(
+        '<measure number="5"><note><rest/>',
+        '<measure number="5"><print new-system="yes"/><note><rest/>'
+    )
+
+    v18_patches.replace(
+        '<measure number="9"><direction><direction-type><wedge type="stop"/>',
+        '<measure number="9"><print new-system="yes"/><direction><direction-type><wedge type="stop"/>'
+    )
+
+    return v18_patches
+
+
+def build_v19_patches():
+    """V19 patch set, built without touching any files."""
+    v19_patches = PatchSet("V19")
+
+    # Update title
+    v19_patches.replace(
+        '<work-title>The Master\'s Palette (Reimagined) - v18 CONDUCTING SCORE</work-title>',
+        '<work-title>The Master\'s Palette (Reimagined)</work-title>'
+    )
+    v19_patches.replace(
+        '<encoder>V18 Conducting Score Pass</encoder>',
+        '<encoder>V19 Publisher Layout Pass</encoder>'
+    )
+    v19_patches.replace(
+        '<software>V18 Conducting Score - Rehearsal Optimized</software>',
+        '<software>V19 Publisher Layout - Print Ready</software>'
+    )
+
+    # V19 RULE 1: Enhanced title page credits
+    v19_patches.replace(
+        f'<credit page="1"><credit-type>rights</credit-type><credit-words font-size="8" justify="center" valign="bottom">{COPYRIGHT}</credit-words></credit>',
+        f'''<credit page="1"><credit-type>title</credit-type><credit-words font-size="28" font-weight="bold" font-family="Times New Roman" justify="center" valign="top" default-y="180">The Master's Palette</credit-words></credit>
 <credit page="1"><credit-type>subtitle</credit-type><credit-words font-size="14" font-style="italic" font-family="Times New Roman" justify="center" valign="top" default-y="150">(Reimagined)</credit-words></credit>
 <credit page="1"><credit-type>composer</credit-type><credit-words font-size="12" font-family="Times New Roman" justify="right" valign="top" default-y="140">Michael Bryant</credit-words></credit>
 <credit page="1"><credit-type>arranger</credit-type><credit-words font-size="10" font-family="Times New Roman" justify="right" valign="top" default-y="125">for hybrid guitar-chamber ensemble</credit-words></credit>
 <credit page="1"><credit-words font-size="10" font-family="Times New Roman" justify="left" valign="top" default-y="125">Duration: ca. 8 minutes</credit-words></credit>
 <credit page="1"><credit-words font-size="9" font-family="Times New Roman" justify="left" valign="bottom" default-y="50">Instrumentation: Flute, Clarinet in Bb, Flugelhorn in Bb, Violin, Viola, Violoncello, Double Bass, Classical Guitar</credit-words></credit>
 <credit page="1"><credit-type>rights</credit-type><credit-words font-size="8" font-family="Times New Roman" justify="center" valign="bottom" default-y="30">{COPYRIGHT}</credit-words></credit>'''
-)
-
-# V19 RULE 3: Standardized margins
-v19 = v19.replace(
-    '<left-margin>56</left-margin><right-margin>56</right-margin>',
-    '<left-margin>57</left-margin><right-margin>57</right-margin><!-- V19: 15mm standard -->'
-)
-
-# V19 RULE 4: Typography - consistent fonts
-v19 = v19.replace(
-    '<music-font font-family="Opus" font-size="20"/>',
-    '<music-font font-family="Opus" font-size="20"/>'
-)
-v19 = v19.replace(
-    '<word-font font-family="Times New Roman" font-size="10"/>',
-    '<word-font font-family="Times New Roman" font-size="10"/>\n<lyric-font font-family="Times New Roman" font-size="10"/>'
-)
-
-# V19 RULE 5: House style - standardize dynamics placement
-# Already done in previous passes
-
-# V19 RULE 6: Movement headers - ensure new page at each movement
-v19 = v19.replace(
-    '<measure number="13"><print new-system="yes" new-page="yes"/><!-- V16: Page 2 -->',
-    '<measure number="13"><print new-page="yes"/><!-- V19: Movement II starts new page -->'
-)
-
-v19 = v19.replace(
-    '<measure number="17"><print new-system="yes" new-page="yes"/><!-- V16: Page 3 -->',
-    '<measure number="17"><print new-page="yes"/><!-- V19: Movement III starts new page -->'
-)
-
-v19 = v19.replace(
-    '<measure number="21"><print new-system="yes" new-page="yes"/><!-- V16: Page 4 -->',
-    '<measure number="21"><print new-page="yes"/><!-- V19: Movement IV starts new page -->'
-)
-
-# V19 RULE 7: Page numbering - add print attributes
-v19 = v19.replace(
-    '<defaults>',
-    '<defaults>\n<page-layout>\n<page-height>1683</page-height><page-width>1190</page-width>\n</page-layout>'
-)
-
-# Fix duplicate page-layout
-v19 = v19.replace(
-    '<defaults>\n<page-layout>\n<page-height>1683</page-height><page-width>1190</page-width>\n</page-layout>\n<scaling>',
-    '<defaults>\n<scaling>'
-)
-
-# Write V19
-with open('scores/masters-palette-orchestrated-v19-publisherLayout.musicxml', 'w', encoding='utf-8') as f:
-    f.write(v19)
-print("Created: scores/masters-palette-orchestrated-v19-publisherLayout.musicxml")
-
-# ============================================================
-# V20 FINAL COMMERCIAL ENGRAVING PASS
-# ============================================================
-print("\n=== GENERATING V20 COMMERCIAL ENGRAVING ===")
-
-v20 = v19  # Start from V19
-
-# Update title
-v20 = v20.replace(
-    '<work-title>The Master\'s Palette (Reimagined)</work-title>',
-    '<work-title>The Master\'s Palette</work-title>'
-)
-v20 = v20.replace(
-    '<encoder>V19 Publisher Layout Pass</encoder>',
-    '<encoder>V20 Final Commercial Engraving</encoder>'
-)
-v20 = v20.replace(
-    '<software>V19 Publisher Layout - Print Ready</software>',
-    '<software>V20 Commercial Grade - Publication Standard</software>'
-)
-
-# V20 RULE 1: Zero collision tolerance - add appearance refinements
-v20 = v20.replace(
-    '<appearance>',
-    '<appearance>\n<line-width type="leger">1.5</line-width>\n<line-width type="tie middle">1.5</line-width>\n<line-width type="tie tip">0.5</line-width>'
-)
-
-# V20 RULE 2: Spacing optimization
-v20 = v20.replace(
-    '<note-size type="grace">60</note-size>',
-    '<note-size type="grace">60</note-size>\n<note-size type="cue">75</note-size>\n<distance type="hyphen">60</distance>\n<distance type="beam">8</distance>'
-)
-
-# V20 RULE 3: Slur & hairpin refinement - standardized line widths
-v20 = v20.replace(
-    '<line-width type="slur middle">2.0</line-width>',
-    '<line-width type="slur middle">1.8</line-width><!-- V20: Refined slur weight -->'
-)
-
-v20 = v20.replace(
-    '<line-width type="slur tip">0.5</line-width>',
-    '<line-width type="slur tip">0.4</line-width><!-- V20: Refined slur taper -->'
-)
-
-# V20 RULE 4: Stem & beam cleanliness - standardized
-v20 = v20.replace(
-    '<line-width type="stem">1.0</line-width>',
-    '<line-width type="stem">0.9</line-width><!-- V20: Publisher standard -->'
-)
-
-v20 = v20.replace(
-    '<line-width type="beam">5.0</line-width>',
-    '<line-width type="beam">4.5</line-width><!-- V20: Publisher standard -->'
-)
-
-# V20 RULE 5: Part-score agreement note
-v20 = v20.replace(
-    '<rights>' + COPYRIGHT + '</rights>',
-    '<rights>' + COPYRIGHT + '</rights>\n<miscellaneous><miscellaneous-field name="part-score-agreement">Verified - all markings consistent between score and parts</miscellaneous-field></miscellaneous>'
-)
-
-# V20 RULE 6: Professional aesthetics - final refinements
-v20 = v20.replace(
-    '<line-width type="staff">1.0</line-width>',
-    '<line-width type="staff">0.9</line-width><!-- V20: Commercial standard -->'
-)
-
-v20 = v20.replace(
-    '<line-width type="barline">1.2</line-width>',
-    '<line-width type="barline">1.1</line-width><!-- V20: Commercial standard -->'
-)
-
-# Add final commercial metadata
-v20 = v20.replace(
-    '</identification>',
-    '<source>Masters Palette - Commercial Publication Edition</source>\n<relation type="catalog-number">MB-2025-001</relation></identification>'
-)
-
-# Clean up any remaining V-comments for commercial release
-v20 = v20.replace('<!-- V16: Page 2 -->', '')
-v20 = v20.replace('<!-- V16: Page 3 -->', '')
-v20 = v20.replace('<!-- V16: Page 4 -->', '')
-v20 = v20.replace('<!-- V17: Safe page turn after dim -->', '')
-v20 = v20.replace('<!-- V17: fff reduced to ff for studio balance -->', '')
-v20 = v20.replace('<!-- V18: Enlarged for conductor -->', '')
-v20 = v20.replace('<!-- V18: Extra family spacing -->', '')
-v20 = v20.replace('<!-- V18: Clearer staff separation -->', '')
-v20 = v20.replace('<!-- V18: Room for bar numbers -->', '')
-v20 = v20.replace('<!-- V19: 15mm standard -->', '')
-v20 = v20.replace('<!-- V19: Movement II starts new page -->', '')
-v20 = v20.replace('<!-- V19: Movement III starts new page -->', '')
-v20 = v20.replace('<!-- V19: Movement IV starts new page -->', '')
-v20 = v20.replace('<!-- V20: Refined slur weight -->', '')
-v20 = v20.replace('<!-- V20: Refined slur taper -->', '')
-v20 = v20.replace('<!-- V20: Publisher standard -->', '')
-v20 = v20.replace('<!-- V20: Commercial standard -->', '')
-
-# Write V20
-with open('scores/masters-palette-orchestrated-v20-commercialEngraved.musicxml', 'w', encoding='utf-8') as f:
-    f.write(v20)
-print("Created: scores/masters-palette-orchestrated-v20-commercialEngraved.musicxml")
-
-# ============================================================
-# SUMMARY
-# ============================================================
-print("\n" + "="*60)
-print("COMMERCIAL PUBLICATION PIPELINE COMPLETE")
-print("="*60)
-print(f"\nCopyright: {COPYRIGHT}")
-
-print("\n--- V18 CONDUCTING SCORE ---")
-print("* Staff size enlarged (6.5mm to 7.5mm) for stand visibility")
-print("* System spacing increased (120 to 180) for family separation")
-print("* Rehearsal marks enlarged to 18pt with rectangle enclosure")
-print("* Conductor cues expanded with phrasing hints (Shape, Press forward, Hold back)")
-print("* Gesture annotations at climaxes (unified attack, slow release, cut cleanly)")
-
-print("\n--- V19 PUBLISHER LAYOUT ---")
-print("* Full title page: Title, Composer, Year, Instrumentation, Duration")
-print("* Typography: Times New Roman hierarchy (28pt title, 14pt subtitle, 12pt composer)")
-print("* Margins standardized to 15mm (57 tenths) all sides")
-print("* Movement headers on new pages with proper spacing")
-print("* House style: consistent fonts, dynamics placement, spacing")
-
-print("\n--- V20 COMMERCIAL ENGRAVING ---")
-print("* Line weights refined: staff 0.9, barline 1.1, stem 0.9, beam 4.5")
-print("* Slur refinement: middle 1.8, tip 0.4 for elegant taper")
-print("* Leger line weight added (1.5) for clear ledger spacing")
-print("* Tie weights standardized (middle 1.5, tip 0.5)")
-print("* Catalog number assigned (MB-2025-001)")
-print("* Part-score agreement verified in metadata")
-print("* All version comments cleaned for commercial release")
-
-print("\n" + "="*60)
-print("PUBLICATION-READY: Boosey/Schott/Alfred standard achieved")
-print("="*60)
-
-
-
-
-
+    )
+
+    # V19 RULE 3: Standardized margins
+    v19_patches.replace(
+        '<left-margin>56</left-margin><right-margin>56</right-margin>',
+        '<left-margin>57</left-margin><right-margin>57</right-margin><!-- V19: 15mm standard -->'
+    )
+
+    # V19 RULE 4: Typography - consistent fonts
+    v19_patches.replace(
+        '<music-font font-family="Opus" font-size="20"/>',
+        '<music-font font-family="Opus" font-size="20"/>'
+    )
+    v19_patches.replace(
+        '<word-font font-family="Times New Roman" font-size="10"/>',
+        '<word-font font-family="Times New Roman" font-size="10"/>\n<lyric-font font-family="Times New Roman" font-size="10"/>'
+    )
+
+    # V19 RULE 5: House style - standardize dynamics placement
+    # Already done in previous passes
+
+    # V19 RULE 6: Movement headers - ensure new page at each movement
+    v19_patches.replace(
+        '<measure number="13"><print new-system="yes" new-page="yes"/><!-- V16: Page 2 -->',
+        '<measure number="13"><print new-page="yes"/><!-- V19: Movement II starts new page -->'
+    )
+
+    v19_patches.replace(
+        '<measure number="17"><print new-system="yes" new-page="yes"/><!-- V16: Page 3 -->',
+        '<measure number="17"><print new-page="yes"/><!-- V19: Movement III starts new page -->'
+    )
+
+    v19_patches.replace(
+        '<measure number="21"><print new-system="yes" new-page="yes"/><!-- V16: Page 4 -->',
+        '<measure number="21"><print new-page="yes"/><!-- V19: Movement IV starts new page -->'
+    )
+
+    # V19 RULE 7: Page numbering - add print attributes
+    v19_patches.replace(
+        '<defaults>',
+        '<defaults>\n<page-layout>\n<page-height>1683</page-height><page-width>1190</page-width>\n</page-layout>'
+    )
+
+    # Fix duplicate page-layout
+    v19_patches.replace(
+        '<defaults>\n<page-layout>\n<page-height>1683</page-height><page-width>1190</page-width>\n</page-layout>\n<scaling>',
+        '<defaults>\n<scaling>'
+    )
+
+    return v19_patches
+
+
+def build_v20_patches():
+    """V20 patch set, built without touching any files."""
+    v20_patches = PatchSet("V20")
+
+    # Update title
+    v20_patches.replace(
+        '<work-title>The Master\'s Palette (Reimagined)</work-title>',
+        '<work-title>The Master\'s Palette</work-title>'
+    )
+    v20_patches.replace(
+        '<encoder>V19 Publisher Layout Pass</encoder>',
+        '<encoder>V20 Final Commercial Engraving</encoder>'
+    )
+    v20_patches.replace(
+        '<software>V19 Publisher Layout - Print Ready</software>',
+        '<software>V20 Commercial Grade - Publication Standard</software>'
+    )
+
+    # V20 RULE 1: Zero collision tolerance - add appearance refinements
+    v20_patches.replace(
+        '<appearance>',
+        '<appearance>\n<line-width type="leger">1.5</line-width>\n<line-width type="tie middle">1.5</line-width>\n<line-width type="tie tip">0.5</line-width>'
+    )
+
+    # V20 RULE 2: Spacing optimization
+    v20_patches.replace(
+        '<note-size type="grace">60</note-size>',
+        '<note-size type="grace">60</note-size>\n<note-size type="cue">75</note-size>\n<distance type="hyphen">60</distance>\n<distance type="beam">8</distance>'
+    )
+
+    # V20 RULE 3: Slur & hairpin refinement - standardized line widths
+    v20_patches.replace(
+        '<line-width type="slur middle">2.0</line-width>',
+        '<line-width type="slur middle">1.8</line-width><!-- V20: Refined slur weight -->'
+    )
+
+    v20_patches.replace(
+        '<line-width type="slur tip">0.5</line-width>',
+        '<line-width type="slur tip">0.4</line-width><!-- V20: Refined slur taper -->'
+    )
+
+    # V20 RULE 4: Stem & beam cleanliness - standardized
+    v20_patches.replace(
+        '<line-width type="stem">1.0</line-width>',
+        '<line-width type="stem">0.9</line-width><!-- V20: Publisher standard -->'
+    )
+
+    v20_patches.replace(
+        '<line-width type="beam">5.0</line-width>',
+        '<line-width type="beam">4.5</line-width><!-- V20: Publisher standard -->'
+    )
+
+    # V20 RULE 5: Part-score agreement note
+    v20_patches.replace(
+        '<rights>' + COPYRIGHT + '</rights>',
+        '<rights>' + COPYRIGHT + '</rights>\n<miscellaneous><miscellaneous-field name="part-score-agreement">Verified - all markings consistent between score and parts</miscellaneous-field></miscellaneous>'
+    )
+
+    # V20 RULE 6: Professional aesthetics - final refinements
+    v20_patches.replace(
+        '<line-width type="staff">1.0</line-width>',
+        '<line-width type="staff">0.9</line-width><!-- V20: Commercial standard -->'
+    )
+
+    v20_patches.replace(
+        '<line-width type="barline">1.2</line-width>',
+        '<line-width type="barline">1.1</line-width><!-- V20: Commercial standard -->'
+    )
+
+    # Add final commercial metadata
+    v20_patches.replace(
+        '</identification>',
+        '<source>Masters Palette - Commercial Publication Edition</source>\n<relation type="catalog-number">MB-2025-001</relation></identification>'
+    )
+
+    # Clean up any remaining V-comments for commercial release
+    v20_patches.replace('<!-- V16: Page 2 -->', '')
+    v20_patches.replace('<!-- V16: Page 3 -->', '')
+    v20_patches.replace('<!-- V16: Page 4 -->', '')
+    v20_patches.replace('<!-- V17: Safe page turn after dim -->', '')
+    v20_patches.replace('<!-- V17: fff reduced to ff for studio balance -->', '')
+    v20_patches.replace('<!-- V18: Enlarged for conductor -->', '')
+    v20_patches.replace('<!-- V18: Extra family spacing -->', '')
+    v20_patches.replace('<!-- V18: Clearer staff separation -->', '')
+    v20_patches.replace('<!-- V18: Room for bar numbers -->', '')
+    v20_patches.replace('<!-- V19: 15mm standard -->', '')
+    v20_patches.replace('<!-- V19: Movement II starts new page -->', '')
+    v20_patches.replace('<!-- V19: Movement III starts new page -->', '')
+    v20_patches.replace('<!-- V19: Movement IV starts new page -->', '')
+    v20_patches.replace('<!-- V20: Refined slur weight -->', '')
+    v20_patches.replace('<!-- V20: Refined slur taper -->', '')
+    v20_patches.replace('<!-- V20: Publisher standard -->', '')
+    v20_patches.replace('<!-- V20: Commercial standard -->', '')
+
+    return v20_patches
+
+
+def main():
+    configure_output(sys.argv[1:])
+    # ============================================================
+    # V18 CONDUCTING SCORE PASS
+    # ============================================================
+    print("=== GENERATING V18 CONDUCTING SCORE ===")
+
+    v18 = read_score_text('scores/masters-palette-orchestrated-v17-sessionReady.musicxml')
+
+    v18_patches = build_v18_patches()
+    v18 = v18_patches.apply(v18)
+    v18_patches.print_report()
+
+    # Write V18
+    write_score('scores/masters-palette-orchestrated-v18-conductingScore.musicxml', v18)
+    print("Created: scores/masters-palette-orchestrated-v18-conductingScore.musicxml")
+
+    # ============================================================
+    # V19 PUBLISHER LAYOUT PASS
+    # ============================================================
+    print("\n=== GENERATING V19 PUBLISHER LAYOUT ===")
+
+    v19 = v18  # Start from V18
+
+    v19_patches = build_v19_patches()
+    v19 = v19_patches.apply(v19)
+    v19_patches.print_report()
+
+    # Write V19
+    write_score('scores/masters-palette-orchestrated-v19-publisherLayout.musicxml', v19)
+    print("Created: scores/masters-palette-orchestrated-v19-publisherLayout.musicxml")
+
+    # ============================================================
+    # V20 FINAL COMMERCIAL ENGRAVING PASS
+    # ============================================================
+    print("\n=== GENERATING V20 COMMERCIAL ENGRAVING ===")
+
+    v20 = v19  # Start from V19
+
+    v20_patches = build_v20_patches()
+    v20 = v20_patches.apply(v20)
+    v20_patches.print_report()
+
+    # Write V20
+    write_score('scores/masters-palette-orchestrated-v20-commercialEngraved.musicxml', v20)
+    print("Created: scores/masters-palette-orchestrated-v20-commercialEngraved.musicxml")
+
+    # ============================================================
+    # SUMMARY
+    # ============================================================
+    print("\n" + "="*60)
+    print("COMMERCIAL PUBLICATION PIPELINE COMPLETE")
+    print("="*60)
+    print(f"\nCopyright: {COPYRIGHT}")
+
+    print("\n--- V18 CONDUCTING SCORE ---")
+    print("* Staff size enlarged (6.5mm to 7.5mm) for stand visibility")
+    print("* System spacing increased (120 to 180) for family separation")
+    print("* Rehearsal marks enlarged to 18pt with rectangle enclosure")
+    print("* Conductor cues expanded with phrasing hints (Shape, Press forward, Hold back)")
+    print("* Gesture annotations at climaxes (unified attack, slow release, cut cleanly)")
+
+    print("\n--- V19 PUBLISHER LAYOUT ---")
+    print("* Full title page: Title, Composer, Year, Instrumentation, Duration")
+    print("* Typography: Times New Roman hierarchy (28pt title, 14pt subtitle, 12pt composer)")
+    print("* Margins standardized to 15mm (57 tenths) all sides")
+    print("* Movement headers on new pages with proper spacing")
+    print("* House style: consistent fonts, dynamics placement, spacing")
+
+    print("\n--- V20 COMMERCIAL ENGRAVING ---")
+    print("* Line weights refined: staff 0.9, barline 1.1, stem 0.9, beam 4.5")
+    print("* Slur refinement: middle 1.8, tip 0.4 for elegant taper")
+    print("* Leger line weight added (1.5) for clear ledger spacing")
+    print("* Tie weights standardized (middle 1.5, tip 0.5)")
+    print("* Catalog number assigned (MB-2025-001)")
+    print("* Part-score agreement verified in metadata")
+    print("* All version comments cleaned for commercial release")
+
+    print("\n" + "="*60)
+    print("PUBLICATION-READY: Boosey/Schott/Alfred standard achieved")
+    print("="*60)
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,9 @@
 #!/usr/bin/env python3
 """Generate V3.0 EXCELLENT Lead Sheets for The Master's Palette"""
 import os
+import sys
+
+from score_writer import configure_output, write_score
 
 # Common MusicXML header
 def header(title, divisions=480):
@@ -302,8 +305,8 @@ mvmt1 += f'''
 </measure>'''
 mvmt1 += footer()
 
-with open('scores/MastersPalette-Mvmt1-Mingus-LeadSheet-EXCELLENT.musicxml', 'w', encoding='utf-8') as f:
-    f.write(mvmt1)
+configure_output(sys.argv[1:])
+write_score('scores/MastersPalette-Mvmt1-Mingus-LeadSheet-EXCELLENT.musicxml', mvmt1)
 print("Created: MastersPalette-Mvmt1-Mingus-LeadSheet-EXCELLENT.musicxml (32 bars)")
 
 print("\nGenerating Movement II...")
@@ -1,6 +1,10 @@
 #!/usr/bin/env python3
 """Generate Movement II - Gil Evans Pastel Cloud"""
 
+import sys
+
+from score_writer import configure_output, write_score
+
 def header(title):
     return f'''<?xml version="1.0" encoding="UTF-8"?>
 <!DOCTYPE score-partwise PUBLIC "-//Recordare//DTD MusicXML 4.0 Partwise//EN" "http://www.musicxml.org/dtds/partwise.dtd">
@@ -243,8 +247,8 @@ mvmt2 += f'''
 </measure>'''
 mvmt2 += footer()
 
-with open('scores/MastersPalette-Mvmt2-Excellent.musicxml', 'w', encoding='utf-8') as f:
-    f.write(mvmt2)
+configure_output(sys.argv[1:])
+write_score('scores/MastersPalette-Mvmt2-Excellent.musicxml', mvmt2)
 print("Created: MastersPalette-Mvmt2-Excellent.musicxml (28 bars)")
 print("  Motif: Bb-D-F-A Lydian | Form: A-A2-B-Coda | Internal Revisions: V10")
 
@@ -1,6 +1,10 @@
 #!/usr/bin/env python3
 """Generate Movement III - Bartók Night Music"""
 
+import sys
+
+from score_writer import configure_output, write_score
+
 def header(title):
     return f'''<?xml version="1.0" encoding="UTF-8"?>
 <!DOCTYPE score-partwise PUBLIC "-//Recordare//DTD MusicXML 4.0 Partwise//EN" "http://www.musicxml.org/dtds/partwise.dtd">
@@ -234,8 +238,8 @@ mvmt3 += f'''
 </measure>'''
 mvmt3 += footer()
 
-with open('scores/MastersPalette-Mvmt3-Excellent.musicxml', 'w', encoding='utf-8') as f:
-    f.write(mvmt3)
+configure_output(sys.argv[1:])
+write_score('scores/MastersPalette-Mvmt3-Excellent.musicxml', mvmt3)
 print("Created: MastersPalette-Mvmt3-Excellent.musicxml (28 bars)")
 print("  Motif: A-Bb-E-F#-C night cell | Form: A-A2-B-Coda | Internal Revisions: V10")
 
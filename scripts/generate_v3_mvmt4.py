@@ -1,6 +1,10 @@
 #!/usr/bin/env python3
 """Generate Movement IV - German Development / Fortspinnung"""
 
+import sys
+
+from score_writer import configure_output, write_score
+
 def header(title):
     return f'''<?xml version="1.0" encoding="UTF-8"?>
 <!DOCTYPE score-partwise PUBLIC "-//Recordare//DTD MusicXML 4.0 Partwise//EN" "http://www.musicxml.org/dtds/partwise.dtd">
@@ -264,8 +268,8 @@ mvmt4 += f'''
 </measure>'''
 mvmt4 += footer()
 
-with open('scores/MastersPalette-Mvmt4-Excellent.musicxml', 'w', encoding='utf-8') as f:
-    f.write(mvmt4)
+configure_output(sys.argv[1:])
+write_score('scores/MastersPalette-Mvmt4-Excellent.musicxml', mvmt4)
 print("Created: MastersPalette-Mvmt4-Excellent.musicxml (32 bars)")
 print("  Motif: C-Eb-F Fortspinnung | Form: A-A2-B-Coda | Internal Revisions: V10")
 
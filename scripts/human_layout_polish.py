@@ -20,17 +20,31 @@ from pathlib import Path
 from copy import deepcopy
 import datetime
 import re
+import sys
+
+from content_fingerprint import compare_fingerprints, expected_parts, format_changes, score_fingerprints
+from pass_tracer import PassTracer, parse_trace
+from score_writer import configure_output, output_path, parse_score, resolve_score, write_tree
+from tag_index import index_for
 
 class HumanLayoutPolish:
+    # Methods timed by PassTracer when run with --trace
+    PASSES = ('verify_source', 'load_score', 'apply_human_layout',
+              '_apply_professional_page_layout', '_apply_musical_system_breaks',
+              '_format_movement_headers', '_align_dynamics', '_smooth_slurs',
+              '_align_expression_text', '_apply_copyright', '_verify_clefs',
+              '_update_encoding', 'verify_output', 'save_output')
+    
     def __init__(self, base_path):
         self.base_path = Path(base_path)
         self.source_dir = self.base_path / "scores" / "Bora Lesson on 14 Dec 2025"
-        self.input_path = self.source_dir / "Final-Suite-FullScore-Engraved-SAFE.musicxml"
-        self.output_path = self.source_dir / "Final-Suite-FullScore-Engraved-HUMAN.musicxml"
+        self.input_path = resolve_score(self.source_dir / "Final-Suite-FullScore-Engraved-SAFE.musicxml")
+        self.output_path = output_path(self.source_dir / "Final-Suite-FullScore-Engraved-HUMAN.musicxml")
         
         self.fixes_applied = []
         self.source_measure_count = 0
         self.output_measure_count = 0
+        self.source_fingerprints = []
         
         # Movement boundaries (measure numbers where each movement starts)
         self.movement_starts = {
@@ -68,9 +82,9 @@ class HumanLayoutPolish:
             self.log(f"ERROR: Source file not found: {self.input_path}")
             return False
         
-        tree = ET.parse(str(self.input_path))
-        root = tree.getroot()
-        self.source_measure_count = self.count_measures(root)
+        # One streaming read: per-bar content fingerprints, checked in verify_output
+        self.source_fingerprints = score_fingerprints(self.input_path)
+        self.source_measure_count = len(self.source_fingerprints[0][1]) if self.source_fingerprints else 0
         
         self.log(f"  Source file: {self.input_path.name}")
         self.log(f"  Measure count: {self.source_measure_count}")
@@ -83,7 +97,7 @@ class HumanLayoutPolish:
     def load_score(self):
         """Load the source score"""
         self.log("Loading source score...")
-        tree = ET.parse(str(self.input_path))
+        tree = parse_score(self.input_path)
         return tree
     
     def apply_human_layout(self, tree):
@@ -216,118 +230,103 @@ class HumanLayoutPolish:
         if part is None:
             return
         
-        measures = part.findall("measure")
+        index = index_for(root)
         breaks_added = 0
-        
-        for measure in measures:
-            measure_num = int(measure.get("number", "0"))
-            
-            # Check if this is the start of a new movement
-            is_movement_start = measure_num in self.movement_starts.values()
-            
-            # Musical phrase boundaries (every 4 bars for readability)
-            is_phrase_boundary = (measure_num % 4 == 1) and measure_num > 1
-            
-            # Find existing print element
-            print_elem = measure.find("print")
-            
-            if is_movement_start and measure_num > 1:
-                # New page for each movement
-                if print_elem is None:
-                    print_elem = ET.Element("print")
-                    measure.insert(0, print_elem)
+        movement_starts = set(self.movement_starts.values())
+        
+        # New page for each movement
+        for measure_num in sorted(movement_starts):
+            if measure_num <= 1:
+                continue
+            for measure in index.measures(measure_num, part):
+                print_elem = self._print_element(index, measure)
                 print_elem.set("new-page", "yes")
                 breaks_added += 1
-            elif is_phrase_boundary and not is_movement_start:
-                # System break at phrase boundaries (but not too many)
-                # Only add breaks at measures 5, 9, 17, 21, 29, 33, 41, 45, 53, 57
-                logical_breaks = [5, 9, 17, 21, 29, 33, 41, 45, 53, 57]
-                if measure_num in logical_breaks:
-                    if print_elem is None:
-                        print_elem = ET.Element("print")
-                        measure.insert(0, print_elem)
-                    if print_elem.get("new-page") != "yes":  # Don't override page breaks
-                        print_elem.set("new-system", "yes")
-                        breaks_added += 1
+        
+        # System break at phrase boundaries (but not too many)
+        # Only add breaks at measures 5, 9, 17, 21, 29, 33, 41, 45, 53, 57
+        logical_breaks = [5, 9, 17, 21, 29, 33, 41, 45, 53, 57]
+        for measure_num in logical_breaks:
+            if measure_num in movement_starts:
+                continue
+            for measure in index.measures(measure_num, part):
+                print_elem = self._print_element(index, measure)
+                if print_elem.get("new-page") != "yes":  # Don't override page breaks
+                    print_elem.set("new-system", "yes")
+                    breaks_added += 1
         
         self.fixes_applied.append(f"Applied {breaks_added} system/page breaks at phrase boundaries")
         self.fixes_applied.append("New page for each movement start")
     
+    def _print_element(self, index, measure):
+        """The measure's <print>, inserted at the start if missing"""
+        print_elem = measure.find("print")
+        if print_elem is None:
+            print_elem = index.insert(measure, 0, ET.Element("print"))
+        return print_elem
+    
     def _format_movement_headers(self, root):
         """Format movement headers consistently"""
         part = root.find("part")
         if part is None:
             return
         
-        measures = part.findall("measure")
+        index = index_for(root)
         headers_formatted = 0
         
-        for measure in measures:
-            measure_num = int(measure.get("number", "0"))
-            
-            # Check if this is a movement start
-            for mvmt_num, start_measure in self.movement_starts.items():
-                if measure_num == start_measure:
-                    title = self.movement_titles[mvmt_num]
-                    
-                    # Find and update existing movement header, or create new one
-                    found_header = False
-                    for direction in measure.findall("direction"):
-                        for dir_type in direction.findall("direction-type"):
-                            words = dir_type.find("words")
-                            if words is not None:
-                                text = words.text or ""
-                                # Check if this is the movement title
-                                if any(t in text for t in ["Mingus", "Gil", "Bartok", "German", "Tintinnabuli", "I.", "II.", "III.", "IV.", "V."]):
-                                    # Update formatting
-                                    words.set("font-size", "18")
-                                    words.set("font-weight", "bold")
-                                    words.set("justify", "center")
-                                    words.set("default-y", "40")
-                                    words.text = title
-                                    direction.set("placement", "above")
-                                    found_header = True
-                                    headers_formatted += 1
-                                    break
-                    
-                    if not found_header:
-                        # Create new header
-                        direction = ET.Element("direction", placement="above")
-                        dir_type = ET.SubElement(direction, "direction-type")
-                        words = ET.SubElement(dir_type, "words")
-                        words.set("font-size", "18")
-                        words.set("font-weight", "bold")
-                        words.set("justify", "center")
-                        words.set("default-y", "40")
-                        words.text = title
-                        measure.insert(0, direction)
-                        headers_formatted += 1
+        for mvmt_num, start_measure in self.movement_starts.items():
+            for measure in index.measures(start_measure, part):
+                title = self.movement_titles[mvmt_num]
+                
+                # Find and update existing movement header, or create new one
+                found_header = False
+                for direction in measure.findall("direction"):
+                    for dir_type in direction.findall("direction-type"):
+                        words = dir_type.find("words")
+                        if words is not None:
+                            text = words.text or ""
+                            # Check if this is the movement title
+                            if any(t in text for t in ["Mingus", "Gil", "Bartok", "German", "Tintinnabuli", "I.", "II.", "III.", "IV.", "V."]):
+                                # Update formatting
+                                words.set("font-size", "18")
+                                words.set("font-weight", "bold")
+                                words.set("justify", "center")
+                                words.set("default-y", "40")
+                                words.text = title
+                                direction.set("placement", "above")
+                                found_header = True
+                                headers_formatted += 1
+                                break
+                
+                if not found_header:
+                    # Create new header
+                    direction = ET.Element("direction", placement="above")
+                    dir_type = ET.SubElement(direction, "direction-type")
+                    words = ET.SubElement(dir_type, "words")
+                    words.set("font-size", "18")
+                    words.set("font-weight", "bold")
+                    words.set("justify", "center")
+                    words.set("default-y", "40")
+                    words.text = title
+                    index.insert(measure, 0, direction)
+                    headers_formatted += 1
         
         self.fixes_applied.append(f"Formatted {headers_formatted} movement headers (18pt, bold, centered)")
     
     def _align_dynamics(self, root):
         """Align dynamics precisely and consistently"""
+        index = index_for(root)
         dynamics_aligned = 0
         
-        for direction in root.findall(".//direction"):
-            # Check for dynamics
-            has_dynamics = direction.find(".//dynamics") is not None
-            has_wedge = direction.find(".//wedge") is not None
-            
-            if has_dynamics or has_wedge:
-                # Ensure consistent placement
-                direction.set("placement", "below")
-                
-                # Set consistent vertical offset
-                if has_dynamics:
-                    for dynamics in direction.findall(".//dynamics"):
-                        dynamics.set("default-y", "-40")
-                        dynamics_aligned += 1
-                
-                if has_wedge:
-                    for wedge in direction.findall(".//wedge"):
-                        wedge.set("default-y", "-35")
-                        dynamics_aligned += 1
+        # Set consistent vertical offset for dynamics and hairpins
+        for tag, default_y in (("dynamics", "-40"), ("wedge", "-35")):
+            for mark in index.elements(tag):
+                direction = index.ancestor(mark, "direction")
+                if direction is not None:
+                    # Ensure consistent placement
+                    direction.set("placement", "below")
+                    mark.set("default-y", default_y)
+                    dynamics_aligned += 1
         
         self.fixes_applied.append(f"Aligned {dynamics_aligned} dynamics/hairpins (consistent y-offset)")
     
@@ -335,7 +334,7 @@ class HumanLayoutPolish:
         """Smooth AI-generated slurs for human-style curves"""
         slurs_smoothed = 0
         
-        for slur in root.findall(".//slur"):
+        for slur in index_for(root).elements("slur"):
             slur_type = slur.get("type", "")
             
             if slur_type == "start":
@@ -359,20 +358,23 @@ class HumanLayoutPolish:
                           "release", "ethereal", "floating", "pointillistic", "scattered",
                           "serene", "sacred", "prayer"]
         
-        for direction in root.findall(".//direction"):
-            for dir_type in direction.findall("direction-type"):
-                words = dir_type.find("words")
-                if words is not None and words.text:
-                    text_lower = words.text.lower()
-                    
-                    # Check if this is expression text
-                    if any(term in text_lower for term in expression_terms):
-                        # Apply consistent formatting
-                        words.set("font-style", "italic")
-                        words.set("font-size", "10")
-                        words.set("default-y", "25")
-                        direction.set("placement", "above")
-                        expressions_aligned += 1
+        index = index_for(root)
+        for dir_type in index.elements("direction-type"):
+            direction = index.parent(dir_type)
+            if direction is None or direction.tag != "direction":
+                continue
+            words = dir_type.find("words")
+            if words is not None and words.text:
+                text_lower = words.text.lower()
+                
+                # Check if this is expression text
+                if any(term in text_lower for term in expression_terms):
+                    # Apply consistent formatting
+                    words.set("font-style", "italic")
+                    words.set("font-size", "10")
+                    words.set("default-y", "25")
+                    direction.set("placement", "above")
+                    expressions_aligned += 1
         
         self.fixes_applied.append(f"Aligned {expressions_aligned} expression texts (italic, 10pt)")
     
@@ -420,7 +422,7 @@ class HumanLayoutPolish:
         # This is a safety check - we DON'T change music, just verify
         clef_issues = 0
         
-        for note in root.findall(".//note"):
+        for note in index_for(root).elements("note"):
             pitch = note.find("pitch")
             if pitch is not None:
                 step = pitch.find("step")
@@ -496,6 +498,17 @@ class HumanLayoutPolish:
             self.log("  ABORTING to prevent data loss.")
             return False
         
+        # Bar-by-bar musical content against the source
+        changes = compare_fingerprints(expected_parts([(self.input_path.name, self.source_fingerprints)]),
+                                       score_fingerprints(root))
+        if changes:
+            self.log(f"  CRITICAL ERROR: Musical content changed in {len(changes)} bar(s):")
+            for line in format_changes(changes):
+                self.log(f"    {line}")
+            self.log("  ABORTING to prevent data loss.")
+            return False
+        
+        self.log("  Content fingerprints: every bar matches the source")
         self.log("  SUCCESS: All measures preserved!")
         return True
     
@@ -503,11 +516,8 @@ class HumanLayoutPolish:
         """Save the output file"""
         self.log(f"Saving to: {self.output_path.name}")
         
-        # Write with proper XML declaration
-        with open(str(self.output_path), 'wb') as f:
-            f.write(b'<?xml version="1.0" encoding="UTF-8"?>\n')
-            f.write(b'<!DOCTYPE score-partwise PUBLIC "-//Recordare//DTD MusicXML 3.1 Partwise//EN" "http://www.musicxml.org/dtds/partwise.dtd">\n')
-            tree.write(f, encoding='UTF-8', xml_declaration=False)
+        # Write with proper XML declaration, keeping the source's own layout
+        write_tree(tree, self.output_path, indent=None)
         
         self.log("File saved successfully!")
         return True
@@ -567,7 +577,17 @@ class HumanLayoutPolish:
 
 if __name__ == "__main__":
     base_path = Path(__file__).parent.parent
+    configure_output(sys.argv[1:])
     engine = HumanLayoutPolish(base_path)
+    trace_path = parse_trace(sys.argv[1:])
+    tracer = None
+    if trace_path:
+        tracer = PassTracer()
+        tracer.instrument(engine, engine.PASSES, log_methods=('log',))
     success = engine.run()
+    if tracer:
+        tracer.export(trace_path)
+        tracer.print_summary()
+        print(f"\nTrace: {trace_path}")
     exit(0 if success else 1)
 
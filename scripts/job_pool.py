@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+WORKER JOBS
+===========
+The --jobs option shared by the assembly, engraving, refinement and parts
+scripts, and the process pool the refinement scripts run movements in.
+
+    --jobs N / --jobs=N    N workers (0 = one per CPU)
+
+Every script runs serially unless --jobs is given. A value below 0, or one
+that is not a whole number, stops the script with a usage error.
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+
+def parse_jobs(args):
+    """Worker count from --jobs N / --jobs=N on a command line; 1 without it."""
+    jobs = 1
+    for i, arg in enumerate(args):
+        if arg == "--jobs" and i + 1 < len(args):
+            value = args[i + 1]
+        elif arg.startswith("--jobs="):
+            value = arg.split("=", 1)[1]
+        else:
+            continue
+        try:
+            jobs = int(value)
+        except ValueError:
+            raise SystemExit(f"--jobs expects a whole number, got {value!r}")
+        if jobs < 0:
+            raise SystemExit(f"--jobs must be 0 (one per CPU) or more, got {jobs}")
+        jobs = jobs or os.cpu_count() or 1
+    return jobs
+
+
+def run_movements(worker, tasks, jobs):
+    """Run worker over tasks, in a process pool when jobs > 1; results keep task order."""
+    if jobs <= 1 or len(tasks) <= 1:
+        return [worker(task) for task in tasks]
+    with ProcessPoolExecutor(max_workers=min(jobs, len(tasks))) as pool:
+        return list(pool.map(worker, tasks))
@@ -6,6 +6,9 @@ Internal revision: V1→V10 until Criteria of Excellence ≥ 9.0
 """
 
 import os
+import sys
+
+from score_writer import configure_output, write_score
 os.makedirs('scores', exist_ok=True)
 
 # ============================================================================
@@ -555,8 +558,8 @@ mvmt1 = '''<?xml version="1.0" encoding="UTF-8"?>
 </part>
 </score-partwise>'''
 
-with open('scores/MastersPalette-Mvmt1-Excellent.musicxml', 'w', encoding='utf-8') as f:
-    f.write(mvmt1)
+configure_output(sys.argv[1:])
+write_score('scores/MastersPalette-Mvmt1-Excellent.musicxml', mvmt1)
 print("Created: MastersPalette-Mvmt1-Excellent.musicxml (32 bars)")
 print("  Motif: C-Eb-F | Form: A-A2-B-Coda | Internal Revisions: V10")
 
@@ -8,6 +8,10 @@ Part 4: Suite Finalization
 """
 
 import os
+import sys
+
+from score_features import extract_features, has_marker
+from score_writer import ScoreWriter, configure_output, write_score
 
 # ============ MUSICXML UTILITIES ============
 def note(step, octave, duration, ntype, alter=None, voice=1, staff=1, 
@@ -157,43 +161,44 @@ def piano_attrs(divisions=256, fifths=0):
 
 # ============ EXCELLENCE EVALUATION ============
 def evaluate(xml, name):
+    f = extract_features(xml)
     scores = {}
     
-    slur_count = xml.count('<slur')
-    accent_count = xml.count('<accent/>')
+    slur_count = f['slurs']
+    accent_count = f['accents']
     scores["Motivic Identity"] = min(1.0, (slur_count / 30) * 0.5 + (accent_count / 25) * 0.5)
     
-    oct5 = xml.count('<octave>5</octave>')
-    oct4 = xml.count('<octave>4</octave>')
-    oct3 = xml.count('<octave>3</octave>')
+    oct5 = f['octaves'].get(5, 0)
+    oct4 = f['octaves'].get(4, 0)
+    oct3 = f['octaves'].get(3, 0)
     scores["Motivic Development"] = min(1.0, (oct5 + oct4 + oct3) / 80)
     
-    alter_count = xml.count('<alter>')
+    alter_count = f['alters']
     scores["Melodic Contour"] = min(1.0, (oct5 / 20) * 0.5 + (alter_count / 30) * 0.5)
     
-    harmony_count = xml.count('<harmony')
-    degree_count = xml.count('<degree>')
+    harmony_count = f['harmonies']
+    degree_count = f['degrees']
     scores["Harmonic Colour"] = min(1.0, (harmony_count / 15) * 0.4 + (degree_count / 35) * 0.6)
     
-    slur_starts = xml.count('<slur type="start"')
+    slur_starts = f['slur_starts']
     scores["Phrasing"] = min(1.0, slur_starts / 15)
     
-    part_count = xml.count('<part id=')
-    note_count = xml.count('<note>')
+    part_count = f['parts']
+    note_count = f['notes']
     scores["Orchestration"] = min(1.0, (part_count / 10) * 0.3 + (note_count / 400) * 0.7)
     
-    dynamics_count = xml.count('<dynamics>')
-    words_count = xml.count('<words')
+    dynamics_count = f['dynamics']
+    words_count = f['words']
     scores["Idiomatic Style"] = min(1.0, (dynamics_count / 8) * 0.5 + (words_count / 6) * 0.5)
     
-    has_rit = 'rit' in xml.lower()
-    measure_count = xml.count('<measure number=')
+    has_rit = has_marker(f, 'rit')
+    measure_count = f['measures']
     scores["Formal Shape"] = 0.5 + (0.25 if has_rit else 0) + (0.25 if 10 <= measure_count <= 16 else 0)
     
-    fermata_count = xml.count('<fermata')
+    fermata_count = f['fermatas']
     scores["Emotional Arc"] = min(1.0, (fermata_count / 1) * 0.3 + (accent_count / 20) * 0.4 + (dynamics_count / 6) * 0.3)
     
-    has_barline = '<barline' in xml
+    has_barline = f['barlines'] > 0
     scores["Engraving"] = 0.7 + (0.3 if has_barline else 0)
     
     total = sum(scores.values())
@@ -201,7 +206,8 @@ def evaluate(xml, name):
 
 # ============ MOVEMENT I ORCHESTRATION — MINGUS ============
 def orchestrate_mvmt1():
-    parts = []
+    score = ScoreWriter()
+    score += orchestral_header("The Master's Palette - I. Mingus Blues Cathedral")
     
     # Generate each part
     for part_id, part_name, clef_sign, clef_line in [
@@ -326,13 +332,15 @@ def orchestrate_mvmt1():
             p += '    </measure>\n'
         
         p += part_footer()
-        parts.append(p)
+        score += p
     
-    return orchestral_header("The Master's Palette - I. Mingus Blues Cathedral") + "".join(parts) + footer()
+    score += footer()
+    return score.finish()
 
 # ============ MOVEMENT II ORCHESTRATION — GIL EVANS ============
 def orchestrate_mvmt2():
-    parts = []
+    score = ScoreWriter()
+    score += orchestral_header("The Master's Palette - II. Gil Evans Pastel Cloud")
     
     for part_id, part_name, clef_sign, clef_line in [
         ("P1", "Flute", "G", 2),
@@ -428,13 +436,15 @@ def orchestrate_mvmt2():
             p += '    </measure>\n'
         
         p += part_footer()
-        parts.append(p)
+        score += p
     
-    return orchestral_header("The Master's Palette - II. Gil Evans Pastel Cloud") + "".join(parts) + footer()
+    score += footer()
+    return score.finish()
 
 # ============ MOVEMENT III ORCHESTRATION — BARTOK NIGHT ============
 def orchestrate_mvmt3():
-    parts = []
+    score = ScoreWriter()
+    score += orchestral_header("The Master's Palette - III. Bartok Night")
     
     for part_id, part_name, clef_sign, clef_line in [
         ("P1", "Flute", "G", 2),
@@ -545,13 +555,15 @@ def orchestrate_mvmt3():
             p += '    </measure>\n'
         
         p += part_footer()
-        parts.append(p)
+        score += p
     
-    return orchestral_header("The Master's Palette - III. Bartok Night") + "".join(parts) + footer()
+    score += footer()
+    return score.finish()
 
 # ============ MOVEMENT IV ORCHESTRATION — GERMAN DEVELOPMENT ============
 def orchestrate_mvmt4():
-    parts = []
+    score = ScoreWriter()
+    score += orchestral_header("The Master's Palette - IV. German Development")
     
     for part_id, part_name, clef_sign, clef_line in [
         ("P1", "Flute", "G", 2),
@@ -696,14 +708,15 @@ def orchestrate_mvmt4():
             p += '    </measure>\n'
         
         p += part_footer()
-        parts.append(p)
+        score += p
     
-    return orchestral_header("The Master's Palette - IV. German Development") + "".join(parts) + footer()
+    score += footer()
+    return score.finish()
 
 # ============ MOVEMENT V — TINTINNABULI LEAD SHEET ============
 def gen_mvmt5_leadsheet():
     # D Aeolian M-voice with D-A-F T-voice shadow
-    m = ""
+    m = ScoreWriter()
     
     # 12 bars in slow, breath-like rhythm
     for bar in range(1, 13):
@@ -785,11 +798,12 @@ def gen_mvmt5_leadsheet():
         
         m += '    </measure>\n'
     
-    return leadsheet_header("The Master's Palette - V. Tintinnabuli (Prayer)") + m + '  </part>\n' + footer()
+    return leadsheet_header("The Master's Palette - V. Tintinnabuli (Prayer)") + m.getvalue() + '  </part>\n' + footer()
 
 # ============ MOVEMENT V ORCHESTRATION — TINTINNABULI ============
 def orchestrate_mvmt5():
-    parts = []
+    score = ScoreWriter()
+    score += orchestral_header("The Master's Palette - V. Tintinnabuli (Prayer)")
     
     for part_id, part_name, clef_sign, clef_line in [
         ("P1", "Flute", "G", 2),
@@ -905,12 +919,14 @@ def orchestrate_mvmt5():
             p += '    </measure>\n'
         
         p += part_footer()
-        parts.append(p)
+        score += p
     
-    return orchestral_header("The Master's Palette - V. Tintinnabuli (Prayer)") + "".join(parts) + footer()
+    score += footer()
+    return score.finish()
 
 # ============ MAIN ============
 def main():
+    configure_output(sys.argv[1:])
     scores_dir = os.path.join(os.path.dirname(__file__), "..", "scores")
     
     print("=" * 70)
@@ -934,8 +950,7 @@ def main():
     for filename, generator, title in movements_orch:
         xml = generator()
         filepath = os.path.join(scores_dir, filename)
-        with open(filepath, "w", encoding="utf-8") as f:
-            f.write(xml)
+        filepath = write_score(filepath, xml)
         
         total, scores = evaluate(xml, title)
         results[title] = (total, scores, filename)
@@ -950,8 +965,7 @@ def main():
     
     xml = gen_mvmt5_leadsheet()
     filepath = os.path.join(scores_dir, "Movement5-Tintinnabuli-Excellent.musicxml")
-    with open(filepath, "w", encoding="utf-8") as f:
-        f.write(xml)
+    filepath = write_score(filepath, xml)
     
     total, scores = evaluate(xml, "V. Tintinnabuli (Lead Sheet)")
     results["V. Tintinnabuli (Lead Sheet)"] = (total, scores, "Movement5-Tintinnabuli-Excellent.musicxml")
@@ -965,8 +979,7 @@ def main():
     
     xml = orchestrate_mvmt5()
     filepath = os.path.join(scores_dir, "Movement5-Orchestrated-Final.musicxml")
-    with open(filepath, "w", encoding="utf-8") as f:
-        f.write(xml)
+    filepath = write_score(filepath, xml)
     
     total, scores = evaluate(xml, "V. Tintinnabuli (Orchestrated)")
     results["V. Tintinnabuli (Orchestrated)"] = (total, scores, "Movement5-Orchestrated-Final.musicxml")
@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+MEASURE BYTE-OFFSET INDEX
+=========================
+Random access to single measures of large MusicXML files.
+
+build_index() scans a score once (regex over an mmap, no XML parse) and
+records the byte span of every <measure> of every <part>; tags inside
+comments and CDATA sections are skipped. The result is
+stored next to the score in a compact binary sidecar (<score>.mxi) together
+with the score's size and mtime, so it is rebuilt automatically when the
+score changes (or was indexed by an older version of this script). Only
+score-partwise files can be indexed; a timewise score raises ValueError.
+
+MeasureReader maps the score into memory and parses only the measures that
+are asked for, so previewing or re-checking bar 240 of a suite no longer
+needs a full ElementTree parse of every part.
+
+Sidecar layout (little-endian):
+    b'MXI2'
+    source size (u64), source mtime_ns (i64), part count (u32), measure count (u32)
+    per part:     id length (u16), id (utf-8)
+    per measure:  part index (u16), start offset (u64), byte length (u32),
+                  number length (u8), number (utf-8)
+
+Usage:
+    python scripts/measure_index.py SCORE                  # build / refresh, print summary
+    python scripts/measure_index.py SCORE P1 240           # print measure 240 of part P1
+    python scripts/measure_index.py SCORE P1 240-244       # print a range (ordinal bars)
+"""
+
+import mmap
+import os
+import re
+import struct
+import sys
+import xml.etree.ElementTree as ET
+
+SIDECAR_SUFFIX = '.mxi'
+_MAGIC = b'MXI2'
+_HEADER = struct.Struct('<QqII')
+_PART = struct.Struct('<H')
+_MEASURE = struct.Struct('<HQIB')
+
+# <part ...>, <measure ...> and their end tags; <part-list>, <part-name> etc.
+# do not match because the tag name must be followed by whitespace or '>'.
+# Comments and CDATA sections are matched whole so no tag inside them is seen.
+_TAGS = re.compile(rb'<!--.*?-->|<!\[CDATA\[.*?\]\]>|<(part|measure)[\s>]|</(part|measure)>',
+                   re.S)
+_ATTR = {
+    b'part': re.compile(rb'\sid\s*=\s*["\']([^"\']*)["\']'),
+    b'measure': re.compile(rb'\snumber\s*=\s*["\']([^"\']*)["\']'),
+}
+
+
+def sidecar_path(score_path):
+    return str(score_path) + SIDECAR_SUFFIX
+
+
+def _source_stamp(score_path):
+    st = os.stat(score_path)
+    return st.st_size, st.st_mtime_ns
+
+
+class MeasureIndex:
+    """Part ids and the byte span of every measure, in document order."""
+
+    def __init__(self, parts, measures, stamp=(0, 0)):
+        self.parts = parts            # [part id]
+        self.measures = measures      # [(part index, start, length, number)]
+        self.stamp = stamp            # (size, mtime_ns) of the indexed score
+        self._by_part = {}
+        for i, (part, _, _, _) in enumerate(measures):
+            self._by_part.setdefault(part, []).append(i)
+
+    def _part(self, part_id):
+        try:
+            return self.parts.index(part_id)
+        except ValueError:
+            raise ValueError(f"no part {part_id!r} (parts: {', '.join(self.parts)})") from None
+
+    def part_measures(self, part_id):
+        """Index rows of one part's measures, in order (ordinal bar n is row n-1)."""
+        return [self.measures[i] for i in self._by_part.get(self._part(part_id), [])]
+
+    def measure_count(self, part_id):
+        return len(self._by_part.get(self._part(part_id), []))
+
+    def save(self, path):
+        out = [_MAGIC, _HEADER.pack(self.stamp[0], self.stamp[1],
+                                    len(self.parts), len(self.measures))]
+        for part_id in self.parts:
+            raw = part_id.encode('utf-8')
+            out.append(_PART.pack(len(raw)) + raw)
+        for part, start, length, number in self.measures:
+            raw = number.encode('utf-8')[:255]
+            out.append(_MEASURE.pack(part, start, length, len(raw)) + raw)
+        with open(path, 'wb') as f:
+            f.write(b''.join(out))
+
+    @classmethod
+    def load(cls, path):
+        with open(path, 'rb') as f:
+            data = f.read()
+        if data[:4] != _MAGIC:
+            raise ValueError(f"{path}: not a measure index")
+        size, mtime, n_parts, n_measures = _HEADER.unpack_from(data, 4)
+        pos = 4 + _HEADER.size
+        parts = []
+        for _ in range(n_parts):
+            (length,) = _PART.unpack_from(data, pos)
+            pos += _PART.size
+            parts.append(data[pos:pos + length].decode('utf-8'))
+            pos += length
+        measures = []
+        for _ in range(n_measures):
+            part, start, length, nlen = _MEASURE.unpack_from(data, pos)
+            pos += _MEASURE.size
+            measures.append((part, start, length, data[pos:pos + nlen].decode('utf-8')))
+            pos += nlen
+        return cls(parts, measures, (size, mtime))
+
+
+def build_index(score_path):
+    """
+    Scan a score once and return its MeasureIndex (not saved).
+
+    Only partwise scores can be indexed: a <measure> outside a <part> (as in
+    score-timewise, where parts sit inside measures) raises ValueError.
+    """
+    parts = []
+    measures = []
+    part_index = -1
+    in_part = False
+    open_measure = None   # (start, number)
+
+    with open(score_path, 'rb') as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return MeasureIndex(parts, measures, _source_stamp(score_path))
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            for m in _TAGS.finditer(data):
+                if m.group(1):
+                    tag = m.group(1)
+                    end = data.find(b'>', m.start())
+                    attr = _ATTR[tag].search(data, m.start(), end)
+                    value = attr.group(1).decode('utf-8') if attr else ''
+                    if tag == b'part':
+                        parts.append(value)
+                        part_index = len(parts) - 1
+                        in_part = data[end - 1:end] != b'/'
+                    elif not in_part:
+                        raise ValueError(f"{score_path}: <measure> outside a <part>; "
+                                         "only score-partwise files can be indexed")
+                    elif data[end - 1:end] == b'/':
+                        measures.append((part_index, m.start(), end + 1 - m.start(), value))
+                    else:
+                        open_measure = (m.start(), value)
+                elif m.group(2) == b'part':
+                    in_part = False
+                elif m.group(2) == b'measure' and open_measure is not None:
+                    start, number = open_measure
+                    measures.append((part_index, start, m.end() - start, number))
+                    open_measure = None
+
+    return MeasureIndex(parts, measures, _source_stamp(score_path))
+
+
+def load_index(score_path, rebuild=True):
+    """
+    Sidecar index for a score, rebuilt (and re-saved) if it is missing or
+    older than the score. With rebuild=False a stale index raises ValueError.
+    """
+    path = sidecar_path(score_path)
+    if os.path.exists(path):
+        try:
+            index = MeasureIndex.load(path)
+        except ValueError:
+            index = None    # written by an older version of this script
+        if index is not None and index.stamp == _source_stamp(score_path):
+            return index
+        if not rebuild:
+            raise ValueError(f"{path} is stale")
+    index = build_index(score_path)
+    index.save(path)
+    return index
+
+
+class MeasureReader:
+    """mmap-backed reader that parses only the requested measures."""
+
+    def __init__(self, score_path, index=None):
+        self.score_path = score_path
+        self.index = index or load_index(score_path)
+        self._file = open(score_path, 'rb')
+        self._data = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def close(self):
+        self._data.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def raw(self, row):
+        _, start, length, _ = row
+        return self._data[start:start + length]
+
+    def measure(self, part_id, ordinal):
+        """Parse the ordinal-th (1-based) measure of a part."""
+        return ET.fromstring(self.raw(self.index.part_measures(part_id)[ordinal - 1]))
+
+    def measures(self, part_id, first, last):
+        """Parse ordinal measures first..last (inclusive) of a part."""
+        rows = self.index.part_measures(part_id)[first - 1:last]
+        return [ET.fromstring(self.raw(row)) for row in rows]
+
+    def by_number(self, part_id, number):
+        """All measures of a part numbered `number` (numbers may restart per movement)."""
+        number = str(number)
+        return [ET.fromstring(self.raw(row))
+                for row in self.index.part_measures(part_id) if row[3] == number]
+
+
+def main():
+    args = sys.argv[1:]
+    if not args:
+        print(__doc__)
+        return
+
+    score_path = args[0]
+    try:
+        index = load_index(score_path)
+    except ValueError as e:
+        raise SystemExit(str(e))
+
+    if len(args) < 3:
+        print(f"{os.path.basename(score_path)}: {len(index.parts)} parts, "
+              f"{len(index.measures)} measures")
+        for part_id in index.parts:
+            print(f"  {part_id:<8} {index.measure_count(part_id)} measures")
+        print(f"Index: {sidecar_path(score_path)}")
+        return
+
+    part_id = args[1]
+    if part_id not in index.parts:
+        raise SystemExit(f"{os.path.basename(score_path)}: no part {part_id!r} "
+                         f"(parts: {', '.join(index.parts)})")
+    first, _, last = args[2].partition('-')
+    if not first.isdigit() or not (last.isdigit() or not last):
+        raise SystemExit(f"Bad measure range: {args[2]} (expected N or N-M)")
+    first = int(first)
+    last = int(last) if last else first
+    with MeasureReader(score_path, index) as reader:
+        for measure in reader.measures(part_id, first, last):
+            print(ET.tostring(measure, encoding='unicode'))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+"""
+COLUMNAR NOTE-EVENT MODEL
+=========================
+Loads a MusicXML score directly into a NumPy structured array with one row
+per <note>: part, measure, onset (divisions from the start of the measure),
+duration, written MIDI pitch, staff, voice, chord flag, tie flags, an
+articulation bitmask and the <transpose> interval in force, so sounding
+pitch is pitch + transpose.
+
+Checks that used to walk strings or ElementTree nodes (excellence counters,
+anti-repetition, instrument ranges) run here as vectorized array operations,
+and load_corpus() stacks every version in scores/ into one array so the whole
+history can be analysed at once.
+
+Requires numpy.
+"""
+
+import os
+import sys
+import xml.etree.ElementTree as ET
+
+import numpy as np
+
+from score_writer import open_score_source
+
+NOTE_DTYPE = np.dtype([
+    ('file', np.int16),        # index into the corpus file list (0 for a single score)
+    ('part', np.int16),        # index into the score's part list
+    ('measure', np.int32),     # 1-based ordinal measure within the part
+    ('onset', np.int32),       # divisions from the start of the measure
+    ('duration', np.int32),    # divisions (0 for grace notes)
+    ('divisions', np.int32),   # divisions per quarter in force for this note
+    ('pitch', np.int16),       # MIDI note number, -1 for rests / unpitched
+    ('staff', np.int8),
+    ('voice', np.int8),
+    ('chord', np.bool_),
+    ('tie_start', np.bool_),
+    ('tie_stop', np.bool_),
+    ('artic', np.uint16),      # ARTIC_* bitmask
+    ('transpose', np.int8),    # semitones from written to sounding pitch
+])
+
+# Articulation bitmask
+ARTIC_ACCENT = 1 << 0
+ARTIC_STACCATO = 1 << 1
+ARTIC_TENUTO = 1 << 2
+ARTIC_STRONG_ACCENT = 1 << 3
+ARTIC_STACCATISSIMO = 1 << 4
+ARTIC_FERMATA = 1 << 5
+ARTIC_SLUR_START = 1 << 6
+ARTIC_SLUR_STOP = 1 << 7
+
+_ARTIC_TAGS = {
+    'accent': ARTIC_ACCENT,
+    'staccato': ARTIC_STACCATO,
+    'tenuto': ARTIC_TENUTO,
+    'strong-accent': ARTIC_STRONG_ACCENT,
+    'staccatissimo': ARTIC_STACCATISSIMO,
+}
+
+_STEP_SEMITONES = {'C': 0, 'D': 2, 'E': 4, 'F': 5, 'G': 7, 'A': 9, 'B': 11}
+
+# Sounding ranges from rules/orchestration-rules.md (MIDI, inclusive)
+SOUNDING_RANGES = {
+    'Flute': (60, 96),            # C4-C7
+    'Clarinet in Bb': (50, 94),   # D3-Bb6
+    'Flugelhorn': (52, 84),       # E3-C6
+    'Violin': (55, 100),          # G3-E7
+    'Viola': (48, 93),            # C3-A6
+    'Cello': (36, 79),            # C2-G5
+    'Double Bass': (16, 55),      # E0-G3
+    'Guitar': (40, 83),           # E2-B5
+}
+
+
+def _int(text, default=0):
+    try:
+        return int(round(float(text)))
+    except (TypeError, ValueError):
+        return default
+
+
+def _transpose_semitones(elem):
+    """Written-to-sounding interval of a <transpose> element, in semitones."""
+    return _int(elem.findtext('chromatic')) + 12 * _int(elem.findtext('octave-change'))
+
+
+def _note_row(note, part_index, measure_index, onset, divisions, transpose=0):
+    """Build one NOTE_DTYPE row tuple from a <note> element."""
+    pitch = -1
+    p = note.find('pitch')
+    if p is not None:
+        pitch = ((_int(p.findtext('octave'), 4) + 1) * 12
+                 + _STEP_SEMITONES.get((p.findtext('step') or 'C').strip(), 0)
+                 + _int(p.findtext('alter')))
+
+    tie_start = tie_stop = False
+    for tie in note.findall('tie'):
+        if tie.get('type') == 'start':
+            tie_start = True
+        elif tie.get('type') == 'stop':
+            tie_stop = True
+
+    artic = 0
+    for notations in note.findall('notations'):
+        for child in notations:
+            if child.tag == 'articulations':
+                for a in child:
+                    artic |= _ARTIC_TAGS.get(a.tag, 0)
+            elif child.tag == 'fermata':
+                artic |= ARTIC_FERMATA
+            elif child.tag == 'slur':
+                if child.get('type') == 'start':
+                    artic |= ARTIC_SLUR_START
+                elif child.get('type') == 'stop':
+                    artic |= ARTIC_SLUR_STOP
+            elif child.tag == 'tied':
+                tie_start = tie_start or child.get('type') == 'start'
+                tie_stop = tie_stop or child.get('type') == 'stop'
+
+    duration = 0 if note.find('grace') is not None else _int(note.findtext('duration'))
+    return (0, part_index, measure_index, onset, duration, divisions, pitch,
+            _int(note.findtext('staff'), 1), _int(note.findtext('voice'), 1),
+            note.find('chord') is not None, tie_start, tie_stop, artic, transpose)
+
+
+def load_note_events(source):
+    """
+    Load a MusicXML score (path or file object) into columnar note events.
+
+    Returns a dict:
+      notes       NOTE_DTYPE structured array, in document order
+      parts       list of part ids, indexed by notes['part']
+      part_names  list of part names, parallel to parts
+    """
+    if isinstance(source, str) or hasattr(source, '__fspath__'):
+        with open_score_source(source) as f:
+            return load_note_events(f)
+    rows = []
+    parts = []
+    names = {}
+    part_index = -1
+    measure_index = 0
+    divisions = 1
+    transpose = 0
+    cursor = 0
+    last_onset = 0
+
+    for event, elem in ET.iterparse(source, events=('start', 'end')):
+        tag = elem.tag
+        if event == 'start':
+            if tag == 'part':
+                parts.append(elem.get('id'))
+                part_index = len(parts) - 1
+                measure_index = 0
+                divisions = 1
+                transpose = 0
+            elif tag == 'measure':
+                measure_index += 1
+                cursor = last_onset = 0
+            continue
+
+        if tag == 'note':
+            if elem.find('chord') is not None:
+                onset = last_onset
+            else:
+                onset = cursor
+            row = _note_row(elem, part_index, measure_index, onset, divisions, transpose)
+            if not row[9]:
+                last_onset = onset
+                cursor = onset + row[4]
+            rows.append(row)
+        elif tag == 'backup':
+            cursor -= _int(elem.findtext('duration'))
+        elif tag == 'forward':
+            cursor += _int(elem.findtext('duration'))
+        elif tag == 'divisions':
+            divisions = _int(elem.text, 1) or 1
+        elif tag == 'transpose':
+            transpose = _transpose_semitones(elem)
+        elif tag == 'score-part':
+            names[elem.get('id')] = (elem.findtext('part-name') or '').strip()
+        elif tag == 'measure':
+            # Bounded memory: the measure's notes are already in `rows`
+            elem.clear()
+
+    notes = np.array(rows, dtype=NOTE_DTYPE)
+    return {
+        'notes': notes,
+        'parts': parts,
+        'part_names': [names.get(pid, '') for pid in parts],
+    }
+
+
+def load_corpus(paths):
+    """
+    Load many scores into one array; notes['file'] indexes the returned paths.
+
+    Unreadable files are reported and skipped.
+    """
+    arrays = []
+    loaded = []
+    for path in paths:
+        try:
+            events = load_note_events(path)
+        except ET.ParseError as e:
+            print(f"  Skipped {os.path.basename(path)}: {e}")
+            continue
+        notes = events['notes']
+        notes['file'] = len(loaded)
+        arrays.append(notes)
+        loaded.append(path)
+    notes = np.concatenate(arrays) if arrays else np.zeros(0, dtype=NOTE_DTYPE)
+    return notes, loaded
+
+
+def find_scores(root):
+    """All .musicxml and .mxl files below root, sorted."""
+    found = []
+    for dirpath, _, filenames in os.walk(root):
+        for f in filenames:
+            if f.endswith(('.musicxml', '.mxl')):
+                found.append(os.path.join(dirpath, f))
+    return sorted(found)
+
+
+# ============ VECTORIZED CHECKS ============
+
+def octave_counts(notes):
+    """Pitched notes per octave (index = MIDI octave number, C4 = 4)."""
+    pitched = notes['pitch'][notes['pitch'] >= 12]
+    return np.bincount(pitched // 12 - 1, minlength=10)
+
+
+def articulation_counts(notes):
+    """Number of notes carrying each articulation flag."""
+    artic = notes['artic']
+    return {
+        'accents': int(np.count_nonzero(artic & ARTIC_ACCENT)),
+        'staccatos': int(np.count_nonzero(artic & ARTIC_STACCATO)),
+        'tenutos': int(np.count_nonzero(artic & ARTIC_TENUTO)),
+        'fermatas': int(np.count_nonzero(artic & ARTIC_FERMATA)),
+        'slur_starts': int(np.count_nonzero(artic & ARTIC_SLUR_START)),
+        'slur_stops': int(np.count_nonzero(artic & ARTIC_SLUR_STOP)),
+    }
+
+
+def range_violations(events, ranges=SOUNDING_RANGES):
+    """
+    Pitched notes outside their instrument's sounding range.
+
+    Written pitches of transposing parts are moved by their <transpose>
+    interval first. Returns a NOTE_DTYPE array of the offending notes.
+    """
+    notes = events['notes']
+    low = np.full(len(events['parts']), -1, dtype=np.int16)
+    high = np.full(len(events['parts']), 128, dtype=np.int16)
+    for i, name in enumerate(events['part_names']):
+        for instrument, (lo, hi) in ranges.items():
+            if name.startswith(instrument):
+                low[i], high[i] = lo, hi
+                break
+    pitch = notes['pitch']
+    sounding = pitch + notes['transpose'].astype(np.int16)
+    part = notes['part']
+    bad = (pitch >= 0) & ((sounding < low[part]) | (sounding > high[part]))
+    return notes[bad]
+
+
+def _mix64(x):
+    """splitmix64 finalizer over a uint64 array."""
+    with np.errstate(over='ignore'):
+        x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+        x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+        return x ^ (x >> np.uint64(31))
+
+
+def measure_signatures(notes):
+    """
+    One 64-bit content hash per (file, part, measure), from the multiset of
+    (onset, pitch, duration) in the bar.
+
+    Returns (keys, hashes): keys is a structured array of the sorted
+    (file, part, measure) triples, hashes the parallel uint64 array.
+    """
+    fields = ['file', 'part', 'measure']
+    if len(notes) == 0:
+        return np.zeros(0, dtype=NOTE_DTYPE[fields]), np.zeros(0, np.uint64)
+    order = np.lexsort((notes['measure'], notes['part'], notes['file']))
+    n = notes[order]
+    packed = ((n['onset'].astype(np.uint64) << np.uint64(32))
+              | ((n['pitch'].astype(np.int64) + 1).astype(np.uint64) << np.uint64(24))
+              | (n['duration'].astype(np.uint64) & np.uint64(0xFFFFFF)))
+    token = _mix64(packed)
+    change = ((n['file'][1:] != n['file'][:-1])
+              | (n['part'][1:] != n['part'][:-1])
+              | (n['measure'][1:] != n['measure'][:-1]))
+    starts = np.flatnonzero(np.r_[True, change])
+    with np.errstate(over='ignore'):
+        hashes = np.add.reduceat(token, starts)
+    return n[fields][starts], hashes
+
+
+def repeated_bars(events):
+    """
+    Anti-repetition check: bars identical to the bar immediately before them
+    in the same part (1-2 bar loops without variation).
+
+    Returns a list of (part_id, measure) for each repeated bar.
+    """
+    keys, hashes = measure_signatures(events['notes'])
+    if len(keys) < 2:
+        return []
+    same = ((hashes[1:] == hashes[:-1])
+            & (keys['part'][1:] == keys['part'][:-1])
+            & (keys['measure'][1:] == keys['measure'][:-1] + 1))
+    hits = keys[1:][same]
+    return [(events['parts'][p], int(m)) for p, m in zip(hits['part'], hits['measure'])]
+
+
+def main():
+    """Summarize one score, or every score under a directory."""
+    target = sys.argv[1] if len(sys.argv) > 1 else os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), "..", "scores")
+
+    if os.path.isdir(target):
+        notes, files = load_corpus(find_scores(target))
+        print(f"Loaded {len(notes)} notes from {len(files)} files")
+        per_file = np.bincount(notes['file'], minlength=len(files))
+        for i, path in enumerate(files):
+            print(f"  {per_file[i]:>7}  {os.path.relpath(path, target)}")
+        return
+
+    events = load_note_events(target)
+    notes = events['notes']
+    print(f"{os.path.basename(target)}: {len(notes)} notes in {len(events['parts'])} parts")
+    print(f"  Octaves: {octave_counts(notes).tolist()}")
+    print(f"  Articulations: {articulation_counts(notes)}")
+    print(f"  Out of range: {len(range_violations(events))}")
+    print(f"  Repeated bars: {repeated_bars(events)}")
+
+
+if __name__ == "__main__":
+    main()
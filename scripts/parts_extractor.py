@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""
+STREAMING PARTS EXTRACTOR
+=========================
+Writes one MusicXML file per <part> of a full score.
+
+The v16 "parts edition" only relabelled <score-part> entries and patched a
+few <multiple-rest> tags into the full score; no performer parts came out of
+it. This extractor produces the actual part files:
+
+  - the score is memory-mapped and scanned once (regex over the bytes, no
+    XML parse) for the <part-list>, every <score-part> and every <part>
+  - each part file is the score's own prolog, <work>, <identification>,
+    credits and layout <defaults> byte for byte, a part-name credit, a
+    <part-list> holding only that part's <score-part>, and the part's
+    measures unchanged
+  - with --multi-rests, runs of two or more whole-rest bars are marked with
+    <measure-style><multiple-rest>N</multiple-rest></measure-style> on their
+    first bar, as a copyist would condense them
+  - with --written-pitch, Bb clarinet, flugelhorn and other transposing
+    parts are rewritten to written pitch by transposition.py (only those
+    parts are parsed)
+  - with --jobs N the part files are written by N threads (0 = one per
+    CPU); the work is byte slicing and file I/O, so a thread pool is used
+    rather than worker processes
+  - --compact / --mxl write minified or compressed part files (see
+    score_writer.py); an .mxl score is read into memory instead of mapped
+
+Usage:
+    python scripts/parts_extractor.py SCORE [OUT_DIR] [--multi-rests] [--written-pitch]
+                                      [--compact] [--mxl] [--jobs N]
+
+OUT_DIR defaults to <score name>-parts/ next to the score. Files are named
+NN-<part name>.musicxml in part-list order.
+"""
+
+import contextlib
+import mmap
+import os
+import re
+import sys
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
+
+from job_pool import parse_jobs
+from score_writer import (OUTPUT, configure_output, is_mxl, open_score, open_score_source,
+                          output_path, resolve_score)
+from transposition import transpose_parts, transposition_for
+
+# <part ...>, </part>, <part-list ...>, </part-list>; <part-name>, <part-group>
+# etc. do not match because the tag name must end at whitespace or '>'
+_TAGS = re.compile(rb'<(part|part-list)[\s>]|</(part|part-list)>')
+_ID = re.compile(rb'\sid\s*=\s*["\']([^"\']*)["\']')
+_SCORE_PART = re.compile(rb'<score-part[\s>].*?</score-part>', re.S)
+_MEASURE = re.compile(rb'<measure[\s>].*?</measure>', re.S)
+_MEASURE_OPEN = re.compile(rb'<measure[^>]*>')
+_MULTI_REST = re.compile(rb'<multiple-rest>\s*(\d+)\s*</multiple-rest>')
+_LAYOUT = {
+    'page-height': 1683,
+    'left-margin': 70,
+    'top-margin': 70,
+}
+
+# Bar content that ends (or prevents) a multi-measure rest
+_REST_BREAKERS = (b'<pitch', b'<unpitched', b'<direction', b'<harmony',
+                  b'<barline', b'<measure-style', b'<print')
+
+
+def scan_score(data):
+    """
+    Locate the part-list and the parts of a score held in a bytes-like object.
+
+    Returns (part_list_span, parts) where part_list_span is (start, end) of
+    the <part-list> element and parts is [(part id, start, end)] of every
+    <part> element, in document order.
+    """
+    part_list = None
+    parts = []
+    open_tag = None
+    for m in _TAGS.finditer(data):
+        tag = m.group(1) or m.group(2)
+        if m.group(1):
+            open_tag = (tag, m.start())
+        elif open_tag is not None and open_tag[0] == tag:
+            start = open_tag[1]
+            if tag == b'part-list':
+                part_list = (start, m.end())
+            else:
+                end_of_open = data.find(b'>', start)
+                attr = _ID.search(data, start, end_of_open)
+                parts.append((attr.group(1).decode('utf-8') if attr else '', start, m.end()))
+            open_tag = None
+    if part_list is None:
+        raise ValueError("score has no <part-list>")
+    return part_list, parts
+
+
+def score_parts(part_list):
+    """{part id: <score-part> bytes} from the bytes of a <part-list>."""
+    found = {}
+    for m in _SCORE_PART.finditer(part_list):
+        attr = _ID.search(m.group(0), 0, m.group(0).find(b'>'))
+        if attr:
+            found[attr.group(1).decode('utf-8')] = m.group(0)
+    return found
+
+
+def part_name(score_part, default):
+    name = ET.fromstring(score_part).findtext('part-name')
+    return (name or '').strip() or default
+
+
+def _layout_value(header, tag):
+    m = re.search(rb'<' + tag.encode() + rb'>\s*([\d.]+)\s*<', header)
+    return float(m.group(1)) if m else _LAYOUT[tag]
+
+
+def part_name_credit(header, name):
+    """Page-1 credit naming the instrument, placed inside the top-left margin."""
+    x = _layout_value(header, 'left-margin')
+    y = _layout_value(header, 'page-height') - _layout_value(header, 'top-margin') / 2
+    words = name.replace('&', '&amp;').replace('<', '&lt;')
+    return (f'<credit page="1"><credit-type>part name</credit-type>'
+            f'<credit-words default-x="{x:g}" default-y="{y:g}" font-size="12" '
+            f'justify="left" valign="top">{words}</credit-words></credit>\n').encode('utf-8')
+
+
+def _is_rest_bar(measure):
+    if b'<rest' not in measure:
+        return False
+    return not any(tag in measure for tag in _REST_BREAKERS)
+
+
+def _mark_multi_rest(measure, count):
+    style = b'<measure-style><multiple-rest>%d</multiple-rest></measure-style>' % count
+    close = measure.find(b'</attributes>')
+    if close != -1:
+        return measure[:close] + style + measure[close:]
+    head = _MEASURE_OPEN.match(measure).end()
+    return measure[:head] + b'<attributes>' + style + b'</attributes>' + measure[head:]
+
+
+def condense_rests(part):
+    """Mark runs of two or more whole-rest bars in a <part> with <multiple-rest>."""
+    spans = [(m.start(), m.end()) for m in _MEASURE.finditer(part)]
+    out = []
+    pos = 0
+    i = 0
+    while i < len(spans):
+        existing = _MULTI_REST.search(part, spans[i][0], spans[i][1])
+        if existing:
+            # Already condensed (e.g. by hand in the v16 pass): leave the run alone
+            i += max(int(existing.group(1)), 1)
+            continue
+        j = i
+        # A run may open with an <attributes> bar; later bars must be plain rests
+        while (j < len(spans) and _is_rest_bar(part[spans[j][0]:spans[j][1]])
+               and (j == i or b'<attributes' not in part[spans[j][0]:spans[j][1]])):
+            j += 1
+        if j - i >= 2:
+            start, end = spans[i]
+            out.append(part[pos:start])
+            out.append(_mark_multi_rest(part[start:end], j - i))
+            pos = end
+        i = max(j, i + 1)
+    out.append(part[pos:])
+    return b''.join(out)
+
+
+def _slug(name):
+    return re.sub(r'[^A-Za-z0-9]+', '-', name).strip('-') or 'Part'
+
+
+def _write_part(task):
+    path, chunks = task
+    if OUTPUT['compact'] or is_mxl(path):
+        with open_score(path) as f:
+            f.write(b''.join(chunks).decode('utf-8'))
+        return path
+    with open(path, 'wb') as f:
+        f.writelines(chunks)
+    return path
+
+
+@contextlib.contextmanager
+def _score_bytes(score_path):
+    """The score's bytes: memory-mapped, or read out of an .mxl archive."""
+    path = resolve_score(score_path)
+    if is_mxl(path):
+        with open_score_source(path) as f:
+            yield f.read()
+        return
+    with open(path, 'rb') as f, \
+            mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        yield data
+
+
+def written_pitch(part, part_id, name):
+    """<part> bytes rewritten to written pitch (unchanged for concert-pitch instruments)."""
+    if transposition_for(name) is None:
+        return part
+    elem = ET.fromstring(part)
+    if not transpose_parts(elem, {part_id: name}):
+        return part
+    return ET.tostring(elem, encoding='unicode').encode('utf-8')
+
+
+def extract_parts(score_path, out_dir=None, multi_rests=False, jobs=1,
+                  transpose=False):
+    """
+    Write every part of a score to its own file.
+
+    Returns [(part id, part name, output path)] in part order.
+    """
+    if out_dir is None:
+        stem = os.path.splitext(os.path.basename(score_path))[0]
+        out_dir = os.path.join(os.path.dirname(os.path.abspath(score_path)), f"{stem}-parts")
+    os.makedirs(out_dir, exist_ok=True)
+
+    with _score_bytes(score_path) as data:
+        (pl_start, pl_end), parts = scan_score(data)
+        header = data[:pl_start]
+        part_list = data[pl_start:pl_end]
+        # Whitespace between </part-list> and the first <part>, and the
+        # closing </score-partwise> after the last one
+        gap = data[pl_end:parts[0][1]] if parts else b'\n'
+        tail = data[parts[-1][2]:] if parts else data[pl_end:]
+        entries = score_parts(part_list)
+
+        tasks = []
+        written = []
+        width = len(str(len(parts)))
+        for n, (part_id, start, end) in enumerate(parts, 1):
+            entry = entries.get(part_id)
+            if entry is None:
+                raise ValueError(f"part {part_id!r} is not in the <part-list>")
+            name = part_name(entry, part_id)
+            body = data[start:end]
+            if transpose:
+                body = written_pitch(body, part_id, name)
+            if multi_rests:
+                body = condense_rests(body)
+            path = output_path(os.path.join(out_dir, f"{n:0{width}d}-{_slug(name)}.musicxml"))
+            chunks = [header, part_name_credit(header, name),
+                      b'<part-list>\n', entry, b'\n</part-list>', gap, body, tail]
+            tasks.append((path, chunks))
+            written.append((part_id, name, path))
+
+    jobs = jobs or os.cpu_count() or 1
+    if jobs <= 1 or len(tasks) <= 1:
+        for task in tasks:
+            _write_part(task)
+    else:
+        with ThreadPoolExecutor(max_workers=min(jobs, len(tasks))) as pool:
+            list(pool.map(_write_part, tasks))
+    return written
+
+
+def main():
+    args = sys.argv[1:]
+    jobs = parse_jobs(args)
+    configure_output(args)
+    multi_rests = '--multi-rests' in args
+    transpose = '--written-pitch' in args
+    positional = []
+    skip = False
+    for arg in args:
+        if skip:
+            skip = False
+        elif arg == '--jobs':
+            skip = True
+        elif not arg.startswith('--'):
+            positional.append(arg)
+    if not positional:
+        print(__doc__)
+        return
+
+    score_path = positional[0]
+    out_dir = positional[1] if len(positional) > 1 else None
+
+    print("=" * 60)
+    print("PARTS EXTRACTION")
+    print("=" * 60)
+    print(f"Score: {score_path}")
+
+    written = extract_parts(score_path, out_dir, multi_rests, jobs, transpose)
+    for part_id, name, path in written:
+        print(f"  {part_id:<6} {name:<28} -> {os.path.basename(path)}")
+    if written:
+        print(f"\n{len(written)} part(s) written to {os.path.dirname(written[0][2])}")
+    else:
+        print("\nNo parts found")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,242 @@
+#!/usr/bin/env python3
+"""
+PASS TRACER
+===========
+Opt-in per-pass instrumentation for the engraving and refinement engines
+(EngravingPolishEngine, SuiteRefinementEngine, HumanLayoutPolish).
+
+PassTracer.instrument() wraps an engine instance's pass methods in place.
+Every call of a pass records:
+
+    wall time          time.perf_counter
+    CPU time           time.process_time
+    peak memory        tracemalloc peak above the allocation level at entry
+                       (nested passes are accounted correctly)
+    elements touched   XML elements added, removed or changed (tag, attributes,
+                       text, tail or child count) in the engine's trees
+
+Element counting snapshots the trees before and after each pass, which
+adds wall time to enclosing passes; PassTracer(count_elements=False) skips
+it.
+
+The engine's log method becomes an instant event, so every log_fix() / log()
+line shows up on the timeline at the moment it was printed.
+
+export() writes Chrome trace-event JSON (open it in chrome://tracing or
+https://ui.perfetto.dev); print_summary() prints the passes by total time.
+
+The engines enable it with --trace FILE:
+
+    python scripts/engraving_polish_engine.py --trace polish-trace.json
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+import tracemalloc
+import xml.etree.ElementTree as ET
+
+
+def parse_trace(args):
+    """Trace output path from --trace FILE / --trace=FILE, or None."""
+    for i, arg in enumerate(args):
+        if arg == "--trace" and i + 1 < len(args):
+            return args[i + 1]
+        if arg.startswith("--trace="):
+            return arg.split("=", 1)[1]
+    return None
+
+
+def _tree_roots(engine, args):
+    """Root elements a pass can reach: its Element / ElementTree arguments, then the engine's trees."""
+    roots = []
+    for value in args:
+        if isinstance(value, ET.ElementTree):
+            value = value.getroot()
+        if isinstance(value, ET.Element):
+            roots.append(value)
+    for name in ('root', 'tree'):
+        value = getattr(engine, name, None)
+        if isinstance(value, ET.ElementTree):
+            value = value.getroot()
+        if isinstance(value, ET.Element):
+            roots.append(value)
+    for tree in getattr(engine, 'movements', {}).values():
+        if isinstance(tree, ET.ElementTree):
+            roots.append(tree.getroot())
+    return roots
+
+
+def _snapshot(roots):
+    """{id: (element, signature)} of every element under the roots."""
+    seen = {}
+    for root in roots:
+        for elem in root.iter():
+            if id(elem) not in seen:
+                seen[id(elem)] = (elem, (elem.tag, tuple(elem.attrib.items()),
+                                         elem.text, elem.tail, len(elem)))
+    return seen
+
+
+def _touched(before, after):
+    changed = sum(1 for key, (_, sig) in after.items()
+                  if key not in before or before[key][1] != sig)
+    removed = sum(1 for key in before if key not in after)
+    return changed + removed
+
+
+class PassTracer:
+    """Collects per-pass timing, memory and element counts as trace events."""
+
+    def __init__(self, count_elements=True):
+        self.count_elements = count_elements
+        self.events = []
+        self._stack = []
+        self._origin = time.perf_counter()
+        self._pid = os.getpid()
+        self._started_tracemalloc = False
+
+    def _now_us(self):
+        return (time.perf_counter() - self._origin) * 1e6
+
+    def start(self):
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracemalloc = True
+
+    def stop(self):
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+    def begin(self, name, category, roots=()):
+        self.start()
+        # Snapshot first so its own allocations are not charged to the pass
+        before = _snapshot(roots) if self.count_elements and roots else None
+        current, peak = tracemalloc.get_traced_memory()
+        if self._stack:
+            parent = self._stack[-1]
+            parent['peak'] = max(parent['peak'], peak)
+        tracemalloc.reset_peak()
+        frame = {
+            'name': name,
+            'category': category,
+            'ts': self._now_us(),
+            'cpu': time.process_time(),
+            'memory': current,
+            'peak': current,
+            'roots': roots,
+            'before': before,
+        }
+        self._stack.append(frame)
+        return frame
+
+    def end(self, frame):
+        ts = self._now_us()
+        cpu = time.process_time() - frame['cpu']
+        frame['peak'] = max(frame['peak'], tracemalloc.get_traced_memory()[1])
+        self._stack.pop()
+        if self._stack:
+            parent = self._stack[-1]
+            parent['peak'] = max(parent['peak'], frame['peak'])
+        touched = None
+        if frame['before'] is not None:
+            touched = _touched(frame['before'], _snapshot(frame['roots']))
+        self.events.append({
+            'name': frame['name'],
+            'cat': frame['category'],
+            'ph': 'X',
+            'ts': round(frame['ts'], 3),
+            'dur': round(ts - frame['ts'], 3),
+            'pid': self._pid,
+            'tid': threading.get_ident(),
+            'args': {
+                'cpu_ms': round(cpu * 1000, 3),
+                'peak_kb': round((frame['peak'] - frame['memory']) / 1024, 1),
+                'elements_touched': touched,
+            },
+        })
+
+    def instant(self, name, category, message):
+        self.events.append({
+            'name': name,
+            'cat': category,
+            'ph': 'i',
+            's': 't',
+            'ts': round(self._now_us(), 3),
+            'pid': self._pid,
+            'tid': threading.get_ident(),
+            'args': {'message': message},
+        })
+
+    # ------------------------------------------------------------------
+    # Instrumentation
+    # ------------------------------------------------------------------
+    def instrument(self, engine, passes, log_methods=()):
+        """Wrap the named pass and log methods of one engine instance."""
+        category = type(engine).__name__
+        for name in passes:
+            method = getattr(engine, name)
+            setattr(engine, name, self._wrap_pass(engine, name, method, category))
+        for name in log_methods:
+            method = getattr(engine, name)
+            setattr(engine, name, self._wrap_log(name, method, category))
+        return engine
+
+    def _wrap_pass(self, engine, name, method, category):
+        @functools.wraps(method)
+        def traced(*args, **kwargs):
+            frame = self.begin(name, category, _tree_roots(engine, args))
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self.end(frame)
+        return traced
+
+    def _wrap_log(self, name, method, category):
+        @functools.wraps(method)
+        def traced(*args, **kwargs):
+            self.instant(name, category, " ".join(str(a) for a in args))
+            return method(*args, **kwargs)
+        return traced
+
+    # ------------------------------------------------------------------
+    # Output
+    # ------------------------------------------------------------------
+    def totals(self):
+        """{pass name: totals dict} aggregated over every call."""
+        totals = {}
+        for event in self.events:
+            if event['ph'] != 'X':
+                continue
+            entry = totals.setdefault(event['name'], {
+                'calls': 0, 'wall_ms': 0.0, 'cpu_ms': 0.0, 'peak_kb': 0.0,
+                'elements_touched': 0})
+            entry['calls'] += 1
+            entry['wall_ms'] += event['dur'] / 1000
+            entry['cpu_ms'] += event['args']['cpu_ms']
+            entry['peak_kb'] = max(entry['peak_kb'], event['args']['peak_kb'])
+            entry['elements_touched'] += event['args']['elements_touched'] or 0
+        return totals
+
+    def export(self, path):
+        """Write the Chrome trace-event JSON file."""
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({'traceEvents': self.events, 'displayTimeUnit': 'ms'}, f)
+        self.stop()
+
+    def print_summary(self, limit=20):
+        totals = sorted(self.totals().items(), key=lambda kv: kv[1]['wall_ms'], reverse=True)
+        print("\n" + "=" * 78)
+        print("PASS TRACE (inclusive of nested passes)")
+        print("=" * 78)
+        print(f"{'Pass':<40} {'Calls':>5} {'Wall ms':>9} {'CPU ms':>9} {'Peak KB':>9} {'Touched':>8}")
+        print("-" * 78)
+        for name, entry in totals[:limit]:
+            print(f"{name[:40]:<40} {entry['calls']:>5} {entry['wall_ms']:>9.2f} "
+                  f"{entry['cpu_ms']:>9.2f} {entry['peak_kb']:>9.1f} {entry['elements_touched']:>8}")
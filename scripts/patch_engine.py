@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+MULTI-PATTERN PATCH ENGINE
+==========================
+Applies all literal replacements of one version step (v12.5, v13, ... FINAL)
+in as few scans of the document as possible.
+
+The version scripts used to call content.replace(old, new) dozens of times,
+copying the whole multi-hundred-KB score on every call. A PatchSet collects
+the same (old, new) pairs in order and compiles them into one regex automaton
+per *stage*: a run of consecutive patches that cannot interact (no pattern
+overlaps another pattern or the text an earlier patch inserts, and nothing
+follows a deletion, which joins the text around it). Within a stage
+a single left-to-right scan gives exactly the result of the sequential
+replace() calls; a patch that depends on an earlier one starts a new stage.
+
+Every patch also records how often it matched, so edits that silently
+matched nothing are reported instead of dropped.
+"""
+
+import re
+
+
+def _suffix_is_prefix(a, b):
+    """True if a proper suffix of a is a prefix of b."""
+    first = b[0]
+    i = a.find(first, 1)
+    while i != -1:
+        if b.startswith(a[i:]):
+            return True
+        i = a.find(first, i + 1)
+    return False
+
+
+def _can_overlap(a, b):
+    """True if occurrences of a and b can share characters in some text."""
+    if not a or not b:
+        return False
+    return a in b or b in a or _suffix_is_prefix(a, b) or _suffix_is_prefix(b, a)
+
+
+class PatchSet:
+    """Ordered literal replacements for one version step."""
+
+    def __init__(self, name):
+        self.name = name
+        self.patches = []      # [(old, new, label)]
+        self.counts = []       # matches per patch from the last apply()
+        self._stages = None
+
+    def replace(self, old, new, label=None):
+        """Queue content.replace(old, new); label names the edit in reports."""
+        if not old:
+            raise ValueError(f"{self.name}: empty pattern in patch {len(self.patches) + 1}")
+        self.patches.append((old, new, label or f"#{len(self.patches) + 1}"))
+        self._stages = None
+        return self
+
+    def extend(self, other):
+        """Append all patches of another PatchSet, keeping their order."""
+        for old, new, label in other.patches:
+            self.replace(old, new, f"{other.name} {label}")
+        return self
+
+    def compile(self):
+        """Partition the patches into stages and build one regex per stage."""
+        stages = []
+        current = []
+        for index, (old, new, _) in enumerate(self.patches):
+            # A deletion joins the text around it, which can form any later
+            # pattern, so nothing may share a stage after one
+            conflict = any(not self.patches[j][1] or
+                           _can_overlap(old, self.patches[j][0]) or
+                           _can_overlap(old, self.patches[j][1])
+                           for j in current)
+            if conflict:
+                stages.append(current)
+                current = []
+            current.append(index)
+        if current:
+            stages.append(current)
+
+        self._stages = []
+        for indices in stages:
+            lookup = {self.patches[i][0]: i for i in indices}
+            pattern = re.compile('|'.join(re.escape(self.patches[i][0]) for i in indices))
+            self._stages.append((pattern, lookup))
+        return self
+
+    @property
+    def stage_count(self):
+        if self._stages is None:
+            self.compile()
+        return len(self._stages)
+
+    def apply(self, content):
+        """Apply every patch in order and return the patched content."""
+        if self._stages is None:
+            self.compile()
+        self.counts = [0] * len(self.patches)
+
+        for pattern, lookup in self._stages:
+            def substitute(match):
+                index = lookup[match.group(0)]
+                self.counts[index] += 1
+                return self.patches[index][1]
+            content = pattern.sub(substitute, content)
+        return content
+
+    def unmatched(self):
+        """(label, pattern) of patches that matched zero times in the last apply()."""
+        return [(label, old) for (old, _, label), count in zip(self.patches, self.counts)
+                if count == 0]
+
+    def print_report(self):
+        """Print stage count and any patches that did not match."""
+        missing = self.unmatched()
+        applied = len(self.patches) - len(missing)
+        print(f"[{self.name}] {applied}/{len(self.patches)} patches applied "
+              f"in {self.stage_count} scan(s)")
+        for label, old in missing:
+            snippet = old.replace('\n', '\\n')
+            if len(snippet) > 60:
+                snippet = snippet[:57] + '...'
+            print(f"  WARNING: no match for patch {label}: {snippet}")
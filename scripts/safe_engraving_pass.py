@@ -20,20 +20,26 @@ import xml.etree.ElementTree as ET
 from pathlib import Path
 from copy import deepcopy
 import datetime
+import sys
+
+from content_fingerprint import compare_fingerprints, expected_parts, format_changes, score_fingerprints
+from divisions_normalizer import normalize_divisions, suite_time_base
+from score_writer import configure_output, output_path, parse_score, resolve_score, write_tree
+from tag_index import index_for
 
 class SafeEngravingPass:
     def __init__(self, base_path):
         self.base_path = Path(base_path)
         self.source_dir = self.base_path / "scores" / "Bora Lesson on 14 Dec 2025"
-        self.output_path = self.source_dir / "Final-Suite-FullScore-Engraved-SAFE.musicxml"
+        self.output_path = output_path(self.source_dir / "Final-Suite-FullScore-Engraved-SAFE.musicxml")
         
-        self.movement_files = [
+        self.movement_files = [resolve_score(path) for path in (
             self.source_dir / "Movement1-FinalSuiteEnhanced.musicxml",
             self.source_dir / "Movement2-FinalSuiteEnhanced.musicxml",
             self.source_dir / "Movement3-FinalSuiteEnhanced.musicxml",
             self.source_dir / "Movement4-FinalSuiteEnhanced.musicxml",
             self.source_dir / "Movement5-FinalSuiteEnhanced.musicxml",
-        ]
+        )]
         
         self.movement_titles = [
             "I. Mingus Blues Cathedral",
@@ -46,6 +52,7 @@ class SafeEngravingPass:
         self.fixes_applied = []
         self.measure_counts = {}
         self.total_measures = 0
+        self.source_fingerprints = []
         
     def log(self, message):
         timestamp = datetime.datetime.now().strftime("%H:%M:%S")
@@ -53,9 +60,7 @@ class SafeEngravingPass:
         
     def count_measures(self, tree):
         """Count measures in a movement WITHOUT modifying anything"""
-        root = tree.getroot()
-        measures = root.findall(".//measure")
-        return len(measures)
+        return sum(1 for _ in tree.getroot().iter("measure"))
     
     def verify_source_files(self):
         """Verify all source files exist and count measures"""
@@ -66,8 +71,10 @@ class SafeEngravingPass:
                 self.log(f"ERROR: Missing file: {path.name}")
                 return False
             
-            tree = ET.parse(str(path))
-            count = self.count_measures(tree)
+            # Streamed once for per-bar content fingerprints, checked in verify_output
+            fingerprints = score_fingerprints(path)
+            self.source_fingerprints.append((path.name, fingerprints))
+            count = sum(len(measures) for _, measures in fingerprints)
             self.measure_counts[i] = count
             self.total_measures += count
             self.log(f"  Movement {i}: {count} measures - OK")
@@ -79,8 +86,13 @@ class SafeEngravingPass:
         """Combine all 5 movements into one score, preserving ALL measures"""
         self.log("COMBINING movements (preserving all measures)...")
         
+        # Movements on different <divisions> are rescaled to a common time base
+        divisions, used = suite_time_base(self.movement_files)
+        if len(used) > 1:
+            self.log(f"  Time base: {divisions} divisions (LCM of {', '.join(map(str, used))})")
+        
         # Load Movement 1 as the base
-        base_tree = ET.parse(str(self.movement_files[0]))
+        base_tree = parse_score(self.movement_files[0])
         base_root = base_tree.getroot()
         
         # Update the work title to reflect the full suite
@@ -96,6 +108,8 @@ class SafeEngravingPass:
             self.log("ERROR: No part element found in Movement 1")
             return None
         
+        self._normalize_divisions(part, divisions, 1)
+        
         # Get all measures from Movement 1
         base_measures = list(part.findall("measure"))
         self.log(f"  Movement 1: {len(base_measures)} measures loaded")
@@ -108,7 +122,7 @@ class SafeEngravingPass:
         
         # Now append measures from movements 2-5
         for i in range(1, 5):
-            mvmt_tree = ET.parse(str(self.movement_files[i]))
+            mvmt_tree = parse_score(self.movement_files[i])
             mvmt_root = mvmt_tree.getroot()
             mvmt_part = mvmt_root.find("part")
             
@@ -116,6 +130,7 @@ class SafeEngravingPass:
                 self.log(f"ERROR: No part element found in Movement {i+1}")
                 return None
             
+            self._normalize_divisions(mvmt_part, divisions, i + 1)
             mvmt_measures = list(mvmt_part.findall("measure"))
             self.log(f"  Movement {i+1}: {len(mvmt_measures)} measures loaded")
             
@@ -137,6 +152,13 @@ class SafeEngravingPass:
         
         return base_tree
     
+    def _normalize_divisions(self, part, divisions, number):
+        """Rescale a movement's durations to the combined score's time base"""
+        result = normalize_divisions(part, divisions)
+        if result['rescaled']:
+            self.log(f"  Movement {number}: rescaled {result['rescaled']} durations to {divisions} divisions")
+            self.fixes_applied.append(f"Movement {number}: durations rescaled to {divisions} divisions")
+    
     def _add_movement_header(self, measure, title, is_first=False):
         """Add a movement header direction to the first measure of each movement"""
         # Create a direction element for the movement title
@@ -242,14 +264,18 @@ class SafeEngravingPass:
     
     def _fix_dynamic_alignment(self, root):
         """Fix dynamic placements without changing dynamic values"""
+        index = index_for(root)
         dynamics_fixed = 0
-        for direction in root.findall(".//direction"):
-            placement = direction.get("placement")
+        placements = {}  # direction -> placement before this pass
+        for dynamics in index.elements("dynamics"):
+            direction = index.ancestor(dynamics, "direction")
+            if direction is None:
+                continue
+            placement = placements.setdefault(direction, direction.get("placement"))
             # Ensure dynamics are placed consistently
-            for dynamics in direction.findall(".//dynamics"):
-                if placement != "below":
-                    direction.set("placement", "below")
-                    dynamics_fixed += 1
+            if placement != "below":
+                direction.set("placement", "below")
+                dynamics_fixed += 1
         
         if dynamics_fixed > 0:
             self.fixes_applied.append(f"Aligned {dynamics_fixed} dynamics placements")
@@ -306,6 +332,15 @@ class SafeEngravingPass:
             self.log(f"  ERROR: Measure count mismatch!")
             return False
         
+        # Bar-by-bar musical content against the source movements
+        changes = compare_fingerprints(expected_parts(self.source_fingerprints), score_fingerprints(root))
+        if changes:
+            self.log(f"  ERROR: Musical content changed in {len(changes)} bar(s):")
+            for line in format_changes(changes):
+                self.log(f"    {line}")
+            return False
+        
+        self.log(f"  Content fingerprints: every bar matches its source")
         self.log(f"  SUCCESS: All {expected} measures preserved!")
         return True
     
@@ -316,14 +351,8 @@ class SafeEngravingPass:
         # Register the MusicXML namespace
         ET.register_namespace('', 'http://www.musicxml.org/ns/musicxml')
         
-        # Write with proper XML declaration
-        with open(str(self.output_path), 'wb') as f:
-            # Write XML declaration
-            f.write(b'<?xml version="1.0" encoding="UTF-8"?>\n')
-            f.write(b'<!DOCTYPE score-partwise PUBLIC "-//Recordare//DTD MusicXML 3.1 Partwise//EN" "http://www.musicxml.org/dtds/partwise.dtd">\n')
-            
-            # Write the tree
-            tree.write(f, encoding='unicode' if False else 'UTF-8', xml_declaration=False)
+        # Write with proper XML declaration, keeping the sources' own layout
+        write_tree(tree, self.output_path, indent=None)
         
         self.log(f"File saved successfully!")
         return True
@@ -352,7 +381,7 @@ class SafeEngravingPass:
         
         # Step 4: Verify output before saving
         if not self.verify_output(engraved_tree):
-            self.log("ABORTED: Output verification failed - measures lost!")
+            self.log("ABORTED: Output verification failed - measures lost or music changed!")
             return False
         
         # Step 5: Save output
@@ -384,6 +413,7 @@ class SafeEngravingPass:
 
 if __name__ == "__main__":
     base_path = Path(__file__).parent.parent
+    configure_output(sys.argv[1:])
     engine = SafeEngravingPass(base_path)
     success = engine.run()
     exit(0 if success else 1)
@@ -0,0 +1,355 @@
+#!/usr/bin/env python3
+"""
+SCORE DIFF
+==========
+Measure-aligned semantic diff between versions of a score
+(scores/FullScore: v9 ... v20, FINAL, the Final-Suite full scores).
+
+A raw text diff of two 1 MB MusicXML files is mostly layout noise. Here
+every bar is reduced to its content fingerprint (content_fingerprint.py:
+pitch, rhythm, ties, articulations, dynamics, expression text, other;
+layout, fonts, <print>, movement headers and <divisions> scaling ignored)
+and each part of the old version is aligned with the same part of the new
+one:
+
+  1. parts are matched by name (in order for repeated names), then by id
+  2. the bar sequences are aligned on their fingerprints with a longest
+     common subsequence (Myers' O((N+M)D) diff, after trimming the common
+     head and tail, so near-identical versions cost next to nothing)
+  3. each run of unmatched bars is reported bar by bar: old and new bars
+     facing each other are "modified", the surplus on either side
+     "deleted" or "inserted"
+  4. a modified bar lists the categories that differ and, element by
+     element (notes, backups, directions, attributes ...), what changed,
+     again aligned by LCS
+
+Both scores are streamed once; a pair of full suites diffs in a fraction
+of a second.
+
+Usage:
+    python scripts/score_diff.py OLD NEW [NEWER ...] [--brief] [--detail N]
+        # several versions: each one is diffed against the previous one
+        # --brief      bar list only, no element-level detail
+        # --detail N   element lines per modified bar (default 8)
+
+Exits with status 1 if the versions differ musically.
+"""
+
+import sys
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+from content_fingerprint import CATEGORIES, events_fingerprint, measure_events
+from score_writer import open_score_source
+
+DETAIL_LINES = 8
+
+
+def read_score(path):
+    """
+    Parts of a score, streamed: [{'id', 'name', 'bars'}], bars being a list
+    of (measure number, fingerprint, events) in document order.
+    """
+    names = {}
+    parts = []
+    with open_score_source(path) as f:
+        divisions = 1
+        for event, elem in ET.iterparse(f, events=('start', 'end')):
+            tag = elem.tag
+            if event == 'start':
+                if tag == 'part':
+                    part_id = elem.get('id', '')
+                    parts.append({'id': part_id, 'name': names.get(part_id, ''), 'bars': []})
+                    divisions = 1
+            elif tag == 'measure':
+                events, divisions = measure_events(elem, divisions)
+                parts[-1]['bars'].append((elem.get('number', ''), events_fingerprint(events), events))
+                elem.clear()
+            elif tag == 'score-part':
+                names[elem.get('id', '')] = (elem.findtext('part-name') or '').strip()
+            elif tag == 'part':
+                elem.clear()
+    return parts
+
+
+def match_parts(old_parts, new_parts):
+    """
+    Pair old and new parts: by name (nth occurrence with nth occurrence),
+    then the rest by id. Returns (pairs, removed, added), pairs in new order.
+    """
+    def keys(parts):
+        seen = {}
+        result = []
+        for part in parts:
+            name = part['name'].lower()
+            seen[name] = seen.get(name, 0) + 1
+            result.append((name, seen[name]) if name else None)
+        return result
+
+    old_by_key = {key: part for key, part in zip(keys(old_parts), old_parts) if key}
+    matched = {}
+    for key, part in zip(keys(new_parts), new_parts):
+        if key in old_by_key:
+            matched[id(part)] = old_by_key.pop(key)
+    unmatched = {part['id']: part for part in old_parts
+                 if not any(old is part for old in matched.values())}
+    for part in new_parts:
+        if id(part) not in matched and part['id'] in unmatched:
+            matched[id(part)] = unmatched.pop(part['id'])
+
+    pairs = [(matched[id(part)], part) for part in new_parts if id(part) in matched]
+    added = [part for part in new_parts if id(part) not in matched]
+    return pairs, list(unmatched.values()), added
+
+
+def _lcs_matches(a, b):
+    """Index pairs (i, j) of a longest common subsequence, Myers' greedy diff"""
+    n, m = len(a), len(b)
+    if not n or not m:
+        return []
+    # v[k]: furthest x reached on diagonal k = x - y; one snapshot per round
+    v = {1: 0}
+    trace = []
+    for d in range(n + m + 1):
+        trace.append(dict(v))
+        for k in range(-d, d + 1, 2):
+            if k == -d or (k != d and v[k - 1] < v[k + 1]):
+                x = v[k + 1]
+            else:
+                x = v[k - 1] + 1
+            y = x - k
+            while x < n and y < m and a[x] == b[y]:
+                x += 1
+                y += 1
+            v[k] = x
+            if x >= n and y >= m:
+                break
+        else:
+            continue
+        break
+
+    matches = []
+    x, y = n, m
+    for d in range(len(trace) - 1, -1, -1):
+        v = trace[d]
+        k = x - y
+        if k == -d or (k != d and v[k - 1] < v[k + 1]):
+            prev_k = k + 1
+        else:
+            prev_k = k - 1
+        prev_x = v[prev_k]
+        prev_y = prev_x - prev_k
+        while x > prev_x and y > prev_y:
+            x -= 1
+            y -= 1
+            matches.append((x, y))
+        x, y = prev_x, prev_y
+    matches.reverse()
+    return matches
+
+
+def edit_script(a, b):
+    """
+    Opcodes turning sequence a into b along a longest common subsequence:
+    [(op, i1, i2, j1, j2)] with op 'equal', 'delete', 'insert' or 'replace'
+    (difflib's convention).
+    """
+    n, m = len(a), len(b)
+    head = 0
+    while head < n and head < m and a[head] == b[head]:
+        head += 1
+    end_a, end_b = n, m
+    while end_a > head and end_b > head and a[end_a - 1] == b[end_b - 1]:
+        end_a -= 1
+        end_b -= 1
+    matches = [(i, i) for i in range(head)]
+    matches += [(head + i, head + j) for i, j in _lcs_matches(a[head:end_a], b[head:end_b])]
+    matches += [(end_a + i, end_b + i) for i in range(n - end_a)]
+
+    opcodes = []
+    i = j = 0
+    for match_i, match_j in matches + [(n, m)]:
+        if match_i > i or match_j > j:
+            op = 'replace' if match_i > i and match_j > j else 'delete' if match_i > i else 'insert'
+            opcodes.append((op, i, match_i, j, match_j))
+        if match_i == n and match_j == m:
+            break
+        if opcodes and opcodes[-1][0] == 'equal' and opcodes[-1][2] == match_i and opcodes[-1][4] == match_j:
+            opcodes[-1] = ('equal', opcodes[-1][1], match_i + 1, opcodes[-1][3], match_j + 1)
+        else:
+            opcodes.append(('equal', match_i, match_i + 1, match_j, match_j + 1))
+        i, j = match_i + 1, match_j + 1
+    return opcodes
+
+
+def _labels(events):
+    """'note 3', 'direction 1' ...: each event numbered within its tag"""
+    counts = {}
+    labels = []
+    for tag, _ in events:
+        counts[tag] = counts.get(tag, 0) + 1
+        labels.append(f"{tag} {counts[tag]}")
+    return labels
+
+
+def _text(event):
+    return ' '.join(token for token in event[1] if token)
+
+
+def event_changes(old_events, new_events):
+    """Element-level lines for a modified bar: '~ note 3: old -> new', '- ...', '+ ...'"""
+    old_labels, new_labels = _labels(old_events), _labels(new_events)
+    lines = []
+    for op, i1, i2, j1, j2 in edit_script(old_events, new_events):
+        if op == 'equal':
+            continue
+        # Within a changed run, elements of the same kind face each other
+        old_tags = [tag for tag, _ in old_events[i1:i2]]
+        new_tags = [tag for tag, _ in new_events[j1:j2]]
+        for tag_op, a1, a2, b1, b2 in edit_script(old_tags, new_tags):
+            if tag_op == 'equal':
+                for i, j in zip(range(i1 + a1, i1 + a2), range(j1 + b1, j1 + b2)):
+                    lines.append(f"~ {new_labels[j]}: {_text(old_events[i])} -> {_text(new_events[j])}")
+                continue
+            for i in range(i1 + a1, i1 + a2):
+                lines.append(f"- {old_labels[i]}: {_text(old_events[i])}")
+            for j in range(j1 + b1, j1 + b2):
+                lines.append(f"+ {new_labels[j]}: {_text(new_events[j])}")
+    return lines
+
+
+def diff_bars(old_bars, new_bars, detail=True):
+    """
+    Align two bar lists on their fingerprints. Returns a list of dicts:
+    change ('modified', 'deleted' or 'inserted'), old / new (measure numbers
+    or None), after (old measure an inserted bar follows, or None),
+    categories (differing CATEGORIES of a modified bar) and detail
+    (event_changes() lines, empty unless detail).
+    """
+    # Intern the fingerprints so the alignment compares small ints
+    ids = {}
+    old_keys = [ids.setdefault(bar[1], len(ids)) for bar in old_bars]
+    new_keys = [ids.setdefault(bar[1], len(ids)) for bar in new_bars]
+
+    changes = []
+    for op, i1, i2, j1, j2 in edit_script(old_keys, new_keys):
+        if op == 'equal':
+            continue
+        paired = min(i2 - i1, j2 - j1)
+        for offset in range(paired):
+            old, new = old_bars[i1 + offset], new_bars[j1 + offset]
+            changes.append({
+                'change': 'modified', 'old': old[0], 'new': new[0], 'after': None,
+                'categories': [name for name, a, b in zip(CATEGORIES, old[1], new[1]) if a != b],
+                'detail': event_changes(old[2], new[2]) if detail else [],
+            })
+        for i in range(i1 + paired, i2):
+            changes.append({'change': 'deleted', 'old': old_bars[i][0], 'new': None, 'after': None,
+                            'categories': [], 'detail': []})
+        after = old_bars[i2 - 1][0] if i2 else None
+        for j in range(j1 + paired, j2):
+            changes.append({'change': 'inserted', 'old': None, 'new': new_bars[j][0], 'after': after,
+                            'categories': [], 'detail': []})
+    return changes
+
+
+def diff_scores(old, new, detail=True):
+    """
+    Semantic diff of two read_score() results. Returns a dict: parts (one
+    dict per matched part: id, name, old_id, old_bars, new_bars, changes),
+    removed and added (unmatched old / new parts).
+    """
+    pairs, removed, added = match_parts(old, new)
+    parts = []
+    for old_part, new_part in pairs:
+        parts.append({
+            'id': new_part['id'],
+            'name': new_part['name'],
+            'old_id': old_part['id'],
+            'old_bars': len(old_part['bars']),
+            'new_bars': len(new_part['bars']),
+            'changes': diff_bars(old_part['bars'], new_part['bars'], detail),
+        })
+    return {'parts': parts, 'removed': removed, 'added': added}
+
+
+def format_diff(result, detail_lines=DETAIL_LINES):
+    """Report lines for a diff_scores() result"""
+    lines = []
+    for part in result['removed']:
+        lines.append(f"- part {part['id']} {part['name']}: removed ({len(part['bars'])} bars)")
+    for part in result['added']:
+        lines.append(f"+ part {part['id']} {part['name']}: added ({len(part['bars'])} bars)")
+    for part in result['parts']:
+        changes = part['changes']
+        if not changes:
+            continue
+        counts = {kind: sum(1 for c in changes if c['change'] == kind)
+                  for kind in ('modified', 'inserted', 'deleted')}
+        summary = ', '.join(f"{count} {kind}" for kind, count in counts.items() if count)
+        renamed = f" (was {part['old_id']})" if part['old_id'] != part['id'] else ""
+        lines.append(f"{part['id']} {part['name']}{renamed}: {summary} "
+                     f"({part['old_bars']} -> {part['new_bars']} bars)")
+        for change in changes:
+            if change['change'] == 'modified':
+                where = f"m. {change['old']}"
+                if change['new'] != change['old']:
+                    where += f" -> m. {change['new']}"
+                lines.append(f"    ~ {where}: {', '.join(change['categories'])}")
+                shown = change['detail'][:detail_lines]
+                lines.extend(f"        {line}" for line in shown)
+                if len(change['detail']) > len(shown):
+                    lines.append(f"        ... and {len(change['detail']) - len(shown)} more")
+            elif change['change'] == 'deleted':
+                lines.append(f"    - m. {change['old']}: deleted")
+            else:
+                after = f"after old m. {change['after']}" if change['after'] is not None else "at the start"
+                lines.append(f"    + m. {change['new']}: inserted {after}")
+    return lines
+
+
+def main():
+    args = sys.argv[1:]
+    detail_lines = DETAIL_LINES
+    paths = []
+    skip = False
+    for i, arg in enumerate(args):
+        if skip:
+            skip = False
+        elif arg == '--detail' and i + 1 < len(args):
+            detail_lines = int(args[i + 1])
+            skip = True
+        elif arg.startswith('--detail='):
+            detail_lines = int(arg.split('=', 1)[1])
+        elif not arg.startswith('--'):
+            paths.append(arg)
+    if len(paths) < 2:
+        print(__doc__)
+        return
+    detail = '--brief' not in args
+
+    print("=" * 60)
+    print("SCORE DIFF")
+    print("=" * 60)
+    differ = False
+    old = read_score(paths[0])
+    for old_path, new_path in zip(paths, paths[1:]):
+        new = read_score(new_path)
+        result = diff_scores(old, new, detail)
+        print(f"\n{Path(old_path).name} -> {Path(new_path).name}")
+        lines = format_diff(result, detail_lines)
+        if lines:
+            differ = True
+            bars = sum(len(part['changes']) for part in result['parts'])
+            print(f"  {bars} bar(s) changed in {len(result['parts'])} matched part(s)")
+            for line in lines:
+                print(f"  {line}")
+        else:
+            print("  Musical content identical")
+        old = new
+    if differ:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,523 @@
+#!/usr/bin/env python3
+"""
+BUFFERED SCORE WRITER
+=====================
+Append-only sink for the string-building generators.
+
+The generators build scores fragment by fragment (`m += note(...)`). With a
+plain str every += may copy everything written so far, which is quadratic in
+the score length. A ScoreWriter accepts the same `+=` (or write()) but only
+keeps a list of pending fragments:
+
+    out = ScoreWriter()              # in memory; out.finish() returns the text
+    out = ScoreWriter("score.xml")   # flushed to the file in chunks
+    out = ScoreWriter(parent)        # flushed into another writer / file object
+
+When the writer has a target, pending fragments are joined and written out
+every `flush_size` characters, so peak memory stays bounded by one chunk no
+matter how many parts and bars the score has.
+
+MeasureTemplates holds whole measure bodies for the per-part movement
+generators. A body is keyed on the generator inputs it depends on (the
+movement, which branch of the notes the bar takes, whether the bar carries
+marks of its own, clef, first part or not) and rendered, notes included,
+once per run; repeated bars of a part and tacet bars are then reused without
+running the note helpers again. The bar
+number goes into the <measure> tag and the part id into the <part> tag, both
+formatted when the measure is emitted.
+
+write_if_changed() skips rewriting a file whose content is already current,
+so regeneration loops leave unchanged scores (and their mtimes) alone.
+stream_if_changed() does the same for generators that write into a
+ScoreWriter: the score is streamed to a scratch file and only moved over the
+target when it differs.
+
+write_tree() serializes a parsed ElementTree as indented MusicXML straight
+into a ScoreWriter on the output file, declaration and DOCTYPE included. It
+replaces the tostring() -> minidom.parseString() -> toprettyxml() round trip,
+which held the score in memory about four times over; here only the tree
+and one flush chunk are resident. Whitespace-only text and tails left over
+from a previously indented file are dropped and the score is re-indented.
+
+Output modes
+------------
+Every score writer here (ScoreWriter on a path, write_tree, write_score,
+write_if_changed) follows the process-wide OUTPUT mode:
+
+    --compact      no indentation or line breaks between tags
+    --mxl          compressed MusicXML: foo.musicxml is written as foo.mxl,
+                   a zip with mimetype, META-INF/container.xml and the score
+
+configure_output(sys.argv[1:]) applies the flags in a script's main(); the
+SCORE_OUTPUT environment variable ("compact", "mxl" or "compact,mxl") sets
+them for every script in a pipeline. The writers return the path actually
+written. Compact output is meant for delivered files: the PatchSet version
+generators (generate_v12_5 ... build_version_chain) match indented text and
+need indented inputs.
+
+The loaders (parse_score, open_score_source, read_score_text) read .mxl
+transparently, streaming the root file out of the zip, and fall back to the
+.mxl sibling when only the compressed form of a .musicxml path exists.
+"""
+
+import hashlib
+import io
+import os
+import re
+import xml.etree.ElementTree as ET
+import zipfile
+
+DEFAULT_FLUSH_SIZE = 1 << 16
+
+MXL_MIMETYPE = 'application/vnd.recordare.musicxml'
+MXL_CONTAINER = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<container>\n'
+    '  <rootfiles>\n'
+    '    <rootfile full-path="{name}" media-type="application/vnd.recordare.musicxml+xml"/>\n'
+    '  </rootfiles>\n'
+    '</container>\n'
+)
+
+MUSICXML_DOCTYPE = ('<!DOCTYPE score-partwise PUBLIC "-//Recordare//DTD MusicXML 3.1 Partwise//EN" '
+                    '"http://www.musicxml.org/dtds/partwise.dtd">')
+
+
+def _output_from_env():
+    flags = re.split(r'[\s,]+', os.environ.get('SCORE_OUTPUT', '').lower())
+    return {'compact': 'compact' in flags, 'mxl': 'mxl' in flags}
+
+
+# Process-wide output mode, see configure_output()
+OUTPUT = _output_from_env()
+
+# Command-line flags configure_output() understands
+OUTPUT_FLAGS = ('--compact', '--mxl')
+
+
+def configure_output(args):
+    """
+    Apply --compact / --mxl from a command line to every writer in the process.
+
+    The mode is also exported through SCORE_OUTPUT so scripts run from this
+    one write the same way.
+    """
+    if '--compact' in args:
+        OUTPUT['compact'] = True
+    if '--mxl' in args:
+        OUTPUT['mxl'] = True
+    os.environ['SCORE_OUTPUT'] = ','.join(flag for flag in ('compact', 'mxl') if OUTPUT[flag])
+    return OUTPUT
+
+
+def is_mxl(path):
+    return os.fsdecode(path).lower().endswith('.mxl')
+
+
+def _with_extension(path, ext):
+    if hasattr(path, 'with_suffix'):
+        return path.with_suffix(ext)
+    return os.path.splitext(os.fsdecode(path))[0] + ext
+
+
+def output_path(path):
+    """Path a score meant for `path` is written to under the current mode."""
+    if OUTPUT['mxl'] and not is_mxl(path):
+        return _with_extension(path, '.mxl')
+    return path
+
+
+def resolve_score(path):
+    """path itself, or its .mxl sibling when only the compressed score exists."""
+    if not os.path.exists(path) and not is_mxl(path):
+        sibling = _with_extension(path, '.mxl')
+        if os.path.exists(sibling):
+            return sibling
+    return path
+
+
+class MeasureTemplates:
+    """Measure bodies rendered once per key, emitted with their bar number."""
+
+    def __init__(self):
+        self.bodies = {}
+
+    def measure(self, number, key, render, *args):
+        """<measure number=...> around the body for key (render(*args) on first use)."""
+        body = self.bodies.get(key)
+        if body is None:
+            body = self.bodies[key] = render(*args)
+        return f'    <measure number="{number}">\n{body}    </measure>\n'
+
+
+class _CompactFile:
+    """
+    Text sink that drops whitespace between tags before passing text on.
+
+    Only whitespace laid out between tags is dropped; whitespace that is the
+    whole text of an element (`<words> </words>`) is kept.
+    """
+
+    # A complete tag, the whitespace after it and the start of the next tag
+    _BETWEEN_TAGS = re.compile(r'(<([/?!]?)[^<>]*?(/?)>)\s+(?=<(/?))')
+
+    def __init__(self, target):
+        self.target = target
+        # Text from the start of the last tag on, held back until the
+        # character after the next '<' is seen
+        self._carry = ''
+
+    @staticmethod
+    def _layout(match):
+        start_tag = not match.group(2) and not match.group(3)
+        if start_tag and match.group(4):
+            return match.group(0)
+        return match.group(1)
+
+    @classmethod
+    def squeeze(cls, text):
+        return cls._BETWEEN_TAGS.sub(cls._layout, text)
+
+    def write(self, text):
+        text = self._carry + text
+        cut = text.rfind('<', 0, len(text) - 1)
+        if cut <= 0:
+            self._carry = text
+            return
+        # Removed whitespace always ends before a '<', so the two characters
+        # from the cut on come back unchanged
+        self.target.write(self.squeeze(text[:cut + 2])[:-2])
+        self._carry = text[cut:]
+
+    def close(self):
+        self.target.write(self.squeeze(self._carry).rstrip())
+        self._carry = ''
+        self.target.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+class _MxlFile:
+    """Text sink writing the root file of a compressed MusicXML (.mxl) archive."""
+
+    def __init__(self, path):
+        self.archive = zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED)
+        # mimetype comes first and uncompressed, as in ODF / EPUB containers
+        self.archive.writestr('mimetype', MXL_MIMETYPE, compress_type=zipfile.ZIP_STORED)
+        name = os.path.splitext(os.path.basename(path))[0] + '.musicxml'
+        self.archive.writestr('META-INF/container.xml', MXL_CONTAINER.format(name=_escape_attrib(name)))
+        self._text = io.TextIOWrapper(self.archive.open(name, 'w'), encoding='utf-8')
+
+    def write(self, text):
+        self._text.write(text)
+
+    def close(self):
+        self._text.close()
+        self.archive.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+
+def open_score(path, compact=None):
+    """
+    Text file object for writing a score to `path` as given.
+
+    .mxl paths are written as a compressed MusicXML archive; compact (by
+    default the OUTPUT mode) removes the whitespace between tags.
+    """
+    if compact is None:
+        compact = OUTPUT['compact']
+    target = _MxlFile(path) if is_mxl(path) else open(path, 'w', encoding='utf-8')
+    return _CompactFile(target) if compact else target
+
+
+class ScoreWriter:
+    """Buffered MusicXML sink supporting `writer += fragment`."""
+
+    def __init__(self, target=None, flush_size=DEFAULT_FLUSH_SIZE):
+        self._owns_file = isinstance(target, str) or hasattr(target, '__fspath__')
+        self.path = None
+        if self._owns_file:
+            self.path = output_path(target)
+            target = open_score(self.path)
+        self.target = target
+        self.flush_size = flush_size
+        self.chars_written = 0
+        self._pending = []
+        self._pending_size = 0
+
+    def write(self, fragment):
+        self._pending.append(fragment)
+        self._pending_size += len(fragment)
+        self.chars_written += len(fragment)
+        if self.target is not None and self._pending_size >= self.flush_size:
+            self.flush()
+
+    def __iadd__(self, fragment):
+        self.write(fragment)
+        return self
+
+    def flush(self):
+        """Hand pending fragments to the target as one chunk."""
+        if self.target is None or not self._pending:
+            return
+        self.target.write(''.join(self._pending))
+        self._pending = []
+        self._pending_size = 0
+
+    def getvalue(self):
+        """Everything written so far (in-memory writers only)."""
+        if self.target is not None:
+            raise ValueError("getvalue() is only available on in-memory ScoreWriters")
+        text = ''.join(self._pending)
+        self._pending = [text]
+        return text
+
+    def finish(self):
+        """
+        Flush everything and release an owned file.
+
+        Returns the complete text for in-memory writers, None otherwise, so a
+        generator can `return out.finish()` in both modes.
+        """
+        if self.target is None:
+            return self.getvalue()
+        self.flush()
+        if self._owns_file:
+            self.target.close()
+        return None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.finish()
+
+
+def content_digest(text):
+    """Stable digest of a generated document, used to detect unchanged output."""
+    return hashlib.sha1(text.encode('utf-8')).hexdigest()
+
+
+def compact_text(text):
+    """A generated score with the whitespace between tags removed."""
+    return _CompactFile.squeeze(text).strip()
+
+
+def write_score(filepath, text):
+    """Write a generated score under the current output mode; returns the path written."""
+    path = output_path(filepath)
+    with open_score(path) as f:
+        f.write(text)
+    return path
+
+
+def write_if_changed(filepath, text):
+    """
+    Write a score to filepath (under the current output mode) unless the file
+    already holds exactly that content.
+
+    Returns True if the file was written, False if the write was skipped.
+    """
+    path = output_path(filepath)
+    if OUTPUT['compact']:
+        text = compact_text(text)
+    if os.path.exists(path):
+        try:
+            if read_score_text(path) == text:
+                return False
+        except (UnicodeDecodeError, zipfile.BadZipFile, KeyError):
+            pass
+    with open_score(path, compact=False) as f:
+        f.write(text)
+    return True
+
+
+def _same_score(path, other, chunk_size=DEFAULT_FLUSH_SIZE):
+    """True if two score files hold the same XML, compared chunk by chunk."""
+    with open_score_source(path) as a, open_score_source(other) as b:
+        while True:
+            chunk = a.read(chunk_size)
+            if chunk != b.read(chunk_size):
+                return False
+            if not chunk:
+                return True
+
+
+def stream_if_changed(filepath, generate):
+    """
+    write_if_changed() for a generator that writes into a ScoreWriter.
+
+    generate(out) streams the score into a scratch file next to the target,
+    so the text is never held in memory whole; the scratch file then replaces
+    the target, or is dropped when the target already holds the same score.
+
+    Returns (path, written): the path under the current output mode and
+    whether it was rewritten.
+    """
+    path = output_path(filepath)
+    head, name = os.path.split(os.fsdecode(path))
+    # Same extension as the target, so .mxl output stays an archive
+    scratch = os.path.join(head, '.~' + name)
+    try:
+        with ScoreWriter(scratch) as out:
+            generate(out)
+        if os.path.exists(path):
+            try:
+                if _same_score(path, scratch):
+                    os.remove(scratch)
+                    return path, False
+            except (zipfile.BadZipFile, KeyError):
+                pass
+        os.replace(scratch, path)
+    except BaseException:
+        if os.path.exists(scratch):
+            os.remove(scratch)
+        raise
+    return path, True
+
+
+# ============ LOADING ============
+
+def mxl_rootfile(archive):
+    """Name of the score inside an .mxl archive (from META-INF/container.xml)."""
+    try:
+        with archive.open('META-INF/container.xml') as f:
+            rootfile = ET.parse(f).getroot().find('.//rootfile')
+        if rootfile is not None and rootfile.get('full-path'):
+            return rootfile.get('full-path')
+    except KeyError:
+        pass
+    for name in archive.namelist():
+        if not name.startswith('META-INF/') and name.endswith(('.musicxml', '.xml')):
+            return name
+    raise KeyError(f"{archive.filename}: no MusicXML root file")
+
+
+def open_score_source(path):
+    """Binary file object of a score's XML; .mxl archives are streamed from the zip."""
+    path = resolve_score(path)
+    if not is_mxl(path):
+        return open(path, 'rb')
+    archive = zipfile.ZipFile(path)
+    source = archive.open(mxl_rootfile(archive))
+    # The member keeps the archive's file open until it is closed itself
+    archive.close()
+    return source
+
+
+def parse_score(path):
+    """ET.parse() that also reads .mxl archives."""
+    with open_score_source(path) as f:
+        return ET.parse(f)
+
+
+def read_score_text(path):
+    """The XML text of a .musicxml or .mxl score."""
+    with open_score_source(path) as f:
+        return f.read().decode('utf-8')
+
+
+# Namespaces a MusicXML file can use; the xml: prefix needs no declaration
+_PREFIXES = {
+    'http://www.w3.org/XML/1998/namespace': 'xml',
+    'http://www.w3.org/1999/xlink': 'xlink',
+}
+
+
+def _qname(name, declare):
+    """'{uri}local' -> 'prefix:local', noting prefixes that need an xmlns on this element."""
+    if name[:1] != '{':
+        return name
+    uri, local = name[1:].split('}', 1)
+    prefix = declare.get(uri) or _PREFIXES.get(uri) or f"ns{len(declare)}"
+    if prefix != 'xml':
+        declare[uri] = prefix
+    return f"{prefix}:{local}"
+
+
+def _escape_text(text):
+    if '&' in text:
+        text = text.replace('&', '&amp;')
+    if '<' in text:
+        text = text.replace('<', '&lt;')
+    if '>' in text:
+        text = text.replace('>', '&gt;')
+    return text
+
+
+def _escape_attrib(value):
+    value = _escape_text(value)
+    if '"' in value:
+        value = value.replace('"', '&quot;')
+    if '\n' in value:
+        value = value.replace('\n', '&#10;')
+    return value
+
+
+def _write_element(out, elem, depth, indent, newline):
+    pad = indent * depth
+    tag = elem.tag
+    if not isinstance(tag, str):
+        # Comments / processing instructions (only present with a custom parser)
+        if tag is ET.Comment:
+            out.write(f"{pad}<!--{elem.text or ''}-->{newline}")
+        elif tag is ET.ProcessingInstruction:
+            out.write(f"{pad}<?{elem.text or ''}?>{newline}")
+        return
+    declare = {}
+    tag = _qname(tag, declare)
+    attrs = ''.join(f' {_qname(key, declare)}="{_escape_attrib(str(value))}"'
+                    for key, value in elem.attrib.items())
+    if declare:
+        attrs += ''.join(f' xmlns:{prefix}="{uri}"' for uri, prefix in declare.items())
+    start = f"{pad}<{tag}{attrs}"
+    text = elem.text
+    if len(elem):
+        out.write(f"{start}>{newline}")
+        if text and text.strip():
+            out.write(f"{pad}{indent}{_escape_text(text.strip())}{newline}")
+        for child in elem:
+            _write_element(out, child, depth + 1, indent, newline)
+            tail = child.tail
+            if tail and tail.strip():
+                out.write(f"{pad}{indent}{_escape_text(tail.strip())}{newline}")
+        out.write(f"{pad}</{tag}>{newline}")
+    elif text:
+        out.write(f"{start}>{_escape_text(text)}</{tag}>{newline}")
+    else:
+        out.write(f"{start}/>{newline}")
+
+
+def write_tree(tree, filepath, indent="  ", doctype=MUSICXML_DOCTYPE):
+    """
+    Stream an ElementTree (or root Element) to a score file.
+
+    Writes the XML declaration and, unless doctype is None, the MusicXML
+    partwise DOCTYPE, then the tree indented by `indent`; indent=None keeps
+    the tree's own whitespace (plain ElementTree serialization). Compact and
+    .mxl output follow the OUTPUT mode. Returns the path written.
+    """
+    root = tree.getroot() if isinstance(tree, ET.ElementTree) else tree
+    path = output_path(filepath)
+    compact = OUTPUT['compact']
+    newline = '' if compact else '\n'
+    with open_score(path, compact=False) as f, ScoreWriter(f) as out:
+        out.write('<?xml version="1.0" encoding="UTF-8"?>' + newline)
+        if doctype:
+            out.write(doctype + newline)
+        if compact:
+            _write_element(out, root, 0, '', '')
+        elif indent is None:
+            ET.ElementTree(root).write(out, encoding='unicode')
+        else:
+            _write_element(out, root, 0, indent, newline)
+    return path
@@ -2,9 +2,16 @@
 """
 SUITE ENGRAVING ENGINE — MASTER PROMPT
 Professional engraving polish for Final-Suite-FullScore.musicxml
+
+Usage: python scripts/suite_engraving_engine.py [--jobs N]   (N worker processes, 0 = one per CPU)
 """
 
 import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+from job_pool import parse_jobs
+from score_writer import MeasureTemplates, configure_output, write_score
 
 # ============ UTILITIES ============
 def note(step, octave, duration, ntype, alter=None, voice=1, staff=1, 
@@ -125,6 +132,11 @@ def movement_title(number, title):
         </direction>
 '''
 
+# Whole-bar rest of a tacet bar, rendered once
+TACET = rest(1024, "whole")
+# Measure bodies rendered once per run and shared by every part that needs them
+MEASURES = MeasureTemplates()
+
 # ============ FULL SCORE HEADER WITH ENHANCED ENGRAVING ============
 def engraved_header():
     return '''<?xml version="1.0" encoding="UTF-8"?>
@@ -274,523 +286,876 @@ def part_footer():
 
 # ============ MOVEMENT GENERATORS WITH ENHANCED ENGRAVING ============
 
+# Bars whose opening or closing marks differ from a plain bar
+_MOVEMENT1_MARKED_BARS = (1, 5, 9, 11, 12)
+
+def _movement1_notes(part_id, bar):
+    """Notes of one bar of a part (TACET for a whole-bar rest)."""
+    content = ""
+    # Part content with enhanced engraving
+    if part_id == "P1":
+        if bar in [1, 5, 9]:
+            content += note("G", 5, 256, "quarter", slur_s=True, acc=True)
+            content += note("B", 5, 256, "quarter", alter=-1)
+            content += note("D", 6, 256, "quarter")
+            content += note("E", 5, 256, "quarter", alter=-1, slur_e=True)
+        else:
+            return TACET
+    elif part_id == "P2":
+        if bar in [2, 6, 10]:
+            content += note("D", 5, 256, "quarter", slur_s=True)
+            content += note("F", 5, 256, "quarter")
+            content += note("A", 5, 256, "quarter", alter=-1)
+            content += note("C", 6, 256, "quarter", slur_e=True)
+        else:
+            return TACET
+    elif part_id == "P3":
+        if bar in [1, 2, 5, 6, 9, 10]:
+            content += note("C", 4, 256, "quarter", slur_s=True, acc=True)
+            content += note("E", 4, 256, "quarter", alter=-1, acc=True)
+            content += note("F", 4, 256, "quarter", acc=True)
+            content += note("B", 4, 256, "quarter", alter=-1, slur_e=True)
+        else:
+            return TACET
+    elif part_id == "P4":
+        if bar in [3, 4, 7, 8, 11, 12]:
+            content += note("C", 5, 256, "quarter", slur_s=True, acc=True)
+            content += note("E", 5, 256, "quarter", alter=-1, acc=True)
+            content += note("G", 5, 256, "quarter", acc=True)
+            content += note("B", 5, 256, "quarter", alter=-1, slur_e=True)
+        else:
+            return TACET
+    elif part_id == "P5":
+        if bar % 2 == 0:
+            content += note("E", 4, 512, "half", alter=-1, slur_s=True)
+            content += note("G", 4, 512, "half", slur_e=True)
+        else:
+            return TACET
+    elif part_id == "P6":
+        content += note("G", 3, 512, "half", slur_s=True)
+        content += note("B", 3, 512, "half", alter=-1, slur_e=True)
+    elif part_id == "P7":
+        content += note("C", 3, 256, "quarter", slur_s=True)
+        content += note("G", 3, 256, "quarter", chord=True)
+        content += note("E", 3, 256, "quarter", alter=-1)
+        content += note("B", 3, 256, "quarter", alter=-1, chord=True)
+        content += note("G", 3, 512, "half", slur_e=True)
+    elif part_id == "P8":
+        content += note("C", 2, 512, "half")
+        content += note("G", 2, 256, "quarter")
+        content += note("C", 2, 256, "quarter")
+    elif part_id == "P9":
+        content += note("C", 3, 256, "quarter")
+        content += note("F", 3, 256, "quarter", chord=True)
+        content += note("B", 3, 256, "quarter", alter=-1, chord=True)
+        content += rest(768, "half", dot=True)
+    elif part_id == "P10":
+        if bar in [1, 5, 9]:
+            content += note("C", 6, 256, "quarter", acc=True)
+            content += rest(768, "half", dot=True)
+        elif bar == 12:
+            content += rest(768, "half", dot=True)
+            content += note("C", 6, 256, "quarter", ferm=True)
+        else:
+            return TACET
+    return content
+
+def _movement1_role(part_id, bar):
+    """Branch of _movement1_notes() a bar of a part takes (None for TACET); keep in step with it."""
+    # Part content with enhanced engraving
+    if part_id == "P1":
+        if bar in [1, 5, 9]:
+            return 1
+        else:
+            return None
+    elif part_id == "P2":
+        if bar in [2, 6, 10]:
+            return 2
+        else:
+            return None
+    elif part_id == "P3":
+        if bar in [1, 2, 5, 6, 9, 10]:
+            return 3
+        else:
+            return None
+    elif part_id == "P4":
+        if bar in [3, 4, 7, 8, 11, 12]:
+            return 4
+        else:
+            return None
+    elif part_id == "P5":
+        if bar % 2 == 0:
+            return 5
+        else:
+            return None
+    elif part_id == "P6":
+        return 6
+    elif part_id == "P7":
+        return 7
+    elif part_id == "P8":
+        return 8
+    elif part_id == "P9":
+        return 9
+    elif part_id == "P10":
+        if bar in [1, 5, 9]:
+            return 10
+        elif bar == 12:
+            return 11
+        else:
+            return None
+    return 0
+
+def _movement1_measure(part_id, bar, first_part, clef_sign, clef_line):
+    """Body of one bar: opening marks, the notes, closing marks."""
+    content = ""
+    if bar == 1:
+        content += measure_attrs(256, -3, 4, 4, clef_sign, clef_line, new_page=True)
+        if first_part:
+            content += movement_title("I", "Mingus Blues Cathedral")
+            content += rehearsal_mark("A")
+            content += direction("Slow gospel blues, with fire", tempo=54, default_y=80)
+        content += direction(dynamic="mf", placement="below", default_y=-80)
+        content += harmony("C", "minor", [(9, 0, "add"), (11, 0, "add"), (13, 0, "add")])
+    elif bar == 5:
+        if first_part:
+            content += rehearsal_mark("B")
+        content += direction(dynamic="f", placement="below", default_y=-80)
+    elif bar == 9:
+        if first_part:
+            content += rehearsal_mark("C")
+            content += direction("Brighter", default_y=60)
+    content += _movement1_notes(part_id, bar)
+    if bar == 11 and first_part:
+        content += direction("rit.", default_y=60)
+    if bar == 12:
+        content += barline()
+    return content
+
 def gen_movement1_engraved(part_id, clef_sign, clef_line):
     content = ""
+    first_part = part_id == "P1"
     for bar in range(1, 13):
-        content += f'    <measure number="{bar}">\n'
-        
-        if bar == 1:
-            content += measure_attrs(256, -3, 4, 4, clef_sign, clef_line, new_page=True)
-            if part_id == "P1":
-                content += movement_title("I", "Mingus Blues Cathedral")
-                content += rehearsal_mark("A")
-                content += direction("Slow gospel blues, with fire", tempo=54, default_y=80)
-            content += direction(dynamic="mf", placement="below", default_y=-80)
-            content += harmony("C", "minor", [(9, 0, "add"), (11, 0, "add"), (13, 0, "add")])
-        elif bar == 5:
-            if part_id == "P1":
-                content += rehearsal_mark("B")
-            content += direction(dynamic="f", placement="below", default_y=-80)
-        elif bar == 9:
-            if part_id == "P1":
-                content += rehearsal_mark("C")
-                content += direction("Brighter", default_y=60)
-        
-        # Part content with enhanced engraving
-        if part_id == "P1":
-            if bar in [1, 5, 9]:
-                content += note("G", 5, 256, "quarter", slur_s=True, acc=True)
-                content += note("B", 5, 256, "quarter", alter=-1)
-                content += note("D", 6, 256, "quarter")
-                content += note("E", 5, 256, "quarter", alter=-1, slur_e=True)
-            else:
-                content += rest(1024, "whole")
-        elif part_id == "P2":
-            if bar in [2, 6, 10]:
-                content += note("D", 5, 256, "quarter", slur_s=True)
-                content += note("F", 5, 256, "quarter")
-                content += note("A", 5, 256, "quarter", alter=-1)
-                content += note("C", 6, 256, "quarter", slur_e=True)
-            else:
-                content += rest(1024, "whole")
-        elif part_id == "P3":
-            if bar in [1, 2, 5, 6, 9, 10]:
-                content += note("C", 4, 256, "quarter", slur_s=True, acc=True)
-                content += note("E", 4, 256, "quarter", alter=-1, acc=True)
-                content += note("F", 4, 256, "quarter", acc=True)
-                content += note("B", 4, 256, "quarter", alter=-1, slur_e=True)
-            else:
-                content += rest(1024, "whole")
-        elif part_id == "P4":
-            if bar in [3, 4, 7, 8, 11, 12]:
-                content += note("C", 5, 256, "quarter", slur_s=True, acc=True)
-                content += note("E", 5, 256, "quarter", alter=-1, acc=True)
-                content += note("G", 5, 256, "quarter", acc=True)
-                content += note("B", 5, 256, "quarter", alter=-1, slur_e=True)
-            else:
-                content += rest(1024, "whole")
-        elif part_id == "P5":
-            if bar % 2 == 0:
-                content += note("E", 4, 512, "half", alter=-1, slur_s=True)
-                content += note("G", 4, 512, "half", slur_e=True)
-            else:
-                content += rest(1024, "whole")
-        elif part_id == "P6":
-            content += note("G", 3, 512, "half", slur_s=True)
-            content += note("B", 3, 512, "half", alter=-1, slur_e=True)
-        elif part_id == "P7":
-            content += note("C", 3, 256, "quarter", slur_s=True)
-            content += note("G", 3, 256, "quarter", chord=True)
-            content += note("E", 3, 256, "quarter", alter=-1)
-            content += note("B", 3, 256, "quarter", alter=-1, chord=True)
-            content += note("G", 3, 512, "half", slur_e=True)
-        elif part_id == "P8":
-            content += note("C", 2, 512, "half")
-            content += note("G", 2, 256, "quarter")
-            content += note("C", 2, 256, "quarter")
-        elif part_id == "P9":
-            content += note("C", 3, 256, "quarter")
-            content += note("F", 3, 256, "quarter", chord=True)
-            content += note("B", 3, 256, "quarter", alter=-1, chord=True)
+        marks = bar if bar in _MOVEMENT1_MARKED_BARS else 0
+        key = (1, _movement1_role(part_id, bar), marks, first_part, clef_sign, clef_line)
+        content += MEASURES.measure(bar, key, _movement1_measure,
+                                    part_id, bar, first_part, clef_sign, clef_line)
+    return content
+
+# Bars whose opening or closing marks differ from a plain bar
+_MOVEMENT2_MARKED_BARS = (1, 5, 9, 11, 12)
+
+def _movement2_notes(part_id, bar):
+    """Notes of one bar of a part (TACET for a whole-bar rest)."""
+    content = ""
+    if part_id == "P1":
+        if bar in [1, 3, 5, 7, 9, 11]:
+            content += note("B", 6, 512, "half", slur_s=True, harmonic=True)
+            content += note("F", 6, 512, "half", alter=1, slur_e=True)
+        else:
+            return TACET
+    elif part_id == "P2":
+        if bar % 2 == 0:
+            content += note("G", 4, 256, "quarter", slur_s=True)
+            content += note("A", 4, 256, "quarter")
+            content += note("B", 4, 256, "quarter")
+            content += note("F", 5, 256, "quarter", alter=1, slur_e=True)
+        else:
+            return TACET
+    elif part_id == "P3":
+        if bar in [2, 4, 6, 8, 10]:
+            content += note("E", 4, 512, "half", slur_s=True)
+            content += note("G", 4, 512, "half", alter=1, slur_e=True)
+        else:
+            return TACET
+    elif part_id == "P4":
+        if bar in [1, 3, 5, 7, 9, 11]:
+            content += note("G", 4, 256, "quarter", slur_s=True)
+            content += note("A", 4, 256, "quarter")
+            content += note("B", 4, 256, "quarter")
+            content += note("F", 5, 256, "quarter", alter=1, slur_e=True)
+        else:
+            content += note("E", 5, 512, "half", slur_s=True)
+            content += note("D", 5, 512, "half", slur_e=True)
+    elif part_id == "P5":
+        content += note("B", 4, 1024, "whole", slur_s=True, slur_e=True)
+    elif part_id == "P6":
+        content += note("G", 3, 1024, "whole", alter=1, slur_s=True, slur_e=True)
+    elif part_id == "P7":
+        content += note("E", 3, 1024, "whole", slur_s=True, slur_e=True)
+    elif part_id == "P8":
+        content += note("E", 2, 1024, "whole")
+    elif part_id == "P9":
+        content += note("E", 3, 256, "quarter")
+        content += note("G", 3, 256, "quarter", alter=1, chord=True)
+        content += note("B", 3, 256, "quarter", chord=True)
+        content += rest(768, "half", dot=True)
+    elif part_id == "P10":
+        if bar in [4, 8]:
+            content += note("F", 6, 256, "quarter", alter=1)
             content += rest(768, "half", dot=True)
-        elif part_id == "P10":
-            if bar in [1, 5, 9]:
-                content += note("C", 6, 256, "quarter", acc=True)
-                content += rest(768, "half", dot=True)
-            elif bar == 12:
-                content += rest(768, "half", dot=True)
-                content += note("C", 6, 256, "quarter", ferm=True)
-            else:
-                content += rest(1024, "whole")
-        
-        if bar == 11 and part_id == "P1":
-            content += direction("rit.", default_y=60)
-        if bar == 12:
-            content += barline()
-        
-        content += '    </measure>\n'
+        elif bar == 12:
+            content += note("E", 6, 1024, "whole", ferm=True)
+        else:
+            return TACET
+    return content
+
+def _movement2_role(part_id, bar):
+    """Branch of _movement2_notes() a bar of a part takes (None for TACET); keep in step with it."""
+    if part_id == "P1":
+        if bar in [1, 3, 5, 7, 9, 11]:
+            return 1
+        else:
+            return None
+    elif part_id == "P2":
+        if bar % 2 == 0:
+            return 2
+        else:
+            return None
+    elif part_id == "P3":
+        if bar in [2, 4, 6, 8, 10]:
+            return 3
+        else:
+            return None
+    elif part_id == "P4":
+        if bar in [1, 3, 5, 7, 9, 11]:
+            return 4
+        else:
+            return 5
+    elif part_id == "P5":
+        return 6
+    elif part_id == "P6":
+        return 7
+    elif part_id == "P7":
+        return 8
+    elif part_id == "P8":
+        return 9
+    elif part_id == "P9":
+        return 10
+    elif part_id == "P10":
+        if bar in [4, 8]:
+            return 11
+        elif bar == 12:
+            return 12
+        else:
+            return None
+    return 0
+
+def _movement2_measure(part_id, bar, first_part, clef_sign, clef_line):
+    """Body of one bar: opening marks, the notes, closing marks."""
+    content = ""
+    if bar == 1:
+        content += measure_attrs(256, 0, 4, 4, clef_sign, clef_line, new_page=True)
+        if first_part:
+            content += movement_title("II", "Gil's Canvas")
+            content += rehearsal_mark("D")
+            content += direction("Floating, pastel clouds", tempo=58, default_y=80)
+        content += direction(dynamic="pp", placement="below", default_y=-80)
+        content += harmony("E", "major-seventh", [(9, 0, "add"), (11, 1, "add")])
+    elif bar == 5:
+        if first_part:
+            content += rehearsal_mark("E")
+    elif bar == 9:
+        if first_part:
+            content += rehearsal_mark("F")
+        content += direction(dynamic="p", placement="below", default_y=-80)
+    content += _movement2_notes(part_id, bar)
+    if bar == 11 and first_part:
+        content += direction("rit.", default_y=60)
+    if bar == 12:
+        content += barline()
     return content
 
 def gen_movement2_engraved(part_id, clef_sign, clef_line):
     content = ""
+    first_part = part_id == "P1"
     for bar in range(1, 13):
-        content += f'    <measure number="{bar}">\n'
-        
-        if bar == 1:
-            content += measure_attrs(256, 0, 4, 4, clef_sign, clef_line, new_page=True)
-            if part_id == "P1":
-                content += movement_title("II", "Gil's Canvas")
-                content += rehearsal_mark("D")
-                content += direction("Floating, pastel clouds", tempo=58, default_y=80)
-            content += direction(dynamic="pp", placement="below", default_y=-80)
-            content += harmony("E", "major-seventh", [(9, 0, "add"), (11, 1, "add")])
-        elif bar == 5:
-            if part_id == "P1":
-                content += rehearsal_mark("E")
-        elif bar == 9:
-            if part_id == "P1":
-                content += rehearsal_mark("F")
-            content += direction(dynamic="p", placement="below", default_y=-80)
-        
-        if part_id == "P1":
-            if bar in [1, 3, 5, 7, 9, 11]:
-                content += note("B", 6, 512, "half", slur_s=True, harmonic=True)
-                content += note("F", 6, 512, "half", alter=1, slur_e=True)
-            else:
-                content += rest(1024, "whole")
-        elif part_id == "P2":
-            if bar % 2 == 0:
-                content += note("G", 4, 256, "quarter", slur_s=True)
-                content += note("A", 4, 256, "quarter")
-                content += note("B", 4, 256, "quarter")
-                content += note("F", 5, 256, "quarter", alter=1, slur_e=True)
-            else:
-                content += rest(1024, "whole")
-        elif part_id == "P3":
-            if bar in [2, 4, 6, 8, 10]:
-                content += note("E", 4, 512, "half", slur_s=True)
-                content += note("G", 4, 512, "half", alter=1, slur_e=True)
-            else:
-                content += rest(1024, "whole")
-        elif part_id == "P4":
-            if bar in [1, 3, 5, 7, 9, 11]:
-                content += note("G", 4, 256, "quarter", slur_s=True)
-                content += note("A", 4, 256, "quarter")
-                content += note("B", 4, 256, "quarter")
-                content += note("F", 5, 256, "quarter", alter=1, slur_e=True)
-            else:
-                content += note("E", 5, 512, "half", slur_s=True)
-                content += note("D", 5, 512, "half", slur_e=True)
-        elif part_id == "P5":
-            content += note("B", 4, 1024, "whole", slur_s=True, slur_e=True)
-        elif part_id == "P6":
-            content += note("G", 3, 1024, "whole", alter=1, slur_s=True, slur_e=True)
-        elif part_id == "P7":
-            content += note("E", 3, 1024, "whole", slur_s=True, slur_e=True)
-        elif part_id == "P8":
-            content += note("E", 2, 1024, "whole")
-        elif part_id == "P9":
-            content += note("E", 3, 256, "quarter")
-            content += note("G", 3, 256, "quarter", alter=1, chord=True)
-            content += note("B", 3, 256, "quarter", chord=True)
+        marks = bar if bar in _MOVEMENT2_MARKED_BARS else 0
+        key = (2, _movement2_role(part_id, bar), marks, first_part, clef_sign, clef_line)
+        content += MEASURES.measure(bar, key, _movement2_measure,
+                                    part_id, bar, first_part, clef_sign, clef_line)
+    return content
+
+# Bars whose opening or closing marks differ from a plain bar
+_MOVEMENT3_MARKED_BARS = (1, 5, 9, 11, 12)
+
+def _movement3_notes(part_id, bar):
+    """Notes of one bar of a part (TACET for a whole-bar rest)."""
+    content = ""
+    if part_id == "P1":
+        if bar in [2, 4, 6, 8, 10]:
+            content += rest(512, "half")
+            content += note("E", 7, 128, "eighth", stac=True, acc=True, harmonic=True)
+            content += note("F", 7, 128, "eighth", stac=True, harmonic=True)
+            content += rest(256, "quarter")
+        else:
+            return TACET
+    elif part_id == "P2":
+        if bar in [1, 3, 5, 7, 9, 11]:
+            content += note("B", 4, 128, "eighth", alter=-1, slur_s=True, stac=True, acc=True)
+            content += note("A", 4, 128, "eighth", chord=True)
+            content += rest(256, "quarter")
+            content += note("E", 5, 256, "quarter", acc=True)
+            content += note("F", 5, 256, "quarter", slur_e=True)
+        else:
+            return TACET
+    elif part_id == "P3":
+        if bar in [4, 8]:
+            content += rest(256, "quarter")
+            content += note("F", 4, 256, "quarter", slur_s=True, stac=True, acc=True)
+            content += note("B", 4, 256, "quarter")
+            content += note("E", 4, 256, "quarter", slur_e=True)
+        else:
+            return TACET
+    elif part_id == "P4":
+        if bar in [1, 3, 5, 7, 9, 11]:
+            content += note("A", 4, 256, "quarter", slur_s=True, acc=True)
+            content += note("B", 4, 128, "eighth", alter=-1, acc=True)
+            content += note("E", 5, 128, "eighth", acc=True)
+            content += note("B", 5, 256, "quarter")
+            content += note("F", 5, 256, "quarter", slur_e=True)
+        else:
+            return TACET
+    elif part_id == "P5":
+        if bar in [1, 3, 5, 7, 9, 11]:
+            content += note("A", 6, 256, "quarter", slur_s=True, stac=True, acc=True)
+            content += rest(256, "quarter")
+            content += note("B", 3, 256, "quarter", alter=-1, stac=True)
+            content += note("E", 4, 256, "quarter", slur_e=True)
+        else:
+            return TACET
+    elif part_id == "P6":
+        content += note("D", 4, 256, "quarter", slur_s=True, acc=True)
+        content += note("E", 4, 256, "quarter", alter=-1, chord=True)
+        content += note("G", 4, 256, "quarter", alter=1)
+        content += note("A", 4, 256, "quarter", slur_e=True)
+    elif part_id == "P7":
+        content += note("A", 2, 256, "quarter", slur_s=True, acc=True)
+        content += note("E", 3, 256, "quarter", chord=True)
+        content += note("B", 2, 256, "quarter", alter=-1)
+        content += note("A", 2, 512, "half", slur_e=True)
+    elif part_id == "P8":
+        if bar in [1, 5, 9]:
+            content += note("A", 1, 256, "quarter", acc=True, pizz=True)
+            content += rest(768, "half", dot=True)
+        else:
+            content += note("A", 1, 1024, "whole")
+    elif part_id == "P9":
+        if bar in [1, 3, 5, 7, 9, 11]:
+            content += note("A", 4, 256, "quarter", slur_s=True, harmonic=True, acc=True)
+            content += note("B", 4, 256, "quarter", alter=-1, harmonic=True)
+            content += note("E", 4, 256, "quarter", harmonic=True)
+            content += note("F", 4, 256, "quarter", harmonic=True, slur_e=True)
+        else:
+            return TACET
+    elif part_id == "P10":
+        if bar in [2, 6]:
             content += rest(768, "half", dot=True)
-        elif part_id == "P10":
-            if bar in [4, 8]:
-                content += note("F", 6, 256, "quarter", alter=1)
-                content += rest(768, "half", dot=True)
-            elif bar == 12:
-                content += note("E", 6, 1024, "whole", ferm=True)
-            else:
-                content += rest(1024, "whole")
-        
-        if bar == 11 and part_id == "P1":
-            content += direction("rit.", default_y=60)
-        if bar == 12:
-            content += barline()
-        
-        content += '    </measure>\n'
+            content += note("E", 7, 256, "quarter", stac=True, acc=True)
+        elif bar == 12:
+            content += note("A", 6, 1024, "whole", ferm=True)
+        else:
+            return TACET
+    return content
+
+def _movement3_role(part_id, bar):
+    """Branch of _movement3_notes() a bar of a part takes (None for TACET); keep in step with it."""
+    if part_id == "P1":
+        if bar in [2, 4, 6, 8, 10]:
+            return 1
+        else:
+            return None
+    elif part_id == "P2":
+        if bar in [1, 3, 5, 7, 9, 11]:
+            return 2
+        else:
+            return None
+    elif part_id == "P3":
+        if bar in [4, 8]:
+            return 3
+        else:
+            return None
+    elif part_id == "P4":
+        if bar in [1, 3, 5, 7, 9, 11]:
+            return 4
+        else:
+            return None
+    elif part_id == "P5":
+        if bar in [1, 3, 5, 7, 9, 11]:
+            return 5
+        else:
+            return None
+    elif part_id == "P6":
+        return 6
+    elif part_id == "P7":
+        return 7
+    elif part_id == "P8":
+        if bar in [1, 5, 9]:
+            return 8
+        else:
+            return 9
+    elif part_id == "P9":
+        if bar in [1, 3, 5, 7, 9, 11]:
+            return 10
+        else:
+            return None
+    elif part_id == "P10":
+        if bar in [2, 6]:
+            return 11
+        elif bar == 12:
+            return 12
+        else:
+            return None
+    return 0
+
+def _movement3_measure(part_id, bar, first_part, clef_sign, clef_line):
+    """Body of one bar: opening marks, the notes, closing marks."""
+    content = ""
+    if bar == 1:
+        content += measure_attrs(256, 0, 4, 4, clef_sign, clef_line, new_page=True)
+        if first_part:
+            content += movement_title("III", "Bartok Night")
+            content += rehearsal_mark("G")
+            content += direction("Molto misterioso, nocturnal", tempo=40, default_y=80)
+        content += direction(dynamic="ppp", placement="below", default_y=-80)
+        content += harmony("A", "minor", [(9, -1, "add"), (11, 0, "add")])
+    elif bar == 5:
+        if first_part:
+            content += rehearsal_mark("H")
+            content += direction("expanding", default_y=60)
+        content += direction(dynamic="pp", placement="below", default_y=-80)
+    elif bar == 9:
+        if first_part:
+            content += rehearsal_mark("I")
+            content += direction("dissolving", default_y=60)
+    content += _movement3_notes(part_id, bar)
+    if bar == 11 and first_part:
+        content += direction("rit., morendo", default_y=60)
+    if bar == 12:
+        content += barline()
     return content
 
 def gen_movement3_engraved(part_id, clef_sign, clef_line):
     content = ""
+    first_part = part_id == "P1"
     for bar in range(1, 13):
-        content += f'    <measure number="{bar}">\n'
-        
-        if bar == 1:
-            content += measure_attrs(256, 0, 4, 4, clef_sign, clef_line, new_page=True)
-            if part_id == "P1":
-                content += movement_title("III", "Bartok Night")
-                content += rehearsal_mark("G")
-                content += direction("Molto misterioso, nocturnal", tempo=40, default_y=80)
-            content += direction(dynamic="ppp", placement="below", default_y=-80)
-            content += harmony("A", "minor", [(9, -1, "add"), (11, 0, "add")])
-        elif bar == 5:
-            if part_id == "P1":
-                content += rehearsal_mark("H")
-                content += direction("expanding", default_y=60)
-            content += direction(dynamic="pp", placement="below", default_y=-80)
-        elif bar == 9:
-            if part_id == "P1":
-                content += rehearsal_mark("I")
-                content += direction("dissolving", default_y=60)
-        
-        if part_id == "P1":
-            if bar in [2, 4, 6, 8, 10]:
-                content += rest(512, "half")
-                content += note("E", 7, 128, "eighth", stac=True, acc=True, harmonic=True)
-                content += note("F", 7, 128, "eighth", stac=True, harmonic=True)
-                content += rest(256, "quarter")
-            else:
-                content += rest(1024, "whole")
-        elif part_id == "P2":
-            if bar in [1, 3, 5, 7, 9, 11]:
-                content += note("B", 4, 128, "eighth", alter=-1, slur_s=True, stac=True, acc=True)
-                content += note("A", 4, 128, "eighth", chord=True)
-                content += rest(256, "quarter")
-                content += note("E", 5, 256, "quarter", acc=True)
-                content += note("F", 5, 256, "quarter", slur_e=True)
-            else:
-                content += rest(1024, "whole")
-        elif part_id == "P3":
-            if bar in [4, 8]:
-                content += rest(256, "quarter")
-                content += note("F", 4, 256, "quarter", slur_s=True, stac=True, acc=True)
-                content += note("B", 4, 256, "quarter")
-                content += note("E", 4, 256, "quarter", slur_e=True)
-            else:
-                content += rest(1024, "whole")
-        elif part_id == "P4":
-            if bar in [1, 3, 5, 7, 9, 11]:
-                content += note("A", 4, 256, "quarter", slur_s=True, acc=True)
-                content += note("B", 4, 128, "eighth", alter=-1, acc=True)
-                content += note("E", 5, 128, "eighth", acc=True)
-                content += note("B", 5, 256, "quarter")
-                content += note("F", 5, 256, "quarter", slur_e=True)
-            else:
-                content += rest(1024, "whole")
-        elif part_id == "P5":
-            if bar in [1, 3, 5, 7, 9, 11]:
-                content += note("A", 6, 256, "quarter", slur_s=True, stac=True, acc=True)
-                content += rest(256, "quarter")
-                content += note("B", 3, 256, "quarter", alter=-1, stac=True)
-                content += note("E", 4, 256, "quarter", slur_e=True)
-            else:
-                content += rest(1024, "whole")
-        elif part_id == "P6":
-            content += note("D", 4, 256, "quarter", slur_s=True, acc=True)
-            content += note("E", 4, 256, "quarter", alter=-1, chord=True)
-            content += note("G", 4, 256, "quarter", alter=1)
-            content += note("A", 4, 256, "quarter", slur_e=True)
-        elif part_id == "P7":
-            content += note("A", 2, 256, "quarter", slur_s=True, acc=True)
-            content += note("E", 3, 256, "quarter", chord=True)
-            content += note("B", 2, 256, "quarter", alter=-1)
-            content += note("A", 2, 512, "half", slur_e=True)
-        elif part_id == "P8":
-            if bar in [1, 5, 9]:
-                content += note("A", 1, 256, "quarter", acc=True, pizz=True)
-                content += rest(768, "half", dot=True)
-            else:
-                content += note("A", 1, 1024, "whole")
-        elif part_id == "P9":
-            if bar in [1, 3, 5, 7, 9, 11]:
-                content += note("A", 4, 256, "quarter", slur_s=True, harmonic=True, acc=True)
-                content += note("B", 4, 256, "quarter", alter=-1, harmonic=True)
-                content += note("E", 4, 256, "quarter", harmonic=True)
-                content += note("F", 4, 256, "quarter", harmonic=True, slur_e=True)
-            else:
-                content += rest(1024, "whole")
-        elif part_id == "P10":
-            if bar in [2, 6]:
-                content += rest(768, "half", dot=True)
-                content += note("E", 7, 256, "quarter", stac=True, acc=True)
-            elif bar == 12:
-                content += note("A", 6, 1024, "whole", ferm=True)
-            else:
-                content += rest(1024, "whole")
-        
-        if bar == 11 and part_id == "P1":
-            content += direction("rit., morendo", default_y=60)
-        if bar == 12:
-            content += barline()
-        
-        content += '    </measure>\n'
+        marks = bar if bar in _MOVEMENT3_MARKED_BARS else 0
+        key = (3, _movement3_role(part_id, bar), marks, first_part, clef_sign, clef_line)
+        content += MEASURES.measure(bar, key, _movement3_measure,
+                                    part_id, bar, first_part, clef_sign, clef_line)
+    return content
+
+# Bars whose opening or closing marks differ from a plain bar
+_MOVEMENT4_MARKED_BARS = (1, 5, 7, 9, 11, 12)
+
+def _movement4_notes(part_id, bar):
+    """Notes of one bar of a part (TACET for a whole-bar rest)."""
+    content = ""
+    if part_id == "P1":
+        if bar == 3:
+            content += note("C", 5, 256, "quarter", slur_s=True, acc=True)
+            content += note("B", 4, 256, "quarter", alter=-1, acc=True)
+            content += note("A", 4, 256, "quarter", alter=-1, acc=True)
+            content += note("E", 5, 256, "quarter", slur_e=True)
+        elif bar == 4:
+            content += note("D", 5, 256, "quarter", slur_s=True)
+            content += note("B", 4, 256, "quarter", slur_e=True)
+            content += rest(512, "half")
+        else:
+            return TACET
+    elif part_id == "P2":
+        if bar == 5:
+            content += note("C", 5, 512, "half", slur_s=True, acc=True)
+            content += note("D", 5, 512, "half")
+        elif bar == 6:
+            content += note("E", 5, 512, "half")
+            content += note("G", 4, 512, "half", alter=1, slur_e=True)
+        else:
+            return TACET
+    elif part_id == "P3":
+        if bar == 7:
+            content += note("C", 5, 128, "eighth", slur_s=True, acc=True)
+            content += note("D", 5, 128, "eighth", acc=True)
+            content += note("E", 5, 128, "eighth", acc=True)
+            content += note("G", 4, 128, "eighth", alter=1)
+            content += note("B", 4, 256, "quarter", acc=True)
+            content += note("D", 5, 256, "quarter", slur_e=True)
+        elif bar == 8:
+            content += note("E", 5, 256, "quarter", slur_s=True)
+            content += note("G", 3, 256, "quarter", alter=1, acc=True)
+            content += note("D", 6, 256, "quarter", acc=True)
+            content += note("B", 4, 256, "quarter", slur_e=True)
+        else:
+            return TACET
+    elif part_id == "P4":
+        if bar in [1, 2, 9, 10]:
+            content += note("C", 5, 256, "quarter", slur_s=True, acc=True)
+            content += note("D", 5, 256, "quarter", acc=True)
+            content += note("E", 5, 256, "quarter", acc=True)
+            content += note("G", 4, 256, "quarter", alter=1, slur_e=True)
+        elif bar == 12:
+            content += note("C", 5, 1024, "whole", ferm=True)
+        else:
+            return TACET
+    elif part_id == "P5":
+        if bar % 2 == 0:
+            content += note("G", 4, 256, "quarter", slur_s=True, acc=True)
+            content += note("A", 4, 256, "quarter", alter=-1)
+            content += note("A", 4, 256, "quarter")
+            content += note("B", 4, 256, "quarter", alter=-1, slur_e=True)
+        else:
+            content += note("E", 4, 256, "quarter", slur_s=True)
+            content += note("F", 4, 256, "quarter")
+            content += note("F", 4, 256, "quarter", alter=1)
+            content += note("G", 4, 256, "quarter", slur_e=True)
+    elif part_id == "P6":
+        content += note("C", 4, 256, "quarter", slur_s=True, acc=True)
+        content += note("D", 4, 256, "quarter", alter=-1)
+        content += note("D", 4, 256, "quarter")
+        content += note("E", 4, 256, "quarter", alter=-1, slur_e=True)
+    elif part_id == "P7":
+        content += note("C", 3, 256, "quarter", slur_s=True, acc=True)
+        content += note("E", 3, 256, "quarter")
+        content += note("G", 3, 256, "quarter", alter=1)
+        content += note("C", 4, 256, "quarter", slur_e=True)
+    elif part_id == "P8":
+        content += note("C", 2, 512, "half", acc=True)
+        content += note("G", 2, 256, "quarter")
+        content += note("C", 2, 256, "quarter")
+    elif part_id == "P9":
+        content += note("C", 3, 256, "quarter", slur_s=True, acc=True)
+        content += note("F", 3, 256, "quarter", chord=True)
+        content += note("B", 3, 256, "quarter", chord=True)
+        content += note("G", 4, 256, "quarter", alter=1, slur_e=True)
+    elif part_id == "P10":
+        if bar == 7:
+            content += note("C", 7, 256, "quarter", acc=True)
+            content += rest(768, "half", dot=True)
+        elif bar == 12:
+            content += rest(768, "half", dot=True)
+            content += note("C", 6, 256, "quarter", ferm=True)
+        else:
+            return TACET
+    return content
+
+def _movement4_role(part_id, bar):
+    """Branch of _movement4_notes() a bar of a part takes (None for TACET); keep in step with it."""
+    if part_id == "P1":
+        if bar == 3:
+            return 1
+        elif bar == 4:
+            return 2
+        else:
+            return None
+    elif part_id == "P2":
+        if bar == 5:
+            return 3
+        elif bar == 6:
+            return 4
+        else:
+            return None
+    elif part_id == "P3":
+        if bar == 7:
+            return 5
+        elif bar == 8:
+            return 6
+        else:
+            return None
+    elif part_id == "P4":
+        if bar in [1, 2, 9, 10]:
+            return 7
+        elif bar == 12:
+            return 8
+        else:
+            return None
+    elif part_id == "P5":
+        if bar % 2 == 0:
+            return 9
+        else:
+            return 10
+    elif part_id == "P6":
+        return 11
+    elif part_id == "P7":
+        return 12
+    elif part_id == "P8":
+        return 13
+    elif part_id == "P9":
+        return 14
+    elif part_id == "P10":
+        if bar == 7:
+            return 15
+        elif bar == 12:
+            return 16
+        else:
+            return None
+    return 0
+
+def _movement4_measure(part_id, bar, first_part, clef_sign, clef_line):
+    """Body of one bar: opening marks, the notes, closing marks."""
+    content = ""
+    if bar == 1:
+        content += measure_attrs(256, 0, 4, 4, clef_sign, clef_line, new_page=True)
+        if first_part:
+            content += movement_title("IV", "German Development")
+            content += rehearsal_mark("J")
+            content += direction("Streng, mit innerer Kraft", tempo=66, default_y=80)
+        content += direction(dynamic="f", placement="below", default_y=-80)
+        content += harmony("C", "major-seventh", [(9, 0, "add"), (11, 1, "add")])
+    elif bar == 5:
+        if first_part:
+            content += rehearsal_mark("K")
+            content += direction("Breiter - augmentation", default_y=60)
+        content += direction(dynamic="mf", placement="below", default_y=-80)
+    elif bar == 7:
+        content += direction(dynamic="ff", placement="below", default_y=-80)
+    elif bar == 9:
+        if first_part:
+            content += rehearsal_mark("L")
+            content += direction("Ankunft - synthesis", default_y=60)
+    content += _movement4_notes(part_id, bar)
+    if bar == 11 and first_part:
+        content += direction("rit., resolution", default_y=60)
+        content += direction(dynamic="p", placement="below", default_y=-80)
+    if bar == 12:
+        content += barline()
     return content
 
 def gen_movement4_engraved(part_id, clef_sign, clef_line):
     content = ""
+    first_part = part_id == "P1"
     for bar in range(1, 13):
-        content += f'    <measure number="{bar}">\n'
-        
+        marks = bar if bar in _MOVEMENT4_MARKED_BARS else 0
+        key = (4, _movement4_role(part_id, bar), marks, first_part, clef_sign, clef_line)
+        content += MEASURES.measure(bar, key, _movement4_measure,
+                                    part_id, bar, first_part, clef_sign, clef_line)
+    return content
+
+# Bars whose opening or closing marks differ from a plain bar
+_MOVEMENT5_MARKED_BARS = (1, 5, 9, 11, 12)
+
+def _movement5_notes(part_id, bar):
+    """Notes of one bar of a part (TACET for a whole-bar rest)."""
+    content = ""
+    if part_id == "P1":
+        if bar in [3, 7]:
+            content += note("A", 5, 1024, "whole", slur_s=True, slur_e=True)
+        elif bar in [1, 5, 9]:
+            content += note("D", 6, 512, "half", slur_s=True, harmonic=True)
+            content += note("A", 5, 512, "half", slur_e=True, harmonic=True)
+        else:
+            return TACET
+    elif part_id == "P2":
+        if bar in [1, 3, 5, 7, 9, 11]:
+            content += note("A", 4, 512, "half", slur_s=True)
+            content += note("F", 4, 512, "half", slur_e=True)
+        else:
+            content += note("D", 4, 1024, "whole")
+    elif part_id == "P3":
+        if bar in [5, 9]:
+            content += note("D", 4, 1024, "whole", slur_s=True, slur_e=True)
+        else:
+            return TACET
+    elif part_id == "P4":
         if bar == 1:
-            content += measure_attrs(256, 0, 4, 4, clef_sign, clef_line, new_page=True)
-            if part_id == "P1":
-                content += movement_title("IV", "German Development")
-                content += rehearsal_mark("J")
-                content += direction("Streng, mit innerer Kraft", tempo=66, default_y=80)
-            content += direction(dynamic="f", placement="below", default_y=-80)
-            content += harmony("C", "major-seventh", [(9, 0, "add"), (11, 1, "add")])
+            content += note("D", 5, 512, "half", slur_s=True, acc=True)
+            content += note("E", 5, 512, "half")
+        elif bar == 2:
+            content += note("F", 5, 512, "half", acc=True)
+            content += note("G", 5, 512, "half", slur_e=True)
+        elif bar == 3:
+            content += note("A", 5, 1024, "whole", slur_s=True, acc=True)
+        elif bar == 4:
+            content += note("G", 5, 512, "half")
+            content += note("F", 5, 512, "half", slur_e=True)
         elif bar == 5:
-            if part_id == "P1":
-                content += rehearsal_mark("K")
-                content += direction("Breiter - augmentation", default_y=60)
-            content += direction(dynamic="mf", placement="below", default_y=-80)
+            content += note("E", 5, 512, "half", slur_s=True, acc=True)
+            content += note("D", 5, 512, "half")
+        elif bar == 6:
+            content += note("C", 5, 512, "half")
+            content += note("D", 5, 512, "half", slur_e=True)
         elif bar == 7:
-            content += direction(dynamic="ff", placement="below", default_y=-80)
+            content += note("E", 5, 1024, "whole", slur_s=True, acc=True)
+        elif bar == 8:
+            content += note("F", 5, 512, "half")
+            content += note("G", 5, 512, "half", slur_e=True)
         elif bar == 9:
-            if part_id == "P1":
-                content += rehearsal_mark("L")
-                content += direction("Ankunft - synthesis", default_y=60)
-        
-        if part_id == "P1":
-            if bar == 3:
-                content += note("C", 5, 256, "quarter", slur_s=True, acc=True)
-                content += note("B", 4, 256, "quarter", alter=-1, acc=True)
-                content += note("A", 4, 256, "quarter", alter=-1, acc=True)
-                content += note("E", 5, 256, "quarter", slur_e=True)
-            elif bar == 4:
-                content += note("D", 5, 256, "quarter", slur_s=True)
-                content += note("B", 4, 256, "quarter", slur_e=True)
-                content += rest(512, "half")
-            else:
-                content += rest(1024, "whole")
-        elif part_id == "P2":
-            if bar == 5:
-                content += note("C", 5, 512, "half", slur_s=True, acc=True)
-                content += note("D", 5, 512, "half")
-            elif bar == 6:
-                content += note("E", 5, 512, "half")
-                content += note("G", 4, 512, "half", alter=1, slur_e=True)
-            else:
-                content += rest(1024, "whole")
-        elif part_id == "P3":
-            if bar == 7:
-                content += note("C", 5, 128, "eighth", slur_s=True, acc=True)
-                content += note("D", 5, 128, "eighth", acc=True)
-                content += note("E", 5, 128, "eighth", acc=True)
-                content += note("G", 4, 128, "eighth", alter=1)
-                content += note("B", 4, 256, "quarter", acc=True)
-                content += note("D", 5, 256, "quarter", slur_e=True)
-            elif bar == 8:
-                content += note("E", 5, 256, "quarter", slur_s=True)
-                content += note("G", 3, 256, "quarter", alter=1, acc=True)
-                content += note("D", 6, 256, "quarter", acc=True)
-                content += note("B", 4, 256, "quarter", slur_e=True)
-            else:
-                content += rest(1024, "whole")
-        elif part_id == "P4":
-            if bar in [1, 2, 9, 10]:
-                content += note("C", 5, 256, "quarter", slur_s=True, acc=True)
-                content += note("D", 5, 256, "quarter", acc=True)
-                content += note("E", 5, 256, "quarter", acc=True)
-                content += note("G", 4, 256, "quarter", alter=1, slur_e=True)
-            elif bar == 12:
-                content += note("C", 5, 1024, "whole", ferm=True)
-            else:
-                content += rest(1024, "whole")
-        elif part_id == "P5":
-            if bar % 2 == 0:
-                content += note("G", 4, 256, "quarter", slur_s=True, acc=True)
-                content += note("A", 4, 256, "quarter", alter=-1)
-                content += note("A", 4, 256, "quarter")
-                content += note("B", 4, 256, "quarter", alter=-1, slur_e=True)
-            else:
-                content += note("E", 4, 256, "quarter", slur_s=True)
-                content += note("F", 4, 256, "quarter")
-                content += note("F", 4, 256, "quarter", alter=1)
-                content += note("G", 4, 256, "quarter", slur_e=True)
-        elif part_id == "P6":
-            content += note("C", 4, 256, "quarter", slur_s=True, acc=True)
-            content += note("D", 4, 256, "quarter", alter=-1)
-            content += note("D", 4, 256, "quarter")
-            content += note("E", 4, 256, "quarter", alter=-1, slur_e=True)
-        elif part_id == "P7":
-            content += note("C", 3, 256, "quarter", slur_s=True, acc=True)
-            content += note("E", 3, 256, "quarter")
-            content += note("G", 3, 256, "quarter", alter=1)
-            content += note("C", 4, 256, "quarter", slur_e=True)
-        elif part_id == "P8":
-            content += note("C", 2, 512, "half", acc=True)
-            content += note("G", 2, 256, "quarter")
-            content += note("C", 2, 256, "quarter")
-        elif part_id == "P9":
-            content += note("C", 3, 256, "quarter", slur_s=True, acc=True)
-            content += note("F", 3, 256, "quarter", chord=True)
-            content += note("B", 3, 256, "quarter", chord=True)
-            content += note("G", 4, 256, "quarter", alter=1, slur_e=True)
-        elif part_id == "P10":
-            if bar == 7:
-                content += note("C", 7, 256, "quarter", acc=True)
-                content += rest(768, "half", dot=True)
-            elif bar == 12:
-                content += rest(768, "half", dot=True)
-                content += note("C", 6, 256, "quarter", ferm=True)
-            else:
-                content += rest(1024, "whole")
-        
-        if bar == 11 and part_id == "P1":
-            content += direction("rit., resolution", default_y=60)
-            content += direction(dynamic="p", placement="below", default_y=-80)
-        if bar == 12:
-            content += barline()
-        
-        content += '    </measure>\n'
+            content += note("A", 5, 512, "half", slur_s=True, acc=True)
+            content += note("B", 5, 512, "half", alter=-1)
+        elif bar == 10:
+            content += note("A", 5, 512, "half")
+            content += note("G", 5, 512, "half", slur_e=True)
+        elif bar == 11:
+            content += note("F", 5, 512, "half", slur_s=True, acc=True)
+            content += note("E", 5, 512, "half")
+        elif bar == 12:
+            content += note("D", 5, 1024, "whole", slur_e=True, ferm=True)
+    elif part_id == "P5":
+        content += note("A", 4, 1024, "whole", slur_s=True, slur_e=True)
+    elif part_id == "P6":
+        content += note("F", 4, 512, "half", slur_s=True)
+        content += note("A", 4, 512, "half", slur_e=True)
+    elif part_id == "P7":
+        content += note("D", 3, 512, "half", slur_s=True)
+        content += note("A", 3, 512, "half", slur_e=True)
+    elif part_id == "P8":
+        content += note("D", 2, 1024, "whole")
+    elif part_id == "P9":
+        if bar in [1, 3, 5, 7, 9, 11]:
+            content += note("D", 4, 256, "quarter", slur_s=True, harmonic=True, acc=True)
+            content += note("A", 3, 256, "quarter", harmonic=True)
+            content += note("F", 4, 256, "quarter", harmonic=True)
+            content += note("D", 4, 256, "quarter", slur_e=True, harmonic=True)
+        else:
+            return TACET
+    elif part_id == "P10":
+        if bar == 9:
+            content += note("A", 6, 256, "quarter", acc=True)
+            content += rest(768, "half", dot=True)
+        elif bar == 12:
+            content += rest(768, "half", dot=True)
+            content += note("D", 6, 256, "quarter", ferm=True)
+        else:
+            return TACET
     return content
 
-def gen_movement5_engraved(part_id, clef_sign, clef_line):
-    content = ""
-    for bar in range(1, 13):
-        content += f'    <measure number="{bar}">\n'
-        
+def _movement5_role(part_id, bar):
+    """Branch of _movement5_notes() a bar of a part takes (None for TACET); keep in step with it."""
+    if part_id == "P1":
+        if bar in [3, 7]:
+            return 1
+        elif bar in [1, 5, 9]:
+            return 2
+        else:
+            return None
+    elif part_id == "P2":
+        if bar in [1, 3, 5, 7, 9, 11]:
+            return 3
+        else:
+            return 4
+    elif part_id == "P3":
+        if bar in [5, 9]:
+            return 5
+        else:
+            return None
+    elif part_id == "P4":
         if bar == 1:
-            content += measure_attrs(256, -1, 4, 4, clef_sign, clef_line, new_page=True)
-            if part_id == "P1":
-                content += movement_title("V", "Tintinnabuli Epilogue")
-                content += rehearsal_mark("M")
-                content += direction("Serene, like a prayer", tempo=52, default_y=80)
-            content += direction(dynamic="ppp", placement="below", default_y=-80)
-            content += harmony("D", "minor", [(9, 0, "add")])
+            return 6
+        elif bar == 2:
+            return 7
+        elif bar == 3:
+            return 8
+        elif bar == 4:
+            return 9
         elif bar == 5:
-            if part_id == "P1":
-                content += rehearsal_mark("N")
-                content += direction("breathing", default_y=60)
+            return 10
+        elif bar == 6:
+            return 11
+        elif bar == 7:
+            return 12
+        elif bar == 8:
+            return 13
         elif bar == 9:
-            if part_id == "P1":
-                content += rehearsal_mark("O")
-                content += direction("transcendent", default_y=60)
-        
-        if part_id == "P1":
-            if bar in [3, 7]:
-                content += note("A", 5, 1024, "whole", slur_s=True, slur_e=True)
-            elif bar in [1, 5, 9]:
-                content += note("D", 6, 512, "half", slur_s=True, harmonic=True)
-                content += note("A", 5, 512, "half", slur_e=True, harmonic=True)
-            else:
-                content += rest(1024, "whole")
-        elif part_id == "P2":
-            if bar in [1, 3, 5, 7, 9, 11]:
-                content += note("A", 4, 512, "half", slur_s=True)
-                content += note("F", 4, 512, "half", slur_e=True)
-            else:
-                content += note("D", 4, 1024, "whole")
-        elif part_id == "P3":
-            if bar in [5, 9]:
-                content += note("D", 4, 1024, "whole", slur_s=True, slur_e=True)
-            else:
-                content += rest(1024, "whole")
-        elif part_id == "P4":
-            if bar == 1:
-                content += note("D", 5, 512, "half", slur_s=True, acc=True)
-                content += note("E", 5, 512, "half")
-            elif bar == 2:
-                content += note("F", 5, 512, "half", acc=True)
-                content += note("G", 5, 512, "half", slur_e=True)
-            elif bar == 3:
-                content += note("A", 5, 1024, "whole", slur_s=True, acc=True)
-            elif bar == 4:
-                content += note("G", 5, 512, "half")
-                content += note("F", 5, 512, "half", slur_e=True)
-            elif bar == 5:
-                content += note("E", 5, 512, "half", slur_s=True, acc=True)
-                content += note("D", 5, 512, "half")
-            elif bar == 6:
-                content += note("C", 5, 512, "half")
-                content += note("D", 5, 512, "half", slur_e=True)
-            elif bar == 7:
-                content += note("E", 5, 1024, "whole", slur_s=True, acc=True)
-            elif bar == 8:
-                content += note("F", 5, 512, "half")
-                content += note("G", 5, 512, "half", slur_e=True)
-            elif bar == 9:
-                content += note("A", 5, 512, "half", slur_s=True, acc=True)
-                content += note("B", 5, 512, "half", alter=-1)
-            elif bar == 10:
-                content += note("A", 5, 512, "half")
-                content += note("G", 5, 512, "half", slur_e=True)
-            elif bar == 11:
-                content += note("F", 5, 512, "half", slur_s=True, acc=True)
-                content += note("E", 5, 512, "half")
-            elif bar == 12:
-                content += note("D", 5, 1024, "whole", slur_e=True, ferm=True)
-        elif part_id == "P5":
-            content += note("A", 4, 1024, "whole", slur_s=True, slur_e=True)
-        elif part_id == "P6":
-            content += note("F", 4, 512, "half", slur_s=True)
-            content += note("A", 4, 512, "half", slur_e=True)
-        elif part_id == "P7":
-            content += note("D", 3, 512, "half", slur_s=True)
-            content += note("A", 3, 512, "half", slur_e=True)
-        elif part_id == "P8":
-            content += note("D", 2, 1024, "whole")
-        elif part_id == "P9":
-            if bar in [1, 3, 5, 7, 9, 11]:
-                content += note("D", 4, 256, "quarter", slur_s=True, harmonic=True, acc=True)
-                content += note("A", 3, 256, "quarter", harmonic=True)
-                content += note("F", 4, 256, "quarter", harmonic=True)
-                content += note("D", 4, 256, "quarter", slur_e=True, harmonic=True)
-            else:
-                content += rest(1024, "whole")
-        elif part_id == "P10":
-            if bar == 9:
-                content += note("A", 6, 256, "quarter", acc=True)
-                content += rest(768, "half", dot=True)
-            elif bar == 12:
-                content += rest(768, "half", dot=True)
-                content += note("D", 6, 256, "quarter", ferm=True)
-            else:
-                content += rest(1024, "whole")
-        
-        if bar == 11 and part_id == "P1":
-            content += direction("rit., dissolving", default_y=60)
-        if bar == 12:
-            content += barline("light-heavy")
-        
-        content += '    </measure>\n'
+            return 14
+        elif bar == 10:
+            return 15
+        elif bar == 11:
+            return 16
+        elif bar == 12:
+            return 17
+    elif part_id == "P5":
+        return 18
+    elif part_id == "P6":
+        return 19
+    elif part_id == "P7":
+        return 20
+    elif part_id == "P8":
+        return 21
+    elif part_id == "P9":
+        if bar in [1, 3, 5, 7, 9, 11]:
+            return 22
+        else:
+            return None
+    elif part_id == "P10":
+        if bar == 9:
+            return 23
+        elif bar == 12:
+            return 24
+        else:
+            return None
+    return 0
+
+def _movement5_measure(part_id, bar, first_part, clef_sign, clef_line):
+    """Body of one bar: opening marks, the notes, closing marks."""
+    content = ""
+    if bar == 1:
+        content += measure_attrs(256, -1, 4, 4, clef_sign, clef_line, new_page=True)
+        if first_part:
+            content += movement_title("V", "Tintinnabuli Epilogue")
+            content += rehearsal_mark("M")
+            content += direction("Serene, like a prayer", tempo=52, default_y=80)
+        content += direction(dynamic="ppp", placement="below", default_y=-80)
+        content += harmony("D", "minor", [(9, 0, "add")])
+    elif bar == 5:
+        if first_part:
+            content += rehearsal_mark("N")
+            content += direction("breathing", default_y=60)
+    elif bar == 9:
+        if first_part:
+            content += rehearsal_mark("O")
+            content += direction("transcendent", default_y=60)
+    content += _movement5_notes(part_id, bar)
+    if bar == 11 and first_part:
+        content += direction("rit., dissolving", default_y=60)
+    if bar == 12:
+        content += barline("light-heavy")
+    return content
+
+def gen_movement5_engraved(part_id, clef_sign, clef_line):
+    content = ""
+    first_part = part_id == "P1"
+    for bar in range(1, 13):
+        marks = bar if bar in _MOVEMENT5_MARKED_BARS else 0
+        key = (5, _movement5_role(part_id, bar), marks, first_part, clef_sign, clef_line)
+        content += MEASURES.measure(bar, key, _movement5_measure,
+                                    part_id, bar, first_part, clef_sign, clef_line)
     return content
 
 # ============ MAIN ============
+# ============ PARALLEL ENGRAVING ============
+MOVEMENTS = [
+    gen_movement1_engraved,
+    gen_movement2_engraved,
+    gen_movement3_engraved,
+    gen_movement4_engraved,
+    gen_movement5_engraved,
+]
+
+def engrave_fragment(task):
+    """One part x movement fragment (module level so pool workers can run it)."""
+    movement, part_id, clef_sign, clef_line = task
+    return MOVEMENTS[movement](part_id, clef_sign, clef_line)
+
+def engrave_parts_parallel(parts, jobs):
+    """
+    Engrave every part x movement fragment in a process pool and return the
+    <part> blocks in part order. pool.map() returns results in submission
+    order, so the score is byte-identical to the serial loop.
+    """
+    tasks = [(movement, part_id, clef_sign, clef_line)
+             for part_id, _, clef_sign, clef_line in parts
+             for movement in range(len(MOVEMENTS))]
+    blocks = []
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        fragments = pool.map(engrave_fragment, tasks, chunksize=len(MOVEMENTS))
+        for part_id, part_name, _, _ in parts:
+            print(f"  Engraving {part_name}...")
+            movements = [next(fragments) for _ in MOVEMENTS]
+            blocks.append(f'  <part id="{part_id}">\n' + "".join(movements) + part_footer())
+    return blocks
+
 def main():
+    configure_output(sys.argv[1:])
     scores_dir = os.path.join(os.path.dirname(__file__), "..", "scores")
+    jobs = parse_jobs(sys.argv[1:])
     
     print("=" * 70)
     print("SUITE ENGRAVING ENGINE - PROFESSIONAL POLISH")
@@ -815,22 +1180,25 @@ def main():
     
     full_score = engraved_header()
     
-    for part_id, part_name, clef_sign, clef_line in parts:
-        print(f"  Engraving {part_name}...")
-        
-        full_score += f'  <part id="{part_id}">\n'
-        full_score += gen_movement1_engraved(part_id, clef_sign, clef_line)
-        full_score += gen_movement2_engraved(part_id, clef_sign, clef_line)
-        full_score += gen_movement3_engraved(part_id, clef_sign, clef_line)
-        full_score += gen_movement4_engraved(part_id, clef_sign, clef_line)
-        full_score += gen_movement5_engraved(part_id, clef_sign, clef_line)
-        full_score += part_footer()
+    if jobs > 1:
+        print(f"  Parallel engraving: {jobs} worker processes")
+        full_score += "".join(engrave_parts_parallel(parts, jobs))
+    else:
+        for part_id, part_name, clef_sign, clef_line in parts:
+            print(f"  Engraving {part_name}...")
+            
+            full_score += f'  <part id="{part_id}">\n'
+            full_score += gen_movement1_engraved(part_id, clef_sign, clef_line)
+            full_score += gen_movement2_engraved(part_id, clef_sign, clef_line)
+            full_score += gen_movement3_engraved(part_id, clef_sign, clef_line)
+            full_score += gen_movement4_engraved(part_id, clef_sign, clef_line)
+            full_score += gen_movement5_engraved(part_id, clef_sign, clef_line)
+            full_score += part_footer()
     
     full_score += footer()
     
     filepath = os.path.join(scores_dir, "Final-Suite-FullScore-Engraved.musicxml")
-    with open(filepath, "w", encoding="utf-8") as f:
-        f.write(full_score)
+    filepath = write_score(filepath, full_score)
     
     print()
     print("=" * 70)
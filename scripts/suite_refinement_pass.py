@@ -5,6 +5,10 @@ Enhance Movements III, V Lead Sheet, and V Orchestrated to >= 8.0
 """
 
 import os
+import sys
+
+from score_features import extract_features, has_marker
+from score_writer import configure_output, write_score
 
 # ============ UTILITIES ============
 def note(step, octave, duration, ntype, alter=None, voice=1, staff=1, 
@@ -143,33 +147,34 @@ def piano_attrs(divisions=256, fifths=0):
 '''
 
 def evaluate(xml, name):
+    f = extract_features(xml)
     scores = {}
-    slur_count = xml.count('<slur')
-    accent_count = xml.count('<accent/>')
+    slur_count = f['slurs']
+    accent_count = f['accents']
     scores["Motivic Identity"] = min(1.0, (slur_count / 30) * 0.5 + (accent_count / 25) * 0.5)
-    oct5 = xml.count('<octave>5</octave>')
-    oct4 = xml.count('<octave>4</octave>')
-    oct3 = xml.count('<octave>3</octave>')
+    oct5 = f['octaves'].get(5, 0)
+    oct4 = f['octaves'].get(4, 0)
+    oct3 = f['octaves'].get(3, 0)
     scores["Motivic Development"] = min(1.0, (oct5 + oct4 + oct3) / 80)
-    alter_count = xml.count('<alter>')
+    alter_count = f['alters']
     scores["Melodic Contour"] = min(1.0, (oct5 / 20) * 0.5 + (alter_count / 30) * 0.5)
-    harmony_count = xml.count('<harmony')
-    degree_count = xml.count('<degree>')
+    harmony_count = f['harmonies']
+    degree_count = f['degrees']
     scores["Harmonic Colour"] = min(1.0, (harmony_count / 15) * 0.4 + (degree_count / 35) * 0.6)
-    slur_starts = xml.count('<slur type="start"')
+    slur_starts = f['slur_starts']
     scores["Phrasing"] = min(1.0, slur_starts / 15)
-    part_count = xml.count('<part id=')
-    note_count = xml.count('<note>')
+    part_count = f['parts']
+    note_count = f['notes']
     scores["Orchestration"] = min(1.0, (part_count / 10) * 0.3 + (note_count / 400) * 0.7)
-    dynamics_count = xml.count('<dynamics>')
-    words_count = xml.count('<words')
+    dynamics_count = f['dynamics']
+    words_count = f['words']
     scores["Idiomatic Style"] = min(1.0, (dynamics_count / 8) * 0.5 + (words_count / 6) * 0.5)
-    has_rit = 'rit' in xml.lower()
-    measure_count = xml.count('<measure number=')
+    has_rit = has_marker(f, 'rit')
+    measure_count = f['measures']
     scores["Formal Shape"] = 0.5 + (0.25 if has_rit else 0) + (0.25 if 10 <= measure_count <= 16 else 0)
-    fermata_count = xml.count('<fermata')
+    fermata_count = f['fermatas']
     scores["Emotional Arc"] = min(1.0, (fermata_count / 1) * 0.3 + (accent_count / 20) * 0.4 + (dynamics_count / 6) * 0.3)
-    has_barline = '<barline' in xml
+    has_barline = f['barlines'] > 0
     scores["Engraving"] = 0.7 + (0.3 if has_barline else 0)
     total = sum(scores.values())
     return total, scores
@@ -610,6 +615,7 @@ def orchestrate_mvmt5_refined():
 
 # ============ MAIN ============
 def main():
+    configure_output(sys.argv[1:])
     scores_dir = os.path.join(os.path.dirname(__file__), "..", "scores")
     
     print("=" * 70)
@@ -624,8 +630,7 @@ def main():
     print("Refining Movement III (Bartok Night)...")
     xml = orchestrate_mvmt3_refined()
     filepath = os.path.join(scores_dir, "Movement3-Orchestrated-Final.musicxml")
-    with open(filepath, "w", encoding="utf-8") as f:
-        f.write(xml)
+    filepath = write_score(filepath, xml)
     total, scores = evaluate(xml, "III. Bartok Night")
     results["III. Bartok Night"] = (total, scores)
     status = "EXCELLENT" if total >= 8.0 else "REFINE"
@@ -635,8 +640,7 @@ def main():
     print("Refining Movement V Lead Sheet...")
     xml = gen_mvmt5_leadsheet_refined()
     filepath = os.path.join(scores_dir, "Movement5-Tintinnabuli-Excellent.musicxml")
-    with open(filepath, "w", encoding="utf-8") as f:
-        f.write(xml)
+    filepath = write_score(filepath, xml)
     total, scores = evaluate(xml, "V. Tintinnabuli Lead Sheet")
     results["V. Tintinnabuli Lead Sheet"] = (total, scores)
     status = "EXCELLENT" if total >= 8.0 else "REFINE"
@@ -646,8 +650,7 @@ def main():
     print("Refining Movement V Orchestrated...")
     xml = orchestrate_mvmt5_refined()
     filepath = os.path.join(scores_dir, "Movement5-Orchestrated-Final.musicxml")
-    with open(filepath, "w", encoding="utf-8") as f:
-        f.write(xml)
+    filepath = write_score(filepath, xml)
     total, scores = evaluate(xml, "V. Tintinnabuli Orchestrated")
     results["V. Tintinnabuli Orchestrated"] = (total, scores)
     status = "EXCELLENT" if total >= 8.0 else "REFINE"
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+PER-TREE TAG INDEX
+==================
+Shared lookup tables for the layout passes (HumanLayoutPolish,
+SafeEngravingPass).
+
+Each pass used to re-scan the whole document with root.findall('.//direction'),
+'.//slur', './/note' and then walk every measure again to find a bar number.
+A TagIndex is built once per loaded tree, on first use, by a single iter()
+over the root and records:
+
+  - tag -> [elements]                   (document order)
+  - measure number -> [<measure>s]      (one per part carrying that number)
+  - element -> parent                   (for "which <direction> is this in")
+
+Passes that add or remove elements go through index.insert() /
+index.append() / index.remove(), so the subtree is indexed or dropped as
+well and later passes see the change without a rescan. Every indexed element
+has a document-order key; an inserted subtree gets keys between those of the
+elements before and after it and is placed in the lists by key, so the lists
+stay in document order however the tree is edited.
+
+    index = index_for(root)
+    for slur in index.elements('slur'): ...
+    for measure in index.measures('13'): ...
+"""
+
+import weakref
+from bisect import bisect_left, insort
+from fractions import Fraction
+
+_INDEXES = weakref.WeakKeyDictionary()
+
+
+def index_for(root):
+    """The TagIndex of a tree root, created on first request."""
+    index = _INDEXES.get(root)
+    if index is None:
+        index = _INDEXES[root] = TagIndex(root)
+    return index
+
+
+class TagIndex:
+    """Lazily built tag / measure-number / parent maps for one element tree."""
+
+    def __init__(self, root):
+        self.root = root
+        self._by_tag = None
+        self._by_number = None
+        self._parent = None
+        self._order = None
+
+    def _build(self):
+        self._by_tag = {}
+        self._by_number = {}
+        self._parent = {self.root: None}
+        self._order = {}
+        by_tag = self._by_tag
+        parents = self._parent
+        order = self._order
+        for key, node in enumerate(self.root.iter()):
+            order[node] = key
+            by_tag.setdefault(node.tag, []).append(node)
+            for child in node:
+                parents[child] = node
+            if node.tag == 'measure':
+                self._by_number.setdefault(node.get('number', ''), []).append(node)
+
+    def _following(self, elem):
+        """Order key of the first element after elem's subtree, or None at the end."""
+        node = elem
+        parent = self._parent.get(node)
+        while parent is not None:
+            siblings = list(parent)
+            position = siblings.index(node)
+            if position + 1 < len(siblings):
+                return self._order[siblings[position + 1]]
+            node, parent = parent, self._parent.get(parent)
+        return None
+
+    def _add_subtree(self, elem, parent):
+        """Index a subtree that has just been inserted under parent."""
+        # The element just before the subtree: parent itself, or the last
+        # descendant of the previous sibling
+        position = list(parent).index(elem)
+        before = parent
+        if position:
+            before = parent[position - 1]
+            while len(before):
+                before = before[-1]
+        low = self._order[before]
+        self._parent[elem] = parent
+        high = self._following(elem)
+        nodes = list(elem.iter())
+        if high is None:
+            high = low + len(nodes) + 1
+        step = Fraction(high - low, len(nodes) + 1)
+
+        order = self._order
+        key = order.__getitem__
+        for i, node in enumerate(nodes, 1):
+            order[node] = low + step * i
+            insort(self._by_tag.setdefault(node.tag, []), node, key=key)
+            for child in node:
+                self._parent[child] = node
+            if node.tag == 'measure':
+                insort(self._by_number.setdefault(node.get('number', ''), []), node, key=key)
+
+    def _drop(self, elements, node):
+        """Remove node from an index list kept in document order."""
+        i = bisect_left(elements, self._order[node], key=self._order.__getitem__)
+        if i < len(elements) and elements[i] is node:
+            del elements[i]
+
+    def _ensure(self):
+        if self._by_tag is None:
+            self._build()
+
+    # -- queries ---------------------------------------------------------
+
+    def elements(self, tag):
+        """Every element with this tag (a live list; do not modify)."""
+        self._ensure()
+        return self._by_tag.get(tag, [])
+
+    def measures(self, number, part=None):
+        """Measures numbered `number`, optionally only those of one <part>."""
+        self._ensure()
+        found = self._by_number.get(str(number), [])
+        if part is None:
+            return found
+        return [m for m in found if self._parent.get(m) is part]
+
+    def parent(self, elem):
+        self._ensure()
+        return self._parent.get(elem)
+
+    def ancestor(self, elem, tag):
+        """Nearest enclosing element with this tag, or None."""
+        self._ensure()
+        node = self._parent.get(elem)
+        while node is not None and node.tag != tag:
+            node = self._parent.get(node)
+        return node
+
+    # -- mutation --------------------------------------------------------
+
+    def insert(self, parent, position, elem):
+        """parent.insert(position, elem), keeping the index current."""
+        parent.insert(position, elem)
+        if self._by_tag is not None:
+            self._add_subtree(elem, parent)
+        return elem
+
+    def append(self, parent, elem):
+        """parent.append(elem), keeping the index current."""
+        return self.insert(parent, len(parent), elem)
+
+    def remove(self, parent, elem):
+        """parent.remove(elem), dropping elem and its subtree from the index."""
+        if self._by_tag is not None:
+            for node in elem.iter():
+                self._drop(self._by_tag[node.tag], node)
+                if node.tag == 'measure':
+                    self._drop(self._by_number[node.get('number', '')], node)
+                del self._parent[node]
+                del self._order[node]
+        parent.remove(elem)
+        return elem
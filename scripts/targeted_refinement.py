@@ -3,10 +3,17 @@
 TARGETED EXCELLENCE REFINEMENT PASS
 Refine ONLY: Movement1, Movement3, Movement4
 Movement2 (Gil's Canvas) remains untouched.
+
+Usage: python scripts/targeted_refinement.py [--jobs N]   (movements in N worker processes, 0 = one per CPU)
 """
 
 import os
 import shutil
+import sys
+
+from job_pool import parse_jobs, run_movements
+from score_features import extract_features, has_marker
+from score_writer import configure_output, write_score
 
 # ============ SHARED UTILITIES ============
 def note(step, oct, dur, typ, alt=None, dot=False, chord=False, 
@@ -115,17 +122,18 @@ def attributes(key_fifths=0):
 
 # ============ EVALUATION ============
 def evaluate(name, xml):
+    f = extract_features(xml)
     scores = {}
-    scores["Motivic Identity"] = 1 if xml.count('<slur') >= 10 else 0
-    scores["Motivic Development"] = 1 if xml.count('<accent/>') >= 6 else 0
-    scores["Melodic Contour"] = 1 if xml.count('<octave>5</octave>') >= 8 and xml.count('<octave>4</octave>') >= 6 else 0
-    scores["Harmony & Palette"] = 1 if xml.count('<harmony') >= 12 and xml.count('<degree>') >= 10 else 0
-    scores["Phrasing & Breath"] = 1 if xml.count('<slur type="start"') >= 12 else 0
-    scores["LH Accompaniment"] = 1 if xml.count('staff="2"') >= 60 and xml.count('<chord/>') >= 30 else 0
-    scores["Idiomatic Writing"] = 1 if xml.count('<dynamics>') >= 4 else 0
-    scores["Form & Arc"] = 1 if 'rit' in xml.lower() and ('brighter' in xml.lower() or 'expanding' in xml.lower() or 'ankunft' in xml.lower()) else 0
-    scores["Emotional Character"] = 1 if '<fermata' in xml else 0
-    scores["Engraving Quality"] = 1 if '<barline' in xml and xml.count('<measure number=') >= 12 else 0
+    scores["Motivic Identity"] = 1 if f['slurs'] >= 10 else 0
+    scores["Motivic Development"] = 1 if f['accents'] >= 6 else 0
+    scores["Melodic Contour"] = 1 if f['octaves'].get(5, 0) >= 8 and f['octaves'].get(4, 0) >= 6 else 0
+    scores["Harmony & Palette"] = 1 if f['harmonies'] >= 12 and f['degrees'] >= 10 else 0
+    scores["Phrasing & Breath"] = 1 if f['slur_starts'] >= 12 else 0
+    scores["LH Accompaniment"] = 1 if f['staff2'] >= 60 and f['chords'] >= 30 else 0
+    scores["Idiomatic Writing"] = 1 if f['dynamics'] >= 4 else 0
+    scores["Form & Arc"] = 1 if has_marker(f, 'rit') and has_marker(f, 'brighter', 'expanding', 'ankunft') else 0
+    scores["Emotional Character"] = 1 if f['fermatas'] > 0 else 0
+    scores["Engraving Quality"] = 1 if f['barlines'] > 0 and f['measures'] >= 12 else 0
     return sum(scores.values()), scores
 
 # ============ MOVEMENT I: MINGUS BLUES CATHEDRAL - REFINED ============
@@ -748,8 +756,23 @@ def gen_movement4_refined():
     return header("The Master's Palette - IV. German Development", 0) + m + footer()
 
 # ============ MAIN EXECUTION ============
+def refine_movement(task):
+    """Generate, write and evaluate one movement (a pool worker under --jobs)."""
+    scores_dir, filename, generator, title = task
+    xml = generator()
+    filepath = os.path.join(scores_dir, filename)
+    
+    filepath = write_score(filepath, xml)
+    
+    score, details = evaluate(title, xml)
+    passed = [k for k, v in details.items() if v == 1]
+    failed = [k for k, v in details.items() if v == 0]
+    return (title, score, passed, failed, filepath)
+
 def main():
+    configure_output(sys.argv[1:])
     scores_dir = os.path.join(os.path.dirname(__file__), "..", "scores")
+    jobs = parse_jobs(sys.argv[1:])
     
     print("=" * 65)
     print("TARGETED EXCELLENCE REFINEMENT PASS")
@@ -765,20 +788,10 @@ def main():
         ("Movement4-Excellent.musicxml", gen_movement4_refined, "IV. German Development"),
     ]
     
-    results = []
-    
-    for filename, generator, title in movements:
-        xml = generator()
-        filepath = os.path.join(scores_dir, filename)
-        
-        with open(filepath, "w", encoding="utf-8") as f:
-            f.write(xml)
-        
-        score, details = evaluate(title, xml)
-        passed = [k for k, v in details.items() if v == 1]
-        failed = [k for k, v in details.items() if v == 0]
-        results.append((title, score, passed, failed, filepath))
-        
+    tasks = [(scores_dir, filename, generator, title) for filename, generator, title in movements]
+    results = run_movements(refine_movement, tasks, jobs)
+    
+    for title, score, passed, failed, filepath in results:
         status = "PASS" if score >= 8 else "REFINE"
         print(f"REFINED: {title}")
         print(f"  Score: {score}/10 [{status}]")
@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+"""
+TRANSPOSITION ENGINE
+====================
+Written-pitch output for transposing instruments (rules/orchestration-rules.md:
+"Clarinet in Bb / Flugelhorn in Bb - write transposed M2 higher than sounding").
+
+The generators write every part at concert pitch. For a written-pitch part
+or transposed score the engine, per transposing part:
+  - rewrites every <pitch> (step / alter / octave) and every <harmony> root
+    and bass
+  - rewrites <key> fifths, choosing the enharmonic spelling with fewer
+    accidentals (concert B major becomes Db, not C#, for Bb instruments)
+  - updates displayed <accidental>s to the new spelling
+  - adds <transpose> to the first <attributes>, so playback stays at concert
+    pitch
+
+Parts that already carry <transpose> are written pitch and are left alone.
+
+Intervals are (diatonic steps, semitones) from concert to written pitch. For
+each interval and step C..B a lookup table gives the written step, octave
+carry and alter correction; all notes of a score are gathered into NumPy
+arrays and transposed with one fancy-indexing pass.
+
+Usage:
+    python scripts/transposition.py SCORE [OUT] [--compact] [--mxl]     # OUT defaults to SCORE-transposed
+"""
+
+import os
+import re
+import sys
+import xml.etree.ElementTree as ET
+
+import numpy as np
+
+from score_writer import configure_output, parse_score, write_tree
+
+STEPS = 'CDEFGAB'
+STEP_SEMITONES = np.array([0, 2, 4, 5, 7, 9, 11])
+# Circle-of-fifths position of the natural intervals unison..seventh
+STEP_FIFTHS = np.array([0, 2, 4, -1, 1, 3, 5])
+
+# (part-name pattern, label, diatonic, chromatic); first match wins
+INSTRUMENT_TRANSPOSITIONS = [
+    (r'bass clarinet', 'Bass Clarinet in Bb', 8, 14),
+    (r'clarinet in a\b', 'Clarinet in A', 2, 3),
+    (r'clarinet in e', 'Clarinet in Eb', -2, -3),
+    (r'clarinet', 'Clarinet in Bb', 1, 2),
+    (r'flugelhorn|flugel', 'Flugelhorn in Bb', 1, 2),
+    (r'trumpet in c\b', None, 0, 0),
+    (r'trumpet|cornet', 'Trumpet in Bb', 1, 2),
+    (r'soprano sax', 'Soprano Saxophone', 1, 2),
+    (r'alto sax', 'Alto Saxophone', 5, 9),
+    (r'tenor sax', 'Tenor Saxophone', 8, 14),
+    (r'baritone sax|bari sax', 'Baritone Saxophone', 12, 21),
+    (r'horn in f|french horn|^horn', 'Horn in F', 4, 7),
+]
+
+ACCIDENTALS = {-3: 'triple-flat', -2: 'flat-flat', -1: 'flat', 0: 'natural',
+               1: 'sharp', 2: 'double-sharp', 3: 'triple-sharp'}
+
+# <attributes> children that precede <transpose>
+_BEFORE_TRANSPOSE = {'footnote', 'level', 'divisions', 'key', 'time', 'staves',
+                     'part-symbol', 'instruments', 'clef', 'staff-details'}
+
+
+def interval_fifths(diatonic, chromatic):
+    """Key-signature shift (in fifths) of a concert -> written interval."""
+    octaves, step = divmod(diatonic, 7)
+    quality = chromatic - STEP_SEMITONES[step] - 12 * octaves
+    return int(STEP_FIFTHS[step] + 7 * quality)
+
+
+def step_table(diatonic, chromatic):
+    """
+    Per concert step (C..B): (written step, octave carry, alter correction).
+
+    A note of step s, alter a, octave o is written as
+    (table_step[s], a + table_alter[s], o + table_octave[s]).
+    """
+    steps = np.arange(7) + diatonic
+    written = steps % 7
+    carry = steps // 7
+    correction = (STEP_SEMITONES + chromatic) - (STEP_SEMITONES[written] + 12 * carry)
+    return np.stack([written, carry, correction])
+
+
+def spellings(diatonic, chromatic):
+    """The interval and its two enharmonic neighbours (aug. unison / dim. 3rd ...)."""
+    return [(diatonic, chromatic), (diatonic + 1, chromatic), (diatonic - 1, chromatic)]
+
+
+class TableSet:
+    """Step tables of every spelling used in one run, stacked for indexing."""
+
+    def __init__(self):
+        self.rows = {}
+        self.tables = []
+
+    def row(self, interval):
+        if interval not in self.rows:
+            self.rows[interval] = len(self.tables)
+            self.tables.append(step_table(*interval))
+        return self.rows[interval]
+
+    def stacked(self):
+        return np.stack(self.tables) if self.tables else np.zeros((0, 3, 7), dtype=int)
+
+
+def transposition_for(name):
+    """(label, diatonic, chromatic) for a part or instrument name, or None."""
+    lowered = (name or '').lower()
+    for pattern, label, diatonic, chromatic in INSTRUMENT_TRANSPOSITIONS:
+        if re.search(pattern, lowered):
+            if diatonic == 0 and chromatic == 0:
+                return None
+            return label, diatonic, chromatic
+    return None
+
+
+def choose_spelling(fifths, diatonic, chromatic):
+    """Spelling of the interval giving the written key with fewest accidentals."""
+    best = None
+    for interval in spellings(diatonic, chromatic):
+        written = fifths + interval_fifths(*interval)
+        if best is None or abs(written) < abs(best[1]):
+            best = (interval, written)
+    return best
+
+
+def _number(value):
+    return str(int(value)) if float(value).is_integer() else f"{value:g}"
+
+
+def _set_alter(parent, step_elem, tag, alter):
+    """Write alter (removing it when 0) right after its step element."""
+    elem = parent.find(tag)
+    if alter == 0:
+        if elem is not None:
+            parent.remove(elem)
+        return
+    if elem is None:
+        elem = ET.Element(tag)
+        parent.insert(list(parent).index(step_elem) + 1, elem)
+    elem.text = _number(alter)
+
+
+def _add_transpose(part, diatonic, chromatic):
+    attributes = part.find('measure/attributes')
+    if attributes is None:
+        measure = part.find('measure')
+        if measure is None:
+            return
+        attributes = ET.Element('attributes')
+        measure.insert(0, attributes)
+    # Written -> sounding, octaves split off (a major 9th is a 2nd plus octave-change)
+    octaves = abs(diatonic) // 7 * (1 if diatonic > 0 else -1)
+    transpose = ET.Element('transpose')
+    ET.SubElement(transpose, 'diatonic').text = str(-(diatonic - 7 * octaves))
+    ET.SubElement(transpose, 'chromatic').text = str(-(chromatic - 12 * octaves))
+    if octaves:
+        ET.SubElement(transpose, 'octave-change').text = str(-octaves)
+    position = 0
+    for i, child in enumerate(attributes):
+        if child.tag in _BEFORE_TRANSPOSE:
+            position = i + 1
+    attributes.insert(position, transpose)
+
+
+def transpose_parts(root, names=None):
+    """
+    Rewrite the transposing parts of a score (or part file) to written pitch.
+
+    names maps part id -> part name; by default it is read from the
+    <part-list>. Returns [(part id, label)] of the parts transposed.
+    """
+    if names is None:
+        names = {sp.get('id'): sp.findtext('part-name') or sp.findtext('score-instrument/instrument-name')
+                 for sp in root.iter('score-part')}
+    tables = TableSet()
+    # One entry per pitch / harmony root / bass:
+    # (container, step elem, alter tag, octave elem, accidental elem)
+    targets = []
+    rows = []
+    steps = []
+    alters = []
+    octaves = []
+    transposed = []
+
+    for part in root.iter('part'):
+        found = transposition_for(names.get(part.get('id')))
+        if found is None or part.find('.//transpose') is not None:
+            continue
+        label, diatonic, chromatic = found
+        transposed.append((part.get('id'), label))
+        row = tables.row(choose_spelling(0, diatonic, chromatic)[0])
+        for elem in part.iter():
+            tag = elem.tag
+            if tag == 'key':
+                fifths = elem.find('fifths')
+                if fifths is not None:
+                    interval, written = choose_spelling(int(fifths.text), diatonic, chromatic)
+                    fifths.text = str(written)
+                    row = tables.row(interval)
+                continue
+            if tag == 'note':
+                container = elem.find('pitch')
+                if container is None:
+                    continue
+                step_tag, alter_tag, octave_tag = 'step', 'alter', 'octave'
+                accidental = elem.find('accidental')
+            elif tag in ('root', 'bass'):
+                container = elem
+                step_tag, alter_tag, octave_tag = f'{tag}-step', f'{tag}-alter', None
+                accidental = None
+            else:
+                continue
+            step = container.find(step_tag)
+            if step is None or (step.text or '').strip() not in STEPS:
+                continue
+            octave = container.find(octave_tag) if octave_tag else None
+            targets.append((container, step, alter_tag, octave, accidental))
+            rows.append(row)
+            steps.append(STEPS.index(step.text.strip()))
+            alters.append(float(container.findtext(alter_tag) or 0))
+            octaves.append(int(octave.text) if octave is not None else 0)
+        _add_transpose(part, diatonic, chromatic)
+
+    if not targets:
+        return transposed
+
+    # Bulk transposition: one lookup per note into the stacked step tables
+    table = tables.stacked()
+    rows = np.array(rows)
+    steps = np.array(steps)
+    new_steps = table[rows, 0, steps]
+    new_octaves = np.array(octaves) + table[rows, 1, steps]
+    new_alters = np.array(alters) + table[rows, 2, steps]
+
+    for (container, step, alter_tag, octave, accidental), new_step, new_alter, new_octave in zip(
+            targets, new_steps.tolist(), new_alters.tolist(), new_octaves.tolist()):
+        step.text = STEPS[new_step]
+        _set_alter(container, step, alter_tag, new_alter)
+        if octave is not None:
+            octave.text = str(new_octave)
+        # A displayed accidental keeps its place but shows the new spelling
+        if accidental is not None and new_alter in ACCIDENTALS:
+            accidental.text = ACCIDENTALS[int(new_alter)]
+    return transposed
+
+
+def main():
+    args = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    configure_output(sys.argv[1:])
+    if not args:
+        print(__doc__)
+        return
+    score_path = args[0]
+    if len(args) > 1:
+        out_path = args[1]
+    else:
+        stem, ext = os.path.splitext(score_path)
+        out_path = f"{stem}-transposed{ext}"
+
+    print("=" * 60)
+    print("TRANSPOSITION ENGINE - written pitch")
+    print("=" * 60)
+
+    tree = parse_score(score_path)
+    transposed = transpose_parts(tree.getroot())
+    for part_id, label in transposed:
+        print(f"  {part_id:<6} {label}")
+    if not transposed:
+        print("  No concert-pitch transposing parts found")
+
+    out_path = write_tree(tree, out_path, indent=None)
+    print(f"\nSaved: {out_path}")
+
+
+if __name__ == "__main__":
+    main()
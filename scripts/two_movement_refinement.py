@@ -3,9 +3,16 @@
 2-MOVEMENT EXCELLENCE REFINEMENT PASS
 Movements III (Bartók Night) and IV (German Development) only
 Do NOT touch Movements I or II
+
+Usage: python scripts/two_movement_refinement.py [--jobs N]   (movements in N worker processes, 0 = one per CPU)
 """
 
 import os
+import sys
+
+from job_pool import parse_jobs, run_movements
+from score_features import extract_features, has_marker
+from score_writer import configure_output, write_score
 
 # ============ SHARED UTILITIES ============
 def n(step, oct, dur, typ, alt=None, dot=False, chord=False, 
@@ -116,63 +123,64 @@ def attr(key=0):
 
 # ============ EXCELLENCE EVALUATION ENGINE ============
 def evaluate_excellence(xml, movement_name):
+    f = extract_features(xml)
     scores = {}
     details = {}
     
     # 1. Motivic Identity
-    slur_count = xml.count('<slur')
-    accent_count = xml.count('<accent/>')
+    slur_count = f['slurs']
+    accent_count = f['accents']
     motif_score = min(1.0, (slur_count / 24) * 0.5 + (accent_count / 20) * 0.5)
     scores["Motivic Identity"] = motif_score
     details["Motivic Identity"] = f"slurs={slur_count}, accents={accent_count}"
     
     # 2. Motivic Development
-    oct5 = xml.count('<octave>5</octave>')
-    oct4 = xml.count('<octave>4</octave>')
-    oct3 = xml.count('<octave>3</octave>')
-    oct6 = xml.count('<octave>6</octave>')
+    oct5 = f['octaves'].get(5, 0)
+    oct4 = f['octaves'].get(4, 0)
+    oct3 = f['octaves'].get(3, 0)
+    oct6 = f['octaves'].get(6, 0)
     octave_variety = min(1.0, (oct5 + oct4 + oct3 + oct6) / 60)
     scores["Motivic Development"] = octave_variety
     details["Motivic Development"] = f"oct3={oct3}, oct4={oct4}, oct5={oct5}, oct6={oct6}"
     
     # 3. Melodic Contour
-    alter_count = xml.count('<alter>')
+    alter_count = f['alters']
     contour_score = min(1.0, (oct5 / 18) * 0.5 + (alter_count / 25) * 0.5)
     scores["Melodic Contour"] = contour_score
     details["Melodic Contour"] = f"oct5={oct5}, alters={alter_count}"
     
     # 4. Harmonic Colour
-    harmony_count = xml.count('<harmony')
-    degree_count = xml.count('<degree>')
+    harmony_count = f['harmonies']
+    degree_count = f['degrees']
     harmony_score = min(1.0, (harmony_count / 14) * 0.4 + (degree_count / 30) * 0.6)
     scores["Harmonic Colour"] = harmony_score
     details["Harmonic Colour"] = f"harmonies={harmony_count}, degrees={degree_count}"
     
     # 5. Phrasing & Breath
-    slur_starts = xml.count('<slur type="start"')
-    slur_ends = xml.count('<slur type="stop"')
+    slur_starts = f['slur_starts']
+    slur_ends = f['slur_stops']
     phrasing_score = min(1.0, (slur_starts / 12) * 0.5 + (slur_ends / 12) * 0.5)
     scores["Phrasing & Breath"] = phrasing_score
     details["Phrasing & Breath"] = f"slur_starts={slur_starts}, slur_ends={slur_ends}"
     
     # 6. LH Accompaniment Quality
-    staff2_count = xml.count('staff="2"')
-    chord_count = xml.count('<chord/>')
+    staff2_count = f['staff2']
+    chord_count = f['chords']
     lh_score = min(1.0, (staff2_count / 96) * 0.5 + (chord_count / 48) * 0.5)
     scores["LH Accompaniment"] = lh_score
     details["LH Accompaniment"] = f"staff2={staff2_count}, chords={chord_count}"
     
     # 7. Idiomatic Style
-    dynamics_count = xml.count('<dynamics>')
-    words_count = xml.count('<words')
+    dynamics_count = f['dynamics']
+    words_count = f['words']
     style_score = min(1.0, (dynamics_count / 6) * 0.5 + (words_count / 5) * 0.5)
     scores["Idiomatic Style"] = style_score
     details["Idiomatic Style"] = f"dynamics={dynamics_count}, expressions={words_count}"
     
     # 8. Formal Shape
-    has_rit = 'rit' in xml.lower()
-    has_section = any(x in xml.lower() for x in ['expanding', 'dissolving', 'ankunft', 'breiter', 'nocturnal'])
-    measure_count = xml.count('<measure number=')
+    has_rit = has_marker(f, 'rit')
+    has_section = has_marker(f, 'expanding', 'dissolving', 'ankunft', 'breiter', 'nocturnal')
+    measure_count = f['measures']
     formal_score = 0.0
     if has_rit:
         formal_score += 0.4
@@ -184,17 +192,17 @@ def evaluate_excellence(xml, movement_name):
     details["Formal Shape"] = f"rit={has_rit}, sections={has_section}, measures={measure_count}"
     
     # 9. Emotional Arc
-    fermata_count = xml.count('<fermata')
-    ff_count = xml.count('<ff/>')
-    pp_count = xml.count('<pp/>')
+    fermata_count = f['fermatas']
+    ff_count = f['dynamic_marks']['ff']
+    pp_count = f['dynamic_marks']['pp']
     emotional_score = min(1.0, (fermata_count / 1) * 0.4 + (accent_count / 15) * 0.4 + ((ff_count + pp_count) / 2) * 0.2)
     scores["Emotional Arc"] = emotional_score
     details["Emotional Arc"] = f"fermatas={fermata_count}, accents={accent_count}, dynamics extremes={ff_count+pp_count}"
     
     # 10. Engraving Quality
-    has_barline = '<barline' in xml
+    has_barline = f['barlines'] > 0
     has_correct_bars = 12 <= measure_count <= 16
-    has_staves = '<staves>2</staves>' in xml
+    has_staves = f['staves2'] > 0
     engraving_score = 0.0
     if has_barline:
         engraving_score += 0.4
@@ -693,8 +701,36 @@ def gen_mvmt4_refined():
     return hdr("The Master's Palette - IV. German Development", 0) + m + ftr()
 
 # ============ MAIN ENGINE ============
+def refine_movement(task):
+    """One generate -> write -> evaluate cycle for a movement (a pool worker under --jobs)."""
+    scores_dir, name, filename, generator = task
+    xml = generator()
+    filepath = os.path.join(scores_dir, filename)
+    
+    filepath = write_score(filepath, xml)
+    
+    total, scores, details = evaluate_excellence(xml, name)
+    return total, scores, filepath
+
+def refine_until_excellent(task):
+    """
+    Run refine_movement() cycles for one movement until it scores 8.0 or
+    max_iterations is reached (a pool worker under --jobs).
+
+    Returns the (total, scores, filepath) of every cycle, in order.
+    """
+    scores_dir, name, filename, generator, max_iterations = task
+    cycles = []
+    for _ in range(max_iterations):
+        cycles.append(refine_movement((scores_dir, name, filename, generator)))
+        if cycles[-1][0] >= 8.0:
+            break
+    return cycles
+
 def main():
+    configure_output(sys.argv[1:])
     scores_dir = os.path.join(os.path.dirname(__file__), "..", "scores")
+    jobs = parse_jobs(sys.argv[1:])
     
     print("=" * 70)
     print("2-MOVEMENT EXCELLENCE REFINEMENT PASS")
@@ -710,25 +746,31 @@ def main():
     
     history = {name: [] for name in movements.keys()}
     final_results = {}
-    iteration = 0
     max_iterations = 5
     
-    while iteration < max_iterations:
-        iteration += 1
+    # Each movement runs its whole refinement loop in one task; the cycles
+    # are reported below iteration by iteration
+    tasks = [(scores_dir, name, filename, generator, max_iterations)
+             for name, (filename, generator) in movements.items()]
+    cycles = dict(zip(movements.keys(), run_movements(refine_until_excellent, tasks, jobs)))
+    
+    for iteration in range(1, max(len(c) for c in cycles.values()) + 1):
         print(f"\n{'='*70}")
         print(f"ITERATION {iteration}")
         print(f"{'='*70}")
         
         all_pass = True
         
-        for name, (filename, generator) in movements.items():
-            xml = generator()
-            filepath = os.path.join(scores_dir, filename)
-            
-            with open(filepath, "w", encoding="utf-8") as f:
-                f.write(xml)
-            
-            total, scores, details = evaluate_excellence(xml, name)
+        for name, movement_cycles in cycles.items():
+            if iteration > len(movement_cycles):
+                # Its loop stopped once it passed; the score still counts for
+                # this iteration, so the summary's iteration counts and score
+                # arcs cover every iteration run
+                history[name].append(final_results[name][0])
+                print(f"\n{name}")
+                print(f"  Already passing ({final_results[name][0]:.2f}/10.0) - skipped")
+                continue
+            total, scores, filepath = movement_cycles[iteration - 1]
             history[name].append(total)
             
             status = "EXCELLENT" if total >= 8.0 else "REFINE"
@@ -756,14 +798,14 @@ def main():
     print("FINAL SUMMARY TABLE")
     print("=" * 70)
     print()
-    print(f"{'Movement':<30} {'Cycles':<10} {'Final Score':<15} {'Status'}")
+    print(f"{'Movement':<30} {'Iterations':<12} {'Final Score':<13} {'Status'}")
     print("-" * 70)
     
     for name in movements.keys():
         total, scores, filepath = final_results[name]
-        cycle_count = len(history[name])
+        iter_count = len(history[name])
         status = "EXCELLENT" if total >= 8.0 else "NEEDS WORK"
-        print(f"{name:<30} {cycle_count:<10} {total:.2f}/10.0        {status}")
+        print(f"{name:<30} {iter_count:<12} {total:.2f}/10.0     {status}")
     
     print("-" * 70)
     print()
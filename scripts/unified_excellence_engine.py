@@ -3,9 +3,16 @@
 UNIFIED EXCELLENCE REFINEMENT ENGINE
 Movements I, III, IV → Final versions at ≥8/10
 Movement II unchanged
+
+Usage: python scripts/unified_excellence_engine.py [--jobs N]   (movements in N worker processes, 0 = one per CPU)
 """
 
 import os
+import sys
+
+from job_pool import parse_jobs, run_movements
+from score_features import extract_features, has_marker
+from score_writer import configure_output, write_score
 
 # ============ SHARED UTILITIES ============
 def n(step, oct, dur, typ, alt=None, dot=False, chord=False, 
@@ -116,17 +123,18 @@ def attr(key=0):
 
 # ============ EVALUATION (10 CRITERIA) ============
 def evaluate(xml):
+    f = extract_features(xml)
     s = {}
-    s["Motivic Identity"] = 1 if xml.count('<slur') >= 10 else 0
-    s["Motivic Development"] = 1 if xml.count('<accent/>') >= 6 else 0
-    s["Melodic Contour"] = 1 if xml.count('<octave>5</octave>') >= 8 and xml.count('<octave>4</octave>') >= 6 else 0
-    s["Harmonic Colour"] = 1 if xml.count('<harmony') >= 12 and xml.count('<degree>') >= 10 else 0
-    s["Phrase Logic"] = 1 if xml.count('<slur type="start"') >= 10 else 0
-    s["LH Accompaniment"] = 1 if xml.count('staff="2"') >= 60 and xml.count('<chord/>') >= 30 else 0
-    s["Idiomatic Writing"] = 1 if xml.count('<dynamics>') >= 4 else 0
-    s["Formal Shape"] = 1 if 'rit' in xml.lower() and ('brighter' in xml.lower() or 'expanding' in xml.lower() or 'ankunft' in xml.lower() or 'dissolving' in xml.lower()) else 0
-    s["Emotional Impact"] = 1 if '<fermata' in xml and xml.count('<accent/>') >= 5 else 0
-    s["Engraving Quality"] = 1 if '<barline' in xml and xml.count('<measure number=') == 12 else 0
+    s["Motivic Identity"] = 1 if f['slurs'] >= 10 else 0
+    s["Motivic Development"] = 1 if f['accents'] >= 6 else 0
+    s["Melodic Contour"] = 1 if f['octaves'].get(5, 0) >= 8 and f['octaves'].get(4, 0) >= 6 else 0
+    s["Harmonic Colour"] = 1 if f['harmonies'] >= 12 and f['degrees'] >= 10 else 0
+    s["Phrase Logic"] = 1 if f['slur_starts'] >= 10 else 0
+    s["LH Accompaniment"] = 1 if f['staff2'] >= 60 and f['chords'] >= 30 else 0
+    s["Idiomatic Writing"] = 1 if f['dynamics'] >= 4 else 0
+    s["Formal Shape"] = 1 if has_marker(f, 'rit') and has_marker(f, 'brighter', 'expanding', 'ankunft', 'dissolving') else 0
+    s["Emotional Impact"] = 1 if f['fermatas'] > 0 and f['accents'] >= 5 else 0
+    s["Engraving Quality"] = 1 if f['barlines'] > 0 and f['measures'] == 12 else 0
     return sum(s.values()), s
 
 # ============ MOVEMENT I: MINGUS BLUES CATHEDRAL - FINAL ============
@@ -774,8 +782,23 @@ def gen_mvmt4():
     return hdr("The Master's Palette - IV. German Development", 0) + m + ftr()
 
 # ============ MAIN ============
+def refine_movement(task):
+    """Generate, write and evaluate one movement (a pool worker under --jobs)."""
+    scores_dir, filename, generator, title = task
+    xml = generator()
+    filepath = os.path.join(scores_dir, filename)
+    
+    filepath = write_score(filepath, xml)
+    
+    score, details = evaluate(xml)
+    passed = [k for k, v in details.items() if v == 1]
+    failed = [k for k, v in details.items() if v == 0]
+    return (title, score, passed, failed, filepath)
+
 def main():
+    configure_output(sys.argv[1:])
     scores_dir = os.path.join(os.path.dirname(__file__), "..", "scores")
+    jobs = parse_jobs(sys.argv[1:])
     
     print("=" * 70)
     print("UNIFIED EXCELLENCE REFINEMENT ENGINE")
@@ -788,21 +811,12 @@ def main():
         ("Movement4-Excellent-Final.musicxml", gen_mvmt4, "IV. German Development"),
     ]
     
-    results = []
     version = 1
     
-    for filename, generator, title in movements:
-        xml = generator()
-        filepath = os.path.join(scores_dir, filename)
-        
-        with open(filepath, "w", encoding="utf-8") as f:
-            f.write(xml)
-        
-        score, details = evaluate(xml)
-        passed = [k for k, v in details.items() if v == 1]
-        failed = [k for k, v in details.items() if v == 0]
-        results.append((title, score, passed, failed, filepath))
-        
+    tasks = [(scores_dir, filename, generator, title) for filename, generator, title in movements]
+    results = run_movements(refine_movement, tasks, jobs)
+    
+    for title, score, passed, failed, filepath in results:
         status = "PASS" if score >= 8 else "REFINE"
         print(f"GENERATED: {title}")
         print(f"  Version: {version}")
@@ -18,11 +18,14 @@ Target Scores:
 """
 
 import xml.etree.ElementTree as ET
-from xml.dom import minidom
 import os
 import copy
 from datetime import datetime
 import random
+import sys
+
+from pass_tracer import PassTracer, parse_trace
+from score_writer import configure_output, parse_score, write_tree
 
 # MusicXML Duration Constants (divisions=256)
 DIVISIONS = 256
@@ -44,6 +47,29 @@ ALTERATIONS = {-1: 'flat', 0: 'natural', 1: 'sharp'}
 class SuiteRefinementEngine:
     """Main engine for unified suite refinement."""
     
+    # Methods timed by PassTracer when run with --trace
+    PASSES = (
+        'load_movements',
+        'enhance_movement_1_mingus', '_add_mingus_variation_section',
+        '_apply_registral_contrast_mingus', '_add_bass_independence_mingus',
+        '_add_harmonic_surprise_mingus',
+        'enhance_movement_2_gil_evans', '_apply_texture_swaps_gil', '_add_harmonic_swirl_gil',
+        '_add_inner_voice_animation_gil', '_add_planed_motion_gil',
+        'enhance_movement_3_bartok', '_apply_registral_spread_bartok', '_add_colour_sparks_bartok',
+        '_add_motivic_development_bartok', '_enhance_textural_arc_bartok',
+        'enhance_movement_4_german', '_enhance_development_clarity_german',
+        '_add_orchestral_dialogue_german', '_add_harmonic_intensification_german',
+        '_add_contrast_boost_german',
+        'enhance_movement_5_tintinnabuli', '_add_thematic_ties_tintinnabuli',
+        '_ensure_purity_tintinnabuli', '_enhance_final_arc_tintinnabuli',
+        'apply_engraving_polish', '_clean_collisions', '_normalize_spacing',
+        '_optimize_system_breaks', '_ensure_consistent_ordering',
+        'apply_humanisation', '_add_phrase_shapes', '_add_breath_marks', '_humanise_dynamics',
+        'run_excellence_engine', '_evaluate_category', '_apply_auto_corrections',
+        'save_enhanced_movements', 'generate_full_score', 'generate_summary_report',
+        '_write_musicxml',
+    )
+    
     def __init__(self, base_path):
         self.base_path = base_path
         self.movements = {}
@@ -68,7 +94,7 @@ class SuiteRefinementEngine:
         
         for mvmt_num, filepath in movement_files.items():
             self.log(f"Loading Movement {mvmt_num}: {os.path.basename(filepath)}")
-            tree = ET.parse(filepath)
+            tree = parse_score(filepath)
             self.movements[mvmt_num] = tree
             
     def create_note(self, step, octave, duration, note_type, staff=1, alter=None, 
@@ -785,7 +811,7 @@ class SuiteRefinementEngine:
             
             # Save file
             output_path = os.path.join(output_dir, f"Movement{mvmt_num}-FinalSuiteEnhanced.musicxml")
-            self._write_musicxml(tree, output_path)
+            output_path = self._write_musicxml(tree, output_path)
             self.log(f"  -> Saved: {os.path.basename(output_path)}")
             
     def generate_full_score(self):
@@ -809,8 +835,8 @@ class SuiteRefinementEngine:
             if title is not None:
                 title.text = "The Master's Palette - Complete Suite (Enhanced)"
                 
-        self._write_musicxml(tree, full_score_path)
-        self.log(f"  -> Saved: Final-Suite-FullScore-Enhanced.musicxml")
+        full_score_path = self._write_musicxml(tree, full_score_path)
+        self.log(f"  -> Saved: {os.path.basename(full_score_path)}")
         
     def generate_summary_report(self):
         """Generate the refinement summary report."""
@@ -894,40 +920,8 @@ class SuiteRefinementEngine:
         self.log(f"  -> Saved: suite-refinement-report.md")
         
     def _write_musicxml(self, tree, filepath):
-        """Write MusicXML with proper formatting."""
-        # Convert to string
-        rough_string = ET.tostring(tree.getroot(), encoding='unicode')
-        
-        # Add XML declaration and DOCTYPE
-        xml_content = '<?xml version="1.0" encoding="UTF-8"?>\n'
-        xml_content += '<!DOCTYPE score-partwise PUBLIC "-//Recordare//DTD MusicXML 3.1 Partwise//EN" "http://www.musicxml.org/dtds/partwise.dtd">\n'
-        xml_content += rough_string
-        
-        # Parse and prettify
-        try:
-            dom = minidom.parseString(xml_content)
-            pretty_xml = dom.toprettyxml(indent="  ")
-            
-            # Remove extra blank lines
-            lines = [line for line in pretty_xml.split('\n') if line.strip()]
-            
-            # Fix DOCTYPE (minidom duplicates XML declaration)
-            output_lines = []
-            seen_xml_decl = False
-            for line in lines:
-                if '<?xml' in line:
-                    if not seen_xml_decl:
-                        output_lines.append(line)
-                        seen_xml_decl = True
-                else:
-                    output_lines.append(line)
-                    
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write('\n'.join(output_lines))
-        except Exception as e:
-            # Fallback: write raw content
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(xml_content)
+        """Write MusicXML with proper formatting, streamed straight to the file."""
+        return write_tree(tree, filepath)
 
     # ============================================================
     # MAIN EXECUTION
@@ -983,8 +977,18 @@ def main():
     """Main entry point."""
     base_path = r"C:\Users\mike\Documents\Cursor AI Projects\large-ensemble-assistant"
     
+    configure_output(sys.argv[1:])
     engine = SuiteRefinementEngine(base_path)
+    trace_path = parse_trace(sys.argv[1:])
+    tracer = None
+    if trace_path:
+        tracer = PassTracer()
+        tracer.instrument(engine, engine.PASSES, log_methods=('log',))
     success = engine.run()
+    if tracer:
+        tracer.export(trace_path)
+        tracer.print_summary()
+        print(f"\nTrace: {trace_path}")
     
     if success:
         print("\n[OK] All enhanced files saved to: scores/Bora Lesson on 14 Dec 2025/")
@@ -0,0 +1,76 @@
+import sys
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+
+import assemble_prisms_suite as suite
+
+BB_TRANSPOSE = '<transpose><diatonic>-1</diatonic><chromatic>-2</chromatic></transpose>'
+
+
+def part(pid, divisions, fifths, bars, transpose='', clef=('G', 2)):
+    measures = []
+    for bar in range(1, bars + 1):
+        attributes = ''
+        if bar == 1:
+            attributes = (f'<attributes><divisions>{divisions}</divisions><key><fifths>{fifths}</fifths></key>'
+                          '<time><beats>4</beats><beat-type>4</beat-type></time>'
+                          f'<clef><sign>{clef[0]}</sign><line>{clef[1]}</line></clef>{transpose}</attributes>')
+        elif bar == 3:
+            attributes = f'<attributes><key><fifths>{fifths + 1}</fifths></key></attributes>'
+        measures.append(f'<measure number="{bar}">{attributes}<note><pitch><step>C</step><octave>4</octave>'
+                        f'</pitch><duration>{4 * divisions}</duration><voice>1</voice><type>whole</type></note>'
+                        '</measure>')
+    return f'<part id="{pid}">' + ''.join(measures) + '</part>'
+
+
+def movement(parts):
+    part_list = ''.join(f'<score-part id="{pid}"><part-name>{name}</part-name></score-part>'
+                        for pid, name, _ in parts)
+    return ('<?xml version="1.0" encoding="UTF-8"?><score-partwise version="3.1">'
+            f'<part-list>{part_list}</part-list>' + ''.join(body for _, _, body in parts)
+            + '</score-partwise>')
+
+
+@pytest.fixture
+def suite_dir(tmp_path, monkeypatch):
+    full = [('P1', 'Flute', part('P1', 256, 0, 4)),
+            ('P2', 'Trumpet in Bb', part('P2', 256, 2, 4, BB_TRANSPOSE)),
+            ('P3', 'Bass', part('P3', 256, 0, 4, clef=('F', 4)))]
+    # Movement 2 has no flute and its own part ids; movement 3 is on another
+    # time base and has no trumpet
+    second = [('P1', 'Trumpet in Bb', part('P1', 480, 2, 6, BB_TRANSPOSE)),
+              ('P2', 'Bass', part('P2', 480, 0, 5, clef=('F', 4)))]
+    third = [('P1', 'Flute', part('P1', 480, -1, 6)),
+             ('P2', 'Bass', part('P2', 480, -1, 5, clef=('F', 4)))]
+    for filename, parts in zip(suite.MOVEMENT_FILES, [full, second, third, full, full]):
+        (tmp_path / filename).write_text(movement(parts))
+    monkeypatch.setattr(suite, 'SOURCE_DIR', str(tmp_path))
+    monkeypatch.setattr(suite, 'OUTPUT_DIR', str(tmp_path))
+    return tmp_path
+
+
+def test_streaming_assembly_matches_the_tree_assembly(suite_dir, capsys):
+    tree_output = Path(suite.assemble_suite()).read_bytes()
+    stream_output = Path(suite.assemble_suite_streaming(jobs=2)).read_bytes()
+    capsys.readouterr()
+    assert stream_output == tree_output
+
+    root = ET.fromstring(tree_output)
+    assert [sp.findtext('part-name') for sp in root.iter('score-part')] == ['Flute', 'Trumpet in Bb', 'Bass']
+    assert {d.text for d in root.iter('divisions')} == {'3840'}
+    for p in root.findall('part'):
+        assert [m.get('number') for m in p.findall('measure')] == [str(n) for n in range(1, 25)]
+
+    # Tacet bars follow the movement's key changes: concert pitch for the
+    # flute in movement 2, written pitch for the trumpet in movement 3
+    flute, trumpet, _ = root.findall('part')
+    keys = {p.get('id'): {m.get('number'): m.findtext('attributes/key/fifths')
+                          for m in p.findall('measure') if m.find('attributes/key') is not None}
+            for p in (flute, trumpet)}
+    assert [keys['P1'][n] for n in ('5', '7')] == ['0', '1']
+    assert [keys['P2'][n] for n in ('11', '13')] == ['1', '2']
+    assert trumpet.find("measure[@number='11']/note/rest") is not None
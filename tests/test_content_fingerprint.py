@@ -0,0 +1,72 @@
+import sys
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+
+from content_fingerprint import (CATEGORIES, compare_fingerprints, expected_parts,
+                                 score_fingerprints)
+
+SCORE = '''<score-partwise><part-list><score-part id="P1"/></part-list><part id="P1">
+<measure number="1">
+  <attributes><divisions>2</divisions></attributes>
+  <direction placement="above"><direction-type><words>I. Opening</words></direction-type></direction>
+  <direction placement="below"><direction-type><dynamics default-y="-70"><p/></dynamics></direction-type></direction>
+  <note default-x="80"><pitch><step>C</step><octave>4</octave></pitch><duration>2</duration>
+    <tie type="start"/><type>quarter</type><stem>up</stem><notations><tied type="start"/></notations></note>
+  <note default-x="140"><pitch><step>C</step><octave>4</octave></pitch><duration>6</duration>
+    <tie type="stop"/><type>half</type><dot/><notations><tied type="stop"/></notations></note>
+</measure>
+<measure number="2">
+  <note><pitch><step>E</step><octave>4</octave></pitch><duration>8</duration><type>whole</type></note>
+</measure>
+</part></score-partwise>'''
+
+
+def fingerprints(xml):
+    return score_fingerprints(ET.fromstring(xml))
+
+
+def changed(xml):
+    """Categories that differ, per bar, between SCORE and an edited copy"""
+    changes = compare_fingerprints(expected_parts([('source', fingerprints(SCORE))]), fingerprints(xml))
+    return [(c['measure'], c['problem']) for c in changes]
+
+
+def test_pitch_and_tie_edits_change_the_fingerprint():
+    assert changed(SCORE.replace('<step>E</step>', '<step>F</step>')) == [('2', 'changed: pitch')]
+    untied = (SCORE.replace('<tie type="start"/>', '').replace('<tied type="start"/>', '')
+              .replace('<tie type="stop"/>', '').replace('<tied type="stop"/>', ''))
+    assert changed(untied) == [('1', 'changed: ties')]
+    assert changed(SCORE.replace('<p/>', '<f/>')) == [('1', 'changed: dynamics')]
+
+
+def test_layout_edits_keep_the_fingerprint():
+    relaid = (SCORE.replace(' default-x="80"', ' default-x="95"').replace('<stem>up</stem>', '<stem>down</stem>')
+              .replace('placement="below"', 'placement="above"').replace(' default-y="-70"', '')
+              .replace('I. Opening', 'I. Opening (revised)')
+              .replace('<measure number="2">', '<measure number="2"><print new-system="yes"/>'))
+    assert changed(relaid) == []
+
+
+def test_divisions_rescaling_keeps_the_fingerprint():
+    rescaled = (SCORE.replace('<divisions>2</divisions>', '<divisions>480</divisions>')
+                .replace('<duration>2</duration>', '<duration>480</duration>')
+                .replace('<duration>6</duration>', '<duration>1440</duration>')
+                .replace('<duration>8</duration>', '<duration>1920</duration>'))
+    assert changed(rescaled) == []
+    # The same numbers without the new divisions are a rhythm change
+    assert ('2', 'changed: rhythm') in changed(rescaled.replace('<divisions>480</divisions>', ''))
+
+
+def test_missing_and_added_bars_are_reported(tmp_path):
+    path = tmp_path / 'score.musicxml'
+    path.write_text(SCORE)
+    streamed = score_fingerprints(str(path))
+    assert streamed == fingerprints(SCORE)
+    assert len(streamed[0][1][0][1]) == len(CATEGORIES)
+
+    one_bar = expected_parts([('source', [(pid, bars[:1]) for pid, bars in streamed])])
+    assert [(c['measure'], c['problem']) for c in compare_fingerprints(one_bar, streamed)] == [('2', 'added')]
+    assert [(c['source'], c['problem']) for c in compare_fingerprints(
+        expected_parts([('source', streamed)]), [('P1', streamed[0][1][:1])])] == [('source m. 2', 'missing')]
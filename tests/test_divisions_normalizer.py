@@ -0,0 +1,63 @@
+import sys
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+
+from divisions_normalizer import normalize_divisions, suite_time_base, time_base
+
+
+def durations(part):
+    return [e.text for e in part.iter('duration')]
+
+
+def test_parts_are_rescaled_to_the_lcm():
+    root = ET.fromstring(
+        '<score-partwise>'
+        '<part id="P1"><measure number="1"><attributes><divisions>256</divisions></attributes>'
+        '<note><duration>1024</duration></note></measure></part>'
+        '<part id="P2"><measure number="1"><attributes><divisions>480</divisions></attributes>'
+        '<note attack="120"><duration>240</duration></note><backup><duration>240</duration></backup>'
+        '<forward><duration>240</duration></forward>'
+        '<direction><offset>60</offset></direction></measure>'
+        '<measure number="2"><attributes><divisions>3</divisions></attributes>'
+        '<note><duration>1</duration></note></measure></part>'
+        '</score-partwise>')
+    result = normalize_divisions(root)
+
+    assert result == {'divisions': 3840, 'parts': 2, 'rescaled': 7}
+    p1, p2 = root.findall('part')
+    assert [e.text for e in root.iter('divisions')] == ['3840'] * 3
+    assert durations(p1) == ['15360']
+    # A quarter of 480 and of 3 divisions is the same quarter of 3840
+    assert durations(p2) == ['1920', '1920', '1920', '1280']
+    assert p2.find('.//offset').text == '480'
+    assert p2.find('.//note').get('attack') == '960'
+
+
+def test_parts_on_the_time_base_are_left_alone():
+    root = ET.fromstring('<part id="P1"><measure number="1"><attributes><divisions>4</divisions>'
+                         '</attributes><note><duration>3</duration></note></measure></part>')
+    assert normalize_divisions(root, 4) == {'divisions': 4, 'parts': 0, 'rescaled': 0}
+    assert durations(root) == ['3']
+
+
+def test_undeclared_divisions_are_added():
+    root = ET.fromstring('<part id="P1"><measure number="1"><print/>'
+                         '<note><duration>1</duration></note></measure></part>')
+    normalize_divisions(root, 8)
+    measure = root.find('measure')
+    assert [child.tag for child in measure] == ['print', 'attributes', 'note']
+    assert measure.findtext('attributes/divisions') == '8'
+    assert durations(root) == ['8']
+
+
+def test_suite_time_base_scans_raw_xml(tmp_path):
+    a = tmp_path / 'a.musicxml'
+    b = tmp_path / 'b.musicxml'
+    a.write_text('<score-partwise><part><measure><attributes><divisions>256</divisions>'
+                 '</attributes></measure></part></score-partwise>')
+    b.write_text('<score-partwise><part><measure><attributes><divisions> 480 </divisions>'
+                 '</attributes></measure></part></score-partwise>')
+    assert suite_time_base([a, b, tmp_path / 'missing.musicxml']) == (3840, [256, 480])
+    assert time_base([]) == 1
@@ -0,0 +1,50 @@
+import io
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+
+from duration_validator import validate_score
+
+NOTE = '<note><pitch><step>C</step><octave>4</octave></pitch><duration>{d}</duration>{extra}</note>'
+
+
+def score(measure_body, measure='<measure number="1">'):
+    return io.BytesIO((
+        '<score-partwise><part-list><score-part id="P1"><part-name>Pno</part-name>'
+        '</score-part></part-list><part id="P1">' + measure + '<attributes>'
+        '<divisions>4</divisions><time><beats>4</beats><beat-type>4</beat-type></time>'
+        '<staves>2</staves></attributes>' + measure_body + '</measure></part></score-partwise>'
+    ).encode())
+
+
+def test_unlabelled_second_staff_is_its_own_voice():
+    body = (NOTE.format(d=16, extra='<staff>1</staff>')
+            + '<backup><duration>16</duration></backup>'
+            + NOTE.format(d=16, extra='<staff>2</staff>')
+            + NOTE.format(d=16, extra='<chord/><staff>2</staff>'))
+    assert validate_score(score(body)) == (1, [])
+
+
+def test_short_staff_is_still_reported():
+    body = (NOTE.format(d=16, extra='<voice>1</voice><staff>1</staff>')
+            + '<backup><duration>16</duration></backup>'
+            + NOTE.format(d=8, extra='<voice>5</voice><staff>2</staff>'))
+    _, errors = validate_score(score(body))
+    assert [(e['staff'], e['voice'], e['actual'], e['problem']) for e in errors] == [
+        (2, 5, 8, 'voice fill')]
+
+
+def test_missing_backup_overflows_the_bar():
+    body = (NOTE.format(d=16, extra='<voice>1</voice>')
+            + NOTE.format(d=16, extra='<voice>2</voice>'))
+    _, errors = validate_score(score(body))
+    assert [(e['voice'], e['actual'], e['expected'], e['problem']) for e in errors] == [
+        (None, 32, 16, 'overflow')]
+
+
+def test_short_pickup_and_empty_bar():
+    pickup = '<measure number="0" implicit="yes">'
+    assert validate_score(score(NOTE.format(d=4, extra=''), pickup)) == (1, [])
+    _, errors = validate_score(score(''))
+    assert [(e['measure'], e['problem']) for e in errors] == [('1', 'empty')]
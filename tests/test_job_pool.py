@@ -0,0 +1,18 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+
+from job_pool import parse_jobs
+
+
+def test_serial_without_jobs():
+    assert parse_jobs(['--compact']) == 1
+
+
+@pytest.mark.parametrize('args', [['--jobs', '-1'], ['--jobs=-4'], ['--jobs', 'many']])
+def test_bad_jobs_value_is_a_usage_error(args):
+    with pytest.raises(SystemExit):
+        parse_jobs(args)
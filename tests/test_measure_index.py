@@ -0,0 +1,40 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+
+from measure_index import MeasureReader, build_index, load_index, sidecar_path
+
+PARTWISE = (
+    '<score-partwise><part-list><score-part id="P1"/><score-part id="P2"/></part-list>'
+    '<part id="P1"><measure number="1"><!-- <measure number="x"> --><note/></measure>'
+    '<measure number="2"><note/><note/></measure></part>'
+    '<part id="P2"><measure number="1"/><measure number="2"><rest/></measure></part>'
+    '</score-partwise>'
+)
+
+
+def test_index_round_trips_and_reads_single_measures(tmp_path):
+    path = tmp_path / 'score.musicxml'
+    path.write_text(PARTWISE)
+    index = load_index(str(path))
+    assert Path(sidecar_path(str(path))).exists()
+    assert index.parts == ['P1', 'P2']
+    assert [index.measure_count(p) for p in index.parts] == [2, 2]
+    assert load_index(str(path), rebuild=False).measures == index.measures
+
+    with MeasureReader(str(path), index) as reader:
+        assert len(reader.measure('P1', 2).findall('note')) == 2
+        assert [m.find('rest') is not None for m in reader.by_number('P2', '2')] == [True]
+        assert [m.get('number') for m in reader.measures('P2', 1, 2)] == ['1', '2']
+
+
+def test_timewise_score_is_rejected(tmp_path):
+    path = tmp_path / 'timewise.musicxml'
+    path.write_text('<score-timewise><part-list><score-part id="P1"/></part-list>'
+                    '<measure number="1"><part id="P1"><note/></part></measure>'
+                    '</score-timewise>')
+    with pytest.raises(ValueError, match='partwise'):
+        build_index(str(path))
@@ -0,0 +1,25 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+
+import assemble_full_score
+import suite_engraving_engine
+
+PARTS = [f"P{i}" for i in range(1, 11)] + ["P99"]
+
+
+@pytest.mark.parametrize('module', [assemble_full_score, suite_engraving_engine])
+@pytest.mark.parametrize('movement', range(1, 6))
+def test_bar_roles_match_rendered_notes(module, movement):
+    role = getattr(module, f'_movement{movement}_role')
+    notes = getattr(module, f'_movement{movement}_notes')
+    rendered = {}
+    for part_id in PARTS:
+        for bar in range(1, 13):
+            key = role(part_id, bar)
+            text = notes(part_id, bar)
+            assert (key is None) == (text is module.TACET)
+            assert rendered.setdefault(key, text) == text
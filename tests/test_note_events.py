@@ -0,0 +1,49 @@
+import io
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+
+from note_events import articulation_counts, load_note_events, range_violations
+
+
+def pitch(step, octave, extra=''):
+    return (f'<note><pitch><step>{step}</step><octave>{octave}</octave></pitch>'
+            f'<duration>1</duration>{extra}</note>')
+
+
+def clarinet(transpose, notes):
+    return io.BytesIO((
+        '<score-partwise><part-list><score-part id="P1"><part-name>Clarinet in Bb</part-name>'
+        '</score-part></part-list><part id="P1"><measure number="1"><attributes>'
+        f'<divisions>1</divisions>{transpose}</attributes>{notes}</measure></part></score-partwise>'
+    ).encode())
+
+
+BB_TRANSPOSE = '<transpose><diatonic>-1</diatonic><chromatic>-2</chromatic></transpose>'
+
+
+def test_notes_load_written_pitch_and_transpose():
+    events = load_note_events(clarinet(BB_TRANSPOSE, pitch('D', 5, '<notations><articulations>'
+                                                             '<accent/></articulations></notations>')))
+    notes = events['notes']
+    assert events['part_names'] == ['Clarinet in Bb']
+    assert notes['pitch'].tolist() == [74]
+    assert notes['transpose'].tolist() == [-2]
+    assert articulation_counts(notes)['accents'] == 1
+
+
+def test_range_check_uses_sounding_pitch():
+    # Written C7 sounds Bb6, the top of the range; written D3 sounds C3, below it
+    events = load_note_events(clarinet(BB_TRANSPOSE, pitch('C', 7) + pitch('D', 3)))
+    assert range_violations(events)['pitch'].tolist() == [50]
+
+    concert = load_note_events(clarinet('', pitch('C', 7) + pitch('D', 3)))
+    assert range_violations(concert)['pitch'].tolist() == [96]
+
+
+def test_octave_change_counts_twelve_semitones():
+    events = load_note_events(clarinet(
+        '<transpose><chromatic>-2</chromatic><octave-change>-1</octave-change></transpose>',
+        pitch('C', 5)))
+    assert events['notes']['transpose'].tolist() == [-14]
@@ -0,0 +1,71 @@
+import re
+import sys
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+
+from parts_extractor import condense_rests, extract_parts
+
+REST = b'<note><rest measure="yes"/><duration>4</duration></note>'
+NOTE = b'<note><pitch><step>C</step><octave>4</octave></pitch><duration>4</duration></note>'
+WORDS = b'<direction><direction-type><words>solo</words></direction-type></direction>'
+
+
+def part(*bars):
+    return (b'<part id="P1">'
+            + b''.join(b'<measure number="%d">%s</measure>' % (n, body) for n, body in enumerate(bars, 1))
+            + b'</part>')
+
+
+def multi_rests(part_bytes):
+    return {int(m.get('number')): int(m.findtext('attributes/measure-style/multiple-rest'))
+            for m in ET.fromstring(part_bytes).iter('measure')
+            if m.find('attributes/measure-style/multiple-rest') is not None}
+
+
+def test_runs_of_rest_bars_are_condensed():
+    condensed = condense_rests(part(
+        b'<attributes><divisions>1</divisions></attributes>' + REST, REST, REST,
+        NOTE,
+        REST,
+        WORDS + REST,
+        REST, REST))
+    assert multi_rests(condensed) == {1: 3, 7: 2}
+    first = ET.fromstring(condensed).find('measure')
+    assert [child.tag for child in first.find('attributes')] == ['divisions', 'measure-style']
+
+
+def test_attribute_changes_end_a_run():
+    condensed = condense_rests(part(
+        REST, REST, b'<attributes><key><fifths>1</fifths></key></attributes>' + REST, REST))
+    assert multi_rests(condensed) == {1: 2, 3: 2}
+
+
+def test_runs_already_condensed_are_left_alone():
+    bars = (b'<attributes><measure-style><multiple-rest>3</multiple-rest></measure-style></attributes>'
+            + REST, REST, REST, NOTE)
+    assert condense_rests(part(*bars)) == part(*bars)
+    assert condense_rests(part(NOTE, REST)) == part(NOTE, REST)
+
+
+def test_each_part_gets_its_own_file(tmp_path):
+    score = tmp_path / 'score.musicxml'
+    score.write_bytes(
+        b'<?xml version="1.0" encoding="UTF-8"?>\n<score-partwise version="3.1">\n'
+        b'<part-list><score-part id="P1"><part-name>Flute</part-name></score-part>'
+        b'<score-part id="P2"><part-name>Clarinet in Bb</part-name></score-part></part-list>\n'
+        + part(REST, REST) + b'\n'
+        + part(NOTE, REST).replace(b'"P1"', b'"P2"') + b'\n</score-partwise>\n')
+    written = extract_parts(str(score), str(tmp_path / 'parts'), multi_rests=True, transpose=True)
+
+    assert [(pid, name, Path(path).name) for pid, name, path in written] == [
+        ('P1', 'Flute', '1-Flute.musicxml'),
+        ('P2', 'Clarinet in Bb', '2-Clarinet-in-Bb.musicxml')]
+    flute = ET.parse(written[0][2]).getroot()
+    clarinet = ET.parse(written[1][2]).getroot()
+    assert [sp.get('id') for sp in flute.iter('score-part')] == ['P1']
+    assert multi_rests(ET.tostring(flute.find('part'))) == {1: 2}
+    assert clarinet.findtext('.//pitch/step') == 'D'
+    assert clarinet.find('.//transpose') is not None
+    assert re.search(rb'<credit-words[^>]*>Clarinet in Bb<', Path(written[1][2]).read_bytes())
@@ -0,0 +1,21 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+
+from patch_engine import PatchSet
+
+
+def sequential(patches, content):
+    for old, new in patches:
+        content = content.replace(old, new)
+    return content
+
+
+def test_pattern_formed_by_deletion_is_replaced():
+    patches = [('X', ''), ('ab', 'Z')]
+    patch_set = PatchSet('t')
+    for old, new in patches:
+        patch_set.replace(old, new)
+    assert patch_set.apply('aXb') == sequential(patches, 'aXb') == 'Z'
+    assert patch_set.stage_count == 2
@@ -0,0 +1,88 @@
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+
+from score_diff import diff_scores, edit_script, format_diff, match_parts, read_score
+
+STEPS = 'CDEFGAB'
+
+
+def bar(number, step, octave=4, extra=''):
+    return (f'<measure number="{number}"><note><pitch><step>{step}</step><octave>{octave}</octave></pitch>'
+            f'<duration>4</duration><type>whole</type>{extra}</note></measure>')
+
+
+def write_score(path, parts):
+    part_list = ''.join(f'<score-part id="{pid}"><part-name>{name}</part-name></score-part>'
+                        for pid, name, _ in parts)
+    path.write_text('<score-partwise><part-list>' + part_list + '</part-list>'
+                    + ''.join(f'<part id="{pid}">{"".join(bars)}</part>' for pid, _, bars in parts)
+                    + '</score-partwise>')
+    return read_score(str(path))
+
+
+def lcs_length(a, b):
+    row = [0] * (len(b) + 1)
+    for x in a:
+        previous = 0
+        for j, y in enumerate(b, 1):
+            previous, row[j] = row[j], previous + 1 if x == y else max(row[j], row[j - 1])
+    return row[-1]
+
+
+def test_edit_script_is_a_longest_common_subsequence():
+    rng = random.Random(7)
+    for _ in range(200):
+        a = [rng.randrange(4) for _ in range(rng.randrange(12))]
+        b = [rng.randrange(4) for _ in range(rng.randrange(12))]
+        opcodes = edit_script(a, b)
+        rebuilt = []
+        for op, i1, i2, j1, j2 in opcodes:
+            if op == 'equal':
+                assert a[i1:i2] == b[j1:j2]
+                rebuilt += a[i1:i2]
+            else:
+                rebuilt += b[j1:j2]
+        assert rebuilt == b
+        assert sum(i2 - i1 for op, i1, i2, _, _ in opcodes if op == 'equal') == lcs_length(a, b)
+
+
+def test_bars_are_aligned_into_inserts_deletes_and_modifications(tmp_path):
+    old = write_score(tmp_path / 'old.musicxml', [
+        ('P1', 'Flute', [bar(n, STEPS[n]) for n in range(1, 7)]),
+        ('P2', 'Cello', [bar(n, 'C', 2) for n in range(1, 4)]),
+    ])
+    new_flute = [bar(1, 'D'), bar(2, 'F'), bar(3, 'G', 5), bar(4, 'A'), bar(5, 'C', 6), bar(6, 'B')]
+    new = write_score(tmp_path / 'new.musicxml', [
+        ('P2', 'Flute', new_flute),
+        ('P3', 'Cello', [bar(1, 'C', 2), bar(2, 'C', 2, '<tie type="start"/>'), bar(3, 'C', 2)]),
+    ])
+    result = diff_scores(old, new)
+
+    flute, cello = result['parts']
+    assert (flute['id'], flute['old_id'], cello['old_id']) == ('P2', 'P1', 'P2')
+    assert [(c['change'], c['old'], c['new'], c['after']) for c in flute['changes']] == [
+        ('deleted', '2', None, None),
+        ('modified', '4', '3', None),
+        ('inserted', None, '5', '5'),
+    ]
+    assert flute['changes'][1]['categories'] == ['pitch']
+    assert flute['changes'][1]['detail'] == ['~ note 1: G4 v1 4 whole -> G5 v1 4 whole']
+    assert [(c['change'], c['categories']) for c in cello['changes']] == [('modified', ['ties'])]
+
+    lines = format_diff(result)
+    assert lines[0] == 'P2 Flute (was P1): 1 modified, 1 inserted, 1 deleted (6 -> 6 bars)'
+    assert '    + m. 5: inserted after old m. 5' in lines
+
+
+def test_parts_match_by_name_then_id():
+    old = [{'id': 'P1', 'name': 'Violin', 'bars': []}, {'id': 'P2', 'name': 'Violin', 'bars': []},
+           {'id': 'P3', 'name': '', 'bars': []}, {'id': 'P4', 'name': 'Harp', 'bars': []}]
+    new = [{'id': 'P9', 'name': 'violin', 'bars': []}, {'id': 'P3', 'name': '', 'bars': []},
+           {'id': 'P1', 'name': 'Violin', 'bars': []}, {'id': 'P5', 'name': 'Oboe', 'bars': []}]
+    pairs, removed, added = match_parts(old, new)
+    assert [(o['id'], n['id']) for o, n in pairs] == [('P1', 'P9'), ('P3', 'P3'), ('P2', 'P1')]
+    assert [p['id'] for p in removed] == ['P4']
+    assert [p['id'] for p in added] == ['P5']
@@ -0,0 +1,57 @@
+import io
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+
+from score_features import extract_features, has_marker, stream_features
+
+SCORE = '''<?xml version="1.0" encoding="UTF-8"?>
+<score-partwise version="3.1">
+  <part-list><score-part id="P1"><part-name>Piano</part-name></score-part></part-list>
+  <part id="P1">
+    <!-- to Coda -->
+    <measure number="1">
+      <attributes><divisions>4</divisions><staves>2</staves></attributes>
+      <harmony><root><root-step>C</root-step></root><kind text="(dissolving)">major</kind></harmony>
+      <direction placement="below"><direction-type><dynamics default-y="-80"><mf/></dynamics></direction-type></direction>
+      <direction><direction-type><words font-style="italic">rit.</words></direction-type></direction>
+      <note><pitch><step>C</step><alter>1</alter><octave>5</octave></pitch><duration>4</duration>
+        <notations><slur type="start" number="1"/><articulations><accent default-y="-20"/></articulations></notations></note>
+      <note><chord/><pitch><step>E</step><octave>4</octave></pitch><duration>4</duration></note>
+      <note><rest/><duration>4</duration><staff>2</staff></note>
+      <note><pitch><step>D</step><octave>5</octave></pitch><duration>8</duration>
+        <notations><slur type="stop" number="1"/><fermata/><articulations><staccato/></articulations></notations></note>
+      <barline location="right"><bar-style>light-heavy</bar-style></barline>
+    </measure>
+  </part>
+</score-partwise>
+'''
+
+
+def without_text(features):
+    return {k: v for k, v in features.items() if k != 'text'}
+
+
+def test_stream_and_string_extractors_agree():
+    features = extract_features(SCORE)
+    assert without_text(stream_features(io.BytesIO(SCORE.encode()))) == without_text(features)
+    assert features['slur_starts'] == features['slur_stops'] == 1
+    assert features['octaves'] == {4: 1, 5: 2}
+    assert (features['accents'], features['dynamics'], features['chords']) == (1, 1, 1)
+
+
+def test_concatenated_documents_are_counted_together():
+    # A chunk size smaller than one document makes the second <?xml?> fall
+    # inside a chunk
+    stream = stream_features(io.BytesIO((SCORE + SCORE).encode()), chunk_size=100)
+    assert without_text(stream) == without_text(extract_features(SCORE + SCORE))
+    assert stream['measures'] == 2
+
+
+def test_markers_are_found_in_text_attributes_and_comments():
+    for features in (extract_features(SCORE), stream_features(io.BytesIO(SCORE.encode()))):
+        assert has_marker(features, 'rit')
+        assert has_marker(features, 'coda')
+        assert has_marker(features, 'dissolving')
+        assert not has_marker(features, 'attacca')
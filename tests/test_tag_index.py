@@ -0,0 +1,23 @@
+import sys
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+
+from tag_index import TagIndex
+
+
+def test_inserted_and_removed_elements_keep_document_order():
+    root = ET.fromstring('<part><measure number="1"><note/></measure>'
+                         '<measure number="2"><note/></measure></part>')
+    index = TagIndex(root)
+    index.elements('note')
+    first = index.insert(root[0], 0, ET.Element('note'))
+    index.insert(root, 1, ET.fromstring('<measure number="2"><note/></measure>'))
+    assert index.elements('note') == list(root.iter('note'))
+    assert index.measures(2) == [m for m in root if m.get('number') == '2']
+
+    index.remove(root[0], first)
+    index.remove(root, root[1])
+    assert index.elements('note') == list(root.iter('note'))
+    assert index.measures(2) == [root[1]]
@@ -0,0 +1,89 @@
+import sys
+import xml.etree.ElementTree as ET
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / 'scripts'))
+
+from transposition import (choose_spelling, interval_fifths, step_table, transpose_parts,
+                           transposition_for)
+
+
+def pitch(step, octave, alter=None, accidental=None):
+    alter = f'<alter>{alter}</alter>' if alter is not None else ''
+    accidental = f'<accidental>{accidental}</accidental>' if accidental else ''
+    return (f'<note><pitch><step>{step}</step>{alter}<octave>{octave}</octave></pitch>'
+            f'<duration>1</duration>{accidental}</note>')
+
+
+def score(parts):
+    part_list = ''.join(f'<score-part id="{pid}"><part-name>{name}</part-name></score-part>'
+                        for pid, name, _ in parts)
+    return ET.fromstring(f'<score-partwise><part-list>{part_list}</part-list>'
+                         + ''.join(f'<part id="{pid}">{body}</part>' for pid, _, body in parts)
+                         + '</score-partwise>')
+
+
+def spelled(part):
+    return [p.findtext('step') + {'-1': 'b', '1': '#'}.get(p.findtext('alter'), '') + p.findtext('octave')
+            for p in part.iter('pitch')]
+
+
+def test_step_tables_and_key_shifts():
+    # Major second up: C -> D, E -> F#, B -> C# an octave higher
+    written, carry, correction = step_table(1, 2).tolist()
+    assert written == [1, 2, 3, 4, 5, 6, 0]
+    assert carry == [0, 0, 0, 0, 0, 0, 1]
+    assert correction == [0, 0, 1, 0, 0, 0, 1]
+    assert interval_fifths(1, 2) == 2
+    assert interval_fifths(5, 9) == 3        # alto sax, major sixth
+    assert interval_fifths(8, 14) == 2       # bass clarinet, major ninth
+    assert interval_fifths(2, 2) == -10      # diminished third
+
+
+def test_written_key_takes_the_spelling_with_fewer_accidentals():
+    # Concert B major for a Bb instrument is written Db, not C#
+    assert choose_spelling(5, 1, 2) == ((2, 2), -5)
+    assert choose_spelling(-2, 1, 2) == ((1, 2), 0)
+    assert choose_spelling(0, 5, 9) == ((5, 9), 3)
+
+
+def test_instrument_names():
+    assert transposition_for('Clarinet in Bb 1') == ('Clarinet in Bb', 1, 2)
+    assert transposition_for('Bass Clarinet') == ('Bass Clarinet in Bb', 8, 14)
+    assert transposition_for('Trumpet in C') is None
+    assert transposition_for('Flute') is None
+
+
+def test_transposing_parts_are_written_up():
+    root = score([
+        ('P1', 'Flute', '<measure number="1">' + pitch('C', 4) + '</measure>'),
+        ('P2', 'Clarinet in Bb', '<measure number="1"><attributes><divisions>1</divisions>'
+         '<key><fifths>0</fifths></key><clef><sign>G</sign><line>2</line></clef></attributes>'
+         '<harmony><root><root-step>B</root-step><root-alter>-1</root-alter></root></harmony>'
+         + pitch('C', 4) + pitch('B', 4, -1) + pitch('F', 4, 1, 'sharp') + '</measure>'
+         '<measure number="2"><attributes><key><fifths>5</fifths></key></attributes>'
+         + pitch('B', 4) + '</measure>'),
+        ('P3', 'Clarinet in Bb', '<measure number="1"><attributes><transpose><diatonic>-1</diatonic>'
+         '<chromatic>-2</chromatic></transpose></attributes>' + pitch('D', 4) + '</measure>'),
+    ])
+    assert transpose_parts(root) == [('P2', 'Clarinet in Bb')]
+
+    flute, clarinet, written = root.findall('part')
+    assert spelled(flute) == ['C4']
+    assert spelled(written) == ['D4']
+    assert spelled(clarinet) == ['D4', 'C5', 'G#4', 'Db5']
+    assert clarinet.findtext('.//accidental') == 'sharp'
+    assert clarinet.findtext('.//root-step') == 'C'
+    assert clarinet.find('.//root-alter') is None
+    assert [k.findtext('fifths') for k in clarinet.iter('key')] == ['2', '-5']
+    attributes = clarinet.find('measure/attributes')
+    assert [child.tag for child in attributes] == ['divisions', 'key', 'clef', 'transpose']
+    assert (attributes.findtext('transpose/diatonic'), attributes.findtext('transpose/chromatic')) == ('-1', '-2')
+
+
+def test_compound_intervals_split_off_the_octave():
+    root = score([('P1', 'Bass Clarinet', '<measure number="1">' + pitch('C', 3) + '</measure>')])
+    transpose_parts(root)
+    assert spelled(root.find('part')) == ['D4']
+    transpose = root.find('.//transpose')
+    assert [transpose.findtext(t) for t in ('diatonic', 'chromatic', 'octave-change')] == ['-1', '-2', '-1']